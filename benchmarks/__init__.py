@@ -0,0 +1,5 @@
+"""
+Benchmark suite for pydash.
+
+Run with ``inv bench`` or ``python -m benchmarks``. See ``python -m benchmarks --help`` for options.
+"""
@@ -0,0 +1,97 @@
+"""
+Command line interface for the benchmark suite.
+
+Examples::
+
+    # Run all cases at default sizes.
+    python -m benchmarks
+
+    # Run only string and numerical cases and store the results as the "main" baseline.
+    python -m benchmarks -k strings -k numerical --save main
+
+    # Compare a new run against the "main" baseline and fail on regressions over 10%.
+    python -m benchmarks --compare main --threshold 0.1
+"""
+
+import argparse
+import sys
+import typing as t
+
+from . import runner
+from .cases import DEFAULT_SIZES, select
+
+
+def parse_args(argv: t.Optional[t.List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.split("\n")[1]
+    )
+    parser.add_argument(
+        "-k",
+        "--match",
+        action="append",
+        default=[],
+        help="Only run cases whose name contains this value (can be repeated)",
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma separated input sizes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timing repetitions per case (default: %(default)s)"
+    )
+    parser.add_argument("--save", help="Save results as a named baseline or to a .json path")
+    parser.add_argument("--compare", help="Compare results to a named baseline or a .json path")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=runner.DEFAULT_THRESHOLD,
+        help="Slowdown ratio reported as a regression (default: %(default)s)",
+    )
+    parser.add_argument("--list", action="store_true", help="List cases and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> int:
+    args = parse_args(argv)
+    selected = select(args.match)
+
+    if args.list:
+        for case in selected:
+            print(case.name)
+        return 0
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    baseline = runner.load(args.compare) if args.compare else None
+
+    def report(name: str, size: int, seconds: float) -> None:
+        print(f"{name:<32} {size:>8}  {runner.format_seconds(seconds):>12}")
+
+    results = runner.run(selected, sizes, repeat=args.repeat, report=report)
+
+    if args.save:
+        print(f"\nSaved results to {runner.save(results, args.save)}")
+
+    if baseline is None:
+        return 0
+
+    comparisons = runner.compare(baseline, results)
+    regressions = [item for item in comparisons if item.is_regression(args.threshold)]
+
+    print(f"\nCompared {len(comparisons)} timings against {args.compare}")
+    for item in sorted(comparisons, key=lambda item: -item.ratio):
+        flag = "REGRESSION" if item in regressions else ""
+        print(
+            f"{item.name:<32} {item.size:>8}  {runner.format_seconds(item.baseline):>12}"
+            f" -> {runner.format_seconds(item.current):>12}  {item.ratio:>6.2f}x  {flag}"
+        )
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%} threshold")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,491 @@
+"""Benchmark cases covering representative functions of each public pydash module."""
+
+import random
+import typing as t
+
+import pydash as pyd
+
+
+#: Input sizes each case is timed at unless overridden.
+DEFAULT_SIZES = (10, 10**3, 10**5)
+
+#: Seed used for all generated benchmark data so that runs are comparable.
+SEED = 1234
+
+
+class Case(t.NamedTuple):
+    """A single benchmark case."""
+
+    #: Name of case in the form ``<module>.<function>``.
+    name: str
+    #: Function that is timed. It receives the value returned by :attr:`data`.
+    func: t.Callable[[t.Any], t.Any]
+    #: Factory that builds the input data for a given size.
+    data: t.Callable[[int], t.Any]
+    #: Largest size this case should be run at. Used for functions that are too slow at large sizes.
+    max_size: t.Optional[int] = None
+
+    @property
+    def module(self) -> str:
+        return self.name.split(".", 1)[0]
+
+    def sizes(self, sizes: t.Iterable[int]) -> t.List[int]:
+        return [size for size in sizes if self.max_size is None or size <= self.max_size]
+
+
+CASES: t.List[Case] = []
+
+
+def case(
+    name: str, data: t.Callable[[int], t.Any], max_size: t.Optional[int] = None
+) -> t.Callable[[t.Callable[[t.Any], t.Any]], t.Callable[[t.Any], t.Any]]:
+    """Register the decorated function as a benchmark case."""
+
+    def decorator(func: t.Callable[[t.Any], t.Any]) -> t.Callable[[t.Any], t.Any]:
+        CASES.append(Case(name, func, data, max_size))
+        return func
+
+    return decorator
+
+
+def select(patterns: t.Iterable[str] = ()) -> t.List[Case]:
+    """Return cases whose name contains any of `patterns` or all cases if none given."""
+    patterns = list(patterns)
+    if not patterns:
+        return list(CASES)
+    return [item for item in CASES if any(pattern in item.name for pattern in patterns)]
+
+
+#
+# Data factories
+#
+
+
+def ints(size: int) -> t.List[int]:
+    rnd = random.Random(SEED)
+    return [rnd.randint(0, size) for _ in range(size)]
+
+
+def floats(size: int) -> t.List[float]:
+    rnd = random.Random(SEED)
+    return [rnd.uniform(-1000, 1000) for _ in range(size)]
+
+
+def pairs(size: int) -> t.Tuple[t.List[int], t.List[int]]:
+    return ints(size), ints(size)[::-1]
+
+
+def nested_lists(size: int) -> t.List[t.Any]:
+    return [[i, [i, [i]]] for i in range(size // 3 or 1)]
+
+
+def records(size: int) -> t.List[t.Dict[str, t.Any]]:
+    rnd = random.Random(SEED)
+    return [
+        {
+            "id": i,
+            "name": f"user{i}",
+            "status": rnd.choice(("active", "inactive", "pending")),
+            "score": rnd.randint(0, 100),
+            "org": {"id": rnd.randint(0, 10), "tags": ["a", "b"]},
+        }
+        for i in range(size)
+    ]
+
+
+def indexed_records(size: int) -> pyd.Index[t.Dict[str, t.Any]]:
+    return pyd.index_by(records(size), "id")
+
+
+def table(size: int) -> pyd.Table:
+    return pyd.Table.from_records(records(size))
+
+
+def document(size: int) -> t.Dict[str, t.Any]:
+    return {f"key{i}": record for i, record in enumerate(records(size))}
+
+
+def documents(size: int) -> t.Tuple[t.Dict[str, t.Any], t.Dict[str, t.Any]]:
+    return document(size), document(size)
+
+
+def text(size: int) -> str:
+    rnd = random.Random(SEED)
+    words = ["fooBar", "baz_qux", "Hello", "WORLD", "lorem-ipsum", "123abc", "éàü"]
+    return " ".join(rnd.choice(words) for _ in range(size))
+
+
+def matrix(size: int) -> t.List[t.List[int]]:
+    width = max(int(size**0.5), 1)
+    return [list(range(row * width, (row + 1) * width)) for row in range(width)]
+
+
+#
+# Arrays
+#
+
+
+@case("arrays.chunk", ints)
+def bench_chunk(data: t.Any) -> t.Any:
+    return pyd.chunk(data, 3)
+
+
+@case("arrays.flatten_deep", nested_lists)
+def bench_flatten_deep(data: t.Any) -> t.Any:
+    return pyd.flatten_deep(data)
+
+
+@case("arrays.uniq", ints)
+def bench_uniq(data: t.Any) -> t.Any:
+    return pyd.uniq(data)
+
+
+@case("arrays.uniq_records", records)
+def bench_uniq_records(data: t.Any) -> t.Any:
+    return pyd.uniq(data)
+
+
+@case("arrays.duplicates", ints)
+def bench_duplicates(data: t.Any) -> t.Any:
+    return pyd.duplicates(data)
+
+
+@case("arrays.difference", pairs)
+def bench_difference(data: t.Any) -> t.Any:
+    return pyd.difference(*data)
+
+
+@case("arrays.intersection", pairs)
+def bench_intersection(data: t.Any) -> t.Any:
+    return pyd.intersection(*data)
+
+
+@case("arrays.without", ints)
+def bench_without(data: t.Any) -> t.Any:
+    return pyd.without(data, 1, 2, 3)
+
+
+@case("arrays.zip_", pairs)
+def bench_zip(data: t.Any) -> t.Any:
+    return pyd.zip_(*data)
+
+
+@case("arrays.zip_object_deep", ints)
+def bench_zip_object_deep(data: t.Any) -> t.Any:
+    return pyd.zip_object_deep([f"a.b[{i}].c" for i in range(len(data))], data)
+
+
+#
+# Collections
+#
+
+
+@case("collections.map_", records)
+def bench_map(data: t.Any) -> t.Any:
+    return pyd.map_(data, "org.id")
+
+
+@case("collections.filter_", records)
+def bench_filter(data: t.Any) -> t.Any:
+    return pyd.filter_(data, {"status": "active", "org": {"id": 5}})
+
+
+@case("collections.find", records)
+def bench_find(data: t.Any) -> t.Any:
+    return pyd.find(data, {"id": len(data) - 1})
+
+
+@case("collections.find_index", indexed_records)
+def bench_find_index(data: t.Any) -> t.Any:
+    return [pyd.find(data, {"id": i}) for i in range(0, len(data), max(len(data) // 100, 1))]
+
+
+@case("collections.group_by", records)
+def bench_group_by(data: t.Any) -> t.Any:
+    return pyd.group_by(data, "status")
+
+
+@case("collections.key_by", records)
+def bench_key_by(data: t.Any) -> t.Any:
+    return pyd.key_by(data, "id")
+
+
+@case("collections.order_by", records)
+def bench_order_by(data: t.Any) -> t.Any:
+    return pyd.order_by(data, ["status", "-score"])
+
+
+@case("collections.pluck", records)
+def bench_pluck(data: t.Any) -> t.Any:
+    return pyd.pluck(data, "score")
+
+
+@case("collections.reduce_", ints)
+def bench_reduce(data: t.Any) -> t.Any:
+    return pyd.reduce_(data, lambda total, value: total + value, 0)
+
+
+#
+# Tables
+#
+
+
+@case("tables.filter_", table)
+def bench_table_filter(data: t.Any) -> t.Any:
+    return pyd.filter_(data, {"status": "active"})
+
+
+@case("tables.group_by", table)
+def bench_table_group_by(data: t.Any) -> t.Any:
+    return pyd.group_by(data, "status")
+
+
+@case("tables.order_by", table)
+def bench_table_order_by(data: t.Any) -> t.Any:
+    return pyd.order_by(data, ["status", "-score"])
+
+
+@case("tables.sum_by", table)
+def bench_table_sum_by(data: t.Any) -> t.Any:
+    return pyd.sum_by(data, "score")
+
+
+#
+# Objects
+#
+
+
+@case("objects.clone_deep", records)
+def bench_clone_deep(data: t.Any) -> t.Any:
+    return pyd.clone_deep(data)
+
+
+@case("objects.diff", documents)
+def bench_diff(data: t.Any) -> t.Any:
+    old, new = data
+    return pyd.diff(old, pyd.set_in(new, "key0.org.id", -1))
+
+
+@case("objects.flatten_keys", document)
+def bench_flatten_keys(data: t.Any) -> t.Any:
+    return pyd.flatten_keys(data)
+
+
+@case("objects.get", records)
+def bench_get(data: t.Any) -> t.Any:
+    return [pyd.get(record, "org.tags[1]") for record in data]
+
+
+@case("objects.get_many", records)
+def bench_get_many(data: t.Any) -> t.Any:
+    return [
+        pyd.get_many(record, ["org.id", "org.tags[0]", "org.tags[1]", "name"]) for record in data
+    ]
+
+
+@case("objects.has", records)
+def bench_has(data: t.Any) -> t.Any:
+    return [pyd.has(record, "org.missing") for record in data]
+
+
+@case("objects.set_", records)
+def bench_set(data: t.Any) -> t.Any:
+    return [pyd.set_(record, "org.meta.seen", True) for record in data]
+
+
+@case("objects.set_in", document)
+def bench_set_in(data: t.Any) -> t.Any:
+    return pyd.set_in(data, "key0.org.meta.seen", True)
+
+
+@case("objects.merge", documents)
+def bench_merge(data: t.Any) -> t.Any:
+    return pyd.merge({}, *data)
+
+
+@case("objects.unflatten_keys", document)
+def bench_unflatten_keys(data: t.Any) -> t.Any:
+    return pyd.unflatten_keys(pyd.flatten_keys(data))
+
+
+@case("objects.map_values_deep", document)
+def bench_map_values_deep(data: t.Any) -> t.Any:
+    return pyd.map_values_deep(data, str)
+
+
+@case("objects.pick", document)
+def bench_pick(data: t.Any) -> t.Any:
+    return pyd.pick(data, "key0.org.id", "key1.name", "key2")
+
+
+@case("objects.walk", document)
+def bench_walk(data: t.Any) -> t.Any:
+    return pyd.walk(data, lambda value: value)
+
+
+#
+# Strings
+#
+
+
+@case("strings.camel_case", text)
+def bench_camel_case(data: t.Any) -> t.Any:
+    return pyd.camel_case(data)
+
+
+@case("strings.snake_case", text)
+def bench_snake_case(data: t.Any) -> t.Any:
+    return pyd.snake_case(data)
+
+
+@case("strings.words", text)
+def bench_words(data: t.Any) -> t.Any:
+    return pyd.words(data)
+
+
+@case("strings.slugify", text)
+def bench_slugify(data: t.Any) -> t.Any:
+    return pyd.slugify(data)
+
+
+#
+# Numerical
+#
+
+
+@case("numerical.sum_by", records)
+def bench_sum_by(data: t.Any) -> t.Any:
+    return pyd.sum_by(data, "score")  # type: ignore[call-overload]
+
+
+@case("numerical.stats_by", records)
+def bench_stats_by(data: t.Any) -> t.Any:
+    return pyd.stats_by(data, "score")
+
+
+@case("numerical.mean", floats)
+def bench_mean(data: t.Any) -> t.Any:
+    return pyd.mean(data)
+
+
+@case("numerical.median", floats)
+def bench_median(data: t.Any) -> t.Any:
+    return pyd.median(data)
+
+
+@case("numerical.quantile", floats)
+def bench_quantile(data: t.Any) -> t.Any:
+    return pyd.quantile(data, [0.5, 0.95, 0.99])
+
+
+@case("numerical.QuantileSketch", floats)
+def bench_quantile_sketch(data: t.Any) -> t.Any:
+    return pyd.QuantileSketch([0.5, 0.95, 0.99], data).estimate()
+
+
+@case("numerical.variance", floats)
+def bench_variance(data: t.Any) -> t.Any:
+    return pyd.variance(data)
+
+
+@case("numerical.zscore", floats)
+def bench_zscore(data: t.Any) -> t.Any:
+    return pyd.zscore(data)
+
+
+@case("numerical.moving_mean", floats)
+def bench_moving_mean(data: t.Any) -> t.Any:
+    return pyd.moving_mean(data, 10)
+
+
+@case("numerical.variance_numpy", floats)
+def bench_variance_numpy(data: t.Any) -> t.Any:
+    return pyd.variance(data, backend="numpy")
+
+
+@case("numerical.zscore_numpy", floats)
+def bench_zscore_numpy(data: t.Any) -> t.Any:
+    return pyd.zscore(data, backend="numpy")
+
+
+@case("numerical.transpose", matrix)
+def bench_transpose(data: t.Any) -> t.Any:
+    return pyd.transpose(data)
+
+
+@case("numerical.max_by", records)
+def bench_max_by(data: t.Any) -> t.Any:
+    return pyd.max_by(data, "score")
+
+
+@case("numerical.min_max_by", records)
+def bench_min_max_by(data: t.Any) -> t.Any:
+    return pyd.min_max_by(data, "score")
+
+
+#
+# Predicates
+#
+
+
+@case("predicates.is_equal", documents)
+def bench_is_equal(data: t.Any) -> t.Any:
+    return pyd.is_equal(*data)
+
+
+def default_equality(value: t.Any, other: t.Any) -> t.Optional[bool]:
+    return None
+
+
+@case("predicates.is_equal_with", documents)
+def bench_is_equal_with(data: t.Any) -> t.Any:
+    value, other = data
+    return pyd.is_equal_with(value, other, default_equality)
+
+
+@case("predicates.is_match", records)
+def bench_is_match(data: t.Any) -> t.Any:
+    return [pyd.is_match(record, {"org": {"id": 5}}) for record in data]
+
+
+@case("predicates.is_empty", records)
+def bench_is_empty(data: t.Any) -> t.Any:
+    return [pyd.is_empty(record) for record in data]
+
+
+#
+# Functions
+#
+
+
+@case("functions.curry", ints)
+def bench_curry(data: t.Any) -> t.Any:
+    add: t.Callable[..., t.Any] = pyd.curry(lambda a, b: a + b)
+    return [add(value)(1) for value in data]
+
+
+@case("functions.flow", ints)
+def bench_flow(data: t.Any) -> t.Any:
+    func = pyd.flow(pyd.compact, pyd.uniq, pyd.sort)
+    return func(data)
+
+
+@case("functions.memoize", ints)
+def bench_memoize(data: t.Any) -> t.Any:
+    square = pyd.memoize(lambda value: value * value)
+    return [square(value) for value in data]
+
+
+#
+# Chaining
+#
+
+
+@case("chaining.chain", records)
+def bench_chain(data: t.Any) -> t.Any:
+    return pyd.chain(data).filter_({"status": "active"}).map_("score").sum_().value()
+
+
+@case("chaining.py_", ints)
+def bench_py(data: t.Any) -> t.Any:
+    return pyd.py_(data).uniq().sort().take(10).value()
@@ -0,0 +1,121 @@
+"""Run benchmark cases, store results as JSON baselines, and compare runs against each other."""
+
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import platform
+import timeit
+import typing as t
+
+import pydash as pyd
+
+from .cases import Case
+
+
+#: Directory where named baselines are stored.
+RESULTS_DIR = Path(__file__).parent / "results"
+
+#: Default ratio over a baseline timing that is reported as a regression.
+DEFAULT_THRESHOLD = 0.25
+
+#: Results keyed by case name then by input size (as a string for JSON compatibility).
+Results = t.Dict[str, t.Dict[str, float]]
+
+
+class Comparison(t.NamedTuple):
+    """Timing of a case at one size compared against its baseline timing."""
+
+    name: str
+    size: int
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.ratio > 1 + threshold
+
+
+def time_case(case: Case, size: int, repeat: int = 3) -> float:
+    """Return best seconds per call of `case` at `size` over `repeat` repetitions."""
+    data = case.data(size)
+    timer = timeit.Timer(lambda: case.func(data))
+    # autorange() picks a number of calls that takes at least 0.2 seconds.
+    number, elapsed = timer.autorange()
+    best = min([elapsed / number] + [timer.timeit(number) / number for _ in range(repeat - 1)])
+    return best
+
+
+def run(
+    cases: t.Iterable[Case],
+    sizes: t.Iterable[int],
+    repeat: int = 3,
+    report: t.Optional[t.Callable[[str, int, float], None]] = None,
+) -> Results:
+    """Time each case at each size it supports."""
+    results: Results = {}
+    sizes = list(sizes)
+
+    for case in cases:
+        for size in case.sizes(sizes):
+            seconds = time_case(case, size, repeat=repeat)
+            results.setdefault(case.name, {})[str(size)] = seconds
+
+            if report:
+                report(case.name, size, seconds)
+
+    return results
+
+
+def baseline_path(name: str) -> Path:
+    """Return path of a baseline given either its name or a path to a JSON file."""
+    if name.endswith(".json"):
+        return Path(name)
+    return RESULTS_DIR / f"{name}.json"
+
+
+def save(results: Results, name: str) -> Path:
+    """Save `results` as a named JSON baseline and return the file path."""
+    path = baseline_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "pydash": pyd.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+
+def load(name: str) -> Results:
+    """Load results from a named JSON baseline."""
+    payload = json.loads(baseline_path(name).read_text(encoding="utf-8"))
+    return payload["results"]
+
+
+def compare(baseline: Results, current: Results) -> t.List[Comparison]:
+    """Pair up timings that exist in both `baseline` and `current`."""
+    comparisons = []
+
+    for name, timings in current.items():
+        for size, seconds in timings.items():
+            if size in baseline.get(name, {}):
+                comparisons.append(Comparison(name, int(size), baseline[name][size], seconds))
+
+    return comparisons
+
+
+def format_seconds(seconds: float) -> str:
+    """Format duration using the most readable unit."""
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.2f} ns"
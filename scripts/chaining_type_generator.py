@@ -45,6 +45,8 @@ from pydash.functions import (
     Spread,
     Throttle,
 )
+from pydash.indexes import Index
+from pydash.tables import Table
 from pydash.utilities import MemoizedFunc
 
 from _typeshed import (
@@ -2,389 +2,869 @@
 
 __version__ = "8.0.6"
 
-from .arrays import (
-    chunk,
-    compact,
-    concat,
-    difference,
-    difference_by,
-    difference_with,
-    drop,
-    drop_right,
-    drop_right_while,
-    drop_while,
-    duplicates,
-    fill,
-    find_index,
-    find_last_index,
-    flatten,
-    flatten_deep,
-    flatten_depth,
-    from_pairs,
-    head,
-    index_of,
-    initial,
-    intercalate,
-    interleave,
-    intersection,
-    intersection_by,
-    intersection_with,
-    intersperse,
-    last,
-    last_index_of,
-    mapcat,
-    nth,
-    pop,
-    pull,
-    pull_all,
-    pull_all_by,
-    pull_all_with,
-    pull_at,
-    push,
-    remove,
-    reverse,
-    shift,
-    slice_,
-    sort,
-    sorted_index,
-    sorted_index_by,
-    sorted_index_of,
-    sorted_last_index,
-    sorted_last_index_by,
-    sorted_last_index_of,
-    sorted_uniq,
-    sorted_uniq_by,
-    splice,
-    split_at,
-    tail,
-    take,
-    take_right,
-    take_right_while,
-    take_while,
-    union,
-    union_by,
-    union_with,
-    uniq,
-    uniq_by,
-    uniq_with,
-    unshift,
-    unzip,
-    unzip_with,
-    without,
-    xor,
-    xor_by,
-    xor_with,
-    zip_,
-    zip_object,
-    zip_object_deep,
-    zip_with,
-)
-from .chaining import _Dash, chain, tap
-from .collections import (
-    at,
-    count_by,
-    every,
-    filter_,
-    find,
-    find_last,
-    flat_map,
-    flat_map_deep,
-    flat_map_depth,
-    for_each,
-    for_each_right,
-    group_by,
-    includes,
-    invoke_map,
-    key_by,
-    map_,
-    nest,
-    order_by,
-    partition,
-    pluck,
-    reduce_,
-    reduce_right,
-    reductions,
-    reductions_right,
-    reject,
-    sample,
-    sample_size,
-    shuffle,
-    size,
-    some,
-    sort_by,
-)
-from .exceptions import InvalidMethod
-from .functions import (
-    after,
-    ary,
-    before,
-    conjoin,
-    curry,
-    curry_right,
-    debounce,
-    delay,
-    disjoin,
-    flip,
-    flow,
-    flow_right,
-    iterated,
-    juxtapose,
-    negate,
-    once,
-    over_args,
-    partial,
-    partial_right,
-    rearg,
-    spread,
-    throttle,
-    unary,
-    wrap,
-)
-from .numerical import (
-    add,
-    ceil,
-    clamp,
-    divide,
-    floor,
-    max_,
-    max_by,
-    mean,
-    mean_by,
-    median,
-    min_,
-    min_by,
-    moving_mean,
-    multiply,
-    power,
-    round_,
-    scale,
-    slope,
-    std_deviation,
-    subtract,
-    sum_,
-    sum_by,
-    transpose,
-    variance,
-    zscore,
-)
-from .objects import (
-    apply,
-    apply_catch,
-    apply_if,
-    apply_if_not_none,
-    assign,
-    assign_with,
-    callables,
-    clone,
-    clone_deep,
-    clone_deep_with,
-    clone_with,
-    defaults,
-    defaults_deep,
-    find_key,
-    find_last_key,
-    for_in,
-    for_in_right,
-    get,
-    has,
-    invert,
-    invert_by,
-    invoke,
-    keys,
-    map_keys,
-    map_values,
-    map_values_deep,
-    merge,
-    merge_with,
-    omit,
-    omit_by,
-    parse_int,
-    pick,
-    pick_by,
-    rename_keys,
-    set_,
-    set_with,
-    to_boolean,
-    to_dict,
-    to_integer,
-    to_list,
-    to_number,
-    to_pairs,
-    to_string,
-    transform,
-    unset,
-    update,
-    update_with,
-    values,
-)
-from .predicates import (
-    eq,
-    eq_cmp,
-    gt,
-    gt_cmp,
-    gte,
-    gte_cmp,
-    in_range,
-    in_range_cmp,
-    is_associative,
-    is_blank,
-    is_boolean,
-    is_builtin,
-    is_date,
-    is_decreasing,
-    is_dict,
-    is_empty,
-    is_equal,
-    is_equal_cmp,
-    is_equal_with,
-    is_equal_with_cmp,
-    is_error,
-    is_even,
-    is_float,
-    is_function,
-    is_increasing,
-    is_indexed,
-    is_instance_of,
-    is_instance_of_cmp,
-    is_integer,
-    is_iterable,
-    is_json,
-    is_list,
-    is_match,
-    is_match_cmp,
-    is_match_with,
-    is_match_with_cmp,
-    is_monotone,
-    is_monotone_cmp,
-    is_nan,
-    is_negative,
-    is_none,
-    is_number,
-    is_object,
-    is_odd,
-    is_positive,
-    is_reg_exp,
-    is_set,
-    is_strictly_decreasing,
-    is_strictly_increasing,
-    is_string,
-    is_tuple,
-    is_zero,
-    lt,
-    lt_cmp,
-    lte,
-    lte_cmp,
-)
-from .strings import (
-    camel_case,
-    capitalize,
-    chars,
-    chop,
-    chop_right,
-    clean,
-    count_substr,
-    deburr,
-    decapitalize,
-    ends_with,
-    ensure_ends_with,
-    ensure_starts_with,
-    escape,
-    escape_reg_exp,
-    has_substr,
-    human_case,
-    insert_substr,
-    join,
-    kebab_case,
-    lines,
-    lower_case,
-    lower_first,
-    number_format,
-    pad,
-    pad_end,
-    pad_start,
-    pascal_case,
-    predecessor,
-    prune,
-    quote,
-    reg_exp_js_match,
-    reg_exp_js_replace,
-    reg_exp_replace,
-    repeat,
-    replace,
-    replace_end,
-    replace_start,
-    separator_case,
-    series_phrase,
-    series_phrase_serial,
-    slugify,
-    snake_case,
-    split,
-    start_case,
-    starts_with,
-    strip_tags,
-    substr_left,
-    substr_left_end,
-    substr_right,
-    substr_right_end,
-    successor,
-    surround,
-    swap_case,
-    title_case,
-    to_lower,
-    to_upper,
-    trim,
-    trim_end,
-    trim_start,
-    truncate,
-    unescape,
-    unquote,
-    upper_case,
-    upper_first,
-    url,
-    words,
-)
-from .utilities import (
-    attempt,
-    cond,
-    conforms,
-    conforms_to,
-    constant,
-    default_to,
-    default_to_any,
-    identity,
-    iteratee,
-    matches,
-    matches_property,
-    memoize,
-    method,
-    method_of,
-    noop,
-    now,
-    nth_arg,
-    over,
-    over_every,
-    over_some,
-    properties,
-    property_,
-    property_of,
-    random,
-    range_,
-    range_right,
-    result,
-    retry,
-    stub_dict,
-    stub_false,
-    stub_list,
-    stub_string,
-    stub_true,
-    times,
-    to_path,
-    unique_id,
+import importlib
+import typing as t
+
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from .arrays import (
+        chunk,
+        compact,
+        concat,
+        difference,
+        difference_by,
+        difference_with,
+        drop,
+        drop_right,
+        drop_right_while,
+        drop_while,
+        duplicates,
+        fill,
+        find_index,
+        find_last_index,
+        flatten,
+        flatten_deep,
+        flatten_depth,
+        from_pairs,
+        head,
+        index_of,
+        initial,
+        intercalate,
+        interleave,
+        intersection,
+        intersection_by,
+        intersection_with,
+        intersperse,
+        last,
+        last_index_of,
+        mapcat,
+        nth,
+        pop,
+        pull,
+        pull_all,
+        pull_all_by,
+        pull_all_with,
+        pull_at,
+        push,
+        remove,
+        reverse,
+        shift,
+        slice_,
+        sort,
+        sorted_index,
+        sorted_index_by,
+        sorted_index_of,
+        sorted_last_index,
+        sorted_last_index_by,
+        sorted_last_index_of,
+        sorted_uniq,
+        sorted_uniq_by,
+        splice,
+        split_at,
+        tail,
+        take,
+        take_right,
+        take_right_while,
+        take_while,
+        union,
+        union_by,
+        union_with,
+        uniq,
+        uniq_by,
+        uniq_with,
+        unshift,
+        unzip,
+        unzip_with,
+        without,
+        xor,
+        xor_by,
+        xor_with,
+        zip_,
+        zip_object,
+        zip_object_deep,
+        zip_with,
+    )
+    from .chaining import _Dash, chain, tap
+    from .collections import (
+        at,
+        count_by,
+        every,
+        filter_,
+        find,
+        find_last,
+        flat_map,
+        flat_map_deep,
+        flat_map_depth,
+        for_each,
+        for_each_right,
+        group_by,
+        includes,
+        index_by,
+        invoke_map,
+        key_by,
+        map_,
+        nest,
+        order_by,
+        partition,
+        pluck,
+        reduce_,
+        reduce_right,
+        reductions,
+        reductions_right,
+        reject,
+        sample,
+        sample_size,
+        shuffle,
+        size,
+        some,
+        sort_by,
+    )
+    from .exceptions import InvalidMethod
+    from .functions import (
+        after,
+        ary,
+        before,
+        conjoin,
+        curry,
+        curry_right,
+        debounce,
+        delay,
+        disjoin,
+        flip,
+        flow,
+        flow_right,
+        iterated,
+        juxtapose,
+        negate,
+        once,
+        over_args,
+        partial,
+        partial_right,
+        rearg,
+        spread,
+        throttle,
+        unary,
+        wrap,
+    )
+    from .indexes import Index
+    from .numerical import (
+        QuantileSketch,
+        RunningStats,
+        add,
+        ceil,
+        clamp,
+        divide,
+        floor,
+        itermoving_mean,
+        max_,
+        max_by,
+        mean,
+        mean_by,
+        median,
+        min_,
+        min_by,
+        min_max_by,
+        moving_max,
+        moving_mean,
+        moving_median,
+        moving_min,
+        moving_std,
+        moving_sum,
+        multiply,
+        percentile,
+        power,
+        quantile,
+        round_,
+        scale,
+        slope,
+        stats_by,
+        std_deviation,
+        subtract,
+        sum_,
+        sum_by,
+        transpose,
+        variance,
+        zscore,
+    )
+    from .objects import (
+        apply,
+        apply_catch,
+        apply_if,
+        apply_if_not_none,
+        assign,
+        assign_with,
+        callables,
+        clone,
+        clone_deep,
+        clone_deep_with,
+        clone_with,
+        defaults,
+        defaults_deep,
+        diff,
+        find_key,
+        find_last_key,
+        flatten_keys,
+        for_in,
+        for_in_right,
+        get,
+        get_many,
+        has,
+        invert,
+        invert_by,
+        invoke,
+        iterflatten_keys,
+        iterwalk,
+        keys,
+        map_keys,
+        map_values,
+        map_values_deep,
+        merge,
+        merge_in,
+        merge_with,
+        omit,
+        omit_by,
+        parse_int,
+        patch,
+        pick,
+        pick_by,
+        rename_keys,
+        set_,
+        set_in,
+        set_many,
+        set_with,
+        to_boolean,
+        to_dict,
+        to_integer,
+        to_list,
+        to_number,
+        to_pairs,
+        to_string,
+        transform,
+        unflatten_keys,
+        unset,
+        unset_in,
+        update,
+        update_in,
+        update_with,
+        values,
+        walk,
+    )
+    from .predicates import (
+        eq,
+        eq_cmp,
+        gt,
+        gt_cmp,
+        gte,
+        gte_cmp,
+        in_range,
+        in_range_cmp,
+        is_associative,
+        is_blank,
+        is_boolean,
+        is_builtin,
+        is_date,
+        is_decreasing,
+        is_dict,
+        is_empty,
+        is_equal,
+        is_equal_cmp,
+        is_equal_with,
+        is_equal_with_cmp,
+        is_error,
+        is_even,
+        is_float,
+        is_function,
+        is_increasing,
+        is_indexed,
+        is_instance_of,
+        is_instance_of_cmp,
+        is_integer,
+        is_iterable,
+        is_json,
+        is_list,
+        is_match,
+        is_match_cmp,
+        is_match_with,
+        is_match_with_cmp,
+        is_monotone,
+        is_monotone_cmp,
+        is_nan,
+        is_negative,
+        is_none,
+        is_number,
+        is_object,
+        is_odd,
+        is_positive,
+        is_reg_exp,
+        is_set,
+        is_strictly_decreasing,
+        is_strictly_increasing,
+        is_string,
+        is_tuple,
+        is_zero,
+        lt,
+        lt_cmp,
+        lte,
+        lte_cmp,
+    )
+    from .strings import (
+        camel_case,
+        capitalize,
+        chars,
+        chop,
+        chop_right,
+        clean,
+        count_substr,
+        deburr,
+        decapitalize,
+        ends_with,
+        ensure_ends_with,
+        ensure_starts_with,
+        escape,
+        escape_reg_exp,
+        has_substr,
+        human_case,
+        insert_substr,
+        join,
+        kebab_case,
+        lines,
+        lower_case,
+        lower_first,
+        number_format,
+        pad,
+        pad_end,
+        pad_start,
+        pascal_case,
+        predecessor,
+        prune,
+        quote,
+        reg_exp_js_match,
+        reg_exp_js_replace,
+        reg_exp_replace,
+        repeat,
+        replace,
+        replace_end,
+        replace_start,
+        separator_case,
+        series_phrase,
+        series_phrase_serial,
+        slugify,
+        snake_case,
+        split,
+        start_case,
+        starts_with,
+        strip_tags,
+        substr_left,
+        substr_left_end,
+        substr_right,
+        substr_right_end,
+        successor,
+        surround,
+        swap_case,
+        title_case,
+        to_lower,
+        to_upper,
+        trim,
+        trim_end,
+        trim_start,
+        truncate,
+        unescape,
+        unquote,
+        upper_case,
+        upper_first,
+        url,
+        words,
+    )
+    from .tables import Table
+    from .utilities import (
+        attempt,
+        compile_matcher,
+        cond,
+        conforms,
+        conforms_to,
+        constant,
+        deep_hash,
+        default_to,
+        default_to_any,
+        identity,
+        iteratee,
+        matches,
+        matches_property,
+        memoize,
+        method,
+        method_of,
+        noop,
+        now,
+        nth_arg,
+        over,
+        over_every,
+        over_some,
+        properties,
+        property_,
+        property_of,
+        random,
+        range_,
+        range_right,
+        register_getter,
+        register_setter,
+        result,
+        retry,
+        stub_dict,
+        stub_false,
+        stub_list,
+        stub_string,
+        stub_true,
+        times,
+        to_path,
+        unique_id,
+    )
+
+    py_ = _Dash()
+    _ = py_
+
+
+#: Submodules of the main module that can be accessed as attributes, e.g. ``pydash.arrays``.
+_SUBMODULES = frozenset(
+    (
+        "arrays",
+        "chaining",
+        "collections",
+        "exceptions",
+        "functions",
+        "helpers",
+        "indexes",
+        "numerical",
+        "objects",
+        "predicates",
+        "strings",
+        "tables",
+        "types",
+        "utilities",
+    )
 )
 
+#: Mapping of each public attribute name to the submodule that defines it. A submodule is only
+#: imported the first time one of its attributes is accessed (see :pep:`562`).
+_LAZY_ATTRS = {
+    "chunk": "arrays",
+    "compact": "arrays",
+    "concat": "arrays",
+    "difference": "arrays",
+    "difference_by": "arrays",
+    "difference_with": "arrays",
+    "drop": "arrays",
+    "drop_right": "arrays",
+    "drop_right_while": "arrays",
+    "drop_while": "arrays",
+    "duplicates": "arrays",
+    "fill": "arrays",
+    "find_index": "arrays",
+    "find_last_index": "arrays",
+    "flatten": "arrays",
+    "flatten_deep": "arrays",
+    "flatten_depth": "arrays",
+    "from_pairs": "arrays",
+    "head": "arrays",
+    "index_of": "arrays",
+    "initial": "arrays",
+    "intercalate": "arrays",
+    "interleave": "arrays",
+    "intersection": "arrays",
+    "intersection_by": "arrays",
+    "intersection_with": "arrays",
+    "intersperse": "arrays",
+    "last": "arrays",
+    "last_index_of": "arrays",
+    "mapcat": "arrays",
+    "nth": "arrays",
+    "pop": "arrays",
+    "pull": "arrays",
+    "pull_all": "arrays",
+    "pull_all_by": "arrays",
+    "pull_all_with": "arrays",
+    "pull_at": "arrays",
+    "push": "arrays",
+    "remove": "arrays",
+    "reverse": "arrays",
+    "shift": "arrays",
+    "slice_": "arrays",
+    "sort": "arrays",
+    "sorted_index": "arrays",
+    "sorted_index_by": "arrays",
+    "sorted_index_of": "arrays",
+    "sorted_last_index": "arrays",
+    "sorted_last_index_by": "arrays",
+    "sorted_last_index_of": "arrays",
+    "sorted_uniq": "arrays",
+    "sorted_uniq_by": "arrays",
+    "splice": "arrays",
+    "split_at": "arrays",
+    "tail": "arrays",
+    "take": "arrays",
+    "take_right": "arrays",
+    "take_right_while": "arrays",
+    "take_while": "arrays",
+    "union": "arrays",
+    "union_by": "arrays",
+    "union_with": "arrays",
+    "uniq": "arrays",
+    "uniq_by": "arrays",
+    "uniq_with": "arrays",
+    "unshift": "arrays",
+    "unzip": "arrays",
+    "unzip_with": "arrays",
+    "without": "arrays",
+    "xor": "arrays",
+    "xor_by": "arrays",
+    "xor_with": "arrays",
+    "zip_": "arrays",
+    "zip_object": "arrays",
+    "zip_object_deep": "arrays",
+    "zip_with": "arrays",
+    "_Dash": "chaining",
+    "chain": "chaining",
+    "tap": "chaining",
+    "at": "collections",
+    "count_by": "collections",
+    "every": "collections",
+    "filter_": "collections",
+    "find": "collections",
+    "find_last": "collections",
+    "flat_map": "collections",
+    "flat_map_deep": "collections",
+    "flat_map_depth": "collections",
+    "for_each": "collections",
+    "for_each_right": "collections",
+    "group_by": "collections",
+    "includes": "collections",
+    "index_by": "collections",
+    "invoke_map": "collections",
+    "key_by": "collections",
+    "map_": "collections",
+    "nest": "collections",
+    "order_by": "collections",
+    "partition": "collections",
+    "pluck": "collections",
+    "reduce_": "collections",
+    "reduce_right": "collections",
+    "reductions": "collections",
+    "reductions_right": "collections",
+    "reject": "collections",
+    "sample": "collections",
+    "sample_size": "collections",
+    "shuffle": "collections",
+    "size": "collections",
+    "some": "collections",
+    "sort_by": "collections",
+    "InvalidMethod": "exceptions",
+    "after": "functions",
+    "ary": "functions",
+    "before": "functions",
+    "conjoin": "functions",
+    "curry": "functions",
+    "curry_right": "functions",
+    "debounce": "functions",
+    "delay": "functions",
+    "disjoin": "functions",
+    "flip": "functions",
+    "flow": "functions",
+    "flow_right": "functions",
+    "iterated": "functions",
+    "juxtapose": "functions",
+    "negate": "functions",
+    "once": "functions",
+    "over_args": "functions",
+    "partial": "functions",
+    "partial_right": "functions",
+    "rearg": "functions",
+    "spread": "functions",
+    "throttle": "functions",
+    "unary": "functions",
+    "wrap": "functions",
+    "Index": "indexes",
+    "add": "numerical",
+    "ceil": "numerical",
+    "clamp": "numerical",
+    "divide": "numerical",
+    "floor": "numerical",
+    "itermoving_mean": "numerical",
+    "max_": "numerical",
+    "max_by": "numerical",
+    "mean": "numerical",
+    "mean_by": "numerical",
+    "median": "numerical",
+    "min_": "numerical",
+    "min_by": "numerical",
+    "min_max_by": "numerical",
+    "moving_max": "numerical",
+    "moving_mean": "numerical",
+    "moving_median": "numerical",
+    "moving_min": "numerical",
+    "moving_std": "numerical",
+    "moving_sum": "numerical",
+    "multiply": "numerical",
+    "percentile": "numerical",
+    "power": "numerical",
+    "quantile": "numerical",
+    "QuantileSketch": "numerical",
+    "round_": "numerical",
+    "RunningStats": "numerical",
+    "scale": "numerical",
+    "slope": "numerical",
+    "stats_by": "numerical",
+    "std_deviation": "numerical",
+    "subtract": "numerical",
+    "sum_": "numerical",
+    "sum_by": "numerical",
+    "transpose": "numerical",
+    "variance": "numerical",
+    "zscore": "numerical",
+    "apply": "objects",
+    "apply_catch": "objects",
+    "apply_if": "objects",
+    "apply_if_not_none": "objects",
+    "assign": "objects",
+    "assign_with": "objects",
+    "callables": "objects",
+    "clone": "objects",
+    "clone_deep": "objects",
+    "clone_deep_with": "objects",
+    "clone_with": "objects",
+    "defaults": "objects",
+    "defaults_deep": "objects",
+    "diff": "objects",
+    "find_key": "objects",
+    "find_last_key": "objects",
+    "flatten_keys": "objects",
+    "for_in": "objects",
+    "for_in_right": "objects",
+    "get": "objects",
+    "get_many": "objects",
+    "has": "objects",
+    "invert": "objects",
+    "invert_by": "objects",
+    "invoke": "objects",
+    "iterflatten_keys": "objects",
+    "iterwalk": "objects",
+    "keys": "objects",
+    "map_keys": "objects",
+    "map_values": "objects",
+    "map_values_deep": "objects",
+    "merge": "objects",
+    "merge_in": "objects",
+    "merge_with": "objects",
+    "omit": "objects",
+    "omit_by": "objects",
+    "parse_int": "objects",
+    "patch": "objects",
+    "pick": "objects",
+    "pick_by": "objects",
+    "rename_keys": "objects",
+    "set_": "objects",
+    "set_in": "objects",
+    "set_many": "objects",
+    "set_with": "objects",
+    "to_boolean": "objects",
+    "to_dict": "objects",
+    "to_integer": "objects",
+    "to_list": "objects",
+    "to_number": "objects",
+    "to_pairs": "objects",
+    "to_string": "objects",
+    "transform": "objects",
+    "unflatten_keys": "objects",
+    "unset": "objects",
+    "unset_in": "objects",
+    "update": "objects",
+    "update_in": "objects",
+    "update_with": "objects",
+    "values": "objects",
+    "walk": "objects",
+    "eq": "predicates",
+    "eq_cmp": "predicates",
+    "gt": "predicates",
+    "gt_cmp": "predicates",
+    "gte": "predicates",
+    "gte_cmp": "predicates",
+    "in_range": "predicates",
+    "in_range_cmp": "predicates",
+    "is_associative": "predicates",
+    "is_blank": "predicates",
+    "is_boolean": "predicates",
+    "is_builtin": "predicates",
+    "is_date": "predicates",
+    "is_decreasing": "predicates",
+    "is_dict": "predicates",
+    "is_empty": "predicates",
+    "is_equal": "predicates",
+    "is_equal_cmp": "predicates",
+    "is_equal_with": "predicates",
+    "is_equal_with_cmp": "predicates",
+    "is_error": "predicates",
+    "is_even": "predicates",
+    "is_float": "predicates",
+    "is_function": "predicates",
+    "is_increasing": "predicates",
+    "is_indexed": "predicates",
+    "is_instance_of": "predicates",
+    "is_instance_of_cmp": "predicates",
+    "is_integer": "predicates",
+    "is_iterable": "predicates",
+    "is_json": "predicates",
+    "is_list": "predicates",
+    "is_match": "predicates",
+    "is_match_cmp": "predicates",
+    "is_match_with": "predicates",
+    "is_match_with_cmp": "predicates",
+    "is_monotone": "predicates",
+    "is_monotone_cmp": "predicates",
+    "is_nan": "predicates",
+    "is_negative": "predicates",
+    "is_none": "predicates",
+    "is_number": "predicates",
+    "is_object": "predicates",
+    "is_odd": "predicates",
+    "is_positive": "predicates",
+    "is_reg_exp": "predicates",
+    "is_set": "predicates",
+    "is_strictly_decreasing": "predicates",
+    "is_strictly_increasing": "predicates",
+    "is_string": "predicates",
+    "is_tuple": "predicates",
+    "is_zero": "predicates",
+    "lt": "predicates",
+    "lt_cmp": "predicates",
+    "lte": "predicates",
+    "lte_cmp": "predicates",
+    "camel_case": "strings",
+    "capitalize": "strings",
+    "chars": "strings",
+    "chop": "strings",
+    "chop_right": "strings",
+    "clean": "strings",
+    "count_substr": "strings",
+    "deburr": "strings",
+    "decapitalize": "strings",
+    "ends_with": "strings",
+    "ensure_ends_with": "strings",
+    "ensure_starts_with": "strings",
+    "escape": "strings",
+    "escape_reg_exp": "strings",
+    "has_substr": "strings",
+    "human_case": "strings",
+    "insert_substr": "strings",
+    "join": "strings",
+    "kebab_case": "strings",
+    "lines": "strings",
+    "lower_case": "strings",
+    "lower_first": "strings",
+    "number_format": "strings",
+    "pad": "strings",
+    "pad_end": "strings",
+    "pad_start": "strings",
+    "pascal_case": "strings",
+    "predecessor": "strings",
+    "prune": "strings",
+    "quote": "strings",
+    "reg_exp_js_match": "strings",
+    "reg_exp_js_replace": "strings",
+    "reg_exp_replace": "strings",
+    "repeat": "strings",
+    "replace": "strings",
+    "replace_end": "strings",
+    "replace_start": "strings",
+    "separator_case": "strings",
+    "series_phrase": "strings",
+    "series_phrase_serial": "strings",
+    "slugify": "strings",
+    "snake_case": "strings",
+    "split": "strings",
+    "start_case": "strings",
+    "starts_with": "strings",
+    "strip_tags": "strings",
+    "substr_left": "strings",
+    "substr_left_end": "strings",
+    "substr_right": "strings",
+    "substr_right_end": "strings",
+    "successor": "strings",
+    "surround": "strings",
+    "swap_case": "strings",
+    "title_case": "strings",
+    "to_lower": "strings",
+    "to_upper": "strings",
+    "trim": "strings",
+    "trim_end": "strings",
+    "trim_start": "strings",
+    "truncate": "strings",
+    "unescape": "strings",
+    "unquote": "strings",
+    "upper_case": "strings",
+    "upper_first": "strings",
+    "url": "strings",
+    "words": "strings",
+    "Table": "tables",
+    "attempt": "utilities",
+    "compile_matcher": "utilities",
+    "cond": "utilities",
+    "conforms": "utilities",
+    "conforms_to": "utilities",
+    "constant": "utilities",
+    "deep_hash": "utilities",
+    "default_to": "utilities",
+    "default_to_any": "utilities",
+    "identity": "utilities",
+    "iteratee": "utilities",
+    "matches": "utilities",
+    "matches_property": "utilities",
+    "memoize": "utilities",
+    "method": "utilities",
+    "method_of": "utilities",
+    "noop": "utilities",
+    "now": "utilities",
+    "nth_arg": "utilities",
+    "over": "utilities",
+    "over_every": "utilities",
+    "over_some": "utilities",
+    "properties": "utilities",
+    "property_": "utilities",
+    "property_of": "utilities",
+    "random": "utilities",
+    "range_": "utilities",
+    "range_right": "utilities",
+    "register_getter": "utilities",
+    "register_setter": "utilities",
+    "result": "utilities",
+    "retry": "utilities",
+    "stub_dict": "utilities",
+    "stub_false": "utilities",
+    "stub_list": "utilities",
+    "stub_string": "utilities",
+    "stub_true": "utilities",
+    "times": "utilities",
+    "to_path": "utilities",
+    "unique_id": "utilities",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        value = getattr(module, name)
+    elif name in ("py_", "_"):
+        value = __getattr__("_Dash")()
+        globals()["py_"] = globals()["_"] = value
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache the resolved attribute so that subsequent lookups bypass this function.
+    globals()[name] = value
+    return value
+
 
-py_ = _Dash()
-_ = py_
+def __dir__() -> t.List[str]:
+    return sorted({"__version__", "py_", "_", *_LAZY_ATTRS, *_SUBMODULES})
 
 
 __all__ = (
@@ -479,6 +959,7 @@ __all__ = (
     "for_each_right",
     "group_by",
     "includes",
+    "index_by",
     "invoke_map",
     "key_by",
     "map_",
@@ -522,11 +1003,13 @@ __all__ = (
     "throttle",
     "unary",
     "wrap",
+    "Index",
     "add",
     "ceil",
     "clamp",
     "divide",
     "floor",
+    "itermoving_mean",
     "max_",
     "max_by",
     "mean",
@@ -534,12 +1017,23 @@ __all__ = (
     "median",
     "min_",
     "min_by",
+    "min_max_by",
+    "moving_max",
     "moving_mean",
+    "moving_median",
+    "moving_min",
+    "moving_std",
+    "moving_sum",
     "multiply",
+    "percentile",
     "power",
+    "quantile",
+    "QuantileSketch",
     "round_",
+    "RunningStats",
     "scale",
     "slope",
+    "stats_by",
     "std_deviation",
     "subtract",
     "sum_",
@@ -560,28 +1054,37 @@ __all__ = (
     "clone_with",
     "defaults",
     "defaults_deep",
+    "diff",
     "find_key",
     "find_last_key",
+    "flatten_keys",
     "for_in",
     "for_in_right",
     "get",
+    "get_many",
     "has",
     "invert",
     "invert_by",
     "invoke",
+    "iterflatten_keys",
+    "iterwalk",
     "keys",
     "map_keys",
     "map_values",
     "map_values_deep",
     "merge",
+    "merge_in",
     "merge_with",
     "omit",
     "omit_by",
     "parse_int",
+    "patch",
     "pick",
     "pick_by",
     "rename_keys",
     "set_",
+    "set_in",
+    "set_many",
     "set_with",
     "to_boolean",
     "to_dict",
@@ -591,10 +1094,14 @@ __all__ = (
     "to_pairs",
     "to_string",
     "transform",
+    "unflatten_keys",
     "unset",
+    "unset_in",
     "update",
+    "update_in",
     "update_with",
     "values",
+    "walk",
     "eq",
     "eq_cmp",
     "gt",
@@ -717,11 +1224,14 @@ __all__ = (
     "upper_first",
     "url",
     "words",
+    "Table",
     "attempt",
+    "compile_matcher",
     "cond",
     "conforms",
     "conforms_to",
     "constant",
+    "deep_hash",
     "default_to",
     "default_to_any",
     "identity",
@@ -743,6 +1253,8 @@ __all__ = (
     "random",
     "range_",
     "range_right",
+    "register_getter",
+    "register_setter",
     "result",
     "retry",
     "stub_dict",
@@ -13,7 +13,7 @@ import typing as t
 
 import pydash as pyd
 
-from .helpers import base_get, iteriteratee, parse_iteratee
+from .helpers import DeepSet, base_get, iteriteratee, parse_iteratee
 from .types import IterateeObjT
 
 
@@ -680,6 +680,9 @@ def flatten_deep(array: t.Iterable[t.Any]) -> t.List[t.Any]:
         [1, 2, 3, 4]
 
     .. versionadded:: 2.0.0
+
+    .. versionchanged:: 8.1.0
+        Flatten without recursion and raise ``ValueError`` for a list that references itself.
     """
     return flatten_depth(array, depth=-1)
 
@@ -2464,7 +2467,8 @@ def without(array: t.Iterable[T], *values: T) -> t.List[T]:
 
     .. versionadded:: 1.0.0
     """
-    return [item for item in array if item not in values]
+    excluded = DeepSet(values)
+    return [item for item in array if item not in excluded]
 
 
 def xor(array: t.Iterable[T], *lists: t.Iterable[T]) -> t.List[T]:
@@ -2724,6 +2728,9 @@ def zip_object_deep(
         True
 
     .. versionadded:: 4.0.0
+
+    .. versionchanged:: 8.1.0
+        Set all values with :func:`pydash.objects.set_many`.
     """
     if values is None:
         keys_values = unzip(keys)
@@ -2732,11 +2739,13 @@ def zip_object_deep(
         else:
             keys, values = keys_values
 
-    obj: t.Dict[t.Any, t.Any] = {}
-    for idx, key in enumerate(keys):
-        obj = pyd.set_(obj, key, pyd.get(values, idx))
+    keys = list(keys)
+    values = list(values)
+    # Keys without a corresponding value are set to None.
+    values.extend([None] * (len(keys) - len(values)))
 
-    return obj
+    obj: t.Dict[t.Any, t.Any] = {}
+    return pyd.set_many(obj, zip(keys, values))
 
 
 @t.overload
@@ -2816,13 +2825,34 @@ def zip_with(*arrays, **kwargs):
 
 
 def iterflatten(array, depth=-1):
-    """Iteratively flatten a list shallowly or deeply."""
-    for item in array:
-        if isinstance(item, (list, tuple)) and depth != 0:
-            for subitem in iterflatten(item, depth - 1):
-                yield subitem
-        else:
+    """Iteratively flatten a list shallowly or deeply with a stack of iterators instead of
+    recursion."""
+    # A list that references itself is nested infinitely deep so reference cycles are only looked
+    # for whenever the stack grows to twice the depth it was last checked at.
+    check_depth = 1024
+    current = array
+    items = iter(array)
+    stack = []
+
+    while True:
+        for item in items:
+            if isinstance(item, (list, tuple)) and len(stack) != depth:
+                stack.append((current, items))
+                current, items = item, iter(item)
+
+                if len(stack) == check_depth:
+                    check_depth *= 2
+
+                    if any(parent is item for parent, _ in stack):
+                        raise ValueError("Unable to flatten list that references itself")
+                break
+
             yield item
+        else:
+            if not stack:
+                return
+
+            current, items = stack.pop()
 
 
 def iterinterleave(*arrays):
@@ -2850,7 +2880,7 @@ def iterintersperse(iterable, separator):
         yield item
 
 
-def iterunique(array, comparator=None, iteratee=None):  # noqa: PLR0912
+def iterunique(array, comparator=None, iteratee=None):
     """Yield each unique item in array."""
     if not array:  # pragma: no cover
         return
@@ -2858,7 +2888,10 @@ def iterunique(array, comparator=None, iteratee=None):  # noqa: PLR0912
     if iteratee is not None:
         iteratee = pyd.iteratee(iteratee)
 
-    seen_hashable = set()
+    if comparator is pyd.is_equal:
+        comparator = None
+
+    seen = DeepSet()
     seen_unhashable = []
 
     for item in array:
@@ -2868,14 +2901,8 @@ def iterunique(array, comparator=None, iteratee=None):  # noqa: PLR0912
             cmp_item = iteratee(item)
 
         if comparator is None:
-            try:
-                if cmp_item not in seen_hashable:
-                    yield item
-                    seen_hashable.add(cmp_item)
-            except TypeError:
-                if cmp_item not in seen_unhashable:
-                    yield item
-                    seen_unhashable.append(cmp_item)
+            if seen.add(cmp_item):
+                yield item
         else:
             unseen = True
             for seen_item in seen_unhashable:
@@ -2889,12 +2916,10 @@ def iterunique(array, comparator=None, iteratee=None):  # noqa: PLR0912
 
 def iterduplicates(array):
     """Yield duplictes found in `array`."""
-    seen = []
+    seen = DeepSet()
     for i, item in enumerate(array):
-        if item in seen:
+        if not seen.add(item):
             yield i, item
-        else:
-            seen.append(item)
 
 
 def iterintersection(array, other, comparator=None, iteratee=None):
@@ -2903,11 +2928,20 @@ def iterintersection(array, other, comparator=None, iteratee=None):
     if not array or not other:  # pragma: no cover
         return
 
-    if comparator is None:
-        comparator = pyd.is_equal
-
     iteratee = pyd.iteratee(iteratee)
 
+    if comparator is None or comparator is pyd.is_equal:
+        # Equal values can be looked up by hash instead of comparing against every value.
+        others = DeepSet(iteratee(value) for value in other)
+        seen = DeepSet()
+
+        for item in array:
+            cmp_item = iteratee(item)
+            if seen.add(cmp_item) and cmp_item in others:
+                yield item
+
+        return
+
     # NOTE: Maintain ordering of yielded values based on `array` ordering.
     seen = []
     for item in array:
@@ -2938,11 +2972,18 @@ def iterdifference(array, other, comparator=None, iteratee=None):
     if not array or not other:  # pragma: no cover
         return
 
-    if comparator is None:
-        comparator = pyd.is_equal
-
     iteratee = pyd.iteratee(iteratee)
 
+    if comparator is None or comparator is pyd.is_equal:
+        # Equal values can be looked up by hash instead of comparing against every value.
+        others = DeepSet(iteratee(value) for value in other)
+
+        for item in array:
+            if iteratee(item) not in others:
+                yield item
+
+        return
+
     def is_different(item, seen):
         is_diff = True
 
@@ -45,6 +45,8 @@ from pydash.functions import (
     Throttle,
 )
 from pydash.helpers import UNSET, Unset
+from pydash.indexes import Index
+from pydash.tables import Table
 from pydash.types import *
 from pydash.utilities import MemoizedFunc
 
@@ -756,6 +758,11 @@ class AllFuncs:
     ) -> "Chain[bool]":
         return self._wrap(pyd.every)(predicate)
 
+    @t.overload
+    def filter_(
+        self: "Chain[Table]",
+        predicate: t.Union[t.Callable[[t.Dict[t.Any, t.Any]], t.Any], IterateeObjT, None] = None,
+    ) -> "Chain[Table]": ...
     @t.overload
     def filter_(
         self: "Chain[t.Mapping[T, T2]]",
@@ -791,6 +798,11 @@ class AllFuncs:
 
     filter = filter_
 
+    @t.overload
+    def find(
+        self: "Chain[Index[T]]",
+        predicate: t.Union[t.Callable[[T], t.Any], IterateeObjT, None] = None,
+    ) -> "Chain[t.Union[T, None]]": ...
     @t.overload
     def find(
         self: "Chain[t.Dict[T, T2]]",
@@ -1053,6 +1065,11 @@ class AllFuncs:
     def for_each_right(self, iteratee):
         return self._wrap(pyd.for_each_right)(iteratee)
 
+    @t.overload
+    def group_by(
+        self: "Chain[Table]",
+        iteratee: t.Union[t.Callable[[t.Dict[t.Any, t.Any]], t.Any], IterateeObjT, None] = None,
+    ) -> "Chain[t.Dict[t.Any, Table]]": ...
     @t.overload
     def group_by(
         self: "Chain[t.Iterable[T]]", iteratee: t.Callable[[T], T2]
@@ -1071,6 +1088,9 @@ class AllFuncs:
     ) -> "Chain[bool]":
         return self._wrap(pyd.includes)(target, from_index)
 
+    def index_by(self: "Chain[t.Iterable[T]]", *keys: t.Any) -> "Chain[Index[T]]":
+        return self._wrap(pyd.index_by)(*keys)
+
     def invoke_map(
         self: "Chain[t.Iterable[t.Any]]", path: PathT, *args: t.Any, **kwargs: t.Any
     ) -> "Chain[t.List[t.Any]]":
@@ -1123,6 +1143,13 @@ class AllFuncs:
     def nest(self: "Chain[t.Iterable[t.Any]]", *properties: t.Any) -> "Chain[t.Any]":
         return self._wrap(pyd.nest)(*properties)
 
+    @t.overload
+    def order_by(
+        self: "Chain[Table]",
+        keys: t.Iterable[t.Union[str, int]],
+        orders: t.Union[t.Iterable[bool], bool, None] = None,
+        reverse: bool = False,
+    ) -> "Chain[Table]": ...
     @t.overload
     def order_by(
         self: "Chain[t.Mapping[t.Any, T2]]",
@@ -1776,14 +1803,25 @@ class AllFuncs:
         return self._wrap(pyd.add)(b)
 
     @t.overload
-    def sum_(self: "Chain[t.Mapping[t.Any, 'SupportsAdd[int, T]']]") -> "Chain[T]": ...
+    def sum_(
+        self: "Chain[t.Mapping[t.Any, 'SupportsAdd[int, T]']]",
+        *,
+        backend: t.Optional[BackendT] = None,
+    ) -> "Chain[T]": ...
     @t.overload
-    def sum_(self: "Chain[t.Iterable['SupportsAdd[int, T]']]") -> "Chain[T]": ...
-    def sum_(self):
-        return self._wrap(pyd.sum_)()
+    def sum_(
+        self: "Chain[t.Iterable['SupportsAdd[int, T]']]", *, backend: t.Optional[BackendT] = None
+    ) -> "Chain[T]": ...
+    def sum_(self, *, backend=None):
+        return self._wrap(pyd.sum_)(backend=backend)
 
     sum = sum_
 
+    @t.overload
+    def sum_by(
+        self: "Chain[Table]",
+        iteratee: t.Union[t.Callable[[t.Dict[t.Any, t.Any]], t.Any], IterateeObjT],
+    ) -> "Chain[t.Any]": ...
     @t.overload
     def sum_by(
         self: "Chain[t.Mapping[T, T2]]",
@@ -1822,12 +1860,25 @@ class AllFuncs:
         return self._wrap(pyd.sum_by)(iteratee)
 
     @t.overload
-    def mean(self: "Chain[t.Mapping[t.Any, 'SupportsAdd[int, t.Any]']]") -> "Chain[float]": ...
+    def mean(
+        self: "Chain[t.Mapping[t.Any, 'SupportsAdd[int, t.Any]']]",
+        *,
+        backend: t.Optional[BackendT] = None,
+    ) -> "Chain[float]": ...
     @t.overload
-    def mean(self: "Chain[t.Iterable['SupportsAdd[int, t.Any]']]") -> "Chain[float]": ...
-    def mean(self):
-        return self._wrap(pyd.mean)()
+    def mean(
+        self: "Chain[t.Iterable['SupportsAdd[int, t.Any]']]",
+        *,
+        backend: t.Optional[BackendT] = None,
+    ) -> "Chain[float]": ...
+    def mean(self, *, backend=None):
+        return self._wrap(pyd.mean)(backend=backend)
 
+    @t.overload
+    def mean_by(
+        self: "Chain[Table]",
+        iteratee: t.Union[t.Callable[[t.Dict[t.Any, t.Any]], t.Any], IterateeObjT],
+    ) -> "Chain[float]": ...
     @t.overload
     def mean_by(
         self: "Chain[t.Mapping[T, T2]]",
@@ -1869,9 +1920,13 @@ class AllFuncs:
         return self._wrap(pyd.ceil)(precision)
 
     def clamp(
-        self: "Chain[NumT]", lower: NumT2, upper: t.Union[NumT3, None] = None
+        self: "Chain[NumT]",
+        lower: NumT2,
+        upper: t.Union[NumT3, None] = None,
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.Union[NumT, NumT2, NumT3]]":
-        return self._wrap(pyd.clamp)(lower, upper)
+        return self._wrap(pyd.clamp)(lower, upper, backend=backend)
 
     def divide(
         self: "Chain[t.Union[NumberT, None]]", divisor: t.Union[NumberT, None]
@@ -1964,34 +2019,55 @@ class AllFuncs:
 
     @t.overload
     def median(
-        self: "Chain[t.Mapping[T, T2]]", iteratee: t.Callable[[T2, T, t.Dict[T, T2]], NumberT]
+        self: "Chain[t.Mapping[T, T2]]",
+        iteratee: t.Callable[[T2, T, t.Dict[T, T2]], NumberT],
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.Union[float, int]]": ...
     @t.overload
     def median(
-        self: "Chain[t.Mapping[T, T2]]", iteratee: t.Callable[[T2, T], NumberT]
+        self: "Chain[t.Mapping[T, T2]]",
+        iteratee: t.Callable[[T2, T], NumberT],
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.Union[float, int]]": ...
     @t.overload
     def median(
-        self: "Chain[t.Mapping[t.Any, T2]]", iteratee: t.Callable[[T2], NumberT]
+        self: "Chain[t.Mapping[t.Any, T2]]",
+        iteratee: t.Callable[[T2], NumberT],
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.Union[float, int]]": ...
     @t.overload
     def median(
-        self: "Chain[t.Iterable[T]]", iteratee: t.Callable[[T, int, t.List[T]], NumberT]
+        self: "Chain[t.Iterable[T]]",
+        iteratee: t.Callable[[T, int, t.List[T]], NumberT],
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.Union[float, int]]": ...
     @t.overload
     def median(
-        self: "Chain[t.Iterable[T]]", iteratee: t.Callable[[T, int], NumberT]
+        self: "Chain[t.Iterable[T]]",
+        iteratee: t.Callable[[T, int], NumberT],
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.Union[float, int]]": ...
     @t.overload
     def median(
-        self: "Chain[t.Iterable[T]]", iteratee: t.Callable[[T], NumberT]
+        self: "Chain[t.Iterable[T]]",
+        iteratee: t.Callable[[T], NumberT],
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.Union[float, int]]": ...
     @t.overload
     def median(
-        self: "Chain[t.Iterable[NumberT]]", iteratee: None = None
+        self: "Chain[t.Iterable[NumberT]]",
+        iteratee: None = None,
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.Union[float, int]]": ...
-    def median(self, iteratee=None):
-        return self._wrap(pyd.median)(iteratee)
+    def median(self, iteratee=None, *, backend=None):
+        return self._wrap(pyd.median)(iteratee, backend=backend)
 
     @t.overload
     def min_(
@@ -2074,10 +2150,78 @@ class AllFuncs:
     def min_by(self, iteratee=None, default=UNSET):
         return self._wrap(pyd.min_by)(iteratee, default)
 
+    @t.overload
+    def min_max_by(
+        self: "Chain[t.Mapping[t.Any, 'SupportsRichComparisonT']]",
+        iteratee: None = None,
+        default: Unset = UNSET,
+    ) -> "Chain[t.Tuple['SupportsRichComparisonT', 'SupportsRichComparisonT']]": ...
+    @t.overload
+    def min_max_by(
+        self: "Chain[t.Mapping[t.Any, T2]]",
+        iteratee: t.Callable[[T2], "SupportsRichComparisonT"],
+        default: Unset = UNSET,
+    ) -> "Chain[t.Tuple[T2, T2]]": ...
+    @t.overload
+    def min_max_by(
+        self: "Chain[t.Iterable['SupportsRichComparisonT']]",
+        iteratee: None = None,
+        default: Unset = UNSET,
+    ) -> "Chain[t.Tuple['SupportsRichComparisonT', 'SupportsRichComparisonT']]": ...
+    @t.overload
+    def min_max_by(
+        self: "Chain[t.Iterable[T2]]",
+        iteratee: t.Callable[[T2], "SupportsRichComparisonT"],
+        default: Unset = UNSET,
+    ) -> "Chain[t.Tuple[T2, T2]]": ...
+    @t.overload
+    def min_max_by(
+        self: "Chain[t.Iterable[T]]", iteratee: IterateeObjT, default: Unset = UNSET
+    ) -> "Chain[t.Tuple[T, T]]": ...
+    @t.overload
+    def min_max_by(
+        self: "Chain[t.Iterable[T]]", iteratee: t.Any = None, *, default: T2
+    ) -> "Chain[t.Tuple[t.Union[T, T2], t.Union[T, T2]]]": ...
+    def min_max_by(self, iteratee=None, default=UNSET):
+        return self._wrap(pyd.min_max_by)(iteratee, default)
+
+    def moving_max(
+        self: "Chain[t.Iterable['SupportsRichComparisonT']]", size: t.SupportsInt
+    ) -> "Chain[t.Generator['SupportsRichComparisonT', None, None]]":
+        return self._wrap(pyd.moving_max)(size)
+
     def moving_mean(
-        self: "Chain[t.Sequence['SupportsAdd[int, t.Any]']]", size: t.SupportsInt
+        self: "Chain[t.Iterable['SupportsAdd[int, t.Any]']]",
+        size: t.SupportsInt,
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.List[float]]":
-        return self._wrap(pyd.moving_mean)(size)
+        return self._wrap(pyd.moving_mean)(size, backend=backend)
+
+    def itermoving_mean(
+        self: "Chain[t.Iterable['SupportsAdd[int, t.Any]']]", size: t.SupportsInt
+    ) -> "Chain[t.Generator[float, None, None]]":
+        return self._wrap(pyd.itermoving_mean)(size)
+
+    def moving_median(
+        self: "Chain[t.Iterable[NumberT]]", size: t.SupportsInt
+    ) -> "Chain[t.Generator[t.Union[float, int], None, None]]":
+        return self._wrap(pyd.moving_median)(size)
+
+    def moving_min(
+        self: "Chain[t.Iterable['SupportsRichComparisonT']]", size: t.SupportsInt
+    ) -> "Chain[t.Generator['SupportsRichComparisonT', None, None]]":
+        return self._wrap(pyd.moving_min)(size)
+
+    def moving_std(
+        self: "Chain[t.Iterable[NumberT]]", size: t.SupportsInt
+    ) -> "Chain[t.Generator[float, None, None]]":
+        return self._wrap(pyd.moving_std)(size)
+
+    def moving_sum(
+        self: "Chain[t.Iterable['SupportsAdd[int, T]']]", size: t.SupportsInt
+    ) -> "Chain[t.Generator[T, None, None]]":
+        return self._wrap(pyd.moving_sum)(size)
 
     @t.overload
     def multiply(self: "Chain[SupportsMul[int, T2]]", multiplicand: None) -> "Chain[T2]": ...
@@ -2092,6 +2236,37 @@ class AllFuncs:
     def multiply(self, multiplicand):
         return self._wrap(pyd.multiply)(multiplicand)
 
+    @t.overload
+    def percentile(
+        self: "Chain[t.Mapping[t.Any, NumberT]]", ps: NumberT, iteratee: None = None
+    ) -> "Chain[t.Union[float, int]]": ...
+    @t.overload
+    def percentile(
+        self: "Chain[t.Iterable[NumberT]]", ps: NumberT, iteratee: None = None
+    ) -> "Chain[t.Union[float, int]]": ...
+    @t.overload
+    def percentile(
+        self: "Chain[t.Mapping[t.Any, NumberT]]", ps: t.Iterable[NumberT], iteratee: None = None
+    ) -> "Chain[t.List[t.Union[float, int]]]": ...
+    @t.overload
+    def percentile(
+        self: "Chain[t.Iterable[NumberT]]", ps: t.Iterable[NumberT], iteratee: None = None
+    ) -> "Chain[t.List[t.Union[float, int]]]": ...
+    @t.overload
+    def percentile(
+        self: "Chain[t.Iterable[t.Any]]",
+        ps: NumberT,
+        iteratee: t.Union[t.Callable[..., NumberT], IterateeObjT],
+    ) -> "Chain[t.Union[float, int]]": ...
+    @t.overload
+    def percentile(
+        self: "Chain[t.Iterable[t.Any]]",
+        ps: t.Iterable[NumberT],
+        iteratee: t.Union[t.Callable[..., NumberT], IterateeObjT],
+    ) -> "Chain[t.List[t.Union[float, int]]]": ...
+    def percentile(self, ps, iteratee=None):
+        return self._wrap(pyd.percentile)(ps, iteratee)
+
     @t.overload
     def power(self: "Chain[int]", n: int) -> "Chain[t.Union[int, float]]": ...
     @t.overload
@@ -2105,29 +2280,79 @@ class AllFuncs:
     def power(self, n):
         return self._wrap(pyd.power)(n)
 
+    @t.overload
+    def quantile(
+        self: "Chain[t.Mapping[t.Any, NumberT]]", qs: NumberT, iteratee: None = None
+    ) -> "Chain[t.Union[float, int]]": ...
+    @t.overload
+    def quantile(
+        self: "Chain[t.Iterable[NumberT]]", qs: NumberT, iteratee: None = None
+    ) -> "Chain[t.Union[float, int]]": ...
+    @t.overload
+    def quantile(
+        self: "Chain[t.Mapping[t.Any, NumberT]]", qs: t.Iterable[NumberT], iteratee: None = None
+    ) -> "Chain[t.List[t.Union[float, int]]]": ...
+    @t.overload
+    def quantile(
+        self: "Chain[t.Iterable[NumberT]]", qs: t.Iterable[NumberT], iteratee: None = None
+    ) -> "Chain[t.List[t.Union[float, int]]]": ...
+    @t.overload
+    def quantile(
+        self: "Chain[t.Iterable[t.Any]]",
+        qs: NumberT,
+        iteratee: t.Union[t.Callable[..., NumberT], IterateeObjT],
+    ) -> "Chain[t.Union[float, int]]": ...
+    @t.overload
+    def quantile(
+        self: "Chain[t.Iterable[t.Any]]",
+        qs: t.Iterable[NumberT],
+        iteratee: t.Union[t.Callable[..., NumberT], IterateeObjT],
+    ) -> "Chain[t.List[t.Union[float, int]]]": ...
+    def quantile(self, qs, iteratee=None):
+        return self._wrap(pyd.quantile)(qs, iteratee)
+
     @t.overload
     def round_(
-        self: "Chain[t.List[SupportsRound[NumberT]]]", precision: int = 0
+        self: "Chain[t.List[SupportsRound[NumberT]]]",
+        precision: int = 0,
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.List[float]]": ...
     @t.overload
-    def round_(self: "Chain[SupportsRound[NumberT]]", precision: int = 0) -> "Chain[float]": ...
-    def round_(self, precision=0):
-        return self._wrap(pyd.round_)(precision)
+    def round_(
+        self: "Chain[SupportsRound[NumberT]]",
+        precision: int = 0,
+        *,
+        backend: t.Optional[BackendT] = None,
+    ) -> "Chain[float]": ...
+    def round_(self, precision=0, *, backend=None):
+        return self._wrap(pyd.round_)(precision, backend=backend)
 
     round = round_
 
     @t.overload
     def scale(
-        self: "Chain[t.Iterable['Decimal']]", maximum: "Decimal"
+        self: "Chain[t.Iterable['Decimal']]",
+        maximum: "Decimal",
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.List['Decimal']]": ...
     @t.overload
     def scale(
-        self: "Chain[t.Iterable[NumberNoDecimalT]]", maximum: NumberNoDecimalT
+        self: "Chain[t.Iterable[NumberNoDecimalT]]",
+        maximum: NumberNoDecimalT,
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.List[float]]": ...
     @t.overload
-    def scale(self: "Chain[t.Iterable[NumberT]]", maximum: int = 1) -> "Chain[t.List[float]]": ...
-    def scale(self, maximum: NumberT = 1):
-        return self._wrap(pyd.scale)(maximum)
+    def scale(
+        self: "Chain[t.Iterable[NumberT]]",
+        maximum: int = 1,
+        *,
+        backend: t.Optional[BackendT] = None,
+    ) -> "Chain[t.List[float]]": ...
+    def scale(self, maximum: NumberT = 1, *, backend=None):
+        return self._wrap(pyd.scale)(maximum, backend=backend)
 
     @t.overload
     def slope(
@@ -2142,8 +2367,18 @@ class AllFuncs:
     def slope(self, point2):
         return self._wrap(pyd.slope)(point2)
 
-    def std_deviation(self: "Chain[t.List[NumberT]]") -> "Chain[float]":
-        return self._wrap(pyd.std_deviation)()
+    def stats_by(
+        self: "Chain[t.Iterable[t.Any]]",
+        iteratee: t.Union[t.Callable[..., NumberT], IterateeObjT, None] = None,
+        *,
+        fsum: bool = False,
+    ) -> "Chain[t.Dict[str, t.Any]]":
+        return self._wrap(pyd.stats_by)(iteratee, fsum=fsum)
+
+    def std_deviation(
+        self: "Chain[t.Iterable[NumberT]]", ddof: int = 0, *, backend: t.Optional[BackendT] = None
+    ) -> "Chain[float]":
+        return self._wrap(pyd.std_deviation)(ddof, backend=backend)
 
     @t.overload
     def subtract(self: "Chain['SupportsSub[T, T2]']", subtrahend: T) -> "Chain[T2]": ...
@@ -2152,46 +2387,102 @@ class AllFuncs:
     def subtract(self, subtrahend):
         return self._wrap(pyd.subtract)(subtrahend)
 
-    def transpose(self: "Chain[t.Iterable[t.Iterable[T]]]") -> "Chain[t.List[t.List[T]]]":
-        return self._wrap(pyd.transpose)()
+    @t.overload
+    def transpose(
+        self: "Chain[t.Iterable[t.Iterable[T]]]",
+        fill_value: t.Any = None,
+        *,
+        truncate: bool = False,
+        lazy: Literal[False] = False,
+        backend: t.Optional[BackendT] = None,
+    ) -> "Chain[t.List[t.List[T]]]": ...
+    @t.overload
+    def transpose(
+        self: "Chain[t.Iterable[t.Iterable[T]]]",
+        fill_value: t.Any = None,
+        *,
+        truncate: bool = False,
+        lazy: Literal[True],
+        backend: t.Optional[BackendT] = None,
+    ) -> "Chain[t.Generator[t.List[T], None, None]]": ...
+    def transpose(self, fill_value=None, *, truncate=False, lazy=False, backend=None):
+        return self._wrap(pyd.transpose)(fill_value, truncate=truncate, lazy=lazy, backend=backend)
 
     @t.overload
-    def variance(self: "Chain[t.Mapping[t.Any, 'SupportsAdd[int, t.Any]']]") -> "Chain[float]": ...
+    def variance(
+        self: "Chain[t.Mapping[t.Any, 'SupportsAdd[int, t.Any]']]",
+        ddof: int = 0,
+        *,
+        backend: t.Optional[BackendT] = None,
+    ) -> "Chain[float]": ...
     @t.overload
-    def variance(self: "Chain[t.Iterable['SupportsAdd[int, t.Any]']]") -> "Chain[float]": ...
-    def variance(self):
-        return self._wrap(pyd.variance)()
+    def variance(
+        self: "Chain[t.Iterable['SupportsAdd[int, t.Any]']]",
+        ddof: int = 0,
+        *,
+        backend: t.Optional[BackendT] = None,
+    ) -> "Chain[float]": ...
+    def variance(self, ddof=0, *, backend=None):
+        return self._wrap(pyd.variance)(ddof, backend=backend)
 
     @t.overload
     def zscore(
-        self: "Chain[t.Mapping[T, T2]]", iteratee: t.Callable[[T2, T, t.Dict[T, T2]], NumberT]
+        self: "Chain[t.Mapping[T, T2]]",
+        iteratee: t.Callable[[T2, T, t.Dict[T, T2]], NumberT],
+        ddof: int = 0,
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.List[float]]": ...
     @t.overload
     def zscore(
-        self: "Chain[t.Mapping[T, T2]]", iteratee: t.Callable[[T2, T], NumberT]
+        self: "Chain[t.Mapping[T, T2]]",
+        iteratee: t.Callable[[T2, T], NumberT],
+        ddof: int = 0,
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.List[float]]": ...
     @t.overload
     def zscore(
-        self: "Chain[t.Mapping[t.Any, T2]]", iteratee: t.Callable[[T2], NumberT]
+        self: "Chain[t.Mapping[t.Any, T2]]",
+        iteratee: t.Callable[[T2], NumberT],
+        ddof: int = 0,
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.List[float]]": ...
     @t.overload
     def zscore(
-        self: "Chain[t.Iterable[T]]", iteratee: t.Callable[[T, int, t.List[T]], NumberT]
+        self: "Chain[t.Iterable[T]]",
+        iteratee: t.Callable[[T, int, t.List[T]], NumberT],
+        ddof: int = 0,
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.List[float]]": ...
     @t.overload
     def zscore(
-        self: "Chain[t.Iterable[T]]", iteratee: t.Callable[[T, int], NumberT]
+        self: "Chain[t.Iterable[T]]",
+        iteratee: t.Callable[[T, int], NumberT],
+        ddof: int = 0,
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.List[float]]": ...
     @t.overload
     def zscore(
-        self: "Chain[t.Iterable[T]]", iteratee: t.Callable[[T], NumberT]
+        self: "Chain[t.Iterable[T]]",
+        iteratee: t.Callable[[T], NumberT],
+        ddof: int = 0,
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.List[float]]": ...
     @t.overload
     def zscore(
-        self: "Chain[t.Iterable[NumberT]]", iteratee: None = None
+        self: "Chain[t.Iterable[NumberT]]",
+        iteratee: None = None,
+        ddof: int = 0,
+        *,
+        backend: t.Optional[BackendT] = None,
     ) -> "Chain[t.List[float]]": ...
-    def zscore(self, iteratee=None):
-        return self._wrap(pyd.zscore)(iteratee)
+    def zscore(self, iteratee=None, ddof=0, *, backend=None):
+        return self._wrap(pyd.zscore)(iteratee, ddof, backend=backend)
 
     @t.overload
     def assign(
@@ -2326,9 +2617,14 @@ class AllFuncs:
         return self._wrap(pyd.defaults)(*sources)
 
     def defaults_deep(
-        self: "Chain[t.Dict[T, T2]]", *sources: t.Dict[T3, T4]
+        self: "Chain[t.Dict[T, T2]]", *sources: t.Dict[T3, T4], copy_values: bool = True
     ) -> "Chain[t.Dict[t.Union[T, T3], t.Union[T2, T4]]]":
-        return self._wrap(pyd.defaults_deep)(*sources)
+        return self._wrap(pyd.defaults_deep)(*sources, copy_values=copy_values)
+
+    def diff(
+        self: "Chain[t.Any]", new: t.Any, iteratee: t.Any = None
+    ) -> "Chain[t.List[t.Tuple[str, t.List[t.Any], t.Any]]]":
+        return self._wrap(pyd.diff)(new, iteratee)
 
     @t.overload
     def find_key(
@@ -2400,6 +2696,11 @@ class AllFuncs:
     def find_last_key(self, predicate=None):
         return self._wrap(pyd.find_last_key)(predicate)
 
+    def flatten_keys(
+        self: "Chain[t.Any]", sep: str = ".", list_style: str = "brackets"
+    ) -> "Chain[t.Dict[str, t.Any]]":
+        return self._wrap(pyd.flatten_keys)(sep, list_style)
+
     @t.overload
     def for_in(
         self: "Chain[t.Mapping[T, T2]]", iteratee: t.Callable[[T2, T, t.Dict[T, T2]], t.Any]
@@ -2477,6 +2778,17 @@ class AllFuncs:
     def get(self: "Chain[t.Any]", path: PathT, default: t.Any = None) -> "Chain[t.Any]":
         return self._wrap(pyd.get)(path, default)
 
+    @t.overload
+    def get_many(
+        self: "Chain[t.Any]", paths: t.Mapping[T, PathT], default: t.Any = None
+    ) -> "Chain[t.Dict[T, t.Any]]": ...
+    @t.overload
+    def get_many(
+        self: "Chain[t.Any]", paths: t.Iterable[PathT], default: t.Any = None
+    ) -> "Chain[t.List[t.Any]]": ...
+    def get_many(self, paths, default=None):
+        return self._wrap(pyd.get_many)(paths, default)
+
     def has(self: "Chain[t.Any]", path: PathT) -> "Chain[bool]":
         return self._wrap(pyd.has)(path)
 
@@ -2509,6 +2821,19 @@ class AllFuncs:
     def invoke(self: "Chain[t.Any]", path: PathT, *args: t.Any, **kwargs: t.Any) -> "Chain[t.Any]":
         return self._wrap(pyd.invoke)(path, *args, **kwargs)
 
+    def iterflatten_keys(
+        self: "Chain[t.Any]", sep: str = ".", list_style: str = "brackets"
+    ) -> "Chain[t.Iterator[t.Tuple[str, t.Any]]]":
+        return self._wrap(pyd.iterflatten_keys)(sep, list_style)
+
+    def iterwalk(
+        self: "Chain[t.Any]",
+        order: str = "pre",
+        prune: t.Union[t.Callable[..., t.Any], None] = None,
+        max_depth: t.Union[int, None] = None,
+    ) -> "Chain[t.Iterator[t.Tuple[t.List[t.Any], t.Any, t.Any]]]":
+        return self._wrap(pyd.iterwalk)(order, prune, max_depth)
+
     @t.overload
     def keys(self: "Chain[t.Iterable[T]]") -> "Chain[t.List[T]]": ...
     @t.overload
@@ -2582,8 +2907,13 @@ class AllFuncs:
         self: "Chain[t.Iterable[t.Any]]",
         iteratee: t.Union[t.Callable[..., t.Any], None] = None,
         property_path: t.Any = UNSET,
+        *,
+        in_place: bool = True,
+        paths: bool = True,
     ) -> "Chain[t.Any]":
-        return self._wrap(pyd.map_values_deep)(iteratee, property_path)
+        return self._wrap(pyd.map_values_deep)(
+            iteratee, property_path, in_place=in_place, paths=paths
+        )
 
     def apply(self: "Chain[T]", func: t.Callable[[T], T2]) -> "Chain[T2]":
         return self._wrap(pyd.apply)(func)
@@ -2617,14 +2947,25 @@ class AllFuncs:
 
     @t.overload
     def merge(
-        self: "Chain[t.Mapping[T, T2]]", *sources: t.Mapping[T3, T4]
+        self: "Chain[t.Mapping[T, T2]]", *sources: t.Mapping[T3, T4], copy_values: bool = True
     ) -> "Chain[t.Dict[t.Union[T, T3], t.Union[T2, T4]]]": ...
     @t.overload
     def merge(
+        self: "Chain[t.Sequence[T]]", *sources: t.Sequence[T2], copy_values: bool = True
+    ) -> "Chain[t.List[t.Union[T, T2]]]": ...
+    def merge(self, *sources, copy_values=True):
+        return self._wrap(pyd.merge)(*sources, copy_values=copy_values)
+
+    @t.overload
+    def merge_in(
+        self: "Chain[t.Mapping[T, T2]]", *sources: t.Mapping[T3, T4]
+    ) -> "Chain[t.Dict[t.Union[T, T3], t.Union[T2, T4]]]": ...
+    @t.overload
+    def merge_in(
         self: "Chain[t.Sequence[T]]", *sources: t.Sequence[T2]
     ) -> "Chain[t.List[t.Union[T, T2]]]": ...
-    def merge(self, *sources):
-        return self._wrap(pyd.merge)(*sources)
+    def merge_in(self, *sources):
+        return self._wrap(pyd.merge_in)(*sources)
 
     def merge_with(self: "Chain[t.Any]", *sources: t.Any, **kwargs: t.Any) -> "Chain[t.Any]":
         return self._wrap(pyd.merge_with)(*sources, **kwargs)
@@ -2672,6 +3013,9 @@ class AllFuncs:
     ) -> "Chain[t.Union[int, None]]":
         return self._wrap(pyd.parse_int)(radix)
 
+    def patch(self: "Chain[T]", changes: t.Iterable[t.Tuple[str, PathT, t.Any]]) -> "Chain[T]":
+        return self._wrap(pyd.patch)(changes)
+
     @t.overload
     def pick(self: "Chain[t.Mapping[T, T2]]", *properties: PathT) -> "Chain[t.Dict[T, T2]]": ...
     @t.overload
@@ -2722,6 +3066,15 @@ class AllFuncs:
 
     set = set_
 
+    def set_in(self: "Chain[T]", path: PathT, value: t.Any) -> "Chain[T]":
+        return self._wrap(pyd.set_in)(path, value)
+
+    def set_many(
+        self: "Chain[T]",
+        path_values: t.Union[t.Mapping[t.Any, t.Any], t.Iterable[t.Tuple[PathT, t.Any]]],
+    ) -> "Chain[T]":
+        return self._wrap(pyd.set_many)(path_values)
+
     def set_with(
         self: "Chain[T]",
         path: PathT,
@@ -2832,6 +3185,19 @@ class AllFuncs:
     def update(self, path, updater):
         return self._wrap(pyd.update)(path, updater)
 
+    @t.overload
+    def update_in(
+        self: "Chain[t.Dict[t.Any, T2]]", path: PathT, updater: t.Callable[[T2], t.Any]
+    ) -> "Chain[t.Dict[t.Any, t.Any]]": ...
+    @t.overload
+    def update_in(
+        self: "Chain[t.List[T]]", path: PathT, updater: t.Callable[[T], t.Any]
+    ) -> "Chain[t.List[t.Any]]": ...
+    @t.overload
+    def update_in(self: "Chain[T]", path: PathT, updater: t.Callable[..., t.Any]) -> "Chain[T]": ...
+    def update_in(self, path, updater):
+        return self._wrap(pyd.update_in)(path, updater)
+
     @t.overload
     def update_with(
         self: "Chain[t.Dict[t.Any, T2]]",
@@ -2856,11 +3222,20 @@ class AllFuncs:
     def update_with(self, path, updater, customizer=None):
         return self._wrap(pyd.update_with)(path, updater, customizer)
 
+    def unflatten_keys(
+        self: "Chain[t.Union[t.Mapping[str, t.Any], t.Iterable[t.Tuple[str, t.Any]]]]",
+        sep: str = ".",
+    ) -> "Chain[t.Dict[t.Any, t.Any]]":
+        return self._wrap(pyd.unflatten_keys)(sep)
+
     def unset(
         self: "Chain[t.Union[t.List[t.Any], t.Dict[t.Any, t.Any]]]", path: PathT
     ) -> "Chain[bool]":
         return self._wrap(pyd.unset)(path)
 
+    def unset_in(self: "Chain[T]", path: PathT) -> "Chain[T]":
+        return self._wrap(pyd.unset_in)(path)
+
     @t.overload
     def values(self: "Chain[t.Mapping[t.Any, T2]]") -> "Chain[t.List[T2]]": ...
     @t.overload
@@ -2870,6 +3245,15 @@ class AllFuncs:
     def values(self):
         return self._wrap(pyd.values)()
 
+    def walk(
+        self: "Chain[t.Any]",
+        visitor: t.Union[t.Callable[..., t.Any], None] = None,
+        order: str = "pre",
+        prune: t.Union[t.Callable[..., t.Any], None] = None,
+        max_depth: t.Union[int, None] = None,
+    ) -> "Chain[t.Any]":
+        return self._wrap(pyd.walk)(visitor, order, prune, max_depth)
+
     def eq(self: "Chain[t.Any]", other: t.Any) -> "Chain[bool]":
         return self._wrap(pyd.eq)(other)
 
@@ -3330,6 +3714,9 @@ class AllFuncs:
     ) -> "Chain[t.Union[T, Exception]]":
         return self._wrap(pyd.attempt)(*args, **kwargs)
 
+    def compile_matcher(self: "Chain[t.Any]") -> "Chain[t.Callable[[t.Any], bool]]":
+        return self._wrap(pyd.compile_matcher)()
+
     @t.overload
     def cond(
         self: "Chain[t.List[t.Tuple[t.Callable[P, t.Any], t.Callable[P, T]]]]",
@@ -3370,6 +3757,9 @@ class AllFuncs:
     def constant(self: "Chain[T]") -> "Chain[t.Callable[..., T]]":
         return self._wrap(pyd.constant)()
 
+    def deep_hash(self: "Chain[t.Any]") -> "Chain[int]":
+        return self._wrap(pyd.deep_hash)()
+
     def default_to(self: "Chain[t.Union[T, None]]", default_value: T2) -> "Chain[t.Union[T, T2]]":
         return self._wrap(pyd.default_to)(default_value)
 
@@ -3509,6 +3899,24 @@ class AllFuncs:
     def range_right(self, *args):
         return self._wrap(pyd.range_right)(*args)
 
+    @t.overload
+    def register_getter(
+        self: "Chain[type]", getter: None = None
+    ) -> "Chain[t.Callable[[CallableT], CallableT]]": ...
+    @t.overload
+    def register_getter(self: "Chain[type]", getter: CallableT) -> "Chain[CallableT]": ...
+    def register_getter(self, getter=None):
+        return self._wrap(pyd.register_getter)(getter)
+
+    @t.overload
+    def register_setter(
+        self: "Chain[type]", setter: None = None
+    ) -> "Chain[t.Callable[[CallableT], CallableT]]": ...
+    @t.overload
+    def register_setter(self: "Chain[type]", setter: CallableT) -> "Chain[CallableT]": ...
+    def register_setter(self, setter=None):
+        return self._wrap(pyd.register_setter)(setter)
+
     @t.overload
     def result(self: "Chain[None]", key: t.Any, default: None = None) -> "Chain[None]": ...
     @t.overload
@@ -13,6 +13,8 @@ import typing as t
 import pydash as pyd
 
 from .helpers import callit, cmp, getargcount, iterator, iteriteratee
+from .indexes import Index, select_candidates
+from .tables import Table, column_values, group_rows, mapped_column, select_rows, table_column
 from .types import IterateeObjT, PathT
 
 
@@ -30,6 +32,7 @@ __all__ = (
     "for_each_right",
     "group_by",
     "includes",
+    "index_by",
     "invoke_map",
     "key_by",
     "map_",
@@ -219,6 +222,13 @@ def every(
     return all(collection)
 
 
+@t.overload
+def filter_(  # type: ignore[overload-overlap]
+    collection: Table,
+    predicate: t.Union[t.Callable[[t.Dict[t.Any, t.Any]], t.Any], IterateeObjT, None] = None,
+) -> Table: ...
+
+
 @t.overload
 def filter_(
     collection: t.Mapping[T, T2],
@@ -284,10 +294,29 @@ def filter_(collection, predicate=None):
 
     .. versionchanged:: 4.0.0
         Removed alias ``select``.
+
+    .. versionchanged:: 8.1.0
+        Return a :class:`.Table` of the matching rows when `collection` is a table.
+
+    .. versionchanged:: 8.1.0
+        Only check the items of an :class:`.Index` that it selects for a dict `predicate`.
     """
+    if isinstance(collection, Table):
+        return collection.take(select_rows(collection, predicate))
+
+    if isinstance(collection, Index):
+        collection = select_candidates(collection, predicate)
+
     return [value for is_true, value, _, _ in iteriteratee(collection, predicate) if is_true]
 
 
+@t.overload
+def find(
+    collection: Index[T],
+    predicate: t.Union[t.Callable[[T], t.Any], IterateeObjT, None] = None,
+) -> t.Union[T, None]: ...
+
+
 @t.overload
 def find(
     collection: t.Dict[T, T2],
@@ -353,7 +382,13 @@ def find(collection, predicate=None):
 
     .. versionchanged:: 4.0.0
         Removed aliases ``detect`` and ``find_where``.
+
+    .. versionchanged:: 8.1.0
+        Only check the items of an :class:`.Index` that it selects for a dict `predicate`.
     """
+    if isinstance(collection, Index):
+        collection = select_candidates(collection, predicate)
+
     search = (value for is_true, value, _, _ in iteriteratee(collection, predicate) if is_true)
     return next(search, None)
 
@@ -813,6 +848,13 @@ def for_each_right(collection, iteratee):
     return collection
 
 
+@t.overload
+def group_by(  # type: ignore[overload-overlap]
+    collection: Table,
+    iteratee: t.Union[t.Callable[[t.Dict[t.Any, t.Any]], t.Any], IterateeObjT, None] = None,
+) -> t.Dict[t.Any, Table]: ...
+
+
 @t.overload
 def group_by(collection: t.Iterable[T], iteratee: t.Callable[[T], T2]) -> t.Dict[T2, t.List[T]]: ...
 
@@ -844,7 +886,16 @@ def group_by(collection, iteratee=None):
                                True: [{'a': 1, 'b': 2}]}
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 8.1.0
+        Group the rows of a :class:`.Table` into tables.
     """
+    if isinstance(collection, Table):
+        return {
+            key: collection.take(indexes)
+            for key, indexes in group_rows(collection, iteratee).items()
+        }
+
     ret = {}
     cbk = pyd.iteratee(iteratee)
 
@@ -896,6 +947,36 @@ def includes(
     return target in collection_values
 
 
+def index_by(collection: t.Iterable[T], *keys: t.Any) -> Index[T]:
+    """
+    Creates an :class:`.Index` of the elements of `collection` by each of `keys` that looks up the
+    elements with a given value of a key without iterating over the collection. Passing the index to
+    :func:`filter_` or :func:`find` with a dict predicate of an indexed key only checks the elements
+    with the predicate's value of the key.
+
+    Args:
+        collection: Collection to index.
+        keys: Hashable property paths of the elements to index.
+
+    Returns:
+        Index of the elements of `collection`.
+
+    Example:
+
+        >>> rows = [{"id": 1, "org": "x"}, {"id": 2, "org": "y"}, {"id": 3, "org": "x"}]
+        >>> index = index_by(rows, "id", "org")
+        >>> index.lookup("id", 2)
+        [{'id': 2, 'org': 'y'}]
+        >>> filter_(index, {"org": "x"})
+        [{'id': 1, 'org': 'x'}, {'id': 3, 'org': 'x'}]
+        >>> index.between("id", 2)
+        [{'id': 2, 'org': 'y'}, {'id': 3, 'org': 'x'}]
+
+    .. versionadded:: 8.1.0
+    """
+    return Index(keys, collection)
+
+
 def invoke_map(
     collection: t.Iterable[t.Any], path: PathT, *args: t.Any, **kwargs: t.Any
 ) -> t.List[t.Any]:
@@ -958,7 +1039,13 @@ def key_by(collection, iteratee=None):
 
     .. versionchanged:: 4.0.0
         Renamed from ``index_by`` to ``key_by``.
+
+    .. versionchanged:: 8.1.0
+        Read the keys of a :class:`.Table` from its column when `iteratee` is a column name.
     """
+    if isinstance(collection, Table):
+        return dict(zip(mapped_column(collection, iteratee), collection))
+
     ret = {}
     cbk = pyd.iteratee(iteratee)
 
@@ -1081,6 +1168,15 @@ def nest(collection: t.Iterable[t.Any], *properties: t.Any) -> t.Any:
     return pyd.map_values(group_by(collection, first), lambda value: nest(value, *rest))
 
 
+@t.overload
+def order_by(  # type: ignore[overload-overlap]
+    collection: Table,
+    keys: t.Iterable[t.Union[str, int]],
+    orders: t.Union[t.Iterable[bool], bool, None] = None,
+    reverse: bool = False,
+) -> Table: ...
+
+
 @t.overload
 def order_by(
     collection: t.Mapping[t.Any, T2],
@@ -1167,6 +1263,9 @@ def order_by(collection, keys, orders=None, reverse=False):
     .. versionchanged:: 4.0.0
         Renamed from ``order_by`` to ``order_by`` and removed alias
         ``sort_by_order``.
+
+    .. versionchanged:: 8.1.0
+        Return a :class:`.Table` of the sorted rows when `collection` is a table.
     """
     if isinstance(collection, dict):
         collection = collection.values()
@@ -1185,7 +1284,7 @@ def order_by(collection, keys, orders=None, reverse=False):
             else:
                 order = 1
 
-            comparers.append((pyd.property_(key), order))
+            comparers.append((key, order))
     else:
         for key in keys:
             if key.startswith("-"):
@@ -1194,7 +1293,16 @@ def order_by(collection, keys, orders=None, reverse=False):
             else:
                 order = 1
 
-            comparers.append((pyd.property_(key), order))
+            comparers.append((key, order))
+
+    if isinstance(collection, Table):
+        # Compare row indexes by the values of each key so that no row is created to be sorted.
+        table = collection
+        collection = range(len(table))
+        comparers = [(mapped_column(table, key).__getitem__, order) for key, order in comparers]
+    else:
+        table = None
+        comparers = [(pyd.property_(key), order) for key, order in comparers]
 
     def comparison(left, right):
         # pylint: disable=useless-else-on-loop,missing-docstring
@@ -1204,7 +1312,9 @@ def order_by(collection, keys, orders=None, reverse=False):
                 return mult * result
         return 0
 
-    return sorted(collection, key=cmp_to_key(comparison), reverse=reverse)
+    result = sorted(collection, key=cmp_to_key(comparison), reverse=reverse)
+
+    return result if table is None else table.take(result)
 
 
 @t.overload
@@ -1325,7 +1435,15 @@ def pluck(collection: t.Iterable[t.Any], path: PathT) -> t.List[t.Any]:
 
     .. versionchanged:: 4.0.1
         Made property access deep.
+
+    .. versionchanged:: 8.1.0
+        Copy the column of a :class:`.Table` when `path` is a column name.
     """
+    column = table_column(collection, path) if isinstance(collection, Table) else None
+
+    if column is not None:
+        return list(column_values(column))
+
     return map_(collection, pyd.property_(path))
 
 
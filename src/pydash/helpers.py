@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import builtins
 from collections.abc import Hashable, Iterable, Mapping, Sequence
+import copy
 from decimal import Decimal
-from functools import wraps
+from functools import singledispatch, wraps
+import importlib
 import inspect
+import math
 import operator
+import re
+import sys
 import warnings
 
 import pydash as pyd
@@ -26,9 +31,15 @@ NUMBER_TYPES = (int, float, Decimal)
 #: Dictionary of builtins with keys as the builtin function and values as the string name.
 BUILTINS = {value: key for key, value in builtins.__dict__.items() if isinstance(value, Hashable)}
 
+#: Strings that ``int()`` converts to an integer key.
+RE_INT_KEY = re.compile(r"\s*[+-]?\d+(?:_\d+)*\s*\Z")
+
 #: Object keys that are restricted from access via path access.
 RESTRICTED_KEYS = ("__globals__", "__builtins__")
 
+#: Common types that are known to be unhashable.
+UNHASHABLE_TYPES = (dict, list, set)
+
 #: Inspect signature parameter kinds that correspond to positional arguments.
 POSITIONAL_PARAMETERS = (
     inspect.Parameter.VAR_POSITIONAL,
@@ -142,6 +153,136 @@ def iterator(obj):
         return getattr(obj, "__dict__", {}).items()
 
 
+def iter_items(obj):
+    """Return an iterator of the ``(key, value)`` pairs of `obj` like :func:`iterator` does but with
+    fast paths for ``dict``, ``list``, and ``tuple`` objects."""
+    obj_type = type(obj)
+
+    if obj_type is dict:
+        return iter(obj.items())
+    elif obj_type is list or obj_type is tuple:
+        return enumerate(obj)
+    else:
+        return iter(iterator(obj))
+
+
+def numpy_backend(value, backend):
+    """
+    Return the NumPy module if `value` should be calculated with the NumPy backend or ``None`` if it
+    should be calculated in pure Python.
+    """
+    if backend is None:
+        # An array can only exist if NumPy has already been imported.
+        numpy = sys.modules.get("numpy")
+        return numpy if numpy is not None and isinstance(value, numpy.ndarray) else None
+
+    if backend == "python":
+        return None
+
+    if backend != "numpy":
+        raise ValueError(f'backend must be "numpy" or "python", got {backend!r}')
+
+    try:
+        numpy = importlib.import_module("numpy")
+    except ImportError as exc:
+        raise ImportError('backend="numpy" requires NumPy to be installed') from exc
+
+    return numpy
+
+
+def base_iterwalk(  # noqa: PLR0912
+    obj,
+    path=None,
+    *,
+    order="pre",
+    prune=None,
+    max_depth=None,
+    containers=(dict, list),
+    copy_containers=False,
+    flat_keys=False,
+):
+    """
+    Generate ``(key, value, parent)`` for each value nested in `obj` by walking it with an explicit
+    stack instead of recursion. Values that are instances of `containers` (except strings) are
+    walked into and are generated before their children in ``"pre"`` order, after them in
+    ``"post"`` order, or not at all when `order` is ``None``. Sending a truthy value to the
+    generator right after a container is generated in ``"pre"`` order skips walking into it.
+    Containers for which ``prune(value, path)`` is truthy or that are `max_depth` levels below `obj`
+    are generated like any other value without being walked into.
+
+    The `path` list holds the keys to `obj` and is extended and truncated in place so that it holds
+    the keys to each generated value. Keys that are lists or tuples extend `path` with their items
+    when `flat_keys` is set. Keys aren't tracked when `path` is ``None``. When `copy_containers` is
+    set, each container is shallow copied and replaces the original in its parent before it's
+    walked into so that the generated parents are the copies.
+
+    Raises:
+        ValueError: If a container references itself.
+    """
+    pre = order == "pre"
+    post = order == "post"
+    track = path is not None
+    # Containers are walked into while fewer than this many containers are on the stack.
+    limit = math.inf if max_depth is None else max_depth - 1
+    # A container that references itself is nested infinitely deep so reference cycles are only
+    # looked for whenever the stack grows to twice the depth it was last checked at.
+    check_depth = 1024
+    stack = []
+    # The container being walked and how it's reached are kept in locals instead of on the stack.
+    # The original of a copied container is kept as its `source` to detect reference cycles.
+    source, parent, items, depth = obj, obj, iter_items(obj), len(path) if track else 0
+    parent_key = grandparent = None
+
+    while True:
+        for key, value in items:
+            if track:
+                del path[depth:]
+
+                if flat_keys and isinstance(key, (list, tuple)):
+                    path.extend(key)
+                else:
+                    path.append(key)
+
+            if (
+                isinstance(value, containers)
+                and not isinstance(value, str)
+                and len(stack) < limit
+                and not (prune and prune(value, path))
+            ):
+                if pre and (yield key, value, parent):
+                    continue
+
+                if len(stack) == check_depth:
+                    check_depth *= 2
+
+                    if value is source or any(frame[0] is value for frame in stack):
+                        raise ValueError("Unable to walk object that references itself")
+
+                stack.append((source, parent, items, depth, parent_key, grandparent))
+                source = value
+
+                if copy_containers:
+                    value = copy.copy(value)
+                    parent[key] = value
+
+                grandparent, parent_key, depth = parent, key, len(path) if track else 0
+                parent, items = value, iter_items(value)
+                break
+
+            yield key, value, parent
+        else:
+            if not stack:
+                return
+
+            if post:
+                if track:
+                    del path[depth:]
+
+                yield parent_key, parent, grandparent
+
+            source, parent, items, depth, parent_key, grandparent = stack.pop()
+
+
 def base_get(obj, key, default=UNSET):
     """
     Safely get an item by `key` from a sequence or mapping object when `default` provided.
@@ -157,37 +298,99 @@ def base_get(obj, key, default=UNSET):
     Raises:
         KeyError: If `obj` is missing key, index, or attribute and no default value provided.
     """
-    if isinstance(obj, dict):
-        value = _base_get_dict(obj, key, default=default)
-    elif not isinstance(obj, (Mapping, Sequence)) or (
-        isinstance(obj, tuple) and hasattr(obj, "_fields")
-    ):
-        # Don't use getattr for dict/list objects since we don't want class methods/attributes
-        # returned for them but do allow getattr for namedtuple.
-        value = _base_get_object(obj, key, default=default)
-    else:
-        value = _base_get_item(obj, key, default=default)
+    value = base_lookup(obj, key)
 
     if value is UNSET:
-        # Raise if there's no default provided.
-        raise KeyError(f'Object "{repr(obj)}" does not have key "{key}"')
+        if default is UNSET:
+            # Raise if there's no default provided.
+            raise KeyError(f'Object "{repr(obj)}" does not have key "{key}"')
+        value = default
 
     return value
 
 
+def base_lookup(obj, key):
+    """
+    Return the item of `obj` at `key` like :func:`base_get` does or ``UNSET`` when it doesn't exist.
+    Misses on ``dict``, ``list``, and ``tuple`` objects are detected without raising and catching
+    exceptions. Other objects are looked up with the getter that :data:`base_getter` dispatches to
+    for their type.
+
+    Raises:
+        KeyError: If `key` is a restricted key of an object that is accessed by attribute.
+    """
+    obj_type = type(obj)
+
+    if obj_type is dict:
+        return _base_get_dict(obj, key)
+    elif obj_type is list or obj_type is tuple:
+        return _base_get_list(obj, key)
+    else:
+        return base_getter.dispatch(obj_type)(obj, key, UNSET)
+
+
+def to_int_key(key):
+    """Return `key` converted to an ``int`` like ``int(key)`` does or ``None`` if it can't be.
+    String keys are matched against :data:`RE_INT_KEY` instead of catching the error ``int()``
+    raises."""
+    if isinstance(key, str):
+        return int(key) if RE_INT_KEY.match(key) else None
+
+    try:
+        return int(key)
+    except Exception:
+        return None
+
+
+@singledispatch
+def base_getter(obj, key, default=UNSET):
+    """
+    Return the attribute or item of `obj` at `key` or `default` if it doesn't exist. Getters of
+    other types are registered with :func:`pydash.utilities.register_getter` and the getter chosen
+    for each type is cached.
+    """
+    return _base_get_object(obj, key, default)
+
+
+@base_getter.register(dict)
 def _base_get_dict(obj, key, default=UNSET):
     value = obj.get(key, UNSET)
     if value is UNSET:
         value = default
         if not isinstance(key, int):
             # Try integer key fallback.
-            try:
-                value = obj.get(int(key), default)
-            except Exception:
-                pass
+            int_key = to_int_key(key)
+            if int_key is not None:
+                value = obj.get(int_key, default)
     return value
 
 
+def _base_get_list(obj, key, default=UNSET):
+    if not isinstance(key, int):
+        if not isinstance(key, str):
+            return _base_get_item(obj, key, default)
+        key = to_int_key(key)
+        if key is None:
+            return default
+
+    if -len(obj) <= key < len(obj):
+        return obj[key]
+
+    return default
+
+
+@base_getter.register(tuple)
+def _base_get_tuple(obj, key, default=UNSET):
+    if hasattr(obj, "_fields"):
+        # Allow getattr for namedtuple.
+        return _base_get_object(obj, key, default)
+    return _base_get_item(obj, key, default)
+
+
+# Don't use getattr for other mappings and sequences since we don't want class methods/attributes
+# returned for them.
+@base_getter.register(Mapping)
+@base_getter.register(Sequence)
 def _base_get_item(obj, key, default=UNSET):
     try:
         return obj[key]
@@ -195,24 +398,27 @@ def _base_get_item(obj, key, default=UNSET):
         pass
 
     if not isinstance(key, int):
-        try:
-            return obj[int(key)]
-        except Exception:
-            pass
+        int_key = to_int_key(key)
+        if int_key is not None:
+            try:
+                return obj[int_key]
+            except Exception:
+                pass
 
     return default
 
 
 def _base_get_object(obj, key, default=UNSET):
-    value = _base_get_item(obj, key, default=UNSET)
-    if value is UNSET:
+    value = UNSET
+
+    if hasattr(type(obj), "__getitem__"):
+        value = _base_get_item(obj, key)
+
+    if value is UNSET and isinstance(key, str):
         _raise_if_restricted_key(key)
-        value = default
-        try:
-            value = getattr(obj, key)
-        except Exception:
-            pass
-    return value
+        value = getattr(obj, key, UNSET)
+
+    return default if value is UNSET else value
 
 
 def _raise_if_restricted_key(*keys):
@@ -226,6 +432,8 @@ def base_set(obj, key, value, allow_override=True):
     """
     Set an object's `key` to `value`. If `obj` is a ``list`` and the `key` is the next available
     index position, append to list; otherwise, pad the list of ``None`` and then append to the list.
+    Objects other than ``dict`` and ``list`` objects are set with the setter that
+    :data:`base_setter` dispatches to for their type.
 
     Args:
         obj: Object to assign value to.
@@ -233,26 +441,48 @@ def base_set(obj, key, value, allow_override=True):
         value: Value to assign.
         allow_override: Whether to allow overriding a previously set key.
     """
-    if isinstance(obj, dict):
+    obj_type = type(obj)
+
+    if obj_type is dict:
         if allow_override or key not in obj:
             obj[key] = value
-    elif isinstance(obj, list):
-        key = int(key)
+    elif obj_type is list:
+        _base_set_list(obj, key, value, allow_override)
+    elif allow_override or base_lookup(obj, key) is UNSET:
+        base_setter.dispatch(obj_type)(obj, key, value)
 
-        if key < len(obj):
-            if allow_override:
-                obj[key] = value
-        else:
-            if key > len(obj):
-                # Pad list object with None values up to the index key, so we can append the value
-                # into the key index.
-                obj[:] = (obj + [None] * key)[:key]
-            obj.append(value)
-    elif (allow_override or not hasattr(obj, key)) and obj is not None:
+    return obj
+
+
+@singledispatch
+def base_setter(obj, key, value):
+    """
+    Set the attribute of `obj` at `key` to `value`. Setters of other types are registered with
+    :func:`pydash.utilities.register_setter` and the setter chosen for each type is cached.
+    """
+    if obj is not None:
         _raise_if_restricted_key(key)
         setattr(obj, key, value)
 
-    return obj
+
+@base_setter.register(dict)
+def _base_set_dict(obj, key, value):
+    obj[key] = value
+
+
+@base_setter.register(list)
+def _base_set_list(obj, key, value, allow_override=True):
+    key = int(key)
+
+    if key < len(obj):
+        if allow_override:
+            obj[key] = value
+    else:
+        if key > len(obj):
+            # Pad list object with None values up to the index key, so we can append the value
+            # into the key index.
+            obj[:] = (obj + [None] * key)[:key]
+        obj.append(value)
 
 
 def cmp(a, b):  # pragma: no cover
@@ -285,6 +515,50 @@ def parse_iteratee(iteratee_keyword, *args, **kwargs):
     return iteratee, args
 
 
+class DeepSet(object):
+    """
+    A set that also holds unhashable values. Unhashable values are grouped by
+    :func:`pydash.utilities.deep_hash` and compared with :func:`pydash.predicates.is_equal` within
+    each group.
+    """
+
+    def __init__(self, values=()):
+        self.hashable = set()
+        self.unhashable = {}
+
+        for value in values:
+            self.add(value)
+
+    def __contains__(self, value):
+        if type(value) not in UNHASHABLE_TYPES:
+            try:
+                return value in self.hashable
+            except TypeError:
+                pass
+
+        bucket = self.unhashable.get(pyd.deep_hash(value), ())
+        return any(pyd.is_equal(value, other) for other in bucket)
+
+    def add(self, value):
+        """Add `value` and return whether it wasn't in the set already."""
+        if type(value) not in UNHASHABLE_TYPES:
+            try:
+                if value in self.hashable:
+                    return False
+                self.hashable.add(value)
+                return True
+            except TypeError:
+                pass
+
+        bucket = self.unhashable.setdefault(pyd.deep_hash(value), [])
+
+        if any(pyd.is_equal(value, other) for other in bucket):
+            return False
+
+        bucket.append(value)
+        return True
+
+
 class iterator_with_default(object):
     """A wrapper around an iterator object that provides a default."""
 
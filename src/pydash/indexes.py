@@ -0,0 +1,277 @@
+"""
+Secondary indexes of collections.
+
+.. versionadded:: 8.1.0
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Mapping
+import typing as t
+
+import pydash as pyd
+
+from .utilities import is_match_source
+
+
+__all__ = ("Index",)
+
+T = t.TypeVar("T")
+
+
+class Index(t.Generic[T]):
+    """
+    Secondary index of a collection that looks up the items whose value of a key equals a given
+    value in constant time and the items whose value of a key is within a range in logarithmic time.
+    Each key is a property path of the items like the ones accepted by :func:`.property_`. Iterating
+    over an index generates its items in the order they were added so that an index can be passed
+    to any function that accepts a list. :func:`pydash.collections.filter_` and
+    :func:`pydash.collections.find` only check the items that the index selects for the indexed keys
+    of a :func:`.matches` style dict predicate.
+
+    The values of the keys are read when an item is added, so an item that is changed afterwards
+    must be removed before the change and added again after it.
+
+    Args:
+        keys: Hashable property paths of the items to index.
+        items: Items to add to the index. Defaults to no items.
+
+    Raises:
+        TypeError: If a key is not hashable.
+
+    Example:
+
+        >>> index = Index(["id", "group"], [{"id": 1, "group": "x"}, {"id": 2, "group": "y"}])
+        >>> index.lookup("group", "y")
+        [{'id': 2, 'group': 'y'}]
+        >>> index.add({"id": 3, "group": "y"})
+        >>> index.between("id", 2, 4)
+        [{'id': 2, 'group': 'y'}, {'id': 3, 'group': 'y'}]
+        >>> pyd.find(index, {"group": "y", "id": 3})
+        {'id': 3, 'group': 'y'}
+
+    .. versionadded:: 8.1.0
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_getters",
+        "_ids",
+        "_items",
+        "_keys",
+        "_next",
+        "_ordered",
+        "_unhashable",
+    )
+
+    def __init__(self, keys: t.Iterable[t.Any], items: t.Iterable[T] = ()) -> None:
+        self._keys = tuple(dict.fromkeys(keys))
+        self._getters = [pyd.property_(key) for key in self._keys]
+        # Items and the values of their keys by the sequence number of when they were added.
+        self._items: t.Dict[int, t.Tuple[T, t.Tuple[t.Any, ...]]] = {}
+        # Sequence numbers of each item by its id.
+        self._ids: t.Dict[int, t.List[int]] = {}
+        # Sequence numbers by each hashable value of each key. Dicts are used as ordered sets.
+        self._buckets: t.Dict[t.Any, t.Dict[t.Any, t.Dict[int, None]]] = {
+            key: {} for key in self._keys
+        }
+        self._unhashable: t.Dict[t.Any, t.Dict[int, None]] = {key: {} for key in self._keys}
+        # Sorted lists of (value, sequence number) of keys that have been looked up by range.
+        self._ordered: t.Dict[t.Any, t.List[t.Tuple[t.Any, int]]] = {}
+        self._next = 0
+
+        for item in items:
+            self.add(item)
+
+    @property
+    def keys(self) -> t.Tuple[t.Any, ...]:
+        """Property paths of the indexed keys."""
+        return self._keys
+
+    def add(self, item: T) -> None:
+        """
+        Add `item` to the index.
+
+        Raises:
+            TypeError: If the value of a key that's been looked up by range can't be compared to
+                the values of the other items.
+        """
+        seq = self._next
+        values = tuple(getter(item) for getter in self._getters)
+        # Find every sorted position first so that an incomparable value leaves the index as is.
+        insertions = []
+
+        for key, ordered in self._ordered.items():
+            value = values[key_position(self, key)]
+
+            if value is not None:
+                insertions.append((ordered, bisect_left(ordered, (value, seq)), value))
+
+        self._next += 1
+        self._items[seq] = (item, values)
+        self._ids.setdefault(id(item), []).append(seq)
+
+        for key, value in zip(self._keys, values):
+            bucket_seqs(self, key, value)[seq] = None
+
+        for ordered, position, value in insertions:
+            ordered.insert(position, (value, seq))
+
+    def remove(self, item: T) -> None:
+        """
+        Remove the first added occurrence of `item` from the index. The item is found by identity
+        instead of equality.
+
+        Raises:
+            ValueError: If `item` is not in the index.
+        """
+        seqs = self._ids.get(id(item))
+
+        if not seqs:
+            raise ValueError("Index.remove(item): item not in index")
+
+        seq = seqs.pop(0)
+
+        if not seqs:
+            del self._ids[id(item)]
+
+        _, values = self._items.pop(seq)
+
+        for key, value in zip(self._keys, values):
+            bucket = bucket_seqs(self, key, value)
+            del bucket[seq]
+
+            if not bucket and bucket is not self._unhashable[key]:
+                del self._buckets[key][value]
+
+        for key, ordered in self._ordered.items():
+            value = values[key_position(self, key)]
+
+            if value is not None:
+                del ordered[bisect_left(ordered, (value, seq))]
+
+    def lookup(self, key: t.Any, value: t.Any) -> t.List[T]:
+        """
+        Return list of the items whose value of `key` equals `value`.
+
+        Raises:
+            KeyError: If `key` is not indexed.
+        """
+        position = key_position(self, key)
+        seqs = matching_seqs(self, key, value)
+
+        if seqs is None:
+            seqs = list(self._items)
+
+        return [
+            item for item, values in (self._items[seq] for seq in seqs) if values[position] == value
+        ]
+
+    def between(self, key: t.Any, start: t.Any = None, end: t.Any = None) -> t.List[T]:
+        """
+        Return list of the items whose value of `key` is greater than or equal to `start` and less
+        than `end` sorted by that value. Items without a value for `key` are excluded. The first
+        range lookup of a key sorts the items by its value and the sort order is kept up to date as
+        items are added and removed.
+
+        Raises:
+            KeyError: If `key` is not indexed.
+            TypeError: If the values of `key` can't be compared.
+        """
+        ordered = self._ordered.get(key)
+
+        if ordered is None:
+            position = key_position(self, key)
+            ordered = sorted(
+                (values[position], seq)
+                for seq, (_, values) in self._items.items()
+                if values[position] is not None
+            )
+            self._ordered[key] = ordered
+
+        low = 0 if start is None else bisect_left(ordered, (start,))
+        high = len(ordered) if end is None else bisect_left(ordered, (end,))
+
+        return [self._items[seq][0] for _, seq in ordered[low:high]]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> t.Iterator[T]:
+        return (item for item, _ in self._items.values())
+
+    def __contains__(self, item: object) -> bool:
+        return id(item) in self._ids
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(keys={self._keys!r}, items={len(self)})"
+
+
+#
+# Utility methods not a part of the main API
+#
+
+
+def key_position(index, key):
+    """Return the position of `key` in the keys of `index`."""
+    try:
+        return index._keys.index(key)
+    except ValueError:
+        raise KeyError(key) from None
+
+
+def bucket_seqs(index, key, value):
+    """Return the ordered set of the sequence numbers of the items of `index` with `value`."""
+    try:
+        return index._buckets[key].setdefault(value, {})
+    except TypeError:
+        return index._unhashable[key]
+
+
+def matching_seqs(index, key, value):
+    """
+    Return list of the sequence numbers of the items of `index` whose value of `key` could equal
+    `value` in the order they were added or ``None`` if `value` can't be looked up by its hash.
+    Items with unhashable values are included since they can only be compared by equality.
+    """
+    try:
+        bucket = index._buckets[key].get(value, {})
+    except TypeError:
+        return None
+
+    unhashable = index._unhashable[key]
+
+    if unhashable:
+        return sorted({**bucket, **unhashable})
+
+    return list(bucket)
+
+
+def select_candidates(index, predicate):
+    """
+    Return list of the items of `index` that could match `predicate` in the order they were added.
+    For a dict predicate the items with the fewest matches of an indexed key are selected.
+    Otherwise, all items are selected.
+    """
+    selected = None
+
+    if isinstance(predicate, Mapping):
+        for key, value in predicate.items():
+            # Dict predicates compare the items' own keys so deep paths can't be used.
+            if (
+                key not in index._buckets
+                or (isinstance(key, str) and ("." in key or "[" in key))
+                or is_match_source(value)
+            ):
+                continue
+
+            seqs = matching_seqs(index, key, value)
+
+            if seqs is not None and (selected is None or len(seqs) < len(selected)):
+                selected = seqs
+
+    if selected is None:
+        return list(index)
+
+    return [index._items[seq][0] for seq in selected]
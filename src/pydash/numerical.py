@@ -1,19 +1,39 @@
 """
 Numerical/mathematical related functions.
 
+Functions that accept a `backend` argument calculate NumPy arrays with NumPy and everything else in
+pure Python unless ``backend="numpy"`` or ``backend="python"`` is given. Results are always returned
+as Python numbers and lists. Inputs that NumPy can't calculate the same way, like empty collections,
+rows of different lengths, or collections that aren't numbers, are calculated in pure Python instead
+so that both backends return the same results and raise the same errors.
+
 .. versionadded:: 2.1.0
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from collections.abc import Iterable, Mapping, Sized
+from itertools import zip_longest
 import math
 import operator
 import typing as t
 
+from typing_extensions import Literal
+
 import pydash as pyd
 
-from .helpers import UNSET, Unset, iterator, iterator_with_default, iteriteratee
-from .types import IterateeObjT, NumberNoDecimalT, NumberT, SupportsMul, SupportsRound
+from .helpers import UNSET, Unset, iterator_with_default, iteriteratee, numpy_backend
+from .tables import Table, column_values, table_column
+from .types import (
+    BackendT,
+    IterateeObjT,
+    NumberNoDecimalT,
+    NumberT,
+    SupportsMul,
+    SupportsRound,
+)
 
 
 if t.TYPE_CHECKING:
@@ -28,6 +48,7 @@ __all__ = (
     "clamp",
     "divide",
     "floor",
+    "itermoving_mean",
     "max_",
     "max_by",
     "mean",
@@ -35,12 +56,23 @@ __all__ = (
     "median",
     "min_",
     "min_by",
+    "min_max_by",
+    "moving_max",
     "moving_mean",
+    "moving_median",
+    "moving_min",
+    "moving_std",
+    "moving_sum",
     "multiply",
+    "percentile",
     "power",
+    "quantile",
+    "QuantileSketch",
     "round_",
+    "RunningStats",
     "scale",
     "slope",
+    "stats_by",
     "std_deviation",
     "sum_",
     "sum_by",
@@ -57,6 +89,10 @@ T3 = t.TypeVar("T3")
 
 INFINITY = float("inf")
 
+#: Number of values at or below which quantile selection sorts instead of partitioning. Sorting is
+#: implemented in C and outperforms partitioning in Python below this size.
+SELECT_SORT_SIZE = 2**14
+
 
 @t.overload
 def add(a: "SupportsAdd[T, T2]", b: T) -> T2: ...
@@ -94,19 +130,25 @@ def add(a, b):
 
 
 @t.overload
-def sum_(collection: t.Mapping[t.Any, "SupportsAdd[int, T]"]) -> T: ...
+def sum_(
+    collection: t.Mapping[t.Any, "SupportsAdd[int, T]"], *, backend: t.Optional[BackendT] = None
+) -> T: ...
 
 
 @t.overload
-def sum_(collection: t.Iterable["SupportsAdd[int, T]"]) -> T: ...
+def sum_(
+    collection: t.Iterable["SupportsAdd[int, T]"], *, backend: t.Optional[BackendT] = None
+) -> T: ...
 
 
-def sum_(collection):
+def sum_(collection, *, backend=None):
     """
     Sum each element in `collection`.
 
     Args:
         collection: Collection to process or first number to add.
+        backend: Either ``"numpy"`` or ``"python"``. Defaults to ``"numpy"`` for NumPy arrays and
+            ``"python"`` otherwise.
 
     Returns:
         Result of summation.
@@ -124,10 +166,27 @@ def sum_(collection):
     .. versionchanged:: 4.0.0
         Move iteratee support to :func:`sum_by`. Move two argument addition to
         :func:`add`.
+
+    .. versionchanged:: 8.1.0
+        Added `backend` argument.
     """
+    numpy = numpy_backend(collection, backend)
+    if numpy:
+        values = to_ndarray(numpy, collection)
+        if values.size:
+            return to_python(numpy.sum(values))
+        collection = values.tolist()
+
     return sum_by(collection)
 
 
+@t.overload
+def sum_by(
+    collection: Table,
+    iteratee: t.Union[t.Callable[[t.Dict[t.Any, t.Any]], t.Any], IterateeObjT],
+) -> t.Any: ...
+
+
 @t.overload
 def sum_by(
     collection: t.Mapping[T, T2],
@@ -189,24 +248,33 @@ def sum_by(collection, iteratee=None):
         30
 
     .. versionadded:: 4.0.0
+
+    .. versionchanged:: 8.1.0
+        Iterate without wrapping each element when `iteratee` is ``None`` or a property name.
     """
-    return sum(result[0] for result in iteriteratee(collection, iteratee))
+    return sum(itervalues_by(collection, iteratee))
 
 
 @t.overload
-def mean(collection: t.Mapping[t.Any, "SupportsAdd[int, t.Any]"]) -> float: ...
+def mean(
+    collection: t.Mapping[t.Any, "SupportsAdd[int, t.Any]"], *, backend: t.Optional[BackendT] = None
+) -> float: ...
 
 
 @t.overload
-def mean(collection: t.Iterable["SupportsAdd[int, t.Any]"]) -> float: ...
+def mean(
+    collection: t.Iterable["SupportsAdd[int, t.Any]"], *, backend: t.Optional[BackendT] = None
+) -> float: ...
 
 
-def mean(collection):
+def mean(collection, *, backend=None):
     """
     Calculate arithmetic mean of each element in `collection`.
 
     Args:
         collection: Collection to process.
+        backend: Either ``"numpy"`` or ``"python"``. Defaults to ``"numpy"`` for NumPy arrays and
+            ``"python"`` otherwise.
 
     Returns:
         Result of mean.
@@ -222,10 +290,27 @@ def mean(collection):
 
         - Removed ``average`` and ``avg`` aliases.
         - Moved iteratee functionality to :func:`mean_by`.
+
+    .. versionchanged:: 8.1.0
+        Added `backend` argument.
     """
+    numpy = numpy_backend(collection, backend)
+    if numpy:
+        values = to_ndarray(numpy, collection)
+        if values.size:
+            return to_python(numpy.mean(values))
+        collection = values.tolist()
+
     return mean_by(collection)
 
 
+@t.overload
+def mean_by(
+    collection: Table,
+    iteratee: t.Union[t.Callable[[t.Dict[t.Any, t.Any]], t.Any], IterateeObjT],
+) -> float: ...
+
+
 @t.overload
 def mean_by(
     collection: t.Mapping[T, T2],
@@ -289,10 +374,27 @@ def mean_by(collection, iteratee=None):
 
         >>> mean_by([1, 2, 3, 4], lambda x: x**2)
         7.5
+        >>> mean_by(x for x in [1, 2, 3, 4])
+        2.5
 
     .. versionadded:: 4.0.0
+
+    .. versionchanged:: 8.1.0
+        Support any iterable for `collection`.
     """
-    return sum_by(collection, iteratee) / len(collection)
+    values = itervalues_by(collection, iteratee)
+
+    if isinstance(values, Sized):
+        return sum(values) / len(values)
+
+    total = 0
+    count = 0
+
+    for value in values:
+        total += value
+        count += 1
+
+    return total / count
 
 
 def ceil(x: NumberT, precision: int = 0) -> float:
@@ -325,14 +427,23 @@ NumT2 = t.TypeVar("NumT2", int, float, "Decimal")
 NumT3 = t.TypeVar("NumT3", int, float, "Decimal")
 
 
-def clamp(x: NumT, lower: NumT2, upper: t.Union[NumT3, None] = None) -> t.Union[NumT, NumT2, NumT3]:
+def clamp(
+    x: NumT,
+    lower: NumT2,
+    upper: t.Union[NumT3, None] = None,
+    *,
+    backend: t.Optional[BackendT] = None,
+) -> t.Union[NumT, NumT2, NumT3]:
     """
-    Clamps number within the inclusive lower and upper bounds.
+    Clamps number within the inclusive lower and upper bounds. The NumPy backend also clamps each
+    number of a list, tuple, or array of numbers.
 
     Args:
         x: Number to clamp.
         lower: Lower bound.
         upper: Upper bound
+        backend: Either ``"numpy"`` or ``"python"``. Defaults to ``"numpy"`` for NumPy arrays and
+            ``"python"`` otherwise.
 
     Returns:
         number
@@ -349,11 +460,19 @@ def clamp(x: NumT, lower: NumT2, upper: t.Union[NumT3, None] = None) -> t.Union[
         -10
 
     .. versionadded:: 4.0.0
+
+    .. versionchanged:: 8.1.0
+        Added `backend` argument.
     """
     if upper is None:
         upper = lower  # type: ignore
         lower = x  # type: ignore
 
+    numpy = numpy_backend(x, backend)
+    values = numeric_ndarray(numpy, x) if numpy else None
+    if values is not None:
+        return to_python(numpy.clip(values, lower, upper))
+
     if x < lower:
         x = lower  # type: ignore
     elif x > upper:  # type: ignore
@@ -560,45 +679,65 @@ def max_by(collection, iteratee=None, default=UNSET):
 
 @t.overload
 def median(
-    collection: t.Mapping[T, T2], iteratee: t.Callable[[T2, T, t.Dict[T, T2]], NumberT]
+    collection: t.Mapping[T, T2],
+    iteratee: t.Callable[[T2, T, t.Dict[T, T2]], NumberT],
+    *,
+    backend: t.Optional[BackendT] = None,
 ) -> t.Union[float, int]: ...
 
 
 @t.overload
 def median(
-    collection: t.Mapping[T, T2], iteratee: t.Callable[[T2, T], NumberT]
+    collection: t.Mapping[T, T2],
+    iteratee: t.Callable[[T2, T], NumberT],
+    *,
+    backend: t.Optional[BackendT] = None,
 ) -> t.Union[float, int]: ...
 
 
 @t.overload
 def median(
-    collection: t.Mapping[t.Any, T2], iteratee: t.Callable[[T2], NumberT]
+    collection: t.Mapping[t.Any, T2],
+    iteratee: t.Callable[[T2], NumberT],
+    *,
+    backend: t.Optional[BackendT] = None,
 ) -> t.Union[float, int]: ...
 
 
 @t.overload
 def median(
-    collection: t.Iterable[T], iteratee: t.Callable[[T, int, t.List[T]], NumberT]
+    collection: t.Iterable[T],
+    iteratee: t.Callable[[T, int, t.List[T]], NumberT],
+    *,
+    backend: t.Optional[BackendT] = None,
 ) -> t.Union[float, int]: ...
 
 
 @t.overload
 def median(
-    collection: t.Iterable[T], iteratee: t.Callable[[T, int], NumberT]
+    collection: t.Iterable[T],
+    iteratee: t.Callable[[T, int], NumberT],
+    *,
+    backend: t.Optional[BackendT] = None,
 ) -> t.Union[float, int]: ...
 
 
 @t.overload
 def median(
-    collection: t.Iterable[T], iteratee: t.Callable[[T], NumberT]
+    collection: t.Iterable[T],
+    iteratee: t.Callable[[T], NumberT],
+    *,
+    backend: t.Optional[BackendT] = None,
 ) -> t.Union[float, int]: ...
 
 
 @t.overload
-def median(collection: t.Iterable[NumberT], iteratee: None = None) -> t.Union[float, int]: ...
+def median(
+    collection: t.Iterable[NumberT], iteratee: None = None, *, backend: t.Optional[BackendT] = None
+) -> t.Union[float, int]: ...
 
 
-def median(collection, iteratee=None):
+def median(collection, iteratee=None, *, backend=None):
     """
     Calculate median of each element in `collection`. If iteratee is passed, each element of
     `collection` is passed through an iteratee before the median is computed.
@@ -606,9 +745,11 @@ def median(collection, iteratee=None):
     Args:
         collection: Collection to process.
         iteratee: Iteratee applied per iteration.
+        backend: Either ``"numpy"`` or ``"python"``. Defaults to ``"numpy"`` for NumPy arrays and
+            ``"python"`` otherwise.
 
     Returns:
-        Result of median.
+        Result of median or ``None`` if `collection` is empty.
 
     Example:
 
@@ -618,19 +759,42 @@ def median(collection, iteratee=None):
         2.5
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: 8.1.0
+        Select the middle elements with introselect in expected linear time instead of sorting the
+        whole collection. `collection` can be any iterable. Return ``None`` for an empty
+        collection. Added `backend` argument.
     """
-    length = len(collection)
-    middle = (length + 1) / 2
-    collection = sorted(ret[0] for ret in iteriteratee(collection, iteratee))
+    numpy = numpy_backend(collection, backend)
+    if numpy:
+        values = to_ndarray(
+            numpy, collection if iteratee is None else mapped_values(collection, iteratee)
+        )
+        length = len(values)
 
-    if pyd.is_odd(length):
-        result = collection[int(middle - 1)]
-    else:
-        left = int(middle - 1.5)
-        right = int(middle - 0.5)
-        result = (collection[left] + collection[right]) / 2
+        if not length:
+            return None
 
-    return result
+        if length % 2:
+            # The middle element is returned as is like in pure Python instead of as a float.
+            middle = length // 2
+            return to_python(numpy.partition(values, middle)[middle])
+
+        return to_python(numpy.median(values))
+
+    values = mapped_values(collection, iteratee)
+    length = len(values)
+
+    if not length:
+        return None
+
+    middle = (length - 1) // 2
+
+    if length % 2:
+        return select_ranks(values, [middle])[middle]
+
+    found = select_ranks(values, [middle, middle + 1])
+    return (found[middle] + found[middle + 1]) / 2
 
 
 @t.overload
@@ -776,14 +940,141 @@ def min_by(collection, iteratee=None, default=UNSET):
     return min(iterator_with_default(collection, default), key=pyd.iteratee(iteratee))
 
 
-def moving_mean(array: t.Sequence["SupportsAdd[int, t.Any]"], size: t.SupportsInt) -> t.List[float]:
+@t.overload
+def min_max_by(
+    collection: t.Mapping[t.Any, "SupportsRichComparisonT"],
+    iteratee: None = None,
+    default: Unset = UNSET,
+) -> t.Tuple["SupportsRichComparisonT", "SupportsRichComparisonT"]: ...
+
+
+@t.overload
+def min_max_by(
+    collection: t.Mapping[t.Any, T2],
+    iteratee: t.Callable[[T2], "SupportsRichComparisonT"],
+    default: Unset = UNSET,
+) -> t.Tuple[T2, T2]: ...
+
+
+@t.overload
+def min_max_by(
+    collection: t.Iterable["SupportsRichComparisonT"], iteratee: None = None, default: Unset = UNSET
+) -> t.Tuple["SupportsRichComparisonT", "SupportsRichComparisonT"]: ...
+
+
+@t.overload
+def min_max_by(
+    collection: t.Iterable[T2],
+    iteratee: t.Callable[[T2], "SupportsRichComparisonT"],
+    default: Unset = UNSET,
+) -> t.Tuple[T2, T2]: ...
+
+
+@t.overload
+def min_max_by(
+    collection: t.Iterable[T], iteratee: IterateeObjT, default: Unset = UNSET
+) -> t.Tuple[T, T]: ...
+
+
+@t.overload
+def min_max_by(
+    collection: t.Iterable[T], iteratee: t.Any = None, *, default: T2
+) -> t.Tuple[t.Union[T, T2], t.Union[T, T2]]: ...
+
+
+def min_max_by(collection, iteratee=None, default=UNSET):
     """
-    Calculate moving mean of each element of `array`.
+    Retrieves the minimum and maximum values of a `collection` in a single pass.
 
     Args:
-        array: List to process.
+        collection: Collection to iterate over.
+        iteratee: Iteratee applied per iteration.
+        default: Value to return as both the minimum and maximum if `collection` is empty.
+
+    Returns:
+        Tuple of minimum and maximum values.
+
+    Raises:
+        ValueError: If `collection` is empty and no `default` is given.
+
+    Example:
+
+        >>> min_max_by([3, 1, 2])
+        (1, 3)
+        >>> min_max_by([{"a": 1}, {"a": 2}, {"a": 3}], "a")
+        ({'a': 1}, {'a': 3})
+        >>> min_max_by(iter([]), default=-1)
+        (-1, -1)
+
+    .. versionadded:: 8.1.0
+    """
+    if isinstance(collection, dict):
+        collection = collection.values()
+
+    key = property_getter(iteratee) if isinstance(iteratee, str) else pyd.iteratee(iteratee)
+    items = iter(collection)
+
+    for low in items:
+        high = low
+        low_key = high_key = key(low)
+        break
+    else:
+        if default is UNSET:
+            raise ValueError("min_max_by() arg is an empty sequence")
+        return default, default
+
+    for item in items:
+        item_key = key(item)
+        if item_key < low_key:
+            low, low_key = item, item_key
+        elif item_key > high_key:
+            high, high_key = item, item_key
+
+    return low, high
+
+
+def moving_max(
+    array: t.Iterable["SupportsRichComparisonT"], size: t.SupportsInt
+) -> t.Generator["SupportsRichComparisonT", None, None]:
+    """
+    Calculate moving maximum of each window of `size` consecutive elements of `array`. Results are
+    yielded lazily so `array` can be any iterable, including an unbounded iterator.
+
+    Args:
+        array: Iterable to process.
         size: Window size.
 
+    Returns:
+        Generator of window maximums.
+
+    Example:
+
+        >>> list(moving_max([1, 3, 2, 5, 4], 2))
+        [3, 3, 5, 5]
+        >>> list(moving_max([1, 3, 2, 5, 4], 3))
+        [3, 5, 5]
+
+    .. versionadded:: 8.1.0
+    """
+    return itermoving_extreme(array, size, operator.le)
+
+
+def moving_mean(
+    array: t.Iterable["SupportsAdd[int, t.Any]"],
+    size: t.SupportsInt,
+    *,
+    backend: t.Optional[BackendT] = None,
+) -> t.List[float]:
+    """
+    Calculate moving mean of each element of `array`. Use :func:`itermoving_mean` to generate the
+    means lazily instead of returning a list.
+
+    Args:
+        array: Iterable to process.
+        size: Window size.
+        backend: Either ``"numpy"`` or ``"python"``. Defaults to ``"numpy"`` for NumPy arrays and
+            ``"python"`` otherwise.
+
     Returns:
         Result of moving average.
 
@@ -800,17 +1091,221 @@ def moving_mean(array: t.Sequence["SupportsAdd[int, t.Any]"], size: t.SupportsIn
 
     .. versionchanged:: 4.0.0
         Rename to ``moving_mean`` and remove ``moving_average`` and ``moving_avg`` aliases.
+
+    .. versionchanged:: 8.1.0
+        Calculate in a single pass using a running sum and support any iterable for `array`. Added
+        `backend` argument.
+    """
+    size = int(size)
+
+    numpy = numpy_backend(array, backend)
+    if numpy:
+        values = to_ndarray(numpy, array)
+        if size < 1 or size > len(values):
+            return []
+        totals = numpy.cumsum(values, dtype=float)
+        totals[size:] = totals[size:] - totals[:-size]
+        return to_python(totals[size - 1 :] / size)
+
+    return list(itermoving_mean(array, size))
+
+
+def itermoving_mean(
+    array: t.Iterable["SupportsAdd[int, t.Any]"], size: t.SupportsInt
+) -> t.Generator[float, None, None]:
+    """
+    Like :func:`moving_mean` except that it yields the mean of each window of `size` consecutive
+    elements of `array` lazily so `array` can be any iterable, including an unbounded iterator.
+
+    Args:
+        array: Iterable to process.
+        size: Window size.
+
+    Returns:
+        Generator of window means.
+
+    Example:
+
+        >>> list(itermoving_mean([1, 2, 3, 4, 5], 2))
+        [1.5, 2.5, 3.5, 4.5]
+
+    .. versionadded:: 8.1.0
+    """
+    size = int(size)
+
+    for total in moving_sum(array, size):
+        yield total / size
+
+
+def moving_median(
+    array: t.Iterable[NumberT], size: t.SupportsInt
+) -> t.Generator[t.Union[float, int], None, None]:
+    """
+    Calculate moving median of each window of `size` consecutive elements of `array`. Results are
+    yielded lazily so `array` can be any iterable, including an unbounded iterator.
+
+    Args:
+        array: Iterable to process.
+        size: Window size.
+
+    Returns:
+        Generator of window medians.
+
+    Example:
+
+        >>> list(moving_median([1, 5, 2, 8, 3], 3))
+        [2, 5, 3]
+        >>> list(moving_median([1, 5, 2, 8, 3], 2))
+        [3.0, 3.5, 5.0, 5.5]
+
+    .. versionadded:: 8.1.0
     """
-    result = []
     size = int(size)
+    if size < 1:
+        return
 
-    for i in range(size - 1, len(array) + 1):
-        window = array[i - size : i]
+    window: t.Deque[t.Any] = deque()
+    ordered: t.List[t.Any] = []
+    middle = size // 2
+
+    for value in array:
+        window.append(value)
+        insort(ordered, value)
+
+        if len(window) > size:
+            del ordered[bisect_left(ordered, window.popleft())]
 
         if len(window) == size:
-            result.append(mean(window))
+            if size % 2:
+                yield ordered[middle]
+            else:
+                yield (ordered[middle - 1] + ordered[middle]) / 2
 
-    return result
+
+def moving_min(
+    array: t.Iterable["SupportsRichComparisonT"], size: t.SupportsInt
+) -> t.Generator["SupportsRichComparisonT", None, None]:
+    """
+    Calculate moving minimum of each window of `size` consecutive elements of `array`. Results are
+    yielded lazily so `array` can be any iterable, including an unbounded iterator.
+
+    Args:
+        array: Iterable to process.
+        size: Window size.
+
+    Returns:
+        Generator of window minimums.
+
+    Example:
+
+        >>> list(moving_min([4, 2, 3, 1, 5], 2))
+        [2, 2, 1, 1]
+        >>> list(moving_min([4, 2, 3, 1, 5], 3))
+        [2, 1, 1]
+
+    .. versionadded:: 8.1.0
+    """
+    return itermoving_extreme(array, size, operator.ge)
+
+
+def moving_std(array: t.Iterable[NumberT], size: t.SupportsInt) -> t.Generator[float, None, None]:
+    """
+    Calculate moving standard deviation of each window of `size` consecutive elements of `array`.
+    Results are yielded lazily so `array` can be any iterable, including an unbounded iterator.
+
+    Args:
+        array: Iterable to process.
+        size: Window size.
+
+    Returns:
+        Generator of window standard deviations.
+
+    Example:
+
+        >>> list(moving_std([2, 4, 4, 4, 5, 5, 7, 9], 8))
+        [2.0]
+        >>> list(moving_std([1, 1, 3, 3], 2))
+        [0.0, 1.0, 0.0]
+
+    .. versionadded:: 8.1.0
+    """
+    size = int(size)
+    if size < 1:
+        return
+
+    window: t.Deque[t.Any] = deque()
+    avg: t.Any = 0.0
+    sum_sq: t.Any = 0.0
+
+    for count, value in enumerate(array, 1):
+        window.append(value)
+
+        if len(window) <= size:
+            # Welford's update while the first window fills up.
+            delta = value - avg
+            avg += delta / len(window)
+            sum_sq += delta * (value - avg)
+        else:
+            old = window.popleft()
+            if count % size:
+                old_avg = avg
+                avg += (value - old) / size
+                sum_sq += (value - old) * (value - avg + old - old_avg)
+            else:
+                # Periodically recalculate from the window to keep rounding errors from the
+                # running updates from accumulating over long inputs.
+                avg = sum(window) / size
+                sum_sq = sum((item - avg) ** 2 for item in window)
+
+        if len(window) == size:
+            yield math.sqrt(max(sum_sq / size, 0.0))
+
+
+def moving_sum(
+    array: t.Iterable["SupportsAdd[int, T]"], size: t.SupportsInt
+) -> t.Generator[T, None, None]:
+    """
+    Calculate moving sum of each window of `size` consecutive elements of `array`. Results are
+    yielded lazily so `array` can be any iterable, including an unbounded iterator.
+
+    Args:
+        array: Iterable to process.
+        size: Window size.
+
+    Returns:
+        Generator of window sums.
+
+    Example:
+
+        >>> list(moving_sum([1, 2, 3, 4, 5], 2))
+        [3, 5, 7, 9]
+        >>> list(moving_sum(range(10), 5))
+        [10, 15, 20, 25, 30, 35]
+
+    .. versionadded:: 8.1.0
+    """
+    size = int(size)
+    if size < 1:
+        return
+
+    window: t.Deque[t.Any] = deque()
+    total: t.Any = 0
+
+    for count, value in enumerate(array, 1):
+        window.append(value)
+
+        if len(window) <= size:
+            total += value
+        elif count % size:
+            total += value - window.popleft()
+        else:
+            # Periodically recalculate from the window to keep rounding errors from the running
+            # sum from accumulating over long inputs.
+            window.popleft()
+            total = sum(window)
+
+        if len(window) == size:
+            yield total
 
 
 @t.overload
@@ -860,6 +1355,76 @@ def multiply(multiplier, multiplicand):
     return call_math_operator(multiplier, multiplicand, operator.mul, 1)
 
 
+@t.overload
+def percentile(
+    collection: t.Mapping[t.Any, NumberT], ps: NumberT, iteratee: None = None
+) -> t.Union[float, int]: ...
+
+
+@t.overload
+def percentile(
+    collection: t.Iterable[NumberT], ps: NumberT, iteratee: None = None
+) -> t.Union[float, int]: ...
+
+
+@t.overload
+def percentile(
+    collection: t.Mapping[t.Any, NumberT], ps: t.Iterable[NumberT], iteratee: None = None
+) -> t.List[t.Union[float, int]]: ...
+
+
+@t.overload
+def percentile(
+    collection: t.Iterable[NumberT], ps: t.Iterable[NumberT], iteratee: None = None
+) -> t.List[t.Union[float, int]]: ...
+
+
+@t.overload
+def percentile(
+    collection: t.Iterable[t.Any],
+    ps: NumberT,
+    iteratee: t.Union[t.Callable[..., NumberT], IterateeObjT],
+) -> t.Union[float, int]: ...
+
+
+@t.overload
+def percentile(
+    collection: t.Iterable[t.Any],
+    ps: t.Iterable[NumberT],
+    iteratee: t.Union[t.Callable[..., NumberT], IterateeObjT],
+) -> t.List[t.Union[float, int]]: ...
+
+
+def percentile(collection, ps, iteratee=None):
+    """
+    Calculate the percentile `ps` or each percentile in `ps` of the elements in `collection` where
+    each percentile is between ``0`` and ``100``. See :func:`quantile` for how values are
+    calculated.
+
+    Args:
+        collection: Collection to process.
+        ps: Percentile or iterable of percentiles.
+        iteratee: Iteratee applied per iteration.
+
+    Returns:
+        Percentile or list of percentiles in the order of `ps`. ``None`` is returned for each
+        percentile if `collection` is empty.
+
+    Raises:
+        ValueError: If a percentile is not between ``0`` and ``100``.
+
+    Example:
+
+        >>> percentile([1, 2, 3, 4, 5], 50)
+        3
+        >>> percentile(range(1, 101), [50, 95, 99])
+        [50.5, 95.05, 99.01]
+
+    .. versionadded:: 8.1.0
+    """
+    return base_quantile(collection, ps, iteratee, 100, "percentile")
+
+
 @t.overload
 def power(x: int, n: int) -> t.Union[int, float]: ...
 
@@ -910,20 +1475,198 @@ def power(x, n):
 
 
 @t.overload
-def round_(x: t.List[SupportsRound[NumberT]], precision: int = 0) -> t.List[float]: ...
+def quantile(
+    collection: t.Mapping[t.Any, NumberT], qs: NumberT, iteratee: None = None
+) -> t.Union[float, int]: ...
+
+
+@t.overload
+def quantile(
+    collection: t.Iterable[NumberT], qs: NumberT, iteratee: None = None
+) -> t.Union[float, int]: ...
+
+
+@t.overload
+def quantile(
+    collection: t.Mapping[t.Any, NumberT], qs: t.Iterable[NumberT], iteratee: None = None
+) -> t.List[t.Union[float, int]]: ...
+
+
+@t.overload
+def quantile(
+    collection: t.Iterable[NumberT], qs: t.Iterable[NumberT], iteratee: None = None
+) -> t.List[t.Union[float, int]]: ...
+
+
+@t.overload
+def quantile(
+    collection: t.Iterable[t.Any],
+    qs: NumberT,
+    iteratee: t.Union[t.Callable[..., NumberT], IterateeObjT],
+) -> t.Union[float, int]: ...
+
+
+@t.overload
+def quantile(
+    collection: t.Iterable[t.Any],
+    qs: t.Iterable[NumberT],
+    iteratee: t.Union[t.Callable[..., NumberT], IterateeObjT],
+) -> t.List[t.Union[float, int]]: ...
+
+
+def quantile(collection, qs, iteratee=None):
+    """
+    Calculate the quantile `qs` or each quantile in `qs` of the elements in `collection` where each
+    quantile is between ``0`` and ``1``. If iteratee is passed, each element of `collection` is
+    passed through an iteratee before the quantiles are computed.
+
+    Quantiles that fall between two elements are linearly interpolated between them. All quantiles
+    are found by partitioning a single copy of the elements with introselect in expected linear
+    time instead of sorting them. For unbounded streams use :class:`QuantileSketch` instead.
+
+    Args:
+        collection: Collection to process.
+        qs: Quantile or iterable of quantiles.
+        iteratee: Iteratee applied per iteration.
+
+    Returns:
+        Quantile or list of quantiles in the order of `qs`. ``None`` is returned for each quantile
+        if `collection` is empty.
+
+    Raises:
+        ValueError: If a quantile is not between ``0`` and ``1``.
+
+    Example:
+
+        >>> quantile([1, 2, 3, 4, 5], 0.5)
+        3
+        >>> quantile([1, 2, 3, 4], [0, 0.25, 1])
+        [1, 1.75, 4]
+        >>> quantile([{"ms": 10}, {"ms": 30}, {"ms": 20}], 0.5, "ms")
+        20
+
+    .. versionadded:: 8.1.0
+    """
+    return base_quantile(collection, qs, iteratee, 1, "quantile")
+
+
+class QuantileSketch:
+    """
+    Streaming estimator of quantiles of an unbounded stream of numbers using the P² algorithm of
+    Jain and Chlamtac. Only five markers are kept for each quantile so memory use is constant no
+    matter how many values are pushed. Estimates are exact until more than five values have been
+    seen.
+
+    Args:
+        qs: Quantile or iterable of quantiles between ``0`` and ``1`` to estimate.
+        values: Iterable of initial values. Defaults to no values.
+
+    Raises:
+        ValueError: If a quantile is not between ``0`` and ``1``.
+
+    Example:
+
+        >>> sketch = QuantileSketch([0.5, 0.9], [1, 2, 3])
+        >>> sketch.estimate()
+        [2, 2.8]
+        >>> sketch.update(range(4, 101)).count
+        100
+        >>> [round(value, 1) for value in sketch.estimate()]
+        [50.0, 90.0]
+        >>> QuantileSketch(0.5, [5, 1, 3]).push(7).estimate()
+        4.0
+
+    .. versionadded:: 8.1.0
+    """
+
+    __slots__ = ("count", "qs", "_initial", "_markers", "_single")
+
+    def __init__(
+        self, qs: t.Union[NumberT, t.Iterable[NumberT]], values: t.Iterable[NumberT] = ()
+    ) -> None:
+        self._single = pyd.is_number(qs)
+        #: Quantiles that are estimated.
+        self.qs: t.List[t.Any] = [qs] if self._single else list(qs)  # type: ignore
+        #: Number of values seen.
+        self.count = 0
+        # First few values seen. Markers are initialized from these once there are enough.
+        self._initial: t.List[t.Any] = []
+        # Heights, positions, and desired positions (as fractions of the count) of the markers of
+        # each quantile.
+        self._markers: t.List[t.Tuple[t.List[t.Any], t.List[int], t.Tuple[t.Any, ...]]] = []
+
+        for q in self.qs:
+            if not 0 <= q <= 1:
+                raise ValueError(f"quantile must be between 0 and 1, got {q!r}")
+
+        self.update(values)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(qs={self.qs!r}, count={self.count})"
+
+    def push(self, value: NumberT) -> "QuantileSketch":
+        """Add a single value and return this sketch."""
+        self.count += 1
+
+        if self._markers:
+            for markers in self._markers:
+                update_p2_markers(markers, value, self.count)
+        else:
+            self._initial.append(value)
+
+            if len(self._initial) == 5:
+                heights = sorted(self._initial)
+                self._markers = [
+                    (list(heights), [0, 1, 2, 3, 4], (0, q / 2, q, (1 + q) / 2, 1)) for q in self.qs
+                ]
+
+        return self
+
+    def update(self, values: t.Iterable[NumberT]) -> "QuantileSketch":
+        """Add each value in `values` and return this sketch."""
+        for value in values:
+            self.push(value)
+        return self
+
+    def estimate(self) -> t.Any:
+        """
+        Return the estimate of each quantile in the order of :attr:`qs` or a single estimate if the
+        sketch was created with a single quantile. ``None`` is returned for each quantile if no
+        values have been seen.
+        """
+        if self.count <= 5:
+            estimates = base_quantile(self._initial, self.qs, None, 1, "quantile")
+        else:
+            # The outer markers track the minimum and maximum exactly.
+            estimates = [
+                heights[0] if q == 0 else heights[4] if q == 1 else heights[2]
+                for q, (heights, *_) in zip(self.qs, self._markers)
+            ]
+
+        return estimates[0] if self._single else estimates
+
+
+@t.overload
+def round_(
+    x: t.List[SupportsRound[NumberT]], precision: int = 0, *, backend: t.Optional[BackendT] = None
+) -> t.List[float]: ...
 
 
 @t.overload
-def round_(x: SupportsRound[NumberT], precision: int = 0) -> float: ...
+def round_(
+    x: SupportsRound[NumberT], precision: int = 0, *, backend: t.Optional[BackendT] = None
+) -> float: ...
 
 
-def round_(x, precision=0):
+def round_(x, precision=0, *, backend=None):
     """
     Round number to precision.
 
     Args:
         x: Number to round.
         precision: Rounding precision. Defaults to ``0``.
+        backend: Either ``"numpy"`` or ``"python"``. Defaults to ``"numpy"`` for NumPy arrays and
+            ``"python"`` otherwise.
 
     Returns:
         Rounded number.
@@ -939,29 +1682,152 @@ def round_(x, precision=0):
 
     .. versionchanged:: 4.0.0
         Remove alias ``curve``.
+
+    .. versionchanged:: 8.1.0
+        Added `backend` argument.
     """
+    numpy = numpy_backend(x, backend)
+    values = numeric_ndarray(numpy, x) if numpy else None
+    if values is not None:
+        if values.dtype.kind in "biu":
+            # Integers are rounded to floats like in pure Python.
+            values = values.astype(float)
+        return to_python(numpy.round(values, precision))
+
     return rounder(round, x, precision)
 
 
-@t.overload
-def scale(array: t.Iterable["Decimal"], maximum: "Decimal") -> t.List["Decimal"]: ...
+class RunningStats:
+    """
+    Accumulator of the count, mean, and variance of a stream of numbers that is updated one value at
+    a time using Welford's algorithm. Accumulators of separate parts of a stream (e.g. calculated by
+    parallel workers) can be combined with :meth:`merge`.
 
+    Args:
+        values: Iterable of initial values. Defaults to no values.
 
-@t.overload
-def scale(array: t.Iterable[NumberNoDecimalT], maximum: NumberNoDecimalT) -> t.List[float]: ...
+    Example:
+
+        >>> stats = RunningStats([1, 2, 3])
+        >>> stats.count, stats.mean
+        (3, 2.0)
+        >>> stats.push(4).mean
+        2.5
+        >>> stats.variance()
+        1.25
+        >>> stats.merge(RunningStats([5, 6, 7, 8])).mean
+        4.5
+        >>> stats.variance(ddof=1)
+        6.0
+
+    .. versionadded:: 8.1.0
+    """
+
+    __slots__ = ("count", "mean", "sum_sq")
+
+    def __init__(self, values: t.Iterable[NumberT] = ()) -> None:
+        #: Number of values seen.
+        self.count: int = 0
+        #: Mean of values seen.
+        self.mean: t.Any = 0
+        #: Sum of squared deviations from the mean of values seen.
+        self.sum_sq: t.Any = 0
+        self.update(values)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(count={self.count}, mean={self.mean!r})"
+
+    def push(self, value: NumberT) -> "RunningStats":
+        """Add a single value and return this accumulator."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.sum_sq += delta * (value - self.mean)
+        return self
+
+    def update(self, values: t.Iterable[NumberT]) -> "RunningStats":
+        """Add each value in `values` and return this accumulator."""
+        count, avg, sum_sq = self.count, self.mean, self.sum_sq
+
+        for value in values:
+            count += 1
+            delta = value - avg
+            avg += delta / count
+            sum_sq += delta * (value - avg)
+
+        self.count, self.mean, self.sum_sq = count, avg, sum_sq
+        return self
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Combine the values seen by `other` into this accumulator and return it."""
+        if not other.count:
+            return self
+
+        if not self.count:
+            self.count, self.mean, self.sum_sq = other.count, other.mean, other.sum_sq
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.sum_sq += other.sum_sq + delta * delta * self.count * other.count / count
+        self.count = count
+        return self
+
+    def variance(self, ddof: int = 0) -> float:
+        """
+        Return the variance of values seen. Use ``ddof=1`` for the sample variance.
+
+        Raises:
+            ZeroDivisionError: If fewer than ``ddof + 1`` values have been seen.
+        """
+        if self.count <= ddof:
+            raise ZeroDivisionError(
+                f"variance with ddof={ddof} requires more than {ddof} values, got {self.count}"
+            )
+        return self.sum_sq / (self.count - ddof)
+
+    def std_deviation(self, ddof: int = 0) -> float:
+        """
+        Return the standard deviation of values seen. Use ``ddof=1`` for the sample standard
+        deviation.
+
+        Raises:
+            ZeroDivisionError: If fewer than ``ddof + 1`` values have been seen.
+        """
+        return math.sqrt(self.variance(ddof))
+
+
+@t.overload
+def scale(
+    array: t.Iterable["Decimal"], maximum: "Decimal", *, backend: t.Optional[BackendT] = None
+) -> t.List["Decimal"]: ...
+
+
+@t.overload
+def scale(
+    array: t.Iterable[NumberNoDecimalT],
+    maximum: NumberNoDecimalT,
+    *,
+    backend: t.Optional[BackendT] = None,
+) -> t.List[float]: ...
 
 
 @t.overload
-def scale(array: t.Iterable[NumberT], maximum: int = 1) -> t.List[float]: ...
+def scale(
+    array: t.Iterable[NumberT], maximum: int = 1, *, backend: t.Optional[BackendT] = None
+) -> t.List[float]: ...
 
 
-def scale(array, maximum: NumberT = 1):
+def scale(array, maximum: NumberT = 1, *, backend=None):
     """
     Scale list of value to a maximum number.
 
     Args:
         array: Numbers to scale.
         maximum: Maximum scale value.
+        backend: Either ``"numpy"`` or ``"python"``. Defaults to ``"numpy"`` for NumPy arrays and
+            ``"python"`` otherwise.
 
     Returns:
         Scaled numbers.
@@ -978,7 +1844,17 @@ def scale(array, maximum: NumberT = 1):
         [0.5, 1.0, 1.5, 2.0]
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: 8.1.0
+        Added `backend` argument.
     """
+    numpy = numpy_backend(array, backend)
+    values = numeric_ndarray(numpy, array) if numpy else None
+    if values is not None:
+        if values.size and values.max():
+            return to_python(values * (maximum / values.max()))
+        array = values.tolist()
+
     array_max = max(array)
     factor = maximum / array_max
     return [item * factor for item in array]
@@ -1027,12 +1903,80 @@ def slope(point1, point2):
     return result
 
 
-def std_deviation(array: t.List[NumberT]) -> float:
+def stats_by(
+    collection: t.Iterable[t.Any],
+    iteratee: t.Union[t.Callable[..., NumberT], IterateeObjT, None] = None,
+    *,
+    fsum: bool = False,
+) -> t.Dict[str, t.Any]:
+    """
+    Calculate the count, sum, minimum, maximum, and mean of each element in `collection` in a single
+    pass. If iteratee is passed, each element of `collection` is passed through an iteratee before
+    the statistics are computed.
+
+    Args:
+        collection: Collection to process.
+        iteratee: Iteratee applied per iteration.
+        fsum: Whether to sum with :func:`math.fsum` which avoids the loss of precision when adding
+            many floats at the cost of speed. Defaults to ``False``.
+
+    Returns:
+        Dictionary with ``count``, ``sum``, ``min``, ``max``, and ``mean`` keys. The minimum,
+        maximum, and mean are ``None`` if `collection` is empty.
+
+    Example:
+
+        >>> stats = stats_by([{"ms": 12}, {"ms": 7}, {"ms": 20}], "ms")
+        >>> stats == {"count": 3, "sum": 39, "min": 7, "max": 20, "mean": 13.0}
+        True
+        >>> stats_by([0.1] * 10)["sum"]
+        0.9999999999999999
+        >>> stats_by([0.1] * 10, fsum=True)["sum"]
+        1.0
+
+    .. versionadded:: 8.1.0
+    """
+    count = 0
+    low = high = None
+
+    def track(values):
+        nonlocal count, low, high
+
+        for value in values:
+            if count:
+                if value < low:
+                    low = value
+                elif value > high:
+                    high = value
+            else:
+                low = high = value
+
+            count += 1
+            yield value
+
+    total = (math.fsum if fsum else sum)(track(itervalues_by(collection, iteratee)))
+
+    return {
+        "count": count,
+        "sum": total,
+        "min": low,
+        "max": high,
+        "mean": total / count if count else None,
+    }
+
+
+def std_deviation(
+    array: t.Iterable[NumberT], ddof: int = 0, *, backend: t.Optional[BackendT] = None
+) -> float:
     """
     Calculate standard deviation of list of numbers.
 
     Args:
-        array: List to process.
+        array: Iterable to process.
+        ddof: Delta degrees of freedom. The variance is divided by ``len(array) - ddof`` so ``0``
+            gives the population and ``1`` the sample standard deviation. Defaults to ``0``.
+        backend: Either ``"numpy"`` or ``"python"``. Defaults to ``"numpy"`` for NumPy arrays and
+            ``"python"`` otherwise.
 
     Returns:
         Calculated standard deviation.
@@ -1041,13 +1985,19 @@ def std_deviation(array: t.List[NumberT]) -> float:
 
         >>> round(std_deviation([1, 18, 20, 4]), 2) == 8.35
         True
+        >>> round(std_deviation([1, 18, 20, 4], ddof=1), 2) == 9.64
+        True
 
     .. versionadded:: 2.1.0
 
     .. versionchanged:: 4.0.0
         Remove alias ``sigma``.
+
+    .. versionchanged:: 8.1.0
+        Calculate in a single pass so that `array` can be any iterable. Added `ddof` and `backend`
+        arguments.
     """
-    return math.sqrt(variance(array))
+    return math.sqrt(variance(array, ddof, backend=backend))
 
 
 @t.overload
@@ -1083,46 +2033,116 @@ def subtract(minuend, subtrahend):
     return call_math_operator(minuend, subtrahend, operator.sub, 0)
 
 
-def transpose(array: t.Iterable[t.Iterable[T]]) -> t.List[t.List[T]]:
+@t.overload
+def transpose(
+    array: t.Iterable[t.Iterable[T]],
+    fill_value: t.Any = None,
+    *,
+    truncate: bool = False,
+    lazy: Literal[False] = False,
+    backend: t.Optional[BackendT] = None,
+) -> t.List[t.List[T]]: ...
+
+
+@t.overload
+def transpose(
+    array: t.Iterable[t.Iterable[T]],
+    fill_value: t.Any = None,
+    *,
+    truncate: bool = False,
+    lazy: Literal[True],
+    backend: t.Optional[BackendT] = None,
+) -> t.Generator[t.List[T], None, None]: ...
+
+
+def transpose(array, fill_value=None, *, truncate=False, lazy=False, backend=None):
     """
     Transpose the elements of `array`.
 
+    Rows of different lengths are padded with `fill_value` to the length of the longest row unless
+    `truncate` is ``True`` in which case every row is truncated to the length of the shortest row.
+    The NumPy backend only transposes NumPy arrays since the rows of other arrays can have different
+    lengths and types.
+
     Args:
         array: List to process.
+        fill_value: Value used to pad shorter rows. Defaults to ``None``.
+        truncate: Whether to truncate rows to the length of the shortest row instead of padding
+            them. Defaults to ``False``.
+        lazy: Whether to return a generator that yields each column as it's needed instead of a
+            list of all columns. Defaults to ``False``.
+        backend: Either ``"numpy"`` or ``"python"``. Defaults to ``"numpy"`` for NumPy arrays and
+            ``"python"`` otherwise.
 
     Returns:
-        Transposed list.
+        Transposed list or generator of columns when `lazy` is ``True``.
 
     Example:
 
         >>> transpose([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
         [[1, 4, 7], [2, 5, 8], [3, 6, 9]]
+        >>> transpose([[1, 2, 3], [4, 5]])
+        [[1, 4], [2, 5], [3, None]]
+        >>> transpose([[1, 2, 3], [4, 5]], 0)
+        [[1, 4], [2, 5], [3, 0]]
+        >>> transpose([[1, 2, 3], [4, 5]], truncate=True)
+        [[1, 4], [2, 5]]
+        >>> columns = transpose([[1, 2], [3, 4]], lazy=True)
+        >>> next(columns)
+        [1, 3]
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: 8.1.0
+        Transpose using ``zip`` instead of setting each element by path. Added `fill_value`,
+        `truncate`, `lazy`, and `backend` arguments. Rows of different lengths are now consistently
+        padded with `fill_value` at the end.
     """
-    trans: t.List[t.List[T]] = []
+    numpy = numpy_backend(array, backend)
+    if numpy and isinstance(array, numpy.ndarray):
+        columns = to_python(array.T)
+        return (column for column in columns) if lazy else columns
+
+    if truncate:
+        columns = zip(*array)
+    else:
+        columns = zip_longest(*array, fillvalue=fill_value)
 
-    for y, row in iterator(array):
-        for x, col in iterator(row):
-            trans = pyd.set_(trans, [x, y], col)
+    if lazy:
+        return (list(column) for column in columns)
 
-    return trans
+    return [list(column) for column in columns]
 
 
 @t.overload
-def variance(array: t.Mapping[t.Any, "SupportsAdd[int, t.Any]"]) -> float: ...
+def variance(
+    array: t.Mapping[t.Any, "SupportsAdd[int, t.Any]"],
+    ddof: int = 0,
+    *,
+    backend: t.Optional[BackendT] = None,
+) -> float: ...
 
 
 @t.overload
-def variance(array: t.Iterable["SupportsAdd[int, t.Any]"]) -> float: ...
+def variance(
+    array: t.Iterable["SupportsAdd[int, t.Any]"],
+    ddof: int = 0,
+    *,
+    backend: t.Optional[BackendT] = None,
+) -> float: ...
 
 
-def variance(array):
+def variance(array, ddof=0, *, backend=None):
     """
     Calculate the variance of the elements in `array`.
 
     Args:
-        array: List to process.
+        array: Iterable to process.
+        ddof: Delta degrees of freedom. The sum of squared deviations is divided by
+            ``len(array) - ddof`` so ``0`` gives the population and ``1`` the sample variance.
+            Defaults to ``0``.
+        backend: Either ``"numpy"`` or ``"python"``. Defaults to ``"numpy"`` for NumPy arrays and
+            ``"python"`` otherwise.
 
     Returns:
         Calculated variance.
@@ -1131,54 +2151,96 @@ def variance(array):
 
         >>> variance([1, 18, 20, 4])
         69.6875
+        >>> variance([1, 18, 20, 4], ddof=1)
+        92.91666666666667
 
     .. versionadded:: 2.1.0
-    """
-    avg = mean(array)
 
-    def var(x):
-        return power(x - avg, 2)
+    .. versionchanged:: 8.1.0
+        Calculate in a single pass with Welford's algorithm so that `array` can be any iterable.
+        Added `ddof` and `backend` arguments.
+    """
+    numpy = numpy_backend(array, backend)
+    if numpy:
+        values = to_ndarray(numpy, array)
+        if values.size > ddof:
+            return to_python(numpy.var(values, ddof=ddof))
+        array = values.tolist()
 
-    return pyd._(array).map_(var).mean().value()
+    return RunningStats(itervalues(array)).variance(ddof)
 
 
 @t.overload
 def zscore(
-    collection: t.Mapping[T, T2], iteratee: t.Callable[[T2, T, t.Dict[T, T2]], NumberT]
+    collection: t.Mapping[T, T2],
+    iteratee: t.Callable[[T2, T, t.Dict[T, T2]], NumberT],
+    ddof: int = 0,
+    *,
+    backend: t.Optional[BackendT] = None,
 ) -> t.List[float]: ...
 
 
 @t.overload
 def zscore(
-    collection: t.Mapping[T, T2], iteratee: t.Callable[[T2, T], NumberT]
+    collection: t.Mapping[T, T2],
+    iteratee: t.Callable[[T2, T], NumberT],
+    ddof: int = 0,
+    *,
+    backend: t.Optional[BackendT] = None,
 ) -> t.List[float]: ...
 
 
 @t.overload
 def zscore(
-    collection: t.Mapping[t.Any, T2], iteratee: t.Callable[[T2], NumberT]
+    collection: t.Mapping[t.Any, T2],
+    iteratee: t.Callable[[T2], NumberT],
+    ddof: int = 0,
+    *,
+    backend: t.Optional[BackendT] = None,
 ) -> t.List[float]: ...
 
 
 @t.overload
 def zscore(
-    collection: t.Iterable[T], iteratee: t.Callable[[T, int, t.List[T]], NumberT]
+    collection: t.Iterable[T],
+    iteratee: t.Callable[[T, int, t.List[T]], NumberT],
+    ddof: int = 0,
+    *,
+    backend: t.Optional[BackendT] = None,
 ) -> t.List[float]: ...
 
 
 @t.overload
-def zscore(collection: t.Iterable[T], iteratee: t.Callable[[T, int], NumberT]) -> t.List[float]: ...
+def zscore(
+    collection: t.Iterable[T],
+    iteratee: t.Callable[[T, int], NumberT],
+    ddof: int = 0,
+    *,
+    backend: t.Optional[BackendT] = None,
+) -> t.List[float]: ...
 
 
 @t.overload
-def zscore(collection: t.Iterable[T], iteratee: t.Callable[[T], NumberT]) -> t.List[float]: ...
+def zscore(
+    collection: t.Iterable[T],
+    iteratee: t.Callable[[T], NumberT],
+    ddof: int = 0,
+    *,
+    backend: t.Optional[BackendT] = None,
+) -> t.List[float]: ...
 
 
 @t.overload
-def zscore(collection: t.Iterable[NumberT], iteratee: None = None) -> t.List[float]: ...
+def zscore(
+    collection: t.Iterable[NumberT],
+    iteratee: None = None,
+    ddof: int = 0,
+    *,
+    backend: t.Optional[BackendT] = None,
+) -> t.List[float]: ...
 
 
-def zscore(collection, iteratee=None):
+def zscore(collection, iteratee=None, ddof=0, *, backend=None):
     """
     Calculate the standard score assuming normal distribution. If iteratee is passed, each element
     of `collection` is passed through an iteratee before the standard score is computed.
@@ -1186,6 +2248,9 @@ def zscore(collection, iteratee=None):
     Args:
         collection: Collection to process.
         iteratee: Iteratee applied per iteration.
+        ddof: Delta degrees of freedom used for the standard deviation. Defaults to ``0``.
+        backend: Either ``"numpy"`` or ``"python"``. Defaults to ``"numpy"`` for NumPy arrays and
+            ``"python"`` otherwise.
 
     Returns:
         Calculated standard score.
@@ -1197,10 +2262,25 @@ def zscore(collection, iteratee=None):
         # [-1.224744871391589, 0.0, 1.224744871391589]
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: 8.1.0
+        Calculate the mean and standard deviation in a single pass. Added `ddof` and `backend`
+        arguments.
     """
+    numpy = numpy_backend(collection, backend)
+    if numpy:
+        values = to_ndarray(
+            numpy, collection if iteratee is None else pyd.map_(collection, iteratee)
+        )
+        sig = values.std(ddof=ddof) if values.size > ddof else 0
+        if sig:
+            return to_python((values - values.mean()) / sig)
+        collection, iteratee = values.tolist(), None
+
     array = pyd.map_(collection, iteratee)
-    avg = mean(array)
-    sig = std_deviation(array)
+    stats = RunningStats(array)
+    avg = stats.mean
+    sig = stats.std_deviation(ddof)
 
     return [(item - avg) / sig for item in array]
 
@@ -1210,6 +2290,43 @@ def zscore(collection, iteratee=None):
 #
 
 
+def base_quantile(collection, qs, iteratee, limit, name):
+    """Return quantiles `qs`, given as fractions of `limit`, of the values of `collection`."""
+    single = pyd.is_number(qs)
+    qs = [qs] if single else list(qs)
+
+    for q in qs:
+        if not 0 <= q <= limit:
+            raise ValueError(f"{name} must be between 0 and {limit}, got {q!r}")
+
+    values = mapped_values(collection, iteratee)
+
+    if not values:
+        return None if single else [None] * len(qs)
+
+    positions = [q * (len(values) - 1) / limit for q in qs]
+    ranks = set()
+
+    for position in positions:
+        ranks.add(math.floor(position))
+        ranks.add(math.ceil(position))
+
+    found = select_ranks(values, ranks)
+    results = []
+
+    for position in positions:
+        lower = found[math.floor(position)]
+        fraction = position - math.floor(position)
+
+        if fraction:
+            upper = found[math.ceil(position)]
+            lower += (upper - lower) * fraction
+
+        results.append(lower)
+
+    return results[0] if single else results
+
+
 def call_math_operator(value1, value2, op, default):
     """Return the result of the math operation on the given values."""
     if value1 is None:
@@ -1233,6 +2350,95 @@ def call_math_operator(value1, value2, op, default):
     return op(value1, value2)
 
 
+def itermoving_extreme(array, size, discard):
+    """Yield the extreme value of each window of `size` consecutive elements of `array` using a
+    monotonic queue. Values at the back of the queue for which ``discard(back, value)`` is true are
+    dropped since they can never be the extreme value of a window containing `value`."""
+    size = int(size)
+    if size < 1:
+        return
+
+    # Queue of (index, value) with the extreme value of the current window at the front.
+    candidates = deque()
+
+    for index, value in enumerate(array):
+        while candidates and discard(candidates[-1][1], value):
+            candidates.pop()
+
+        candidates.append((index, value))
+
+        if candidates[0][0] <= index - size:
+            candidates.popleft()
+
+        if index >= size - 1:
+            yield candidates[0][1]
+
+
+def itervalues(collection):
+    """Return iterable of the values of `collection` whether it's a mapping or not."""
+    if isinstance(collection, Mapping):
+        return collection.values()
+    return collection
+
+
+def itervalues_by(collection, iteratee=None):
+    """
+    Return iterable of the result of `iteratee` for each value of `collection`. Unlike
+    :func:`iteriteratee` no tuple is created per value and the common cases of no `iteratee` or a
+    property name `iteratee` are iterated without calling :func:`callit`. A column name `iteratee`
+    of a :class:`.Table` iterates over the values of the column.
+    """
+    column = table_column(collection, iteratee) if isinstance(collection, Table) else None
+
+    if column is not None:
+        return column_values(column)
+
+    if isinstance(collection, Mapping):
+        values = collection.values()
+    elif isinstance(collection, Iterable) and not hasattr(collection, "items"):
+        values = collection
+    else:
+        values = None
+
+    if values is not None and iteratee is None:
+        return values
+
+    if values is not None and isinstance(iteratee, str):
+        return map(property_getter(iteratee), values)
+
+    return (result[0] for result in iteriteratee(collection, iteratee))
+
+
+def mapped_values(collection, iteratee=None):
+    """Return list of the values of `collection` mapped through `iteratee`."""
+    column = table_column(collection, iteratee) if isinstance(collection, Table) else None
+
+    if column is not None:
+        return list(column_values(column))
+
+    if iteratee is None:
+        return list(itervalues(collection))
+    return [result[0] for result in iteriteratee(collection, iteratee)]
+
+
+def property_getter(path):
+    """
+    Return callable like :func:`pydash.utilities.property_` that looks up `path` of dictionaries
+    directly when it is a plain key.
+    """
+    getter = pyd.property_(path)
+
+    if "." in path or "[" in path or "\\" in path:
+        return getter
+
+    def get(obj):
+        if type(obj) is dict and path in obj:
+            return obj[path]
+        return getter(obj)
+
+    return get
+
+
 def rounder(func, x, precision):
     precision = pow(10, precision)
 
@@ -1250,3 +2456,126 @@ def rounder(func, x, precision):
             pass
 
     return result
+
+
+def select_ranks(array, ranks):
+    """
+    Return dict mapping each rank in `ranks` to the element of `array` that would be at that index
+    if `array` was sorted.
+
+    Elements are partitioned around a median of three pivot and only the partitions that contain a
+    wanted rank are processed further (introselect). Partitions are sorted once they're small or
+    once partitioning has gone on for too long so that the worst case is ``O(n log n)``.
+    """
+    found = {}
+    stack = [(array, 0, sorted(ranks), 2 * len(array).bit_length())]
+
+    while stack:
+        items, offset, wanted, depth = stack.pop()
+
+        if len(items) <= SELECT_SORT_SIZE or depth <= 0:
+            items = sorted(items)
+            for rank in wanted:
+                found[rank] = items[rank - offset]
+            continue
+
+        pivot = sorted((items[0], items[len(items) // 2], items[-1]))[1]
+        lower = [item for item in items if item < pivot]
+        upper = [item for item in items if pivot < item]
+        # Ranks in [lower_end, upper_start) are equal to the pivot.
+        lower_end = offset + len(lower)
+        upper_start = offset + len(items) - len(upper)
+
+        for rank in wanted:
+            if lower_end <= rank < upper_start:
+                found[rank] = pivot
+
+        lower_wanted = [rank for rank in wanted if rank < lower_end]
+        upper_wanted = [rank for rank in wanted if rank >= upper_start]
+
+        if lower_wanted:
+            stack.append((lower, offset, lower_wanted, depth - 1))
+
+        if upper_wanted:
+            stack.append((upper, upper_start, upper_wanted, depth - 1))
+
+    return found
+
+
+def to_ndarray(numpy, collection):
+    """Return `collection` or the values of a mapping `collection` as a NumPy array."""
+    if isinstance(collection, numpy.ndarray):
+        return collection
+
+    values = itervalues(collection)
+
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+
+    return numpy.asarray(values)
+
+
+def numeric_ndarray(numpy, value):
+    """
+    Return `value` if it's a NumPy array, `value` as a NumPy array if it's a list or tuple of
+    numbers that NumPy stores as integers or floats, or ``None`` otherwise.
+    """
+    if isinstance(value, numpy.ndarray):
+        return value
+
+    if isinstance(value, (list, tuple)) and all(pyd.is_number(item) for item in value):
+        values = numpy.asarray(value)
+        if values.dtype.kind in "iuf":
+            return values
+
+    return None
+
+
+def to_python(value):
+    """Convert NumPy arrays and scalars to the equivalent Python lists and numbers."""
+    return value.tolist() if hasattr(value, "tolist") else value
+
+
+def update_p2_markers(markers, value, count):
+    """Update P² markers of :class:`QuantileSketch` with the `count`-th value seen."""
+    heights, positions, fractions = markers
+
+    if value < heights[0]:
+        heights[0] = value
+        cell = 0
+    elif value >= heights[4]:
+        heights[4] = value
+        cell = 3
+    else:
+        cell = bisect_right(heights, value) - 1
+
+    for i in range(cell + 1, 5):
+        positions[i] += 1
+
+    # Move the middle markers towards their desired positions.
+    for i in (1, 2, 3):
+        delta = (count - 1) * fractions[i] - positions[i]
+
+        if -1 < delta < 1:
+            continue
+
+        right = positions[i + 1] - positions[i]
+        left = positions[i - 1] - positions[i]
+
+        if (delta >= 1 and right > 1) or (delta <= -1 and left < -1):
+            step = 1 if delta > 0 else -1
+            # Piecewise parabolic prediction of the new height.
+            height = heights[i] + step / (right - left) * (
+                (step - left) * (heights[i + 1] - heights[i]) / right
+                + (right - step) * (heights[i] - heights[i - 1]) / -left
+            )
+
+            if not heights[i - 1] < height < heights[i + 1]:
+                # Fall back to linear prediction when the parabola isn't monotonic.
+                neighbor = i + step
+                height = heights[i] + step * (heights[neighbor] - heights[i]) / (
+                    positions[neighbor] - positions[i]
+                )
+
+            heights[i] = height
+            positions[i] += step
@@ -6,8 +6,9 @@ Functions that operate on lists, dicts, and other objects.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 import copy
-from functools import partial
+from functools import lru_cache, partial
 import math
 import re
 import typing as t
@@ -19,6 +20,8 @@ from .helpers import (
     Unset,
     _raise_if_restricted_key,
     base_get,
+    base_iterwalk,
+    base_lookup,
     base_set,
     callit,
     getargcount,
@@ -26,7 +29,14 @@ from .helpers import (
     iteriteratee,
 )
 from .types import IterateeObjT, PathT
-from .utilities import PathToken, to_path, to_path_tokens
+from .utilities import (
+    PATH_KEYS_PATTERN,
+    PathToken,
+    escape_path_key,
+    split_path_keys,
+    to_path,
+    to_path_tokens,
+)
 
 
 if t.TYPE_CHECKING:
@@ -46,28 +56,37 @@ __all__ = (
     "clone_with",
     "defaults",
     "defaults_deep",
+    "diff",
     "find_key",
     "find_last_key",
+    "flatten_keys",
     "for_in",
     "for_in_right",
     "get",
+    "get_many",
     "has",
     "invert",
     "invert_by",
     "invoke",
+    "iterflatten_keys",
+    "iterwalk",
     "keys",
     "map_keys",
     "map_values",
     "map_values_deep",
     "merge",
+    "merge_in",
     "merge_with",
     "omit",
     "omit_by",
     "parse_int",
+    "patch",
     "pick",
     "pick_by",
     "rename_keys",
     "set_",
+    "set_in",
+    "set_many",
     "set_with",
     "to_boolean",
     "to_dict",
@@ -77,10 +96,14 @@ __all__ = (
     "to_pairs",
     "to_string",
     "transform",
+    "unflatten_keys",
     "unset",
+    "unset_in",
     "update",
+    "update_in",
     "update_with",
     "values",
+    "walk",
 )
 
 T = t.TypeVar("T")
@@ -89,6 +112,15 @@ T3 = t.TypeVar("T3")
 T4 = t.TypeVar("T4")
 T5 = t.TypeVar("T5")
 
+#: Immutable types that are shared instead of copied by :func:`clone_deep`.
+ATOMIC_TYPES = frozenset((str, int, float, bool, bytes, complex, type(None)))
+
+#: Supported list styles of :func:`flatten_keys`.
+FLATTEN_LIST_STYLES = ("brackets", "dots")
+
+#: Supported orders of :func:`walk` and :func:`iterwalk`.
+WALK_ORDERS = ("pre", "post")
+
 
 @t.overload
 def assign(
@@ -400,6 +432,10 @@ def clone_deep(value: T) -> T:
 
     .. versionchanged:: 4.0.0
         Moved 'iteratee' parameter to :func:`clone_deep_with`.
+
+    .. versionchanged:: 8.1.0
+        Clone nested ``dict`` and ``list`` objects without :func:`copy.deepcopy` which is only used
+        for other types.
     """
     return base_clone(value, is_deep=True)
 
@@ -458,6 +494,10 @@ def clone_deep_with(value, customizer=None):
 
     Returns:
         Cloned object.
+
+    .. versionchanged:: 8.1.0
+        Walk `value` with :func:`walk` so that nested dicts and lists are cloned without modifying
+        `value`.
     """
     return base_clone(value, is_deep=True, customizer=customizer)
 
@@ -498,7 +538,7 @@ def defaults(
 
 
 def defaults_deep(
-    obj: t.Dict[T, T2], *sources: t.Dict[T3, T4]
+    obj: t.Dict[T, T2], *sources: t.Dict[T3, T4], copy_values: bool = True
 ) -> t.Dict[t.Union[T, T3], t.Union[T2, T4]]:
     """
     This method is like :func:`defaults` except that it recursively assigns default properties.
@@ -506,6 +546,10 @@ def defaults_deep(
     Args:
         obj: Destination object whose properties will be modified.
         sources: Source objects to assign to `obj`.
+        copy_values: Whether to deep clone source values that are assigned to `obj`. Pass ``False``
+            to assign them as-is when the sources won't be mutated afterwards. Objects shared with
+            the sources are still copied before anything is merged into them so that the sources
+            aren't modified. Defaults to ``True``.
 
     Returns:
         Modified `obj`.
@@ -523,13 +567,52 @@ def defaults_deep(
         True
 
     .. versionadded:: 3.3.0
+
+    .. versionchanged:: 8.1.0
+        Only clone source values that are assigned to `obj` and added `copy_values` argument.
     """
 
-    def setter(obj, key, value):
-        if hasattr(obj, "setdefault"):
-            obj.setdefault(key, value)
+    def setter(obj, key, value, clone):
+        if hasattr(obj, "setdefault") and key not in obj:
+            obj.setdefault(key, clone(value))
+
+    return merge_with(obj, *sources, copy_values=copy_values, _setter=setter)
+
+
+def diff(
+    old: t.Any, new: t.Any, iteratee: t.Any = None
+) -> t.List[t.Tuple[str, t.List[t.Any], t.Any]]:
+    """
+    Creates a list of changes that turn `old` into `new` when applied in order with :func:`patch`.
+    Each change is an ``(op, path, value)`` tuple where `op` is either ``"set"`` or ``"unset"``,
+    `path` is a list of keys, and `value` is the new value or ``None`` for ``"unset"``. Dicts and
+    lists of the same type are compared key by key while any other values are compared with ``==``
+    like :func:`pydash.predicates.is_equal` does. Identical and equal sub-objects are skipped
+    without being walked.
+
+    Args:
+        old: Object to compare from.
+        new: Object to compare to.
+        iteratee: Property path or function that returns the key of a list item. When given, list
+            items are matched by their key instead of their index so that removing an item doesn't
+            change every item after it. Defaults to ``None``.
+
+    Returns:
+        List of changes.
+
+    Example:
+
+        >>> diff({"a": 1, "b": {"c": 2}}, {"a": 1, "b": {"c": 3}, "d": 4})
+        [('set', ['b', 'c'], 3), ('set', ['d'], 4)]
+        >>> diff({"a": [1, 2, 3]}, {"a": [1, 3]})
+        [('set', ['a', 1], 3), ('unset', ['a', 2], None)]
+        >>> diff([{"id": 1}, {"id": 2}, {"id": 3}], [{"id": 1}, {"id": 3}], "id")
+        [('unset', [1], None)]
 
-    return merge_with(obj, *sources, _setter=setter)
+    .. versionadded:: 8.1.0
+    """
+    key = None if iteratee is None else pyd.iteratee(iteratee)
+    return base_diff(old, new, key)
 
 
 @t.overload
@@ -669,6 +752,39 @@ def find_last_key(obj, predicate=None):
             return key
 
 
+def flatten_keys(obj: t.Any, sep: str = ".", list_style: str = "brackets") -> t.Dict[str, t.Any]:
+    """
+    Flattens a nested object into a dict of its leaf values keyed by their path. Dict keys are
+    converted to strings with any `sep`, ``[``, ``]``, and backslash characters escaped with a
+    backslash so that the paths can be parsed by :func:`get`, :func:`set_`, or
+    :func:`unflatten_keys`. Empty dicts and lists are kept as leaf values.
+
+    Args:
+        obj: Object to flatten.
+        sep: Separator between path keys. Defaults to ``"."``.
+        list_style: How list indexes are written. ``"brackets"`` writes ``a[0]`` which
+            :func:`unflatten_keys` turns back into lists while ``"dots"`` writes them like dict keys
+            (e.g. ``a.0``). Defaults to ``"brackets"``.
+
+    Returns:
+        Flattened dict.
+
+    Raises:
+        ValueError: If `list_style` isn't supported or a dict key is an empty string which a path
+            can't represent.
+
+    Example:
+
+        >>> flatten_keys({"a": {"b": [1, {"c": 2}], "d.e": 3}})
+        {'a.b[0]': 1, 'a.b[1].c': 2, 'a.d\\\\.e': 3}
+        >>> flatten_keys({"a": {"b": [1, 2]}}, sep="/", list_style="dots")
+        {'a/b/0': 1, 'a/b/1': 2}
+
+    .. versionadded:: 8.1.0
+    """
+    return dict(iterflatten_keys(obj, sep=sep, list_style=list_style))
+
+
 @t.overload
 def for_in(
     obj: t.Mapping[T, T2], iteratee: t.Callable[[T2, T, t.Dict[T, T2]], t.Any]
@@ -864,27 +980,62 @@ def get(obj: t.Any, path: PathT, default: t.Any = None) -> t.Any:
 
     .. versionchanged:: 4.7.6
         Fixed bug where getattr is used on Mappings and Sequence in Python 3.5+
+    .. versionchanged:: 8.1.0
+        Look up each key without raising and catching an exception when it's missing.
     """
-    if default is UNSET:
-        # When NoValue given for default, then this method will raise if path is not present in obj.
-        sentinel = default
-    else:
-        # When a returnable default is given, use a sentinel value to detect when base_get() returns
-        # a default value for a missing path, so we can exit early from the loop and not mistakenly
-        # iterate over the default.
-        sentinel = object()
-
     for key in to_path(path):
-        obj = base_get(obj, key, default=sentinel)
+        value = base_lookup(obj, key)
 
-        if obj is sentinel:
-            # Path doesn't exist so set return obj to the default.
-            obj = default
-            break
+        if value is UNSET:
+            if default is UNSET:
+                # When UNSET is given for default, then this method will raise if path is not
+                # present in obj.
+                raise KeyError(f'Object "{repr(obj)}" does not have key "{key}"')
+            # Path doesn't exist so return the default.
+            return default
+
+        obj = value
 
     return obj
 
 
+@t.overload
+def get_many(obj: t.Any, paths: t.Mapping[T, PathT], default: t.Any = None) -> t.Dict[T, t.Any]: ...
+
+
+@t.overload
+def get_many(obj: t.Any, paths: t.Iterable[PathT], default: t.Any = None) -> t.List[t.Any]: ...
+
+
+def get_many(obj, paths, default=None):
+    """
+    Get the values at many paths of `obj` at once like calling :func:`get` for each path. The paths
+    are compiled into a trie so that each shared path prefix is only walked once.
+
+    Args:
+        obj: Object to process.
+        paths: List of paths or a mapping of names to paths.
+        default: Default value to return for each path that doesn't exist. Defaults to ``None``.
+
+    Returns:
+        List of values in the order of `paths` or, if `paths` is a mapping, a dict of values keyed
+        by name.
+
+    Example:
+
+        >>> obj = {"a": {"b": {"c": 1, "d": 2}, "e": [{"f": 3}]}}
+        >>> get_many(obj, ["a.b.c", "a.b.d", "a.e[0].f", "a.x"])
+        [1, 2, 3, None]
+        >>> get_many(obj, {"c": "a.b.c", "f": ["a", "e", 0, "f"]})
+        {'c': 1, 'f': 3}
+
+    .. versionadded:: 8.1.0
+    """
+    if isinstance(paths, Mapping):
+        return dict(zip(paths.keys(), base_get_many(obj, paths.values(), default=default)))
+    return base_get_many(obj, paths, default=default)
+
+
 def has(obj: t.Any, path: PathT) -> bool:
     """
     Checks if `path` exists as a key of `obj`.
@@ -922,14 +1073,22 @@ def has(obj: t.Any, path: PathT) -> bool:
 
     .. versionchanged:: 4.0.0
         Removed aliases ``deep_has`` and ``has_path``.
+
+    .. versionchanged:: 8.1.0
+        Look up each key without raising and catching an exception when it's missing.
     """
     try:
-        get(obj, path, default=UNSET)
-        exists = True
+        for key in to_path(path):
+            obj = base_lookup(obj, key)
+
+            if obj is UNSET:
+                return False
     except (KeyError, IndexError, TypeError, ValueError):
-        exists = False
+        # Only raised for restricted keys and by unusual objects whose item access errors aren't
+        # caught while looking up a key.
+        return False
 
-    return exists
+    return True
 
 
 @t.overload
@@ -1072,6 +1231,88 @@ def invoke(obj: t.Any, path: PathT, *args: t.Any, **kwargs: t.Any) -> t.Any:
     return ret
 
 
+def iterflatten_keys(
+    obj: t.Any, sep: str = ".", list_style: str = "brackets"
+) -> t.Iterator[t.Tuple[str, t.Any]]:
+    """
+    Like :func:`flatten_keys` except that the ``(path, value)`` pairs are yielded as `obj` is walked
+    so that large objects can be streamed without building the flattened dict.
+
+    Args:
+        obj: Object to flatten.
+        sep: Separator between path keys. Defaults to ``"."``.
+        list_style: How list indexes are written. ``"brackets"`` writes ``a[0]`` which
+            :func:`unflatten_keys` turns back into lists while ``"dots"`` writes them like dict keys
+            (e.g. ``a.0``). Defaults to ``"brackets"``.
+
+    Returns:
+        Iterator of ``(path, value)`` pairs.
+
+    Raises:
+        ValueError: If `list_style` isn't supported or a dict key is an empty string which a path
+            can't represent.
+
+    Example:
+
+        >>> list(iterflatten_keys({"a": [1, {"b": 2}]}))
+        [('a[0]', 1), ('a[1].b', 2)]
+
+    .. versionadded:: 8.1.0
+    """
+    if list_style not in FLATTEN_LIST_STYLES:
+        raise ValueError(
+            f"list_style must be one of {', '.join(FLATTEN_LIST_STYLES)}, not {list_style!r}"
+        )
+
+    return base_flatten_keys(obj, sep, list_style == "brackets")
+
+
+def iterwalk(
+    obj: t.Any,
+    order: str = "pre",
+    prune: t.Union[t.Callable[..., t.Any], None] = None,
+    max_depth: t.Union[int, None] = None,
+) -> t.Iterator[t.Tuple[t.List[t.Any], t.Any, t.Any]]:
+    """
+    Walks `obj` and every value nested in its dicts and lists without recursion and yields a
+    ``(path, value, parent)`` tuple for each of them. The `path` is the list of keys to `value` and
+    `parent` is the dict or list holding it or ``None`` for `obj` itself.
+
+    Args:
+        obj: Object to walk.
+        order: ``"pre"`` to yield each dict and list before the values it holds or ``"post"`` to
+            yield it after them. Defaults to ``"pre"``.
+        prune: Predicate invoked with ``(value, path)`` for each dict and list. The values it holds
+            aren't walked when it returns truthy. Defaults to ``None``.
+        max_depth: Number of levels below `obj` to walk. All levels are walked when ``None``.
+            Defaults to ``None``.
+
+    Returns:
+        Iterator of ``(path, value, parent)`` tuples.
+
+    Raises:
+        ValueError: If `order` isn't supported or, while iterating, if `obj` contains a reference
+            to itself.
+
+    Example:
+
+        >>> [path for path, _, _ in iterwalk({"a": [1, {"b": 2}]})]
+        [[], ['a'], ['a', 0], ['a', 1], ['a', 1, 'b']]
+        >>> [value for _, value, _ in iterwalk([1, [2]], order="post")]
+        [1, 2, [2], [1, [2]]]
+        >>> [path for path, _, _ in iterwalk({"a": [1, {"b": 2}]}, order="post", max_depth=1)]
+        [['a'], []]
+        >>> [path for path, _, _ in iterwalk({"a": [1], "b": [2]}, prune=lambda v, p: p == ["a"])]
+        [[], ['a'], ['b'], ['b', 0]]
+
+    .. versionadded:: 8.1.0
+    """
+    if order not in WALK_ORDERS:
+        raise ValueError(f"order must be one of {', '.join(WALK_ORDERS)}, not {order!r}")
+
+    return base_iterwalk_paths(obj, order, path_callback(prune), max_depth)
+
+
 @t.overload
 def keys(obj: t.Iterable[T]) -> t.List[T]: ...
 
@@ -1232,6 +1473,9 @@ def map_values_deep(
     obj: t.Iterable[t.Any],
     iteratee: t.Union[t.Callable[..., t.Any], None] = None,
     property_path: t.Any = UNSET,
+    *,
+    in_place: bool = True,
+    paths: bool = True,
 ) -> t.Any:
     """
     Map all non-object values in `obj` with return values from `iteratee`. The iteratee is invoked
@@ -1242,12 +1486,19 @@ def map_values_deep(
         obj: Object to map.
         iteratee: Iteratee applied to each value.
         property_path: Path key(s) to access.
+        in_place: Whether to modify `obj` in place. If ``False``, the nested objects of `obj` are
+            copied and `obj` is left unmodified. Defaults to ``True``.
+        paths: Whether to pass ``property_path`` to `iteratee`. Pass ``False`` to skip building a
+            path for each value when `iteratee` doesn't need it. Defaults to ``True``.
 
     Returns:
         The modified object.
 
+    Raises:
+        ValueError: If `obj` contains a reference to itself.
+
     Warning:
-        `obj` is modified in place.
+        `obj` is modified in place unless `in_place` is ``False``.
 
     Example:
 
@@ -1258,6 +1509,11 @@ def map_values_deep(
         >>> z = map_values_deep(x, lambda val, props: props)
         >>> z == {"a": ["a"], "b": {"c": ["b", "c"]}}
         True
+        >>> x = {"a": 1, "b": {"c": 2}}
+        >>> map_values_deep(x, str, in_place=False, paths=False) == {"a": "1", "b": {"c": "2"}}
+        True
+        >>> x == {"a": 1, "b": {"c": 2}}
+        True
 
     .. versionadded: 2.2.0
 
@@ -1266,17 +1522,20 @@ def map_values_deep(
 
     .. versionchanged:: 4.0.0
         Renamed from ``deep_map_values`` to ``map_values_deep``.
+
+    .. versionchanged:: 8.1.0
+        Map values without recursion and added `in_place` and `paths` arguments.
     """
-    properties = to_path(property_path)
+    if iteratee is None:
+        iteratee = pyd.identity
 
-    if pyd.is_object(obj):
+    argcount = getargcount(iteratee, maxargs=2) if paths else 1
+    properties = to_path(property_path)
 
-        def deep_iteratee(value, key):
-            return map_values_deep(value, iteratee, pyd.flatten([properties, key]))
+    if not pyd.is_object(obj):
+        return callit(iteratee, obj, properties, argcount=argcount)
 
-        return assign(obj, map_values(obj, deep_iteratee))  # type: ignore
-    else:
-        return callit(iteratee, obj, properties)
+    return base_map_values_deep(obj, iteratee, properties, argcount, in_place)
 
 
 def apply(obj: T, func: t.Callable[[T], T2]) -> T2:
@@ -1396,15 +1655,17 @@ def apply_catch(obj, func, exceptions, default=UNSET):
 
 @t.overload
 def merge(
-    obj: t.Mapping[T, T2], *sources: t.Mapping[T3, T4]
+    obj: t.Mapping[T, T2], *sources: t.Mapping[T3, T4], copy_values: bool = True
 ) -> t.Dict[t.Union[T, T3], t.Union[T2, T4]]: ...
 
 
 @t.overload
-def merge(obj: t.Sequence[T], *sources: t.Sequence[T2]) -> t.List[t.Union[T, T2]]: ...
+def merge(
+    obj: t.Sequence[T], *sources: t.Sequence[T2], copy_values: bool = True
+) -> t.List[t.Union[T, T2]]: ...
 
 
-def merge(obj, *sources):
+def merge(obj, *sources, copy_values=True):
     """
     Recursively merges properties of the source object(s) into the destination object. Subsequent
     sources will overwrite property assignments of previous sources.
@@ -1412,6 +1673,10 @@ def merge(obj, *sources):
     Args:
         obj: Destination object to merge source(s) into.
         sources: Source objects to merge from. subsequent sources overwrite previous ones.
+        copy_values: Whether to deep clone source values that are assigned to `obj`. Pass ``False``
+            to assign them as-is when the sources won't be mutated afterwards. Objects shared with
+            the sources are still copied before anything is merged into them so that the sources
+            aren't modified. Defaults to ``True``.
 
     Returns:
         Merged object.
@@ -1441,8 +1706,55 @@ def merge(obj, *sources):
 
     .. versionchanged:: 4.9.3
         Fixed regression in v4.8.0 that caused exception when `obj` was ``None``.
+
+    .. versionchanged:: 8.1.0
+        Only clone source values that are assigned to `obj` instead of each whole `source` and
+        added `copy_values` argument.
+    """
+    return merge_with(obj, *sources, copy_values=copy_values)
+
+
+@t.overload
+def merge_in(
+    obj: t.Mapping[T, T2], *sources: t.Mapping[T3, T4]
+) -> t.Dict[t.Union[T, T3], t.Union[T2, T4]]: ...
+
+
+@t.overload
+def merge_in(obj: t.Sequence[T], *sources: t.Sequence[T2]) -> t.List[t.Union[T, T2]]: ...
+
+
+def merge_in(obj, *sources):
+    """
+    This method is like :func:`merge` except that `obj` isn't modified. Only the objects of `obj`
+    that are merged into are shallow copied while every other value is shared with `obj` and
+    `sources`.
+
+    Args:
+        obj: Object to merge source(s) into.
+        sources: Source objects to merge from. subsequent sources overwrite previous ones.
+
+    Returns:
+        Merged copy of `obj`.
+
+    Warning:
+        The result shares values with `obj` and `sources` so none of them should be modified in
+        place afterwards.
+
+    Example:
+
+        >>> obj = {"a": {"b": 1}, "c": {"d": 2}}
+        >>> obj2 = merge_in(obj, {"a": {"e": 3}})
+        >>> obj2 == {"a": {"b": 1, "e": 3}, "c": {"d": 2}}
+        True
+        >>> obj == {"a": {"b": 1}, "c": {"d": 2}}
+        True
+        >>> obj2["c"] is obj["c"]
+        True
+
+    .. versionadded:: 8.1.0
     """
-    return merge_with(obj, *sources)
+    return merge_with(obj, *sources, copy_values=False, _persistent=True)
 
 
 def merge_with(obj: t.Any, *sources: t.Any, **kwargs: t.Any) -> t.Any:
@@ -1460,6 +1772,10 @@ def merge_with(obj: t.Any, *sources: t.Any, **kwargs: t.Any) -> t.Any:
     Keyword Args:
         iteratee: Iteratee function to handle merging
             (must be passed in as keyword argument).
+        copy_values: Whether to deep clone source values that are assigned to `obj`. Pass ``False``
+            to assign them as-is when the sources won't be mutated afterwards. Objects shared with
+            the sources are still copied before anything is merged into them so that the sources
+            aren't modified. Defaults to ``True``.
 
     Returns:
         Merged object.
@@ -1480,51 +1796,109 @@ def merge_with(obj: t.Any, *sources: t.Any, **kwargs: t.Any) -> t.Any:
 
     .. versionchanged:: 4.9.3
         Fixed regression in v4.8.0 that caused exception when `obj` was ``None``.
+
+    .. versionchanged:: 8.1.0
+        Only clone source values that are assigned to `obj` when no customizer is given, added
+        `copy_values` argument, and merge without recursion so that deeply nested objects can be
+        merged.
     """
     if obj is None:
         return None
 
     list_sources = list(sources)
     iteratee = kwargs.pop("iteratee", None)
+    copy_values = kwargs.pop("copy_values", True)
 
     if iteratee is None and list_sources and callable(list_sources[-1]):
         iteratee = list_sources.pop()
 
-    list_sources = [copy.deepcopy(source) for source in list_sources]
-
     if callable(iteratee):
         iteratee = partial(callit, iteratee, argcount=getargcount(iteratee, maxargs=5))
+
+        # The customizer receives source values and may return them (or parts of them) to be
+        # assigned so they can't be cloned lazily.
+        if copy_values:
+            list_sources = [base_clone_deep(source) for source in list_sources]
+            copy_values = False
     else:
         iteratee = None
 
-    return _merge_with(obj, *list_sources, iteratee=iteratee, **kwargs)
+    return _merge_with(obj, *list_sources, iteratee=iteratee, copy_values=copy_values, **kwargs)
 
 
-def _merge_with(obj, *sources, **kwargs):
+def _merge_with(obj, *sources, **kwargs):  # noqa: PLR0912
     iteratee = kwargs.get("iteratee")
     setter = kwargs.get("_setter")
+    copy_values = kwargs.get("copy_values", True)
+    persistent = kwargs.get("_persistent", False)
 
     if setter is None:
-        setter = base_set
+        setter = merge_setter
+
+    if persistent:
+        obj = copy.copy(obj)
+
+    # Objects that were copied by this merge and can be modified in place keyed by their id.
+    owned = {id(obj): obj} if persistent else {}
+    # Source lists and dicts that were assigned to `obj` as-is keyed by their id.
+    shared = {}
 
     for source in sources:
-        for key, src_value in iterator(source):
-            obj_value = base_get(obj, key, default=None)
-            all_sequences = isinstance(src_value, list) and isinstance(obj_value, list)
-            all_mappings = isinstance(src_value, dict) and isinstance(obj_value, dict)
-
-            _result = None
-            if iteratee:
-                _result = iteratee(obj_value, src_value, key, obj, source)
-
-            if _result is not None:
-                result = _result
-            elif all_sequences or all_mappings:
-                result = _merge_with(obj_value, src_value, iteratee=iteratee, _setter=setter)
+        if copy_values:
+            # Share the memo across all values cloned from a source so that objects it references
+            # more than once are cloned once like when cloning the whole source.
+            memo = {}
+            clone = partial(base_clone_deep, memo=memo)
+        else:
+            clone = pyd.identity
+
+        # Each target is paired with whether it's a copy whose objects are shared with the sources.
+        stack = [(obj, source, iter(iterator(source)), persistent)]
+
+        while stack:
+            target, target_source, items, copied = stack[-1]
+
+            for key, src_value in items:
+                if type(target) is dict and key in target:
+                    obj_value = target[key]
+                else:
+                    obj_value = base_get(target, key, default=None)
+
+                all_sequences = isinstance(src_value, list) and isinstance(obj_value, list)
+                all_mappings = isinstance(src_value, dict) and isinstance(obj_value, dict)
+
+                _result = None
+                if iteratee:
+                    _result = iteratee(obj_value, src_value, key, target, target_source)
+
+                if _result is not None:
+                    setter(target, key, _result, pyd.identity)
+
+                    if not copy_values and isinstance(_result, (list, dict)):
+                        shared[id(_result)] = _result
+                elif all_sequences or all_mappings:
+                    if id(obj_value) not in owned and (copied or id(obj_value) in shared):
+                        # Merge into a copy so that the sources aren't modified.
+                        obj_value = copy.copy(obj_value)
+                        owned[id(obj_value)] = obj_value
+                        base_set(target, key, obj_value)
+                    else:
+                        setter(target, key, obj_value, pyd.identity)
+
+                    # Descend into the nested objects before continuing with the remaining keys.
+                    stack.append(
+                        (obj_value, src_value, iter(iterator(src_value)), id(obj_value) in owned)
+                    )
+                    break
+                elif type(src_value) in ATOMIC_TYPES:
+                    setter(target, key, src_value, pyd.identity)
+                else:
+                    setter(target, key, src_value, clone)
+
+                    if not copy_values and isinstance(src_value, (list, dict)):
+                        shared[id(src_value)] = src_value
             else:
-                result = src_value
-
-            setter(obj, key, result)
+                stack.pop()
 
     return obj
 
@@ -1704,6 +2078,50 @@ def parse_int(value: t.Any, radix: t.Union[int, None] = None) -> t.Union[int, No
     return parsed
 
 
+def patch(obj: T, changes: t.Iterable[t.Tuple[str, PathT, t.Any]]) -> T:
+    """
+    Applies a list of changes created by :func:`diff` to `obj` in order. A ``"set"`` change is
+    applied like :func:`set_` and an ``"unset"`` change like :func:`unset`. A ``"set"`` change with
+    an empty path replaces `obj` itself.
+
+    Args:
+        obj: Object to modify.
+        changes: List of ``(op, path, value)`` changes.
+
+    Returns:
+        Modified `obj` or the value that replaced it.
+
+    Raises:
+        ValueError: If a change has an op other than ``"set"`` or ``"unset"``.
+
+    Warning:
+        `obj` is modified in place and values are set without being copied.
+
+    Example:
+
+        >>> old = {"a": [1, 2, 3], "b": {"c": 2}}
+        >>> new = {"a": [1, 3], "b": {"c": 3}, "d": 4}
+        >>> patch(old, diff(old, new)) == new
+        True
+        >>> patch({"a": 1}, [("unset", "a", None), ("set", "b.c", 2)])
+        {'b': {'c': 2}}
+
+    .. versionadded:: 8.1.0
+    """
+    for op, path, value in changes:
+        if op == "set":
+            if isinstance(path, (list, tuple, str)) and not path:
+                obj = value
+            else:
+                set_(obj, path, value)
+        elif op == "unset":
+            unset(obj, path)  # type: ignore
+        else:
+            raise ValueError(f'patch op must be "set" or "unset", got {op!r}')
+
+    return obj
+
+
 @t.overload
 def pick(obj: t.Mapping[T, T2], *properties: PathT) -> t.Dict[T, T2]: ...
 
@@ -1804,12 +2222,15 @@ def pick_by(obj, iteratee=None):
         else:
             argcount = getargcount(iteratee, maxargs=2)
     else:
-        paths = iteratee if iteratee is not None else []
+        # Resolve all paths in a single walk, skipping the ones that don't exist like has() would.
+        paths = list(iteratee)
+        result = {}
 
-        def iteratee(value, path):  # pylint: disable=function-redefined
-            return has(obj, path)
+        for path, value in zip(paths, base_get_many(obj, paths, default=UNSET, ignore_errors=True)):
+            if value is not UNSET:
+                set_(result, path, value)
 
-        argcount = 2
+        return result
 
     result = {}
 
@@ -1887,6 +2308,68 @@ def set_(obj: T, path: PathT, value: t.Any) -> T:
     return set_with(obj, path, value)
 
 
+def set_in(obj: T, path: PathT, value: t.Any) -> T:
+    """
+    This method is like :func:`set_` except that `obj` isn't modified. Only the objects along `path`
+    are shallow copied while every other value is shared with `obj`.
+
+    Args:
+        obj: Object to update.
+        path: Target path to set value to.
+        value: Value to set.
+
+    Returns:
+        Updated copy of `obj`.
+
+    Example:
+
+        >>> obj = {"a": {"b": 1}, "c": {"d": 2}}
+        >>> obj2 = set_in(obj, "a.b", 3)
+        >>> obj2
+        {'a': {'b': 3}, 'c': {'d': 2}}
+        >>> obj
+        {'a': {'b': 1}, 'c': {'d': 2}}
+        >>> obj2["c"] is obj["c"]
+        True
+
+    .. versionadded:: 8.1.0
+    """
+    return _update_with(obj, path, pyd.constant(value), persistent=True)
+
+
+def set_many(
+    obj: T, path_values: t.Union[t.Mapping[t.Any, t.Any], t.Iterable[t.Tuple[PathT, t.Any]]]
+) -> T:
+    """
+    Sets many values of an object like calling :func:`set_` for each path and value in order. The
+    paths are compiled into a trie so that each intermediate object is only created or looked up
+    once.
+
+    Args:
+        obj: Object to modify.
+        path_values: Mapping of paths to values or list of ``(path, value)`` pairs.
+
+    Returns:
+        Modified `obj`.
+
+    Warning:
+        `obj` is modified in place.
+
+    Example:
+
+        >>> set_many({}, {"a.b.c": 1, "a.b.d": 2, "a.e[0]": 3})
+        {'a': {'b': {'c': 1, 'd': 2}, 'e': [3]}}
+        >>> set_many({"a": [1]}, [("a[1]", 2), (["a", 2], 3)])
+        {'a': [1, 2, 3]}
+
+    .. versionadded:: 8.1.0
+    """
+    if isinstance(path_values, Mapping):
+        path_values = path_values.items()
+
+    return base_set_many(obj, list(path_values))
+
+
 def set_with(
     obj: T, path: PathT, value: t.Any, customizer: t.Union[t.Callable[..., t.Any], None] = None
 ) -> T:
@@ -2388,6 +2871,59 @@ def update(obj, path, updater):
     return update_with(obj, path, updater)
 
 
+@t.overload
+def update_in(
+    obj: t.Dict[t.Any, T2],
+    path: PathT,
+    updater: t.Callable[[T2], t.Any],
+) -> t.Dict[t.Any, t.Any]: ...
+
+
+@t.overload
+def update_in(
+    obj: t.List[T],
+    path: PathT,
+    updater: t.Callable[[T], t.Any],
+) -> t.List[t.Any]: ...
+
+
+@t.overload
+def update_in(
+    obj: T,
+    path: PathT,
+    updater: t.Callable[..., t.Any],
+) -> T: ...
+
+
+def update_in(obj, path, updater):
+    """
+    This method is like :func:`update` except that `obj` isn't modified. Only the objects along
+    `path` are shallow copied while every other value is shared with `obj`.
+
+    Args:
+        obj: Object to update.
+        path: A string or list of keys that describe the object path to update.
+        updater: Function that returns updated value.
+
+    Returns:
+        Updated copy of `obj`.
+
+    Example:
+
+        >>> obj = {"a": {"b": 1}, "c": [2]}
+        >>> obj2 = update_in(obj, "a.b", lambda value: value + 1)
+        >>> obj2
+        {'a': {'b': 2}, 'c': [2]}
+        >>> obj
+        {'a': {'b': 1}, 'c': [2]}
+        >>> obj2["c"] is obj["c"]
+        True
+
+    .. versionadded:: 8.1.0
+    """
+    return _update_with(obj, path, updater, persistent=True)
+
+
 @t.overload
 def update_with(
     obj: t.Dict[t.Any, T2],
@@ -2415,7 +2951,7 @@ def update_with(
 ) -> T: ...
 
 
-def update_with(obj, path, updater, customizer=None):  # noqa: PLR0912
+def update_with(obj, path, updater, customizer=None):
     """
     This method is like :func:`update` except that it accepts customizer which is invoked to produce
     the objects of path. If customizer returns ``None``, path creation is handled by the method
@@ -2440,6 +2976,10 @@ def update_with(obj, path, updater, customizer=None):  # noqa: PLR0912
 
     .. versionadded:: 4.0.0
     """
+    return _update_with(obj, path, updater, customizer=customizer)
+
+
+def _update_with(obj, path, updater, customizer=None, persistent=False):  # noqa: PLR0912
     if not callable(updater):
         updater = pyd.constant(updater)
 
@@ -2458,6 +2998,10 @@ def update_with(obj, path, updater, customizer=None):  # noqa: PLR0912
     if isinstance(last_key, PathToken):
         last_key = last_key.key
 
+    if persistent:
+        # Copy each existing object along the path so that `obj` itself is left unmodified.
+        obj = copy.copy(obj)
+
     target = obj
 
     for idx, token in enumerate(pyd.initial(tokens)):
@@ -2476,10 +3020,10 @@ def update_with(obj, path, updater, customizer=None):  # noqa: PLR0912
         base_set(target, key, path_obj, allow_override=False)
 
         try:
-            target = base_get(target, key, default=None)
+            next_target = base_get(target, key, default=None)
         except TypeError as exc:  # pragma: no cover
             try:
-                target = target[int(key)]
+                next_target = target[int(key)]
                 _failed = False
             except Exception:
                 _failed = True
@@ -2487,12 +3031,52 @@ def update_with(obj, path, updater, customizer=None):  # noqa: PLR0912
             if _failed:
                 raise TypeError(f"Unable to update object at index {key!r}. {exc}") from exc
 
+        if persistent and next_target is not path_obj:
+            next_target = copy.copy(next_target)
+            base_set(target, key, next_target)
+
+        target = next_target
+
     value = base_get(target, last_key, default=None)
     base_set(target, last_key, callit(updater, value))
 
     return obj
 
 
+def unflatten_keys(
+    flat: t.Union[t.Mapping[str, t.Any], t.Iterable[t.Tuple[str, t.Any]]], sep: str = "."
+) -> t.Dict[t.Any, t.Any]:
+    """
+    The inverse of :func:`flatten_keys`. Builds a nested dict from a dict of values keyed by their
+    path or from an iterable of ``(path, value)`` pairs.
+
+    Args:
+        flat: Mapping of paths to values or iterable of ``(path, value)`` pairs.
+        sep: Separator between path keys. Defaults to ``"."``.
+
+    Returns:
+        Nested dict.
+
+    Example:
+
+        >>> unflatten_keys({"a.b[0]": 1, "a.b[1].c": 2, "a.d\\\\.e": 3})
+        {'a': {'b': [1, {'c': 2}], 'd.e': 3}}
+        >>> unflatten_keys([("a/b", 1), ("a/c", 2)], sep="/")
+        {'a': {'b': 1, 'c': 2}}
+
+    .. versionadded:: 8.1.0
+    """
+    if isinstance(flat, Mapping):
+        flat = flat.items()
+
+    if sep != ".":
+        # Convert the paths to the "." separated syntax that the path functions parse.
+        regex = re.compile(PATH_KEYS_PATTERN.format(sep=re.escape(sep)), re.DOTALL)
+        flat = ((to_dotted_path(path, sep, regex), value) for path, value in flat)
+
+    return set_many({}, flat)
+
+
 def unset(obj: t.Union[t.List[t.Any], t.Dict[t.Any, t.Any]], path: PathT) -> bool:  # noqa: C901
     """
     Removes the property at `path` of `obj`.
@@ -2562,12 +3146,82 @@ def unset(obj: t.Union[t.List[t.Any], t.Dict[t.Any, t.Any]], path: PathT) -> boo
     return did_unset
 
 
-@t.overload
-def values(obj: t.Mapping[t.Any, T2]) -> t.List[T2]: ...
+def unset_in(obj: T, path: PathT) -> T:
+    """
+    This method is like :func:`unset` except that `obj` isn't modified. Only the objects along
+    `path` are shallow copied while every other value is shared with `obj`.
 
+    Args:
+        obj: The object to update.
+        path: The path of the property to unset.
 
-@t.overload
-def values(obj: t.Iterable[T]) -> t.List[T]: ...
+    Returns:
+        Updated copy of `obj` or `obj` itself if there was nothing to unset.
+
+    Example:
+
+        >>> obj = {"a": [{"b": {"c": 7}}], "d": {}}
+        >>> obj2 = unset_in(obj, "a[0].b.c")
+        >>> obj2
+        {'a': [{'b': {}}], 'd': {}}
+        >>> obj
+        {'a': [{'b': {'c': 7}}], 'd': {}}
+        >>> obj2["d"] is obj["d"]
+        True
+        >>> unset_in(obj, "a[0].x") is obj
+        True
+
+    .. versionadded:: 8.1.0
+    """
+    tokens = to_path_tokens(path)
+
+    last_key = pyd.last(tokens)
+
+    if isinstance(last_key, PathToken):
+        last_key = last_key.key
+
+    parents = []
+    target = obj
+
+    for token in pyd.initial(tokens):
+        key = token.key
+
+        try:
+            try:
+                value = target[key]  # type: ignore
+            except TypeError:
+                key = int(key)
+                value = target[key]  # type: ignore
+        except Exception:
+            return obj
+
+        parents.append((target, key))
+        target = value
+
+    target = copy.copy(target)
+
+    try:
+        try:
+            target.pop(last_key)  # type: ignore
+        except TypeError:
+            target.pop(int(last_key))  # type: ignore
+    except Exception:
+        return obj
+
+    for parent, key in reversed(parents):
+        parent = copy.copy(parent)
+        parent[key] = target  # type: ignore
+        target = parent
+
+    return target
+
+
+@t.overload
+def values(obj: t.Mapping[t.Any, T2]) -> t.List[T2]: ...
+
+
+@t.overload
+def values(obj: t.Iterable[T]) -> t.List[T]: ...
 
 
 @t.overload
@@ -2603,43 +3257,663 @@ def values(obj):
     return [value for _, value in iterator(obj)]
 
 
+def walk(
+    obj: t.Any,
+    visitor: t.Union[t.Callable[..., t.Any], None] = None,
+    order: str = "pre",
+    prune: t.Union[t.Callable[..., t.Any], None] = None,
+    max_depth: t.Union[int, None] = None,
+) -> t.Any:
+    """
+    Creates a copy of `obj` where `obj` and every value nested in its dicts and lists are replaced
+    by the return value of `visitor`. The visitor is invoked with two arguments: ``(value, path)``
+    where ``path`` is the list of keys to ``value``. The dicts and lists that are walked are shallow
+    copied while any other values are shared with `obj`. The walk is done without recursion.
+
+    In ``"pre"`` order the visitor is invoked with each dict and list before the values it holds.
+    The values are only walked when the visitor returns the dict or list itself. Any other return
+    value replaces it as is. In ``"post"`` order the visitor is invoked with each dict and list
+    after the values it holds have been replaced.
+
+    Args:
+        obj: Object to walk.
+        visitor: Function invoked per value. Defaults to ``None`` which copies every dict and list
+            that is walked.
+        order: ``"pre"`` to visit each dict and list before the values it holds or ``"post"`` to
+            visit it after them. Defaults to ``"pre"``.
+        prune: Predicate invoked with ``(value, path)`` for each dict and list. When it returns
+            truthy, the dict or list is visited without being copied or walked. Defaults to
+            ``None``.
+        max_depth: Number of levels below `obj` to walk. All levels are walked when ``None``.
+            Defaults to ``None``.
+
+    Returns:
+        Walked copy of `obj`.
+
+    Raises:
+        ValueError: If `order` isn't supported or `obj` contains a reference to itself.
+
+    Example:
+
+        >>> double = lambda value: value * 2 if isinstance(value, int) else value
+        >>> walk({"a": [1, 2], "b": {"c": 3}}, double)
+        {'a': [2, 4], 'b': {'c': 6}}
+        >>> walk({"a": {"b": [1]}, "c": 2}, lambda value, path: "***" if path == ["a"] else value)
+        {'a': '***', 'c': 2}
+        >>> total = lambda value: sum(value) if isinstance(value, list) else value
+        >>> walk({"a": [1, 2], "b": {"c": [3, [4]]}}, total, order="post")
+        {'a': 3, 'b': {'c': 7}}
+
+    .. versionadded:: 8.1.0
+    """
+    if order not in WALK_ORDERS:
+        raise ValueError(f"order must be one of {', '.join(WALK_ORDERS)}, not {order!r}")
+
+    visit = None
+
+    if visitor is not None:
+        argcount = getargcount(visitor, maxargs=2)
+
+        def visit(value, key, parent, path):
+            return visitor(value, list(path)) if argcount > 1 else visitor(value)
+
+    return base_walk(obj, visit, order, path_callback(prune), max_depth)
+
+
 #
 # Utility methods not a part of the main API
 #
 
 
-def base_clone(value, is_deep=False, customizer=None, key=None, _cloned=False):
+def base_clone(value, is_deep=False, customizer=None):
     """Base clone function that supports deep clone and customizer callback."""
-    clone_by = copy.deepcopy if is_deep else copy.copy
-    result = None
-
-    if callable(customizer) and not _cloned:
-        argcount = getargcount(customizer, maxargs=4)
-        cbk = partial(callit, customizer, argcount=argcount)
-    elif _cloned:
-        cbk = customizer
-    else:
-        cbk = None
+    if not callable(customizer):
+        return base_clone_deep(value) if is_deep else copy.copy(value)
 
-    if cbk:
-        result = cbk(value, key, value)
+    argcount = getargcount(customizer, maxargs=4)
+    cbk = partial(callit, customizer, argcount=argcount)
+
+    if is_deep:
+        return base_clone_deep_with(value, cbk)
+
+    result = cbk(value, None, value)
 
     if result is not None:
         return result
 
-    if not _cloned:
-        result = clone_by(value)
-    else:
-        result = value
+    result = copy.copy(value)
 
-    if cbk and not pyd.is_string(value) and not isinstance(value, bytes):
-        for key, subvalue in iterator(value):  # noqa: PLR1704
-            if is_deep:
-                val = base_clone(subvalue, is_deep, cbk, key, _cloned=True)
-            else:
-                val = cbk(subvalue, key, value)
+    if not pyd.is_string(value) and not isinstance(value, bytes):
+        for key, subvalue in iterator(value):
+            val = cbk(subvalue, key, value)
 
             if val is not None:
                 result[key] = val
 
     return result
+
+
+def base_clone_deep(value, memo=None):
+    """
+    Deep clone `value` like :func:`copy.deepcopy` but walk ``dict`` and ``list`` objects with an
+    explicit stack and share atomic values without copying them. Other types are cloned with
+    :func:`copy.deepcopy` using the same memo so that shared and self-referencing objects are
+    cloned once. A `memo` can be passed to share it across several calls.
+    """
+    if type(value) in ATOMIC_TYPES:
+        return value
+
+    if memo is None:
+        memo = {}
+
+    if type(value) is not dict and type(value) is not list:
+        return copy.deepcopy(value, memo)
+
+    stack = []
+
+    def clone_child(child):
+        child_id = id(child)
+
+        if child_id in memo:
+            return memo[child_id]
+
+        if type(child) is dict:
+            cloned = {}
+        elif type(child) is list:
+            cloned = []
+        else:
+            return copy.deepcopy(child, memo)
+
+        memo[child_id] = cloned
+        stack.append((child, cloned))
+        return cloned
+
+    result = clone_child(value)
+
+    while stack:
+        source, cloned = stack.pop()
+
+        if type(source) is dict:
+            for key, child in source.items():
+                cloned[key if type(key) in ATOMIC_TYPES else clone_child(key)] = (
+                    child if type(child) in ATOMIC_TYPES else clone_child(child)
+                )
+        else:
+            cloned.extend(
+                child if type(child) in ATOMIC_TYPES else clone_child(child) for child in source
+            )
+
+    return result
+
+
+def base_clone_deep_with(value, cbk):
+    """
+    Deep clone `value` with :func:`base_walk` using the ``cbk(value, key, parent)`` customizer. A
+    value that the customizer returns ``None`` for is cloned by walking into it if it's a ``dict``
+    or ``list`` or else with :func:`base_clone_deep`.
+    """
+    memo = {}
+
+    def visit(value, key, parent, path):
+        result = cbk(value, key, value if parent is None else parent)
+
+        if result is not None:
+            return result
+
+        if isinstance(value, (dict, list)):
+            return value
+
+        return base_clone_deep(value, memo)
+
+    return base_walk(value, visit)
+
+
+def merge_setter(obj, key, value, clone):
+    """Assign ``clone(value)`` to `obj` at `key` while merging."""
+    base_set(obj, key, clone(value))
+
+
+def path_trie(paths):
+    """
+    Build a trie of the keys of `paths`. Each node is a ``(indexes, children)`` tuple of the indexes
+    of the paths that end at the node and the child nodes keyed by path key. Tries of string paths
+    are cached since parsing the paths is the bulk of the work when the same paths are looked up in
+    many objects.
+    """
+    if all(type(path) is str for path in paths):
+        return string_path_trie(tuple(paths))
+    return build_path_trie(paths)
+
+
+@lru_cache(maxsize=256)
+def string_path_trie(paths):
+    """Build a cached trie of string `paths`. The returned trie must not be modified."""
+    return build_path_trie(paths)
+
+
+def build_path_trie(paths):
+    root = ([], {})
+
+    for index, path in enumerate(paths):
+        node = root
+
+        for key in to_path(path):
+            children = node[1]
+
+            if key not in children:
+                children[key] = ([], {})
+
+            node = children[key]
+
+        node[0].append(index)
+
+    return root
+
+
+def base_get_many(obj, paths, default=None, ignore_errors=False):
+    """
+    Return the value of each path of `paths` in `obj` or `default` when it doesn't exist by walking
+    the trie of `paths` so that shared path prefixes are only resolved once. Errors raised while
+    resolving a path are treated like a missing path when `ignore_errors` is set.
+    """
+    paths = list(paths)
+    values = [default] * len(paths)
+    errors = (KeyError, IndexError, TypeError, ValueError) if ignore_errors else ()
+    stack = [(obj, path_trie(paths))]
+
+    while stack:
+        value, (indexes, children) = stack.pop()
+
+        for index in indexes:
+            values[index] = value
+
+        for key, child in children.items():
+            try:
+                child_value = base_lookup(value, key)
+
+                if child_value is UNSET and default is UNSET:
+                    # Like get(), a default of UNSET raises for missing paths.
+                    base_get(value, key)
+            except errors:
+                continue
+
+            if child_value is not UNSET:
+                stack.append((child_value, child))
+
+    return values
+
+
+def base_set_many(obj, items):
+    """
+    Set each ``(path, value)`` of `items` in `obj` like calling :func:`set_` for each of them in
+    order but walk a trie of the path tokens so that each intermediate object is only created or
+    looked up once.
+    """
+    root = set_path_trie(items)
+
+    if root is None:
+        for path, value in items:
+            set_(obj, path, value)
+        return obj
+
+    stack = [(obj, root)]
+
+    while stack:
+        target, children = stack.pop()
+
+        for key, (_, indexes, grandchildren) in children.items():
+            if indexes:
+                for index in indexes:
+                    base_set(target, key, items[index][1])
+            else:
+                # Like update_with(), the type of a missing object is determined by the next key.
+                default_factory = next(iter(grandchildren.values()))[0]
+                base_set(target, key, default_factory(), allow_override=False)
+                stack.append((base_get(target, key, default=None), grandchildren))
+
+    return obj
+
+
+def set_path_trie(items):
+    """
+    Build a trie of the path tokens of ``(path, value)`` `items` for :func:`base_set_many`. Each
+    node is a ``[default_factory, indexes, children]`` list of the default factory of the node's
+    token, the indexes of the items whose path ends at the node, and the child nodes keyed by path
+    key. Return ``None`` if the values must be set in order because a path is empty, ends where
+    another one continues, or has a key that could set the same list index as another key.
+    """
+    root = {}
+
+    for index, (path, _) in enumerate(items):
+        tokens = to_path_tokens(path)
+
+        if not tokens:
+            return None
+
+        children = root
+        node = None
+
+        for token in tokens:
+            if node is not None:
+                children = node[2]
+
+            node = children.get(token.key)
+
+            if node is None:
+                node = children[token.key] = [token.default_factory, [], {}]
+
+        node[1].append(index)
+
+    siblings = [root]
+
+    while siblings:
+        children = siblings.pop()
+
+        if has_list_index_aliases(children):
+            return None
+
+        for _, indexes, grandchildren in children.values():
+            if indexes and grandchildren:
+                return None
+
+            if grandchildren:
+                siblings.append(grandchildren)
+
+    return root
+
+
+def has_list_index_aliases(keys):
+    """
+    Return whether two of `keys` could set the same index of a list, like ``0`` and ``"0"`` or a
+    negative index and any other index, which depends on the list that's being set.
+    """
+    if len(keys) < 2:
+        return False
+
+    indexes = set()
+    negative = False
+
+    for key in keys:
+        try:
+            index = int(key)
+        except (TypeError, ValueError, OverflowError):
+            continue
+
+        if index in indexes or (indexes and (negative or index < 0)):
+            return True
+
+        indexes.add(index)
+        negative = negative or index < 0
+
+    return False
+
+
+def base_flatten_keys(obj, sep, brackets):
+    """Yield the ``(path, value)`` pairs of the leaf values of `obj` in depth-first order."""
+    if not isinstance(obj, (dict, list)):
+        return
+
+    stack = [(None, obj, iter(iterator(obj)))]
+
+    while stack:
+        prefix, parent, items = stack[-1]
+
+        for key, value in items:
+            if isinstance(parent, list):
+                key = f"[{key}]" if brackets else str(key)
+
+                if prefix is None:
+                    path = key
+                elif brackets:
+                    path = prefix + key
+                else:
+                    path = prefix + sep + key
+            else:
+                key = str(key)
+
+                if not key:
+                    raise ValueError("flatten_keys() can't write the path of an empty key")
+
+                key = escape_path_key(key, sep)
+                path = key if prefix is None else prefix + sep + key
+
+            if value and isinstance(value, (dict, list)):
+                stack.append((path, value, iter(iterator(value))))
+                break
+
+            yield path, value
+        else:
+            stack.pop()
+
+
+def to_dotted_path(path, sep, regex):
+    """Convert a `path` whose keys are separated by `sep` into a ``.`` separated path."""
+    return ".".join(
+        f"[{key}]" if isinstance(key, int) else escape_path_key(key)
+        for key in split_path_keys(path, regex, sep)
+    )
+
+
+def base_map_values_deep(obj, iteratee, path, argcount, in_place):
+    """
+    Map the leaf values of the ``dict`` or ``list`` `obj` with `iteratee` using
+    :func:`pydash.helpers.base_iterwalk`. The path of each value is only tracked when `iteratee`
+    accepts it and it's only copied when it's passed to `iteratee`.
+    """
+    result = obj if in_place else copy.copy(obj)
+
+    if argcount <= 1:
+        path = None
+
+    for key, value, parent in base_iterwalk(
+        result, path, order=None, copy_containers=not in_place, flat_keys=True
+    ):
+        if argcount > 1:
+            parent[key] = iteratee(value, list(path))
+        else:
+            parent[key] = callit(iteratee, value, argcount=argcount)
+
+    return result
+
+
+def path_callback(func):
+    """
+    Return a ``(value, path)`` callback that invokes `func` with a copy of the walked path if it
+    accepts one since the walked path is modified in place.
+    """
+    if func is None:
+        return None
+
+    if getargcount(func, maxargs=2) > 1:
+        return lambda value, path: func(value, list(path))
+
+    return lambda value, path: func(value)
+
+
+def can_walk(obj, path, prune, max_depth):
+    """Return whether the values of the root `obj` of a walk are walked."""
+    return (
+        isinstance(obj, (dict, list))
+        and (max_depth is None or max_depth > 0)
+        and not (prune and prune(obj, path))
+    )
+
+
+def base_iterwalk_paths(obj, order, prune, max_depth):
+    """Yield the ``(path, value, parent)`` tuples of :func:`iterwalk`."""
+    path = []
+
+    if not can_walk(obj, path, prune, max_depth):
+        yield [], obj, None
+        return
+
+    if order == "pre":
+        yield [], obj, None
+
+    for _key, value, parent in base_iterwalk(
+        obj, path, order=order, prune=prune, max_depth=max_depth
+    ):
+        yield list(path), value, parent
+
+    if order == "post":
+        yield [], obj, None
+
+
+def base_walk(obj, visit, order="pre", prune=None, max_depth=None):
+    """
+    Copy `obj` while replacing each value with ``visit(value, key, parent, path)`` as described by
+    :func:`walk`. The `key` and `parent` of `obj` itself are ``None``.
+    """
+    pre = order == "pre"
+    path = []
+    result = obj
+
+    if visit and pre:
+        result = visit(obj, None, None, path)
+
+        if result is not obj:
+            return result
+
+    if can_walk(obj, path, prune, max_depth):
+        result = copy.copy(obj)
+        events = base_iterwalk(
+            result, path, order=order, prune=prune, max_depth=max_depth, copy_containers=True
+        )
+
+        if not visit:
+            for _event in events:
+                pass
+        elif pre:
+            visit_pre_events(events, visit, path)
+        else:
+            for key, value, parent in events:
+                new_value = visit(value, key, parent, path)
+
+                if new_value is not value:
+                    parent[key] = new_value
+
+    if visit and not pre:
+        result = visit(result, None, None, path)
+
+    return result
+
+
+def visit_pre_events(events, visit, path):
+    """
+    Replace the values generated by the ``"pre"`` order `events` of
+    :func:`pydash.helpers.base_iterwalk` with ``visit(value, key, parent, path)`` and tell the walk
+    to skip the children of the values that were replaced.
+    """
+    try:
+        key, value, parent = next(events)
+
+        while True:
+            new_value = visit(value, key, parent, path)
+            replaced = new_value is not value
+
+            if replaced:
+                parent[key] = new_value
+
+            key, value, parent = events.send(replaced)
+    except StopIteration:
+        pass
+
+
+def base_diff(old, new, key):
+    """
+    Compare `old` and `new` by walking nested dicts and lists with a stack of iterators of
+    ``(old, new, path)`` pairs. A pair whose `old` or `new` value is ``UNSET`` records that the key
+    was added or removed. Pairs of containers are first compared with native ``==`` so that equal
+    subtrees aren't walked. Pairs that are already being compared further up the stack are skipped
+    so that self-referencing structures terminate.
+    """
+    changes = []
+    walking = set()
+    native = True
+    stack = [(None, iter([(old, new, [])]))]
+
+    while stack:
+        ids, pairs = stack[-1]
+
+        for before, after, path in pairs:
+            if before is after:
+                continue
+
+            if not is_diff_walked(before, after):
+                change = diff_change(before, after, path)
+                if change is not None:
+                    changes.append(change)
+                continue
+
+            value_ids = (id(before), id(after))
+
+            if value_ids in walking:
+                continue
+
+            if native:
+                try:
+                    if before == after:
+                        continue
+                except RecursionError:
+                    # Native comparison recursed too deep so only walk from now on.
+                    native = False
+
+            walking.add(value_ids)
+            stack.append((value_ids, diff_children(before, after, path, key)))
+            break
+        else:
+            walking.discard(ids)
+            stack.pop()
+
+    return changes
+
+
+def is_diff_walked(old, new):
+    """Return whether `old` and `new` are both dicts or both lists whose children are compared."""
+    return (
+        old is not UNSET
+        and new is not UNSET
+        and type(old) is type(new)
+        and isinstance(old, (dict, list))
+    )
+
+
+def diff_change(old, new, path):
+    """Return the change from `old` to `new` at `path` or ``None`` if they're equal."""
+    if new is UNSET:
+        return ("unset", path, None)
+
+    if old is UNSET or old != new:
+        return ("set", path, new)
+
+    return None
+
+
+def diff_children(old, new, path, key):
+    """Return iterator of the ``(old, new, path)`` pairs of the children of two dicts or lists."""
+    if isinstance(old, dict):
+        return diff_dict_pairs(old, new, path)
+
+    if key is None:
+        return diff_list_pairs(old, new, path)
+
+    return diff_keyed_list_pairs(old, new, path, key)
+
+
+def diff_dict_pairs(old, new, path):
+    """Generate the ``(old, new, path)`` pairs to compare for the keys of two dicts."""
+    for key, value in old.items():
+        other = new[key] if key in new else UNSET
+
+        if value is not other:
+            yield value, other, path + [key]
+
+    for key, value in new.items():
+        if key not in old:
+            yield UNSET, value, path + [key]
+
+
+def diff_list_pairs(old, new, path):
+    """
+    Generate the ``(old, new, path)`` pairs to compare for the items of two lists matched by index.
+    Items past the end of `new` are removed from the last one backwards so that the indexes of the
+    earlier ones stay valid.
+    """
+    for index, value in enumerate(new):
+        other = old[index] if index < len(old) else UNSET
+
+        if value is not other:
+            yield other, value, path + [index]
+
+    for index in range(len(old) - 1, len(new) - 1, -1):
+        yield old[index], UNSET, path + [index]
+
+
+def diff_keyed_list_pairs(old, new, path, key):
+    """
+    Generate the ``(old, new, path)`` pairs to compare for the items of two lists matched by `key`.
+    Items of `old` whose key isn't in `new` are removed first. The remaining items are then compared
+    by index with the items of `new` and replaced wherever their keys don't line up.
+    """
+    new_keys = [key(value) for value in new]
+    keys = set(new_keys)
+    kept = []
+
+    for index in range(len(old) - 1, -1, -1):
+        value_key = key(old[index])
+
+        if value_key in keys:
+            kept.append((value_key, old[index]))
+        else:
+            yield old[index], UNSET, path + [index]
+
+    kept.reverse()
+
+    for index, value in enumerate(new):
+        if index < len(kept) and kept[index][0] == new_keys[index]:
+            yield kept[index][1], value, path + [index]
+        else:
+            yield UNSET, value, path + [index]
+
+    for index in range(len(kept) - 1, len(new) - 1, -1):
+        yield kept[index][1], UNSET, path + [index]
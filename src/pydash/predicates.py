@@ -19,7 +19,7 @@ from typing_extensions import TypeGuard
 
 import pydash as pyd
 
-from .helpers import BUILTINS, NUMBER_TYPES, UNSET, base_get, callit, iterator
+from .helpers import BUILTINS, NUMBER_TYPES, UNSET, base_get, base_iterwalk, callit
 
 
 if t.TYPE_CHECKING:
@@ -740,34 +740,20 @@ def is_equal_with(value, other, customizer):
         True
 
     .. versionadded:: 4.0.0
-    """
-    # If customizer provided, use it for comparison.
-    equal = customizer(value, other) if callable(customizer) else None
-
-    # Return customizer results if anything but None.
-    if equal is not None:
-        pass
-    elif (
-        callable(customizer)
-        and type(value) is type(other)
-        and isinstance(value, (list, dict))
-        and isinstance(other, (list, dict))
-        and len(value) == len(other)
-    ):
-        # Walk a/b to determine equality using customizer.
-        for key, val in iterator(value):
-            if pyd.has(other, key):
-                equal = is_equal_with(val, other[key], customizer)
-            else:
-                equal = False
 
-            if not equal:
-                break
-    else:
-        # Use basic == comparison.
-        equal = value == other
+    .. versionchanged:: 8.1.0
+        - Compare nested lists and dicts without recursion and skip identical sub-objects.
+        - Support comparing deeply nested and self-referencing structures.
+        - Use native ``==`` when no `customizer` is given.
+    """
+    if not callable(customizer):
+        try:
+            return value == other
+        except RecursionError:
+            # Native comparison recursed too deep, e.g. for self-referencing structures.
+            return base_is_equal(value, other, None)
 
-    return equal
+    return base_is_equal(value, other, customizer)
 
 
 def is_equal_with_cmp(other: T, customizer: t.Callable[[T, T], T3]) -> t.Callable[[T], T3]:
@@ -1166,8 +1152,11 @@ def is_match_cmp(source: t.Any) -> t.Callable[[t.Any], bool]:
         True
 
     .. versionadded:: 7.1.0
+
+    .. versionchanged:: 8.1.0
+        Precompile `source` with :func:`pydash.utilities.compile_matcher`.
     """
-    return lambda obj: is_match(obj, source)
+    return pyd.compile_matcher(source)
 
 
 def is_match_with(
@@ -1202,6 +1191,9 @@ def is_match_with(
         True
 
     .. versionadded:: 4.0.0
+
+    .. versionchanged:: 8.1.0
+        Walk `source` without recursion.
     """
     if _obj is UNSET:
         _obj = obj
@@ -1219,23 +1211,33 @@ def is_match_with(
     else:
         cbk = customizer
 
-    if isinstance(source, (Mapping, Iterable)) and not isinstance(source, str):
-        # Set equal to True if source is empty, otherwise, False and then allow deep comparison to
-        # determine equality.
-        equal = not source
+    if not isinstance(source, (Mapping, Iterable)) or isinstance(source, str):
+        return callit(cbk, obj, source, _key, _obj, _source)
 
-        # Walk a/b to determine equality.
-        for key, value in iterator(source):
-            try:
-                obj_value = base_get(obj, key)
-                equal = is_match_with(obj_value, value, cbk, _key=key, _obj=_obj, _source=_source)
-            except Exception:
-                equal = False
+    # Walk `source` and look up each of its values in the value of `obj` at the same path. The
+    # values of `obj` that are matched against containers of `source` are kept by depth.
+    path: t.List[t.Any] = []
+    targets = [obj]
+    # Set equal to True if source is empty, otherwise, False and then allow deep comparison to
+    # determine equality.
+    equal = not source
 
-            if not equal:
-                break
-    else:
-        equal = callit(cbk, obj, source, _key, _obj, _source)
+    try:
+        for key, value, _parent in base_iterwalk(source, path, containers=(Mapping, Iterable)):
+            depth = len(path)
+            del targets[depth:]
+            obj_value = base_get(targets[depth - 1], key)
+
+            if isinstance(value, (Mapping, Iterable)) and not isinstance(value, str):
+                targets.append(obj_value)
+                equal = not value
+            else:
+                equal = callit(cbk, obj_value, value, key, _obj, _source)
+
+                if not equal:
+                    break
+    except Exception:
+        equal = False
 
     return equal
 
@@ -1662,3 +1664,60 @@ def is_zero(value: t.Any) -> TypeGuard[int]:
     .. versionadded:: 2.0.0
     """
     return value == 0 and is_integer(value)
+
+
+#
+# Utility methods not a part of the main API
+#
+
+
+def base_is_equal(value, other, customizer):
+    """
+    Compare `value` and `other` by walking nested lists and dicts with an explicit stack. Identical
+    sub-objects are skipped and pairs of containers that are already being compared are treated as
+    equal so that self-referencing structures terminate. Tuples are walked too when there is no
+    `customizer` since their native comparison is otherwise recursive.
+    """
+    containers = (list, dict) if customizer else (list, dict, tuple)
+    visited = set()
+    stack = [(value, other)]
+    equal = True
+
+    while stack:
+        value, other = stack.pop()
+        equal = customizer(value, other) if customizer else None
+
+        if equal is not None:
+            if not equal:
+                return equal
+            continue
+
+        if (
+            type(value) is not type(other)
+            or not isinstance(value, containers)
+            or len(value) != len(other)
+        ):
+            equal = value == other
+            if not equal:
+                return equal
+            continue
+
+        ids = (id(value), id(other))
+        if ids in visited:
+            equal = True
+            continue
+        visited.add(ids)
+
+        if isinstance(value, dict):
+            pairs = []
+            for key, val in value.items():
+                if key not in other:
+                    return False
+                pairs.append((val, other[key]))
+        else:
+            pairs = list(zip(value, other))
+
+        stack.extend(pair for pair in reversed(pairs) if pair[0] is not pair[1])
+        equal = True
+
+    return equal
@@ -6,6 +6,7 @@ String functions.
 
 from __future__ import annotations
 
+from functools import cached_property
 import html
 import math
 import re
@@ -105,9 +106,13 @@ class JSRegExp:
 
         self._global = "g" in options
         self._ignore_case = "i" in options
+        self._source = pattern
 
+    @cached_property
+    def pattern(self) -> re.Pattern[str]:
+        """Compiled regular expression, compiled on first use to keep module import fast."""
         flags = re.I if self._ignore_case else 0
-        self.pattern = re.compile(pattern, flags=flags)
+        return re.compile(self._source, flags=flags)
 
     def find(self, text: str) -> t.List[str]:
         """Return list of regular expression matches."""
@@ -279,7 +284,7 @@ RS_UNICODE_WORDS = (
     f"/g"
 )
 
-# Compiled regexes for use in functions.
+# Regexes for use in functions. Javascript-style regexes are compiled lazily on first use.
 JS_RE_ASCII_WORDS = JSRegExp(RS_ASCII_WORDS)
 JS_RE_UNICODE_WORDS = JSRegExp(RS_UNICODE_WORDS)
 JS_RE_LATIN1 = JSRegExp(RS_LATIN1)
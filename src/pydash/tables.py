@@ -0,0 +1,294 @@
+"""
+Column-oriented tables of records.
+
+.. versionadded:: 8.1.0
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Mapping
+import typing as t
+
+import pydash as pyd
+
+from .helpers import iteriteratee, numpy_backend
+from .types import BackendT
+from .utilities import is_match_source
+
+
+__all__ = ("Table",)
+
+
+class Table:
+    """
+    Column-oriented table of records that stores the values of each key of the records in a column
+    instead of storing a dict per record. Iterating over a table generates its rows as dicts so that
+    a table can be passed to any function that accepts a list of dicts. The collection functions
+    :func:`pydash.collections.filter_`, :func:`pydash.collections.group_by`,
+    :func:`pydash.collections.key_by`, :func:`pydash.collections.order_by`, and
+    :func:`pydash.collections.pluck` and the ``*_by`` functions of :mod:`pydash.numerical` work on
+    the columns of a table directly when they're given a column name or a :func:`.matches` style
+    dict of column values. :func:`pydash.collections.filter_`, :func:`pydash.collections.group_by`,
+    and :func:`pydash.collections.order_by` return tables when given a table.
+
+    Args:
+        columns: Mapping of column names to the values of each row. Defaults to no columns.
+        backend: ``"numpy"`` to store each column as a NumPy array, ``"python"`` to store each
+            column as a list, or ``None`` to keep NumPy arrays as they are and store any other
+            values as a list. Defaults to ``None``.
+
+    Raises:
+        ValueError: If the columns don't all have the same length or `backend` is not supported.
+        ImportError: If `backend` is ``"numpy"`` and NumPy is not installed.
+
+    Example:
+
+        >>> table = Table.from_records([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"a": 3, "b": "x"}])
+        >>> table.columns
+        ('a', 'b')
+        >>> table["a"]
+        [1, 2, 3]
+        >>> table[1]
+        {'a': 2, 'b': 'y'}
+        >>> pyd.filter_(table, {"b": "x"}).to_records()
+        [{'a': 1, 'b': 'x'}, {'a': 3, 'b': 'x'}]
+        >>> pyd.sum_by(table, "a")
+        6
+
+    .. versionadded:: 8.1.0
+    """
+
+    __slots__ = ("_columns", "_size")
+
+    def __init__(
+        self,
+        columns: t.Union[t.Mapping[t.Any, t.Iterable[t.Any]], None] = None,
+        *,
+        backend: t.Union[BackendT, None] = None,
+    ) -> None:
+        self._columns: t.Dict[t.Any, t.Any] = {
+            name: to_column(values, backend) for name, values in (columns or {}).items()
+        }
+        sizes = {len(column) for column in self._columns.values()}
+
+        if len(sizes) > 1:
+            raise ValueError(f"columns must all have the same length, got lengths {sorted(sizes)}")
+
+        self._size = sizes.pop() if sizes else 0
+
+    @classmethod
+    def from_records(
+        cls,
+        records: t.Iterable[t.Mapping[t.Any, t.Any]],
+        columns: t.Union[t.Iterable[t.Any], None] = None,
+        *,
+        backend: t.Union[BackendT, None] = None,
+    ) -> "Table":
+        """
+        Create a table from a list of dicts. The columns are the keys of all records in the order
+        they're first seen unless `columns` is given. Keys that are missing from a record are
+        ``None`` in its row.
+        """
+        records = list(records)
+
+        if columns is None:
+            columns = dict.fromkeys(key for record in records for key in record)
+
+        return cls(
+            {name: [record.get(name) for record in records] for name in columns}, backend=backend
+        )
+
+    @property
+    def columns(self) -> t.Tuple[t.Any, ...]:
+        """Names of the columns."""
+        return tuple(self._columns)
+
+    def column(self, name: t.Any) -> t.Any:
+        """Return the list or NumPy array of the values of the column `name` without copying it."""
+        return self._columns[name]
+
+    def row(self, index: int) -> t.Dict[t.Any, t.Any]:
+        """Return the row at `index` as a dict."""
+        if index < 0:
+            index += self._size
+
+        return {
+            name: column[index]
+            if isinstance(column, list)
+            else column[index : index + 1].tolist()[0]
+            for name, column in self._columns.items()
+        }
+
+    def take(self, indexes: t.Iterable[int]) -> "Table":
+        """Return a table of the rows at each of `indexes` in that order."""
+        indexes = list(indexes)
+        table = Table.__new__(Table)
+        table._columns = {
+            name: take_column(column, indexes) for name, column in self._columns.items()
+        }
+        table._size = len(indexes)
+        return table
+
+    def to_records(self) -> t.List[t.Dict[t.Any, t.Any]]:
+        """Return the rows as a list of dicts."""
+        return list(self)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> t.Iterator[t.Dict[t.Any, t.Any]]:
+        names = self.columns
+        values = [column_values(column) for column in self._columns.values()]
+        return (dict(zip(names, row)) for row in zip(*values))
+
+    @t.overload
+    def __getitem__(self, key: int) -> t.Dict[t.Any, t.Any]: ...
+
+    @t.overload
+    def __getitem__(self, key: slice) -> "Table": ...
+
+    @t.overload
+    def __getitem__(self, key: t.Any) -> t.Any: ...
+
+    def __getitem__(self, key):
+        if isinstance(key, Hashable) and key in self._columns:
+            return self._columns[key]
+
+        if isinstance(key, slice):
+            return self.take(range(self._size)[key])
+
+        if isinstance(key, int):
+            if not -self._size <= key < self._size:
+                raise IndexError(f"table index {key} out of range")
+            return self.row(key)
+
+        raise KeyError(key)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Table):
+            return NotImplemented
+        return self.columns == other.columns and all(
+            column_values(column) == column_values(other._columns[name])
+            for name, column in self._columns.items()
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(columns={self.columns!r}, rows={self._size})"
+
+
+#
+# Utility methods not a part of the main API
+#
+
+
+def to_column(values, backend):
+    """Return `values` as a column of a :class:`Table` stored by `backend`."""
+    numpy = numpy_backend(values, backend)
+
+    if numpy is not None:
+        return numpy.asarray(values if isinstance(values, (list, tuple)) else list(values))
+
+    # Copy lists so that the table doesn't share its columns with the caller.
+    return list(values) if isinstance(values, list) else column_values(values)
+
+
+def column_values(column):
+    """Return the values of `column` as a list of Python objects."""
+    if isinstance(column, list):
+        return column
+    tolist = getattr(column, "tolist", None)
+    return tolist() if tolist is not None else list(column)
+
+
+def take_column(column, indexes):
+    """Return the values of `column` at each of `indexes`."""
+    if isinstance(column, list):
+        return [column[index] for index in indexes]
+    return column[indexes]
+
+
+def table_column(table, key):
+    """
+    Return the column of `table` that the property path `key` looks up or ``None`` if `key` isn't a
+    column name. String keys that :func:`pydash.utilities.to_path` splits into a deep path aren't
+    column names even when a column has that name.
+    """
+    if not isinstance(key, Hashable) or (isinstance(key, str) and ("." in key or "[" in key)):
+        return None
+    return table._columns.get(key)
+
+
+def mapped_column(table, iteratee):
+    """Return list of the result of `iteratee` for each row of `table`."""
+    column = table_column(table, iteratee)
+
+    if column is not None:
+        return column_values(column)
+
+    return list(map(pyd.iteratee(iteratee), table))
+
+
+def select_rows(table, predicate):
+    """
+    Return the indexes of the rows of `table` that `predicate` returns truthy for. A column name or
+    a dict of column values for `predicate` is evaluated a column at a time by narrowing down a
+    selection of row indexes instead of creating and matching each row.
+    """
+    column = table_column(table, predicate)
+
+    if column is not None:
+        return [index for index, value in enumerate(column_values(column)) if value]
+
+    if (
+        isinstance(predicate, Mapping)
+        and predicate
+        and all(
+            key in table._columns and not is_match_source(value) for key, value in predicate.items()
+        )
+    ):
+        return select_matching_rows(table, predicate)
+
+    return [index for is_true, _, index, _ in iteriteratee(table, predicate) if is_true]
+
+
+def select_matching_rows(table, source):
+    """
+    Return the indexes of the rows of `table` whose column values equal those of `source`. NumPy
+    columns are compared as a whole before list columns narrow down the selected indexes.
+    """
+    mask = None
+    narrowing = []
+
+    for key, expected in source.items():
+        column = table._columns[key]
+
+        if isinstance(column, list):
+            narrowing.append((column, expected))
+            continue
+
+        matched = column == expected
+
+        # Comparisons that NumPy can't broadcast are left to narrowing by the column's values.
+        if getattr(matched, "shape", None) == column.shape:
+            mask = matched if mask is None else mask & matched
+        else:
+            narrowing.append((column_values(column), expected))
+
+    indexes = range(len(table)) if mask is None else mask.nonzero()[0].tolist()
+
+    for values, expected in narrowing:
+        indexes = [index for index in indexes if values[index] == expected]
+
+    return list(indexes)
+
+
+def group_rows(table, iteratee):
+    """Return dict of the indexes of the rows of `table` grouped by the result of `iteratee`."""
+    groups: t.Dict[t.Any, t.List[int]] = {}
+
+    for index, key in enumerate(mapped_column(table, iteratee)):
+        groups.setdefault(key, []).append(index)
+
+    return groups
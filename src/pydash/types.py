@@ -9,9 +9,10 @@ from __future__ import annotations
 from decimal import Decimal
 import typing as t
 
-from typing_extensions import Protocol
+from typing_extensions import Literal, Protocol
 
 
+BackendT = Literal["numpy", "python"]
 IterateeObjT = t.Union[int, str, t.List[t.Any], t.Tuple[t.Any, ...], t.Dict[t.Any, t.Any]]
 NumberT = t.Union[float, int, Decimal]
 NumberNoDecimalT = t.Union[float, int]
@@ -7,6 +7,7 @@ Utility functions.
 from __future__ import annotations
 
 from collections import namedtuple
+from collections.abc import Iterable, Mapping, Set
 from datetime import datetime, timezone
 from functools import partial, wraps
 import math
@@ -19,16 +20,28 @@ from typing_extensions import Literal, ParamSpec, Protocol, Type
 
 import pydash as pyd
 
-from .helpers import NUMBER_TYPES, UNSET, base_get, callit, getargcount, iterator
+from .helpers import (
+    NUMBER_TYPES,
+    UNSET,
+    base_get,
+    base_getter,
+    base_lookup,
+    base_setter,
+    callit,
+    getargcount,
+    iterator,
+)
 from .types import PathT
 
 
 __all__ = (
     "attempt",
+    "compile_matcher",
     "cond",
     "conforms",
     "conforms_to",
     "constant",
+    "deep_hash",
     "default_to",
     "default_to_any",
     "identity",
@@ -50,6 +63,8 @@ __all__ = (
     "random",
     "range_",
     "range_right",
+    "register_getter",
+    "register_setter",
     "result",
     "retry",
     "stub_list",
@@ -69,10 +84,14 @@ P = ParamSpec("P")
 
 # These regexes are used in to_path() to parse deep path strings.
 
-# This is used to split a deep path string into dict keys or list indexes. This matches "." as
-# delimiter (unless it is escaped by "//") and "[<integer>]" as delimiter while keeping the
-# "[<integer>]" as an item.
-RE_PATH_KEY_DELIM = re.compile(r"(?<!\\)(?:\\\\)*\.|(\[-?\d+\])")
+# This is used to split a deep path string into dict keys or list indexes. Each match is either a
+# "[<integer>]" list index, a `sep` delimiter, or a dict key in which "\\", "\[", "\]", and an
+# escaped `sep` stand for the escaped character. Other backslashes and any "[" that doesn't start
+# a list index are part of the key.
+PATH_KEYS_PATTERN = (
+    r"\[(-?\d+)\]|({sep})|((?:\\(?:[\\\[\]]|{sep})|\\|\[(?!-?\d+\])|(?!{sep})[^\\\[])+)"
+)
+RE_PATH_KEYS = re.compile(PATH_KEYS_PATTERN.format(sep=re.escape(".")), re.DOTALL)
 
 # Matches on path strings like "[<integer>]". This is used to test whether a path string part is a
 # list index.
@@ -81,6 +100,16 @@ RE_PATH_LIST_INDEX = re.compile(r"^\[-?\d+\]$")
 
 ID_COUNTER = 0
 
+# Hashes used by deep_hash() for self-references and for unhashable values it can't look into.
+DEEP_HASH_CYCLE = hash("pydash.deep_hash.cycle")
+DEEP_HASH_UNHASHABLE = hash("pydash.deep_hash.unhashable")
+
+# Types that deep_hash() hashes directly without checking whether they are containers.
+DEEP_HASH_SCALAR_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+# Types that deep_hash() hashes by their children without checking whether they are hashable.
+DEEP_HASH_CONTAINER_TYPES = frozenset((dict, list))
+
 PathToken = namedtuple("PathToken", ["key", "default_factory"])
 
 
@@ -110,6 +139,70 @@ def attempt(func: t.Callable[P, T], *args: "P.args", **kwargs: "P.kwargs") -> t.
     return ret
 
 
+def compile_matcher(source: t.Any) -> t.Callable[[t.Any], bool]:
+    """
+    Creates a predicate function like :func:`matches` that precompiles `source` into a flat sequence
+    of ``(path, expected)`` checks. The structure of `source` is walked once instead of on every
+    call which makes the returned predicate faster to call repeatedly than
+    :func:`pydash.predicates.is_match` while keeping the same matching rules.
+
+    Args:
+        source: Source object used for comparison.
+
+    Returns:
+        Function that compares an object to `source` and returns whether the object contains
+            equivalent property values.
+
+    Example:
+
+        >>> is_active = compile_matcher({"status": "active", "org": {"id": 5}})
+        >>> is_active({"status": "active", "org": {"id": 5, "name": "acme"}})
+        True
+        >>> is_active({"status": "active", "org": {"id": 6}})
+        False
+        >>> compile_matcher([1, 2])([1, 2, 3])
+        True
+        >>> compile_matcher(5)(5)
+        True
+
+    .. versionadded:: 8.1.0
+    """
+    if not is_match_source(source):
+        return lambda obj: obj == source
+
+    checks: t.List[t.Tuple[t.Tuple[t.Any, ...], t.Any]] = []
+
+    if not compile_match_checks(source, (), checks):
+        return lambda obj: False
+
+    def matcher(obj):
+        equal = True
+
+        for path, expected in checks:
+            try:
+                value = obj
+                for key in path:
+                    if type(value) is dict and key in value:
+                        value = value[key]
+                    else:
+                        value = base_lookup(value, key)
+
+                        if value is UNSET:
+                            return False
+
+                if expected is not UNSET:
+                    equal = value == expected
+            except Exception:
+                return False
+
+            if not equal:
+                break
+
+        return equal
+
+    return matcher
+
+
 @t.overload
 def cond(
     pairs: t.List[t.Tuple[t.Callable[P, t.Any], t.Callable[P, T]]],
@@ -280,6 +373,102 @@ def constant(value: T) -> t.Callable[..., T]:
     return partial(identity, value)
 
 
+def deep_hash(value: t.Any) -> int:  # noqa: PLR0912
+    """
+    Return a hash of `value` that also supports unhashable values like lists, dicts, and sets by
+    hashing their contents. Values that compare equal with ``==`` have the same hash. Lists and
+    tuples are hashed in order while dicts and sets are hashed regardless of their order.
+    Self-referencing structures are supported. Like :func:`hash`, the result is only stable within
+    the same interpreter process.
+
+    Args:
+        value: Value to hash.
+
+    Returns:
+        Hash of `value`.
+
+    Example:
+
+        >>> deep_hash({"a": [1, 2], "b": {3}}) == deep_hash({"b": {3}, "a": [1, 2]})
+        True
+        >>> deep_hash([1, 2]) == deep_hash([2, 1])
+        False
+        >>> deep_hash((1, 2)) == hash((1, 2))
+        True
+
+    Note:
+        Unhashable values that aren't a list, tuple, set, or mapping all share the same hash.
+
+    .. versionadded:: 8.1.0
+    """
+    if type(value) not in DEEP_HASH_CONTAINER_TYPES:
+        try:
+            return hash(value)
+        except TypeError:
+            pass
+
+        if isinstance(value, Set):
+            return hash(frozenset(value))
+
+        if not isinstance(value, (Mapping, list, tuple)):
+            return DEEP_HASH_UNHASHABLE
+
+    # Ids of containers that are being hashed. Used to detect self-references.
+    active: t.Set[int] = set()
+    # Hashes of containers by id so that containers referenced more than once are hashed once.
+    computed: t.Dict[int, int] = {}
+    # Containers that are being hashed along with an iterator of their remaining children and the
+    # hashes of their children so far.
+    frames = [open_deep_hash_frame(value, active)]
+    container_hash = 0
+
+    while frames:
+        container, children, hashes = frames[-1]
+
+        for child in children:
+            child_type = type(child)
+
+            if child_type in DEEP_HASH_SCALAR_TYPES:
+                hashes.append(hash(child))
+                continue
+
+            if id(child) in computed:
+                hashes.append(computed[id(child)])
+                continue
+
+            if id(child) in active:
+                hashes.append(DEEP_HASH_CYCLE)
+                continue
+
+            if child_type in DEEP_HASH_CONTAINER_TYPES:
+                frames.append(open_deep_hash_frame(child, active))
+                break
+
+            try:
+                hashes.append(hash(child))
+                continue
+            except TypeError:
+                pass
+
+            if isinstance(child, Set):
+                hashes.append(hash(frozenset(child)))
+            elif isinstance(child, (Mapping, list, tuple)):
+                frames.append(open_deep_hash_frame(child, active))
+                break
+            else:
+                hashes.append(DEEP_HASH_UNHASHABLE)
+        else:
+            frames.pop()
+            active.discard(id(container))
+            container_hash = combine_deep_hash(container, hashes)
+            computed[id(container)] = container_hash
+
+            if frames:
+                frames[-1][2].append(container_hash)
+
+    return container_hash
+
+
 def default_to(value: t.Union[T, None], default_value: T2) -> t.Union[T, T2]:
     """
     Checks `value` to determine whether a default value should be returned in its place. The
@@ -529,8 +718,11 @@ def matches(source: t.Any) -> t.Callable[[t.Any], bool]:
 
     .. versionchanged:: 3.0.0
         Use :func:`pydash.predicates.is_match` as matching function.
+
+    .. versionchanged:: 8.1.0
+        Precompile `source` with :func:`compile_matcher`.
     """
-    return lambda obj: pyd.is_match(obj, source)
+    return compile_matcher(source)
 
 
 def matches_property(key: t.Any, value: t.Any) -> t.Callable[[t.Any], bool]:
@@ -555,9 +747,13 @@ def matches_property(key: t.Any, value: t.Any) -> t.Callable[[t.Any], bool]:
         False
 
     .. versionadded:: 3.1.0
+
+    .. versionchanged:: 8.1.0
+        Precompile `value` with :func:`compile_matcher`.
     """
     prop_accessor = property_(key)
-    return lambda obj: matches(value)(prop_accessor(obj))
+    matcher = compile_matcher(value)
+    return lambda obj: matcher(prop_accessor(obj))
 
 
 class MemoizedFunc(Protocol[P, T, T2]):
@@ -1047,6 +1243,101 @@ def range_right(*args):
     return base_range(*args, from_right=True)
 
 
+@t.overload
+def register_getter(cls: type, getter: None = None) -> t.Callable[[CallableT], CallableT]: ...
+
+
+@t.overload
+def register_getter(cls: type, getter: CallableT) -> CallableT: ...
+
+
+def register_getter(cls, getter=None):
+    """
+    Registers `getter` as the function that gets the value at a path key of instances of `cls` for
+    :func:`pydash.objects.get`, :func:`pydash.objects.has`, and the other functions that access
+    objects by path. The getter is invoked with three arguments: ``(obj, key, default)`` and should
+    return `default` when `obj` doesn't have `key`. Like :func:`functools.singledispatch`, the
+    getter also applies to subclasses of `cls` that don't have their own getter and it can be
+    registered with an abstract base class. Instances of exactly ``dict``, ``list``, and ``tuple``
+    always use their builtin lookup.
+
+    Args:
+        cls: Type to register `getter` for.
+        getter: Function to get the value at a key of `cls` instances. When omitted, a decorator
+            that registers the decorated function is returned.
+
+    Returns:
+        `getter` or a decorator that registers a getter.
+
+    Example:
+
+        >>> class Point:
+        ...     __slots__ = ("x", "y")
+        ...
+        ...     def __init__(self, x, y):
+        ...         self.x, self.y = x, y
+        >>> @register_getter(Point)
+        ... def get_point(obj, key, default):
+        ...     return getattr(obj, key) if key in Point.__slots__ else default
+        >>> pyd.get({"a": Point(1, 2)}, "a.y")
+        2
+        >>> pyd.has({"a": Point(1, 2)}, "a.z")
+        False
+
+    .. versionadded:: 8.1.0
+    """
+    if getter is None:
+        return partial(register_getter, cls)
+
+    base_getter.register(cls, getter)
+    return getter
+
+
+@t.overload
+def register_setter(cls: type, setter: None = None) -> t.Callable[[CallableT], CallableT]: ...
+
+
+@t.overload
+def register_setter(cls: type, setter: CallableT) -> CallableT: ...
+
+
+def register_setter(cls, setter=None):
+    """
+    Registers `setter` as the function that sets the value at a path key of instances of `cls` for
+    :func:`pydash.objects.set_` and the other functions that modify objects by path. The setter is
+    invoked with three arguments: ``(obj, key, value)``. Like :func:`functools.singledispatch`, the
+    setter also applies to subclasses of `cls` that don't have their own setter and it can be
+    registered with an abstract base class. Instances of exactly ``dict`` and ``list`` always use
+    their builtin assignment.
+
+    Args:
+        cls: Type to register `setter` for.
+        setter: Function to set the value at a key of `cls` instances. When omitted, a decorator
+            that registers the decorated function is returned.
+
+    Returns:
+        `setter` or a decorator that registers a setter.
+
+    Example:
+
+        >>> class Record:
+        ...     def __init__(self):
+        ...         self.fields = {}
+        >>> @register_setter(Record)
+        ... def set_record(obj, key, value):
+        ...     obj.fields[key] = value
+        >>> pyd.set_({"a": Record()}, "a.b", 1)["a"].fields
+        {'b': 1}
+
+    .. versionadded:: 8.1.0
+    """
+    if setter is None:
+        return partial(register_setter, cls)
+
+    base_setter.register(cls, setter)
+    return setter
+
+
 # TODO
 @t.overload
 def result(obj: None, key: t.Any, default: None = None) -> None: ...
@@ -1441,13 +1732,64 @@ def _to_path_token(key) -> PathToken:
     )
 
 
+def compile_match_checks(source, path, checks):
+    """
+    Append a ``(path, expected)`` check to `checks` for each leaf value of `source`. An empty
+    `source` only requires that `path` exists which is marked with an `expected` of ``UNSET``.
+    Return ``False`` if `source` can never match.
+    """
+    if not source:
+        checks.append((path, UNSET))
+        return True
+
+    matchable = False
+
+    for key, value in iterator(source):
+        matchable = True
+        key_path = path + (key,)
+
+        if not is_match_source(value):
+            checks.append((key_path, value))
+        elif not compile_match_checks(value, key_path, checks):
+            return False
+
+    # A non-empty source without any items, like an exhausted iterator, never matches.
+    return matchable
+
+
+def combine_deep_hash(container, hashes):
+    """Return hash of `container` given the hashes of its children."""
+    if type(container) is dict or isinstance(container, Mapping):
+        # Entries are unique by key so they can be hashed like a set to be independent of order.
+        return hash(frozenset(zip(map(hash, container.keys()), hashes)))
+    return hash((isinstance(container, list), tuple(hashes)))
+
+
+def is_match_source(value):
+    """Return whether `value` is compared by its items in a match instead of by equality."""
+    return isinstance(value, (Mapping, Iterable)) and not isinstance(value, str)
+
+
+def open_deep_hash_frame(container, active):
+    """Return :func:`deep_hash` stack frame that starts hashing the children of `container`."""
+    active.add(id(container))
+    if type(container) is dict or isinstance(container, Mapping):
+        children = container.values()
+    else:
+        children = container
+    return container, iter(children), []
+
+
 def to_path_tokens(value) -> t.List[PathToken]:
     """Parse `value` into :class:`PathToken` objects."""
-    if pyd.is_string(value) and ("." in value or "[" in value):
+    if pyd.is_string(value) and ("." in value or "[" in value or "\\" in value):
         # Since we can't tell whether a bare number is supposed to be dict key or a list index, we
         # support a special syntax where any string-integer surrounded by brackets is treated as a
         # list index and converted to an integer.
-        keys = [_to_path_token(key) for key in filter(None, RE_PATH_KEY_DELIM.split(value))]
+        keys = [
+            PathToken(key, default_factory=list if isinstance(key, int) else dict)
+            for key in split_path_keys(value)
+        ]
     elif pyd.is_string(value) or pyd.is_number(value):
         keys = [PathToken(value, default_factory=dict)]
     elif value is UNSET:
@@ -1460,13 +1802,39 @@ def to_path_tokens(value) -> t.List[PathToken]:
     return keys
 
 
-def unescape_path_key(key):
-    """Unescape path key."""
-    key = key.replace(r"\\", "\\")
-    key = key.replace(r"\.", r".")
+def split_path_keys(path, regex=RE_PATH_KEYS, sep="."):
+    """
+    Return list of the unescaped dict keys and integer list indexes of the string `path` whose keys
+    are separated by `sep` and matched by `regex` compiled from :data:`PATH_KEYS_PATTERN`. Empty
+    keys are skipped.
+    """
+    keys = []
+
+    for index, _, key in regex.findall(path):
+        if index:
+            keys.append(int(index))
+        elif key:
+            keys.append(unescape_path_key(key, sep))
+
+    return keys
+
+
+def escape_path_key(key, sep="."):
+    """Escape path key so that :func:`split_path_keys` parses it as a single key."""
+    key = key.replace("\\", r"\\")
+    key = key.replace(sep, "\\" + sep)
+    key = key.replace("[", r"\[")
+    key = key.replace("]", r"\]")
     return key
 
 
+def unescape_path_key(key, sep="."):
+    """Unescape path key."""
+    if "\\" not in key:
+        return key
+    return re.sub(r"\\([\\\[\]]|" + re.escape(sep) + ")", r"\1", key)
+
+
 def base_range(*args, **kwargs):
     """Yield range values."""
     from_right = kwargs.get("from_right", False)
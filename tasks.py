@@ -20,8 +20,9 @@ from invoke import Context, Exit, UnexpectedExit, run as _run, task
 PACKAGE_NAME = "pydash"
 PACKAGE_SOURCE = f"src/{PACKAGE_NAME}"
 MYPY_TESTS_DIR = "tests/pytest_mypy_testing"
+BENCHMARKS_DIR = "benchmarks"
 TEST_TARGETS = f"{PACKAGE_SOURCE} tests"
-LINT_TARGETS = f"{TEST_TARGETS} tasks.py"
+LINT_TARGETS = f"{TEST_TARGETS} {BENCHMARKS_DIR} tasks.py"
 EXIT_EXCEPTIONS = (Exit, UnexpectedExit, SystemExit)
 
 
@@ -121,6 +122,38 @@ def test(
     run(f"pytest {args} {ignored_dirs}")
 
 
+@task(
+    help={
+        "match": "Only run cases whose name contains this value",
+        "sizes": "Comma separated input sizes",
+        "save": "Save results as a named baseline",
+        "compare": "Compare results to a named baseline and fail on regressions",
+        "threshold": "Slowdown ratio reported as a regression",
+    }
+)
+def bench(
+    ctx: Context,
+    *,
+    match: str = "",
+    sizes: str = "",
+    save: str = "",
+    compare: str = "",
+    threshold: float = 0.25,
+) -> None:
+    """Run benchmarks."""
+    args = [f"--threshold {threshold}"]
+    if match:
+        args.append(f"--match {match}")
+    if sizes:
+        args.append(f"--sizes {sizes}")
+    if save:
+        args.append(f"--save {save}")
+    if compare:
+        args.append(f"--compare {compare}")
+
+    run(f"python -m {BENCHMARKS_DIR} {' '.join(args)}")
+
+
 @task()
 def ci(ctx: Context) -> None:
     """Run linters and tests."""
@@ -7,3 +7,8 @@ import pytest
 def mock_sleep():
     with mock.patch("time.sleep") as mocked:
         yield mocked
+
+
+@pytest.fixture
+def np():
+    return pytest.importorskip("numpy")
@@ -34,6 +34,7 @@ def test_mypy_every() -> None:
 def test_mypy_filter_() -> None:
     reveal_type(_.filter_([{"a": 1}, {"b": 2}, {"a": 1, "b": 3}], {"a": 1}))  # R: builtins.list[builtins.dict[builtins.str, builtins.int]]
     reveal_type(_.filter_([1, 2, 3, 4], lambda x: x >= 3))  # R: builtins.list[builtins.int]
+    reveal_type(_.filter_(_.Table({"a": [1, 2]}), {"a": 1}))  # R: pydash.tables.Table
 
 
 @pytest.mark.mypy_testing
@@ -91,6 +92,13 @@ def test_mypy_for_each_right() -> None:
 def test_mypy_group_by() -> None:
     reveal_type(_.group_by([{"a": 1, "b": 2}, {"a": 3, "b": 4}], "a"))  # R: builtins.dict[Any, builtins.list[builtins.dict[builtins.str, builtins.int]]]
     reveal_type(_.group_by([{"a": 1, "b": 2}, {"a": 3, "b": 4}], lambda d: d == {"a": 1}))  # R: builtins.dict[builtins.bool, builtins.list[builtins.dict[builtins.str, builtins.int]]]
+    reveal_type(_.group_by(_.Table({"a": [1, 2]}), "a"))  # R: builtins.dict[Any, pydash.tables.Table]
+
+
+@pytest.mark.mypy_testing
+def test_mypy_index_by() -> None:
+    reveal_type(_.index_by([{"a": 1}, {"a": 2}], "a"))  # R: pydash.indexes.Index[builtins.dict[builtins.str, builtins.int]]
+    reveal_type(_.find(_.index_by([{"a": 1}, {"a": 2}], "a"), {"a": 1}))  # R: Union[builtins.dict[builtins.str, builtins.int], None]
 
 
 @pytest.mark.mypy_testing
@@ -128,6 +136,7 @@ def test_mypy_nest() -> None:
 def test_mypy_order_by() -> None:
     reveal_type(_.order_by([{"a": 2, "b": 1}, {"a": 3, "b": 2}, {"a": 1, "b": 3}], ["b", "a"]))  # R: builtins.list[builtins.dict[builtins.str, builtins.int]]
     reveal_type(_.order_by([{"a": 2, "b": 1}, {"a": 3, "b": 2}, {"a": 1, "b": 3}], ["a", "b"], [False, True]))  # R: builtins.list[builtins.dict[builtins.str, builtins.int]]
+    reveal_type(_.order_by(_.Table({"a": [1, 2]}), ["a"]))  # R: pydash.tables.Table
 
 
 @pytest.mark.mypy_testing
@@ -23,6 +23,7 @@ def test_mypy_sum_() -> None:
 @pytest.mark.mypy_testing
 def test_mypy_sum_by() -> None:
     reveal_type(_.sum_by([1, 2, 3, 4], lambda x: x ** 2))  # R: builtins.int
+    reveal_type(_.sum_by(_.Table({"a": [1, 2]}), "a"))  # R: Any
 
 
 @pytest.mark.mypy_testing
@@ -33,6 +34,7 @@ def test_mypy_mean() -> None:
 @pytest.mark.mypy_testing
 def test_mypy_mean_by() -> None:
     reveal_type(_.mean_by([1, 2, 3, 4], lambda x: x ** 2))  # R: builtins.float
+    reveal_type(_.mean_by(_.Table({"a": [1, 2]}), "a"))  # R: builtins.float
 
 
 @pytest.mark.mypy_testing
@@ -89,6 +91,8 @@ def test_mypy_max_by() -> None:
 def test_mypy_median() -> None:
     reveal_type(_.median([1, 2, 3, 4, 5]))  # R: Union[builtins.float, builtins.int]
     reveal_type(_.median([1, 2, 3, 4]))  # R: Union[builtins.float, builtins.int]
+    reveal_type(_.median(iter([1, 2, 3, 4])))  # R: Union[builtins.float, builtins.int]
+    reveal_type(_.median([1, 2, 3, 4], backend="numpy"))  # R: Union[builtins.float, builtins.int]
 
 
 @pytest.mark.mypy_testing
@@ -111,11 +115,53 @@ def test_mypy_min_by() -> None:
     reveal_type(_.min_by(empty_int_list, default=100))  # R: builtins.int
 
 
+@pytest.mark.mypy_testing
+def test_mypy_min_max_by() -> None:
+    def floor(x: float) -> int:
+        return math.floor(x)
+
+    reveal_type(_.min_max_by([1.8, 1.5, 1.0], floor))  # R: Tuple[builtins.float, builtins.float]
+    reveal_type(_.min_max_by([{'a': 1}, {'a': 2}, {'a': 3}], 'a'))  # R: Tuple[builtins.dict[builtins.str, builtins.int], builtins.dict[builtins.str, builtins.int]]
+
+    empty_int_list: t.List[int] = []
+    reveal_type(_.min_max_by(empty_int_list, default=None))  # R: Tuple[Union[builtins.int, None], Union[builtins.int, None]]
+
+
+@pytest.mark.mypy_testing
+def test_mypy_moving_max() -> None:
+    reveal_type(_.moving_max([1, 3, 2, 5, 4], 2))  # R: typing.Generator[builtins.int, None, None]
+
+
 @pytest.mark.mypy_testing
 def test_mypy_moving_mean() -> None:
     reveal_type(_.moving_mean(range(10), 1))  # R: builtins.list[builtins.float]
 
 
+@pytest.mark.mypy_testing
+def test_mypy_itermoving_mean() -> None:
+    reveal_type(_.itermoving_mean(range(10), 1))  # R: typing.Generator[builtins.float, None, None]
+
+
+@pytest.mark.mypy_testing
+def test_mypy_moving_median() -> None:
+    reveal_type(_.moving_median([1, 5, 2, 8, 3], 3))  # R: typing.Generator[Union[builtins.float, builtins.int], None, None]
+
+
+@pytest.mark.mypy_testing
+def test_mypy_moving_min() -> None:
+    reveal_type(_.moving_min([4, 2, 3, 1, 5], 2))  # R: typing.Generator[builtins.int, None, None]
+
+
+@pytest.mark.mypy_testing
+def test_mypy_moving_std() -> None:
+    reveal_type(_.moving_std([1, 1, 3, 3], 2))  # R: typing.Generator[builtins.float, None, None]
+
+
+@pytest.mark.mypy_testing
+def test_mypy_moving_sum() -> None:
+    reveal_type(_.moving_sum([1, 2, 3, 4, 5], 2))  # R: typing.Generator[builtins.int, None, None]
+
+
 @pytest.mark.mypy_testing
 def test_mypy_multiply() -> None:
     reveal_type(_.multiply(4, 5))  # R: builtins.int
@@ -128,18 +174,48 @@ def test_mypy_multiply() -> None:
     reveal_type(_.multiply(None, None))  # R: builtins.int
 
 
+@pytest.mark.mypy_testing
+def test_mypy_percentile() -> None:
+    reveal_type(_.percentile([1, 2, 3], 50))  # R: Union[builtins.float, builtins.int]
+    reveal_type(_.percentile([1, 2, 3], [50, 99]))  # R: builtins.list[Union[builtins.float, builtins.int]]
+    reveal_type(_.percentile([{"a": 1}], [50], "a"))  # R: builtins.list[Union[builtins.float, builtins.int]]
+
+
 @pytest.mark.mypy_testing
 def test_mypy_power() -> None:
     reveal_type(_.power(5, 2))  # R: Union[builtins.int, builtins.float]
     reveal_type(_.power(12.5, 3))  # R: builtins.float
 
 
+@pytest.mark.mypy_testing
+def test_mypy_quantile() -> None:
+    reveal_type(_.quantile([1, 2, 3], 0.5))  # R: Union[builtins.float, builtins.int]
+    reveal_type(_.quantile({"a": 1, "b": 2}, [0.5, 0.9]))  # R: builtins.list[Union[builtins.float, builtins.int]]
+    reveal_type(_.quantile([{"a": 1}], 0.5, lambda x: x["a"]))  # R: Union[builtins.float, builtins.int]
+
+
+@pytest.mark.mypy_testing
+def test_mypy_quantile_sketch() -> None:
+    sketch = _.QuantileSketch([0.5, 0.99], [1.0, 2.0])
+    reveal_type(sketch)  # R: pydash.numerical.QuantileSketch
+    reveal_type(sketch.push(3.0).update([4.0, 5.0]))  # R: pydash.numerical.QuantileSketch
+
+
 @pytest.mark.mypy_testing
 def test_mypy_round_() -> None:
     reveal_type(_.round_(3.275))  # R: builtins.float
     reveal_type(_.round_(3.275, 1))  # R: builtins.float
 
 
+@pytest.mark.mypy_testing
+def test_mypy_running_stats() -> None:
+    stats = _.RunningStats([1, 2, 3])
+    reveal_type(stats)  # R: pydash.numerical.RunningStats
+    reveal_type(stats.push(4).merge(_.RunningStats()))  # R: pydash.numerical.RunningStats
+    reveal_type(stats.variance(ddof=1))  # R: builtins.float
+    reveal_type(stats.std_deviation())  # R: builtins.float
+
+
 @pytest.mark.mypy_testing
 def test_mypy_scale() -> None:
     reveal_type(_.scale([1, 2, 3, 4]))  # R: builtins.list[builtins.float]
@@ -151,9 +227,16 @@ def test_mypy_slope() -> None:
     reveal_type(_.slope((1, 2), (4, 8)))  # R: builtins.float
 
 
+@pytest.mark.mypy_testing
+def test_mypy_stats_by() -> None:
+    reveal_type(_.stats_by([1, 2, 3]))  # R: builtins.dict[builtins.str, Any]
+    reveal_type(_.stats_by([{'a': 1}, {'a': 2}], 'a', fsum=True))  # R: builtins.dict[builtins.str, Any]
+
+
 @pytest.mark.mypy_testing
 def test_mypy_std_deviation() -> None:
     reveal_type(_.std_deviation([1, 18, 20, 4]))  # R: builtins.float
+    reveal_type(_.std_deviation(iter([1, 18, 20, 4]), ddof=1))  # R: builtins.float
 
 
 @pytest.mark.mypy_testing
@@ -166,13 +249,19 @@ def test_mypy_subtract() -> None:
 @pytest.mark.mypy_testing
 def test_mypy_transpose() -> None:
     reveal_type(_.transpose([[1, 2, 3], [4, 5, 6], [7, 8, 9]]))  # R: builtins.list[builtins.list[builtins.int]]
+    reveal_type(_.transpose([[1, 2, 3], [4, 5]], truncate=True))  # R: builtins.list[builtins.list[builtins.int]]
+    reveal_type(_.transpose([[1, 2], [3, 4]], lazy=True))  # R: typing.Generator[builtins.list[builtins.int], None, None]
 
 
 @pytest.mark.mypy_testing
 def test_mypy_variance() -> None:
     reveal_type(_.variance([1, 18, 20, 4]))  # R: builtins.float
+    reveal_type(_.variance([1, 18, 20, 4], ddof=1))  # R: builtins.float
+    reveal_type(_.variance([1, 18, 20, 4], backend="python"))  # R: builtins.float
 
 
 @pytest.mark.mypy_testing
 def test_mypy_var() -> None:
     reveal_type(_.zscore([1, 2, 3]))  # R: builtins.list[builtins.float]
+    reveal_type(_.zscore([1, 2, 3], ddof=1))  # R: builtins.list[builtins.float]
+    reveal_type(_.zscore([1, 2, 3], backend="numpy"))  # R: builtins.list[builtins.float]
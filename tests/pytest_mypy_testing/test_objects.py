@@ -74,6 +74,13 @@ def test_mypy_defaults() -> None:
 def test_mypy_defaults_deep() -> None:
     obj = {"a": {"b": 1}}
     reveal_type(_.defaults_deep(obj, {"a": {"b": 2, "c": 3}}))  # R: builtins.dict[builtins.str, builtins.dict[builtins.str, builtins.int]]
+    reveal_type(_.defaults_deep(obj, {"a": {"b": 2, "c": 3}}, copy_values=False))  # R: builtins.dict[builtins.str, builtins.dict[builtins.str, builtins.int]]
+
+
+@pytest.mark.mypy_testing
+def test_mypy_diff() -> None:
+    reveal_type(_.diff({"a": 1}, {"a": 2}))  # R: builtins.list[Tuple[builtins.str, builtins.list[Any], Any]]
+    reveal_type(_.diff([{"id": 1}], [{"id": 2}], "id"))  # R: builtins.list[Tuple[builtins.str, builtins.list[Any], Any]]
 
 
 @pytest.mark.mypy_testing
@@ -94,6 +101,11 @@ def test_mypy_find_last_key() -> None:
     reveal_type(_.find_last_key([1, 2, 3, 1], is_one))  # R: Union[builtins.int, None]
 
 
+@pytest.mark.mypy_testing
+def test_mypy_flatten_keys() -> None:
+    reveal_type(_.flatten_keys({"a": {"b": [1, 2]}}))  # R: builtins.dict[builtins.str, Any]
+
+
 @pytest.mark.mypy_testing
 def test_mypy_for_in() -> None:
     def cb(v: int, k: str) -> None:
@@ -120,6 +132,13 @@ def test_mypy_get() -> None:
     reveal_type(_.get(MyClass(), "x"))  # R: Any
 
 
+@pytest.mark.mypy_testing
+def test_mypy_get_many() -> None:
+    obj = {"a": {"b": 1}}
+    reveal_type(_.get_many(obj, ["a.b", "a.c"]))  # R: builtins.list[Any]
+    reveal_type(_.get_many(obj, {"b": "a.b"}))  # R: builtins.dict[builtins.str, Any]
+
+
 @pytest.mark.mypy_testing
 def test_mypy_has() -> None:
     reveal_type(_.has([1, 2, 3], 1))  # R: builtins.bool
@@ -150,6 +169,16 @@ def test_mypy_invoke() -> None:
     reveal_type(_.invoke(MyClass(), "get_x"))  # R: Any
 
 
+@pytest.mark.mypy_testing
+def test_mypy_iterflatten_keys() -> None:
+    reveal_type(_.iterflatten_keys({"a": {"b": [1, 2]}}))  # R: typing.Iterator[Tuple[builtins.str, Any]]
+
+
+@pytest.mark.mypy_testing
+def test_mypy_iterwalk() -> None:
+    reveal_type(_.iterwalk({"a": [1, 2]}))  # R: typing.Iterator[Tuple[builtins.list[Any], Any, Any]]
+
+
 @pytest.mark.mypy_testing
 def test_mypy_keys() -> None:
     reveal_type(_.keys([1, 2, 3]))  # R: builtins.list[builtins.int]
@@ -182,12 +211,20 @@ def test_mypy_map_values_deep() -> None:
         return x * 2
 
     reveal_type(_.map_values_deep(x, times_two))  # R: Any
+    reveal_type(_.map_values_deep(x, times_two, in_place=False, paths=False))  # R: Any
 
 
 @pytest.mark.mypy_testing
 def test_mypy_merge() -> None:
     obj = {"a": 2}
     reveal_type(_.merge(obj, {"a": 1}, {"b": 2, "c": 3}, {"d": 4}))  # R: builtins.dict[builtins.str, builtins.int]
+    reveal_type(_.merge(obj, {"a": 1}, copy_values=False))  # R: builtins.dict[builtins.str, builtins.int]
+
+
+@pytest.mark.mypy_testing
+def test_mypy_merge_in() -> None:
+    obj = {"a": 2}
+    reveal_type(_.merge_in(obj, {"a": 1}, {"b": 2, "c": 3}, {"d": 4}))  # R: builtins.dict[builtins.str, builtins.int]
 
 
 @pytest.mark.mypy_testing
@@ -224,6 +261,11 @@ def test_mypy_parse_int() -> None:
     reveal_type(_.parse_int("12", 8))  # R: Union[builtins.int, None]
 
 
+@pytest.mark.mypy_testing
+def test_mypy_patch() -> None:
+    reveal_type(_.patch({"a": 1}, [("set", ["a"], 2)]))  # R: builtins.dict[builtins.str, builtins.int]
+
+
 @pytest.mark.mypy_testing
 def test_mypy_pick() -> None:
     reveal_type(_.pick({"a": 1, "b": 2, "c": 3}, "a", "b"))  # R: builtins.dict[builtins.str, builtins.int]
@@ -252,6 +294,18 @@ def test_mypy_set_() -> None:
     reveal_type(_.set_(MyClass(), "x", 10))  # R: tests.pytest_mypy_testing.test_objects.MyClass
 
 
+@pytest.mark.mypy_testing
+def test_mypy_set_in() -> None:
+    reveal_type(_.set_in({"a": {"b": 1}}, "a.b", 2))  # R: builtins.dict[builtins.str, builtins.dict[builtins.str, builtins.int]]
+    reveal_type(_.set_in(MyClass(), "x", 10))  # R: tests.pytest_mypy_testing.test_objects.MyClass
+
+
+@pytest.mark.mypy_testing
+def test_mypy_set_many() -> None:
+    reveal_type(_.set_many({"a": {"b": 1}}, {"a.b": 2, "a.c": 3}))  # R: builtins.dict[builtins.str, builtins.dict[builtins.str, builtins.int]]
+    reveal_type(_.set_many(MyClass(), [("x", 10)]))  # R: tests.pytest_mypy_testing.test_objects.MyClass
+
+
 @pytest.mark.mypy_testing
 def test_mypy_set_with() -> None:
     reveal_type(_.set_with({}, "[0][1]", "a", lambda: {}))  # R: builtins.dict[Never, Never]
@@ -328,6 +382,13 @@ def test_mypy_update() -> None:
     reveal_type(_.update(MyClass(), "x", lambda value: 10))  # R: tests.pytest_mypy_testing.test_objects.MyClass
 
 
+@pytest.mark.mypy_testing
+def test_mypy_update_in() -> None:
+    reveal_type(_.update_in({}, ["a", "b"], lambda value: value))  # R: builtins.dict[Any, Any]
+    reveal_type(_.update_in([], [0, 0], lambda value: 1))  # R: builtins.list[Any]
+    reveal_type(_.update_in(MyClass(), "x", lambda value: 10))  # R: tests.pytest_mypy_testing.test_objects.MyClass
+
+
 @pytest.mark.mypy_testing
 def test_mypy_update_with() -> None:
     reveal_type(_.update_with({}, "[0][1]", lambda x: "a", lambda x: {}))  # R: builtins.dict[Any, Any]
@@ -335,11 +396,21 @@ def test_mypy_update_with() -> None:
     reveal_type(_.update_with(MyClass(), "lst.0", lambda value: 10, lambda x: []))  # R: tests.pytest_mypy_testing.test_objects.MyClass
 
 
+@pytest.mark.mypy_testing
+def test_mypy_unflatten_keys() -> None:
+    reveal_type(_.unflatten_keys({"a.b[0]": 1}))  # R: builtins.dict[Any, Any]
+
+
 @pytest.mark.mypy_testing
 def test_mypy_unset() -> None:
     reveal_type(_.unset({"a": [{"b": {"c": 7}}]}, "a[0].b.c"))  # R: builtins.bool
 
 
+@pytest.mark.mypy_testing
+def test_mypy_unset_in() -> None:
+    reveal_type(_.unset_in({"a": [{"b": {"c": 7}}]}, "a[0].b.c"))  # R: builtins.dict[builtins.str, builtins.list[builtins.dict[builtins.str, builtins.dict[builtins.str, builtins.int]]]]
+
+
 @pytest.mark.mypy_testing
 def test_mypy_values() -> None:
     reveal_type(_.values({"a": "a", "b": "b", "c": "c"}))  # R: builtins.list[builtins.str]
@@ -348,6 +419,11 @@ def test_mypy_values() -> None:
     reveal_type(_.values(MyClass()))  # R: builtins.list[Any]
 
 
+@pytest.mark.mypy_testing
+def test_mypy_walk() -> None:
+    reveal_type(_.walk({"a": [1, 2]}, lambda value: value))  # R: Any
+
+
 @pytest.mark.mypy_testing
 def test_mypy_apply() -> None:
     reveal_type(_.apply("1", lambda x: int(x)))  # R: builtins.int
@@ -13,6 +13,11 @@ def test_mypy_attempt() -> None:
     reveal_type(_.attempt(divide_by_zero, 1))  # R: Union[builtins.float, builtins.Exception]
 
 
+@pytest.mark.mypy_testing
+def test_mypy_compile_matcher() -> None:
+    reveal_type(_.compile_matcher({'a': {'b': 2}}))  # R: def (Any) -> builtins.bool
+
+
 @pytest.mark.mypy_testing
 def test_mypy_cond() -> None:
     def is_1(n: int) -> bool:
@@ -50,6 +55,11 @@ def test_mypy_constant() -> None:
     reveal_type(_.constant("hello"))  # R: def (*Any, **Any) -> builtins.str
 
 
+@pytest.mark.mypy_testing
+def test_mypy_deep_hash() -> None:
+    reveal_type(_.deep_hash({'a': [1, 2]}))  # R: builtins.int
+
+
 @pytest.mark.mypy_testing
 def test_mypy_default_to() -> None:
     reveal_type(_.default_to(1, 10))  # R: builtins.int
@@ -211,6 +221,22 @@ def test_mypy_range_right() -> None:
     reveal_type(list(_.range_right(4, 1)))  # R: builtins.list[builtins.int]
 
 
+@pytest.mark.mypy_testing
+def test_mypy_register_getter() -> None:
+    def get_item(obj: t.Any, key: t.Any, default: t.Any) -> t.Any:
+        return default
+
+    reveal_type(_.register_getter(object, get_item))  # R: def (obj: Any, key: Any, default: Any) -> Any
+
+
+@pytest.mark.mypy_testing
+def test_mypy_register_setter() -> None:
+    def set_item(obj: t.Any, key: t.Any, value: t.Any) -> None:
+        pass
+
+    reveal_type(_.register_setter(object, set_item))  # R: def (obj: Any, key: Any, value: Any)
+
+
 @pytest.mark.mypy_testing
 def test_mypy_result() -> None:
     reveal_type(_.result({'a': 1, 'b': lambda: 2}, 'a'))  # R: Any
@@ -0,0 +1,184 @@
+"""
+Harness for measuring how a function's running time grows with its input size.
+
+A function is timed at doubling input sizes and a power law ``time = c * size**k`` is fitted to the
+measurements. The fitted exponent ``k`` is then compared against the limit for the complexity class
+the function is declared to have. Timings use the best of several repetitions so that the fitted
+exponent is stable enough to tell linear and quadratic growth apart on a developer machine.
+"""
+
+from contextlib import contextmanager
+import math
+import random
+import sys
+import timeit
+import typing as t
+
+
+#: Highest fitted exponent accepted for each declared complexity class. The gaps between classes
+#: are wide enough to absorb timing noise while still catching a quadratic implementation.
+EXPONENT_LIMITS = {
+    "linear": 1.35,
+    "nlogn": 1.45,
+}
+
+#: Doubling input sizes that are measured.
+SIZES = (128, 256, 512, 1024, 2048, 4096)
+
+#: Stop growing the input once the next size is projected to take longer than this many seconds per
+#: call. Calls that already take longer than this are only timed once.
+TIME_BUDGET = 0.1
+
+#: Each timing repetition runs the function enough times to take at least this many seconds.
+MIN_TIME = 0.002
+
+#: Number of timing repetitions per size. The fastest repetition is used.
+REPEAT = 3
+
+#: Seed used for generated inputs so that every run measures the same data.
+SEED = 1234
+
+
+class Growth(t.NamedTuple):
+    """Measured running times of a function at each input size."""
+
+    sizes: t.List[int]
+    times: t.List[float]
+
+    @property
+    def exponent(self) -> float:
+        return fit_exponent(self.sizes, self.times)
+
+    def __str__(self) -> str:
+        timings = ", ".join(
+            f"{size}: {seconds:.2e}s" for size, seconds in zip(self.sizes, self.times)
+        )
+        return f"exponent={self.exponent:.2f} ({timings})"
+
+
+def fit_exponent(sizes: t.Sequence[int], times: t.Sequence[float]) -> float:
+    """Return the least squares slope of ``log(times)`` against ``log(sizes)``."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(seconds, 1e-12)) for seconds in times]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    numerator = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    denominator = sum((x - x_mean) ** 2 for x in xs)
+    return numerator / denominator
+
+
+@contextmanager
+def untraced() -> t.Iterator[None]:
+    """Suspend any trace function (e.g. installed by coverage) whose per-line overhead would distort
+    timings."""
+    trace = sys.gettrace()
+    sys.settrace(None)
+    try:
+        yield
+    finally:
+        sys.settrace(trace)
+
+
+def time_call(func: t.Callable[[t.Any], t.Any], data: t.Any) -> float:
+    """Return the best seconds per call of ``func(data)``."""
+    with untraced():
+        return _time_call(func, data)
+
+
+def _time_call(func: t.Callable[[t.Any], t.Any], data: t.Any) -> float:
+    timer = timeit.Timer(lambda: func(data))
+    number = 1
+
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= MIN_TIME:
+            break
+        number *= 2
+
+    if elapsed > TIME_BUDGET:
+        return elapsed
+
+    return min([elapsed] + timer.repeat(REPEAT - 1, number)) / number
+
+
+def measure_growth(
+    func: t.Callable[[t.Any], t.Any],
+    data: t.Callable[[int], t.Any],
+    sizes: t.Sequence[int] = SIZES,
+) -> Growth:
+    """Time ``func(data(size))`` for each size, stopping early once the time budget is used up."""
+    growth = Growth([], [])
+
+    for size in sizes:
+        seconds = time_call(func, data(size))
+        growth.sizes.append(size)
+        growth.times.append(seconds)
+
+        if len(growth.sizes) >= 3:
+            # Project the time of the next size from the growth between the last two sizes.
+            projected = seconds * seconds / max(growth.times[-2], 1e-12)
+            if projected > TIME_BUDGET:
+                break
+
+    return growth
+
+
+#
+# Input factories
+#
+
+
+def ints(size: int) -> t.List[int]:
+    rnd = random.Random(SEED)
+    return [rnd.randrange(size) for _ in range(size)]
+
+
+def distinct_ints(size: int) -> t.List[int]:
+    values = list(range(size))
+    random.Random(SEED).shuffle(values)
+    return values
+
+
+def floats(size: int) -> t.List[float]:
+    rnd = random.Random(SEED)
+    return [rnd.uniform(-1000, 1000) for _ in range(size)]
+
+
+def int_pairs(size: int) -> t.Tuple[t.List[int], t.List[int]]:
+    return distinct_ints(size), [value + size // 2 for value in distinct_ints(size)]
+
+
+def records(size: int) -> t.List[t.Dict[str, t.Any]]:
+    rnd = random.Random(SEED)
+    return [
+        {"id": i, "group": i % 10, "score": rnd.randrange(100), "tags": {"a": i % 3}}
+        for i in range(size)
+    ]
+
+
+def record_pairs(size: int) -> t.Tuple[t.List[t.Dict[str, t.Any]], t.List[t.Dict[str, t.Any]]]:
+    first = records(size)
+    return first, [dict(record) for record in first[size // 2 :] + records(size // 2)]
+
+
+def mapping(size: int) -> t.Dict[str, int]:
+    return {f"key{i}": i for i in range(size)}
+
+
+def document(size: int) -> t.Dict[str, t.Any]:
+    return {f"key{i}": {"id": i, "values": [i, {"x": i}]} for i in range(size)}
+
+
+def nested_lists(size: int) -> t.List[t.Any]:
+    return [[i, [i, [i]]] for i in range(size // 3)]
+
+
+def text(size: int) -> str:
+    rnd = random.Random(SEED)
+    words = ("fooBar", "baz_qux", "Hello", "WORLD", "lorem-ipsum", "abc123")
+    return " ".join(rnd.choice(words) for _ in range(size))
+
+
+def square_matrix(size: int) -> t.List[t.List[int]]:
+    width = max(int(math.sqrt(size)), 1)
+    return [list(range(row * width, (row + 1) * width)) for row in range(width)]
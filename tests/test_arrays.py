@@ -53,6 +53,10 @@ def test_concat(case, expected):
         (([1, 2, 3, 4], []), [1, 2, 3, 4]),
         (([1, 2, 3, 4], [2, 4], [3, 5, 6]), [1]),
         (([1, 1, 1, 1], [2, 4], [3, 5, 6]), [1, 1, 1, 1]),
+        (([{"a": 1}, {"a": 2}, {"a": 1}, [3]], [{"a": 1}], [[3]]), [{"a": 2}]),
+        (([{"a": [1, 2]}, {"a": [2, 1]}], [{"a": [2, 1]}]), [{"a": [1, 2]}]),
+        (([{"a": 1}, 1, 1.0], [True]), [{"a": 1}]),
+        (([(1, [2]), (1, [3])], [(1, [2])]), [(1, [3])]),
     ],
 )
 def test_difference(case, expected):
@@ -139,6 +143,7 @@ def test_drop_right_while(case, expected):
     [
         (([1, 2, 3, 2, 1, 5, 6, 5, 5, 5],), [2, 1, 5]),
         ((["A", "b", "C", "a", "B", "c"], lambda letter: letter.lower()), ["a", "B", "c"]),
+        (([{"a": 1}, [1], {"a": 1}, {"a": 2}, [1], {"a": 1}],), [{"a": 1}, [1]]),
     ],
 )
 def test_duplicates(case, expected):
@@ -222,6 +227,24 @@ def test_flatten_deep(case, expected):
     assert _.flatten_deep(case) == expected
 
 
+def test_flatten_deep_deeply_nested():
+    case = value = [1]
+    for _i in range(10000):
+        value.append([])
+        value = value[-1]
+    value.append(2)
+
+    assert _.flatten_deep(case) == [1, 2]
+
+
+def test_flatten_deep_raises_for_reference_cycle():
+    case: list = [1]
+    case.append([case])
+
+    with pytest.raises(ValueError, match="references itself"):
+        _.flatten_deep(case)
+
+
 @parametrize(
     "case,expected",
     [
@@ -307,6 +330,8 @@ def test_interleave(case, expected):
         (([1, 2, 3],), [1, 2, 3]),
         (([], [101, 2, 1, 10], [2, 1]), []),
         (([],), []),
+        (([{"a": 1}, {"a": 2}, {"a": 1}], [{"a": 1}, [1]]), [{"a": 1}]),
+        (([{"a": {"b": [1]}}, {"a": {"b": [2]}}], [{"a": {"b": [2]}}]), [{"a": {"b": [2]}}]),
     ],
 )
 def test_intersection(case, expected):
@@ -341,6 +366,10 @@ def test_intersection_by(case, expected):
             (["A", "b", "cC"], ["a", "cc"], ["A", "CC"], lambda a, b: a.lower() == b.lower()),
             ["A", "cC"],
         ),
+        (
+            (["A", "b", "A", "c"], ["a", "a", "B"], lambda a, b: a.lower() == b.lower()),
+            ["A", "b"],
+        ),
     ],
 )
 def test_intersection_with(case, expected):
@@ -758,6 +787,9 @@ def test_take_right_while(case, expected):
     [
         ([1, 2, 1, 3, 1], [1, 2, 3]),
         ([dict(a=1), dict(a=2), dict(a=1)], [dict(a=1), dict(a=2)]),
+        ([[1, 2], [2, 1], [1, 2], {1, 2}, {2, 1}], [[1, 2], [2, 1], {1, 2}]),
+        ([{"a": [1]}, {"a": [1.0]}, {"a": (1,)}], [{"a": [1]}, {"a": (1,)}]),
+        ([(1, [2]), (1, [2]), (1, [3])], [(1, [2]), (1, [3])]),
     ],
 )
 def test_uniq(case, expected):
@@ -797,6 +829,8 @@ def test_uniq_by(case, iteratee, expected):
     [
         ([1, 2, 3, 4, 5], lambda a, b: (a % 2) == (b % 2), [1, 2]),
         ([5, 4, 3, 2, 1], lambda a, b: (a % 2) == (b % 2), [5, 4]),
+        ([{"a": 1}, {"a": 2}, {"a": 1}], None, [{"a": 1}, {"a": 2}]),
+        ([{"a": 1}, {"a": 2}, {"a": 1}], _.is_equal, [{"a": 1}, {"a": 2}]),
     ],
 )
 def test_uniq_with(case, iteratee, expected):
@@ -874,14 +908,24 @@ def test_unzip_with(case, expected):
     assert _.unzip_with(*case) == expected
 
 
-@parametrize("case,expected", [(([1, 2, 1, 0, 3, 1, 4], 0, 1), [2, 3, 4])])
+@parametrize(
+    "case,expected",
+    [
+        (([1, 2, 1, 0, 3, 1, 4], 0, 1), [2, 3, 4]),
+        (([{"a": 1}, [1], {"a": 2}, 1], {"a": 1}, [1]), [{"a": 2}, 1]),
+    ],
+)
 def test_without(case, expected):
     assert _.without(*case) == expected
 
 
 @parametrize(
     "case,expected",
-    [(([1, 2, 3], [5, 2, 1, 4]), [3, 5, 4]), (([1, 2, 5], [2, 3, 5], [3, 4, 5]), [1, 4, 5])],
+    [
+        (([1, 2, 3], [5, 2, 1, 4]), [3, 5, 4]),
+        (([1, 2, 5], [2, 3, 5], [3, 4, 5]), [1, 4, 5]),
+        (([{"a": 1}, {"a": 2}], [{"a": 2}, {"a": 3}]), [{"a": 1}, {"a": 3}]),
+    ],
 )
 def test_xor(case, expected):
     assert _.xor(*case) == expected
@@ -929,6 +973,8 @@ def test_zip_object(case, expected):
         ((["a.b.c", "a.b.d"], [1, 2]), {"a": {"b": {"c": 1, "d": 2}}}),
         (([["a.b.c", 1], ["a.b.d", 2]],), {"a": {"b": {"c": 1, "d": 2}}}),
         ((["a.b[0].c", "a.b[1].d"], [1, 2]), {"a": {"b": [{"c": 1}, {"d": 2}]}}),
+        ((["a.b", "a.c", "d"], [1]), {"a": {"b": 1, "c": None}, "d": None}),
+        ((["a.b", "a"], [1, 2, 3]), {"a": 2}),
         (([],), {}),
         (([], []), {}),
     ],
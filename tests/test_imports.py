@@ -0,0 +1,95 @@
+import ast
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pydash as _
+
+
+parametrize = pytest.mark.parametrize
+
+SRC_DIR = os.path.dirname(os.path.dirname(_.__file__))
+
+
+def run_python(code):
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def type_checking_imports():
+    with open(_.__file__, encoding="utf-8") as fp:
+        tree = ast.parse(fp.read())
+
+    return {
+        name.name: node.module
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ImportFrom)
+        for name in node.names
+    }
+
+
+def test_import_does_not_load_submodules():
+    loaded = run_python(
+        "import sys, pydash; print(sorted(m for m in sys.modules if m.startswith('pydash')))"
+    )
+    assert loaded == "['pydash']"
+
+
+def test_attribute_access_loads_only_needed_submodules():
+    loaded = run_python(
+        "import sys, pydash; pydash.chunk; "
+        "print(sorted(m for m in sys.modules if m.startswith('pydash')))"
+    )
+    assert "pydash.arrays" in loaded
+    assert "pydash.strings" not in loaded
+    assert "pydash.objects" not in loaded
+
+
+def test_strings_regexes_compiled_on_first_use():
+    compiled = run_python(
+        "import pydash.strings as s; "
+        "before = 'pattern' in vars(s.JS_RE_UNICODE_WORDS); "
+        "s.words('fooBar'); "
+        "print(before, 'pattern' in vars(s.JS_RE_UNICODE_WORDS))"
+    )
+    assert compiled == "False True"
+
+
+def test_lazy_attrs_match_type_checking_imports():
+    assert _._LAZY_ATTRS == type_checking_imports()
+
+
+def test_lazy_attrs_resolve_to_submodule_objects():
+    for name, module in _._LAZY_ATTRS.items():
+        assert getattr(_, name) is getattr(getattr(_, module), name)
+
+
+def test_all_is_importable():
+    namespace = {}
+    exec("from pydash import *", namespace)
+    assert set(_.__all__) <= set(namespace)
+
+
+def test_dir_lists_lazy_attrs():
+    names = dir(_)
+    assert set(_.__all__) <= set(names)
+    assert {"py_", "_", "arrays", "strings"} <= set(names)
+
+
+def test_dash_instance_is_shared():
+    assert _.py_ is _._
+
+
+@parametrize("name", ["arrays", "chaining", "helpers", "strings", "types"])
+def test_submodule_attributes(name):
+    assert getattr(_, name) is sys.modules[f"pydash.{name}"]
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError):
+        _.does_not_exist  # noqa: B018
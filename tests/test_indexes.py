@@ -0,0 +1,193 @@
+import pytest
+
+import pydash as _
+from pydash.indexes import Index, select_candidates
+
+
+parametrize = pytest.mark.parametrize
+
+ROWS = [
+    {"id": 1, "org": "x", "score": 3, "tags": ["a"]},
+    {"id": 2, "org": "y", "score": 1, "tags": ["b"]},
+    {"id": 3, "org": "x", "score": 2, "tags": ["a", "b"]},
+    {"id": 4, "org": "y", "score": 3},
+    {"id": 5, "org": "z", "score": None, "tags": ["a"]},
+]
+
+
+@pytest.fixture
+def index():
+    return _.index_by(ROWS, "id", "org", "score", "tags")
+
+
+def test_index_by(index):
+    assert isinstance(index, Index)
+    assert index.keys == ("id", "org", "score", "tags")
+    assert len(index) == len(ROWS)
+    assert list(index) == ROWS
+    assert all(row in index for row in ROWS)
+    assert {"id": 1, "org": "x", "score": 3, "tags": ["a"]} not in index
+
+
+def test_index_by_ignores_duplicate_keys():
+    index = _.index_by(ROWS, "id", "id")
+    assert index.keys == ("id",)
+    index.remove(ROWS[0])
+    assert index.lookup("id", 1) == []
+
+
+def test_index_by_raises_for_unhashable_key():
+    with pytest.raises(TypeError):
+        _.index_by(ROWS, ["org"])
+
+
+@parametrize(
+    "key,value,expected",
+    [
+        ("id", 3, [ROWS[2]]),
+        ("id", 3.0, [ROWS[2]]),
+        ("id", 6, []),
+        ("org", "x", [ROWS[0], ROWS[2]]),
+        ("score", None, [ROWS[4]]),
+        ("tags", ["a"], [ROWS[0], ROWS[4]]),
+        ("tags", None, [ROWS[3]]),
+    ],
+)
+def test_index_lookup(index, key, value, expected):
+    assert index.lookup(key, value) == expected
+
+
+def test_index_lookup_deep_path():
+    rows = [{"org": {"id": 1}}, {"org": {"id": 2}}]
+    assert _.index_by(rows, "org.id").lookup("org.id", 2) == [rows[1]]
+
+
+def test_index_lookup_raises_for_unindexed_key(index):
+    with pytest.raises(KeyError):
+        index.lookup("name", 1)
+
+
+@parametrize(
+    "key,start,end,expected",
+    [
+        ("id", 2, 4, [ROWS[1], ROWS[2]]),
+        ("id", None, 3, [ROWS[0], ROWS[1]]),
+        ("id", 4, None, [ROWS[3], ROWS[4]]),
+        ("id", None, None, ROWS),
+        ("id", 2.5, 3.5, [ROWS[2]]),
+        ("id", 10, 20, []),
+        ("score", 2, None, [ROWS[2], ROWS[0], ROWS[3]]),
+        ("org", "y", "z", [ROWS[1], ROWS[3]]),
+    ],
+)
+def test_index_between(index, key, start, end, expected):
+    assert index.between(key, start, end) == expected
+
+
+def test_index_between_raises_for_unindexed_key(index):
+    with pytest.raises(KeyError):
+        index.between("name")
+
+
+def test_index_add(index):
+    row = {"id": 6, "org": "x", "score": 2}
+    index.between("score")
+    index.add(row)
+    assert len(index) == 6
+    assert list(index)[-1] is row
+    assert index.lookup("org", "x") == [ROWS[0], ROWS[2], row]
+    assert index.between("score", 2, 3) == [ROWS[2], row]
+    assert index.between("id", 5) == [ROWS[4], row]
+
+
+def test_index_add_incomparable_value_leaves_index_unchanged(index):
+    index.between("score")
+
+    with pytest.raises(TypeError):
+        index.add({"id": 6, "org": "x", "score": "high"})
+
+    assert len(index) == len(ROWS)
+    assert index.lookup("org", "x") == [ROWS[0], ROWS[2]]
+
+
+def test_index_remove(index):
+    index.between("score")
+    index.remove(ROWS[2])
+    assert ROWS[2] not in index
+    assert list(index) == [ROWS[0], ROWS[1], ROWS[3], ROWS[4]]
+    assert index.lookup("org", "x") == [ROWS[0]]
+    assert index.lookup("tags", ["a", "b"]) == []
+    assert index.between("score") == [ROWS[1], ROWS[0], ROWS[3]]
+
+    index.remove(ROWS[0])
+    assert index.lookup("org", "x") == []
+    assert _.filter_(index, {"org": "x"}) == []
+
+
+def test_index_remove_duplicate_item():
+    row = {"id": 1}
+    index = _.index_by([row, {"id": 2}, row], "id")
+    index.remove(row)
+    assert row in index
+    assert list(index) == [{"id": 2}, row]
+    index.remove(row)
+    assert row not in index
+
+
+def test_index_remove_raises_for_missing_item(index):
+    with pytest.raises(ValueError):
+        index.remove(dict(ROWS[0]))
+
+
+def test_index_repr(index):
+    assert repr(index) == "Index(keys=('id', 'org', 'score', 'tags'), items=5)"
+
+
+@parametrize(
+    "predicate",
+    [
+        {"org": "x"},
+        {"org": "y", "score": 3},
+        {"org": "x", "name": None},
+        {"id": 4.0},
+        {"score": None},
+        {"tags": ["a"]},
+        {"org": "q"},
+        {"name": "x"},
+        {},
+        "tags",
+        lambda row: row["id"] % 2,
+        None,
+    ],
+)
+def test_index_filter_and_find(index, predicate):
+    assert _.filter_(index, predicate) == _.filter_(ROWS, predicate)
+    assert _.find(index, predicate) == _.find(ROWS, predicate)
+
+
+def test_index_filter_selects_fewest_candidates(index):
+    assert select_candidates(index, {"org": "x", "id": 3}) == [ROWS[2]]
+    assert select_candidates(index, {"org": "x", "name": "y"}) == [ROWS[0], ROWS[2]]
+    assert select_candidates(index, {"tags": ["a"]}) == ROWS
+
+
+def test_index_filter_ignores_deep_path_keys():
+    rows = [{"a.b": 1, "a": {"b": 2}}]
+    index = _.index_by(rows, "a.b")
+    assert _.filter_(index, {"a.b": 1}) == _.filter_(rows, {"a.b": 1}) == rows
+
+
+def test_index_unhashable_values():
+    class Unhashable:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __eq__(self, other):
+            return other == 1
+
+    rows = [{"a": 1}, {"a": Unhashable()}, {"a": 2}]
+    index = _.index_by(rows, "a")
+    assert index.lookup("a", 1) == [rows[0], rows[1]]
+    assert index.lookup("a", {"unhashable": True}) == []
+    assert _.filter_(index, {"a": 1}) == _.filter_(rows, {"a": 1})
+    index.remove(rows[1])
+    assert index.lookup("a", 1) == [rows[0]]
@@ -1,7 +1,15 @@
+from decimal import Decimal
+import itertools
+import random
+import sys
+import warnings
+
 import pytest
 
 import pydash as _
 
+from . import helpers
+
 
 parametrize = pytest.mark.parametrize
 
@@ -131,6 +139,24 @@ def test_mean_by(case, expected):
     assert _.mean_by(*case) == expected
 
 
+@parametrize(
+    "case,expected",
+    [
+        (((x for x in [1, 2, 3, 4]),), 2.5),
+        ((iter([{"b": 4}, {"b": 5}, {"b": 6}]), "b"), 5),
+        (((x for x in [1, 2, 3]), lambda x: x * 2), 4),
+    ],
+)
+def test_mean_by_iterator(case, expected):
+    assert _.mean_by(*case) == expected
+
+
+@parametrize("collection", [[], iter([])])
+def test_mean_by_empty(collection):
+    with pytest.raises(ZeroDivisionError):
+        _.mean_by(collection)
+
+
 @parametrize(
     "case,expected",
     [
@@ -138,12 +164,75 @@ def test_mean_by(case, expected):
         (([0, 0, 1, 2, 5],), 1),
         (([0, 0, 1, 2],), 0.5),
         (([0, 0, 1, 2, 3, 4],), 1.5),
+        ((iter([3, 1, 2]),), 2),
+        (({"a": 1, "b": 5, "c": 4, "d": 2},), 3),
+        (([{"a": 3}, {"a": 1}, {"a": 2}], "a"), 2),
+        (([],), None),
     ],
 )
 def test_median(case, expected):
     assert _.median(*case) == expected
 
 
+def random_values(size, method, *args, seed=1):
+    rnd = random.Random(seed)
+    return [getattr(rnd, method)(*args) for _ in range(size)]
+
+
+def median_of_three_killer(size):
+    # Place the two smallest remaining values at the ends of each partition so that every
+    # partition only removes two values.
+    slots = list(range(size))
+    values = [0] * size
+    value = 0
+
+    while slots:
+        for slot in {slots[0], slots[-1]}:
+            values[slot] = value
+            value += 1
+        slots = slots[1:-1]
+
+    return values
+
+
+def quantile_reference(values, q):
+    values = sorted(values)
+    position = q * (len(values) - 1)
+    lower = int(position)
+    if position == lower:
+        return values[lower]
+    return values[lower] + (values[lower + 1] - values[lower]) * (position - lower)
+
+
+@parametrize(
+    "values",
+    [
+        random_values(1000, "random", seed=1),
+        random_values(1001, "randrange", 10, seed=2),
+        list(range(500)),
+        list(range(500, 0, -1)),
+        median_of_three_killer(64),
+        median_of_three_killer(65),
+    ],
+)
+def test_median_selection(monkeypatch, values):
+    # Partition even small inputs to exercise the selection instead of only sorting.
+    monkeypatch.setattr(_.numerical, "SELECT_SORT_SIZE", 2)
+    assert _.median(values) == quantile_reference(values, 0.5)
+    qs = [0, 0.01, 0.25, 0.5, 0.95, 0.99, 1]
+    assert _.quantile(values, qs) == [quantile_reference(values, q) for q in qs]
+
+
+def test_select_ranks_above_sort_size():
+    rnd = random.Random(0)
+    values = [rnd.uniform(-1000, 1000) for _ in range(_.numerical.SELECT_SORT_SIZE * 2 + 1)]
+    ordered = sorted(values)
+    ranks = [0, 1, len(values) // 4, len(values) // 2, len(values) - 1]
+
+    assert _.numerical.select_ranks(values, ranks) == {rank: ordered[rank] for rank in ranks}
+    assert _.median(values) == ordered[len(values) // 2]
+
+
 @parametrize(
     "case,expected",
     [
@@ -186,6 +275,40 @@ def test_min_default(collection, default, expected):
     assert _.min_(collection, default=default) == expected
 
 
+@parametrize(
+    "case,expected",
+    [
+        (([3, 1, 2],), (1, 3)),
+        (({"a": 3, "b": 1, "c": 2},), (1, 3)),
+        ((iter([3, 1, 2]),), (1, 3)),
+        (([7],), (7, 7)),
+        (([{"a": 2}, {"a": 1}, {"a": 3}], "a"), ({"a": 1}, {"a": 3})),
+        (([{"a": 1, "b": 1}, {"a": 1, "b": 2}], "a"), ({"a": 1, "b": 1}, {"a": 1, "b": 1})),
+        ((["bb", "a", "ccc"], len), ("a", "ccc")),
+        (([], None, -1), (-1, -1)),
+        (({}, None, None), (None, None)),
+        (([1, 2], None, -1), (1, 2)),
+    ],
+)
+def test_min_max_by(case, expected):
+    assert _.min_max_by(*case) == expected
+
+
+@parametrize("collection", [[], {}, iter([])])
+def test_min_max_by_empty(collection):
+    with pytest.raises(ValueError, match="empty sequence"):
+        _.min_max_by(collection)
+
+
+@parametrize("seed", [1, 2, 3])
+def test_min_max_by_matches_min_by_and_max_by(seed):
+    values = random_values(500, "randrange", 100, seed=seed)
+    assert _.min_max_by(values, lambda x: -x) == (
+        _.min_by(values, lambda x: -x),
+        _.max_by(values, lambda x: -x),
+    )
+
+
 @parametrize(
     "case,expected",
     [
@@ -198,6 +321,140 @@ def test_moving_mean(case, expected):
     assert _.moving_mean(*case) == expected
 
 
+@parametrize(
+    "case,expected",
+    [
+        ((iter([1, 2, 3, 4, 5]), 3), [2, 3, 4]),
+        (([1, 2, 3], 4), []),
+        (([1, 2, 3], 0), []),
+        (([], 2), []),
+    ],
+)
+def test_moving_mean_edge_cases(case, expected):
+    assert _.moving_mean(*case) == expected
+
+
+@parametrize(
+    "case,expected",
+    [
+        (([1, 2, 3, 4, 5], 2), [1.5, 2.5, 3.5, 4.5]),
+        ((iter([1, 2, 3, 4, 5]), 3), [2.0, 3.0, 4.0]),
+        (([1, 2, 3], 4), []),
+        (([1, 2, 3], 0), []),
+    ],
+)
+def test_itermoving_mean(case, expected):
+    assert list(_.itermoving_mean(*case)) == expected
+
+
+def test_itermoving_mean_is_lazy():
+    means = _.itermoving_mean(itertools.count(), 4)
+    assert list(itertools.islice(means, 3)) == [1.5, 2.5, 3.5]
+
+
+@parametrize(
+    "case,expected",
+    [
+        (([1, 2, 3, 4, 5], 1), [1, 2, 3, 4, 5]),
+        (([1, 2, 3, 4, 5], 2), [3, 5, 7, 9]),
+        (([1, 2, 3, 4, 5], 5), [15]),
+        ((iter([1, 2, 3, 4, 5]), 3), [6, 9, 12]),
+        (([1, 2, 3], 4), []),
+        (([1, 2, 3], 0), []),
+    ],
+)
+def test_moving_sum(case, expected):
+    assert list(_.moving_sum(*case)) == expected
+
+
+@parametrize(
+    "case,expected",
+    [
+        (([4, 2, 3, 1, 5], 1), [4, 2, 3, 1, 5]),
+        (([4, 2, 3, 1, 5], 2), [2, 2, 1, 1]),
+        (([4, 2, 3, 1, 5], 3), [2, 1, 1]),
+        ((iter([5, 4, 3, 2, 1]), 2), [4, 3, 2, 1]),
+        (([1, 1, 1], 2), [1, 1]),
+        (([1, 2, 3], 4), []),
+        (([1, 2, 3], 0), []),
+    ],
+)
+def test_moving_min(case, expected):
+    assert list(_.moving_min(*case)) == expected
+
+
+@parametrize(
+    "case,expected",
+    [
+        (([4, 2, 3, 1, 5], 1), [4, 2, 3, 1, 5]),
+        (([4, 2, 3, 1, 5], 2), [4, 3, 3, 5]),
+        (([4, 2, 3, 1, 5], 3), [4, 3, 5]),
+        ((iter([1, 2, 3, 4, 5]), 2), [2, 3, 4, 5]),
+        (([1, 1, 1], 2), [1, 1]),
+        (([1, 2, 3], 4), []),
+        (([1, 2, 3], 0), []),
+    ],
+)
+def test_moving_max(case, expected):
+    assert list(_.moving_max(*case)) == expected
+
+
+@parametrize(
+    "case,expected",
+    [
+        (([1, 5, 2, 8, 3], 1), [1, 5, 2, 8, 3]),
+        (([1, 5, 2, 8, 3], 2), [3.0, 3.5, 5.0, 5.5]),
+        (([1, 5, 2, 8, 3], 3), [2, 5, 3]),
+        ((iter([3, 3, 1, 1, 2]), 3), [3, 1, 1]),
+        (([1, 2, 3], 4), []),
+        (([1, 2, 3], 0), []),
+    ],
+)
+def test_moving_median(case, expected):
+    assert list(_.moving_median(*case)) == expected
+
+
+@parametrize(
+    "case,expected",
+    [
+        (([1, 1, 3, 3], 1), [0.0, 0.0, 0.0, 0.0]),
+        (([1, 1, 3, 3], 2), [0.0, 1.0, 0.0]),
+        (([2, 4, 4, 4, 5, 5, 7, 9], 8), [2.0]),
+        ((iter([1, 3, 5]), 2), [1.0, 1.0]),
+        (([1, 2, 3], 4), []),
+        (([1, 2, 3], 0), []),
+    ],
+)
+def test_moving_std(case, expected):
+    assert list(_.moving_std(*case)) == expected
+
+
+@parametrize("size", [1, 2, 3, 7, 10])
+def test_moving_functions_match_window_calculations(size):
+    rnd = random.Random(size)
+    array = [rnd.uniform(-1e6, 1e6) for _ in range(200)]
+    windows = [array[i : i + size] for i in range(len(array) - size + 1)]
+
+    assert list(_.moving_sum(iter(array), size)) == pytest.approx([sum(w) for w in windows])
+    assert _.moving_mean(iter(array), size) == pytest.approx([_.mean(w) for w in windows])
+    assert list(_.moving_min(iter(array), size)) == [min(w) for w in windows]
+    assert list(_.moving_max(iter(array), size)) == [max(w) for w in windows]
+    assert list(_.moving_median(iter(array), size)) == [_.median(w) for w in windows]
+    assert list(_.moving_std(iter(array), size)) == pytest.approx(
+        [_.std_deviation(w) for w in windows], abs=1e-6
+    )
+
+
+def test_moving_functions_are_lazy():
+    values = itertools.count()
+
+    assert list(itertools.islice(_.moving_sum(values, 3), 3)) == [3, 6, 9]
+    assert list(itertools.islice(_.moving_max(values, 2), 2)) == [6, 7]
+    assert list(itertools.islice(_.moving_min(values, 2), 2)) == [8, 9]
+    assert list(itertools.islice(_.moving_median(values, 3), 2)) == [12, 13]
+    assert list(itertools.islice(_.moving_std(values, 2), 2)) == [0.5, 0.5]
+
+
 @parametrize(
     "multiplier,multiplicand,expected",
     [
@@ -214,6 +471,27 @@ def test_multiply(multiplier, multiplicand, expected):
     assert _.multiply(multiplier, multiplicand) == expected
 
 
+@parametrize(
+    "case,expected",
+    [
+        (([1, 2, 3, 4, 5], 50), 3),
+        (([1, 2, 3, 4], [0, 25, 100]), [1, 1.75, 4]),
+        ((range(1, 101), (50, 95, 99)), [50.5, 95.05, 99.01]),
+        (([{"ms": 10}, {"ms": 30}, {"ms": 20}], 50, "ms"), 20),
+        (([], 50), None),
+        (([], [50, 90]), [None, None]),
+    ],
+)
+def test_percentile(case, expected):
+    assert _.percentile(*case) == pytest.approx(expected)
+
+
+@parametrize("ps", [-1, 101, [50, 100.5]])
+def test_percentile_out_of_range(ps):
+    with pytest.raises(ValueError, match="percentile must be between 0 and 100"):
+        _.percentile([1, 2, 3], ps)
+
+
 @parametrize(
     "case,expected",
     [
@@ -227,6 +505,89 @@ def test_power(case, expected):
     assert _.power(*case) == expected
 
 
+@parametrize(
+    "case,expected",
+    [
+        (([1, 2, 3, 4, 5], 0.5), 3),
+        (([5, 4, 3, 2, 1], [0, 1]), [1, 5]),
+        (([1, 2, 3, 4], [0, 0.25, 0.5, 1]), [1, 1.75, 2.5, 4]),
+        (([1, 2, 3, 4], [0.5, 0.5]), [2.5, 2.5]),
+        ((iter([3, 1, 2]), 0.25), 1.5),
+        (({"a": 1, "b": 3}, 0.5), 2),
+        (([{"ms": 10}, {"ms": 30}, {"ms": 20}], [0.5, 1], "ms"), [20, 30]),
+        (([1, 2, 3], [0.5], lambda x: x * 2), [4]),
+        (([7], [0, 0.5, 1]), [7, 7, 7]),
+        (([], 0.5), None),
+    ],
+)
+def test_quantile(case, expected):
+    assert _.quantile(*case) == expected
+
+
+@parametrize("qs", [-0.1, 1.1, [0.5, 2]])
+def test_quantile_out_of_range(qs):
+    with pytest.raises(ValueError, match="quantile must be between 0 and 1"):
+        _.quantile([1, 2, 3], qs)
+
+
+@parametrize(
+    "qs,values,expected",
+    [
+        (0.5, [], None),
+        ([0.5, 0.9], [], [None, None]),
+        (0.5, [5, 1, 3], 3),
+        ([0, 0.5, 1], [5, 1, 3, 7, 9], [1, 5, 9]),
+    ],
+)
+def test_quantile_sketch_is_exact_for_few_values(qs, values, expected):
+    sketch = _.QuantileSketch(qs, values)
+    assert sketch.count == len(values)
+    assert sketch.estimate() == expected
+
+
+@parametrize(
+    "values",
+    [
+        random_values(20000, "random", seed=1),
+        random_values(20000, "expovariate", 1, seed=2),
+        random_values(20000, "randrange", 100, seed=3),
+        list(range(20000)),
+        list(range(20000, 0, -1)),
+    ],
+)
+def test_quantile_sketch_estimates(values):
+    qs = [0, 0.01, 0.5, 0.95, 0.99, 1]
+    sketch = _.QuantileSketch(qs)
+
+    for value in values:
+        sketch.push(value)
+
+    exact = _.quantile(values, qs)
+    spread = max(values) - min(values)
+    assert sketch.count == len(values)
+
+    for estimate, expected in zip(sketch.estimate(), exact):
+        assert estimate == pytest.approx(expected, abs=0.01 * spread)
+
+
+def test_quantile_sketch_with_single_quantile():
+    sketch = _.QuantileSketch(0.5)
+    assert sketch.qs == [0.5]
+    assert sketch.update(iter(range(1001))) is sketch
+    assert sketch.estimate() == pytest.approx(500, abs=5)
+    assert repr(sketch) == "QuantileSketch(qs=[0.5], count=1001)"
+
+
+def test_quantile_sketch_with_constant_values():
+    assert _.QuantileSketch([0.1, 0.9], [4] * 100).estimate() == [4, 4]
+
+
+@parametrize("qs", [-0.1, 1.1, [0.5, 2]])
+def test_quantile_sketch_out_of_range(qs):
+    with pytest.raises(ValueError, match="quantile must be between 0 and 1"):
+        _.QuantileSketch(qs)
+
+
 @parametrize(
     "case,expected",
     [
@@ -267,6 +628,61 @@ def test_slope(case, expected):
     assert _.slope(*case) == expected
 
 
+@parametrize(
+    "case,expected",
+    [
+        (([1, 2, 3, 4, 5],), {"count": 5, "sum": 15, "min": 1, "max": 5, "mean": 3}),
+        (([5, 1, 4, 2, 3],), {"count": 5, "sum": 15, "min": 1, "max": 5, "mean": 3}),
+        (
+            ([{"b": 4}, {"b": 6}, {"b": 5}], "b"),
+            {"count": 3, "sum": 15, "min": 4, "max": 6, "mean": 5},
+        ),
+        (
+            ([{"a": {"b": 4}}, {"a": {"b": 6}}], "a.b"),
+            {"count": 2, "sum": 10, "min": 4, "max": 6, "mean": 5},
+        ),
+        (
+            ({"one": {"a": 1}, "two": {"a": 2}, "three": {"a": 3}}, "a"),
+            {"count": 3, "sum": 6, "min": 1, "max": 3, "mean": 2},
+        ),
+        (
+            ((x for x in [1, 2, 3]), lambda x: x * 2),
+            {"count": 3, "sum": 12, "min": 2, "max": 6, "mean": 4},
+        ),
+        (([7],), {"count": 1, "sum": 7, "min": 7, "max": 7, "mean": 7}),
+        (([],), {"count": 0, "sum": 0, "min": None, "max": None, "mean": None}),
+        ((iter([]),), {"count": 0, "sum": 0, "min": None, "max": None, "mean": None}),
+    ],
+)
+def test_stats_by(case, expected):
+    assert _.stats_by(*case) == expected
+
+
+def test_stats_by_fsum():
+    values = [0.1] * 10
+    assert _.stats_by(values)["sum"] != 1.0
+    assert _.stats_by(values, fsum=True) == {
+        "count": 10,
+        "sum": 1.0,
+        "min": 0.1,
+        "max": 0.1,
+        "mean": 0.1,
+    }
+
+
+@parametrize("seed", [1, 2, 3])
+def test_stats_by_matches_separate_calculations(seed):
+    records = [{"v": value} for value in random_values(500, "uniform", -10, 10, seed=seed)]
+    values = _.map_(records, "v")
+    assert _.stats_by(records, "v") == {
+        "count": len(values),
+        "sum": _.sum_by(records, "v"),
+        "min": min(values),
+        "max": max(values),
+        "mean": _.mean_by(records, "v"),
+    }
+
+
 @parametrize(
     "case,expected",
     [
@@ -277,6 +693,19 @@ def test_std_deviation(case, expected):
     assert _.std_deviation(case) == expected
 
 
+@parametrize(
+    "case,ddof,expected",
+    [
+        ([1, 2, 3], 0, (2.0 / 3.0) ** 0.5),
+        ([1, 2, 3], 1, 1.0),
+        (iter([1, 2, 3]), 1, 1.0),
+        ({"a": 1, "b": 3}, 1, 2.0**0.5),
+    ],
+)
+def test_std_deviation_ddof(case, ddof, expected):
+    assert _.std_deviation(case, ddof) == pytest.approx(expected)
+
+
 @parametrize(
     "minuend,subtrahend,expected",
     [
@@ -330,16 +759,69 @@ def test_sum_by(case, expected):
     assert _.sum_by(*case) == expected
 
 
+@parametrize(
+    "case,expected",
+    [
+        (([{"a": 1}, {"a": 2}], "a"), 3),
+        (([{"a": {"b": 1}}, {"a": {"b": 2}}], "a.b"), 3),
+        (([{"a.b": 1}, {"a.b": 2}], "a\\.b"), 3),
+        (([[1, 2], [3, 4]], "1"), 6),
+        (([{"1": 1}, {1: 2}], "1"), 3),
+        ((iter([{"a": 1}, {"a": 2}]), "a"), 3),
+        ((helpers.Object(a=1, b=2),), 3),
+        ((helpers.ItemsObject({"a": {"b": 1}, "c": {"b": 2}}), "b"), 3),
+    ],
+)
+def test_sum_by_property_shorthand(case, expected):
+    assert _.sum_by(*case) == expected
+
+
 @parametrize(
     "case,expected",
     [
         ([[1, 2, 3], [4, 5, 6], [7, 8, 9]], [[1, 4, 7], [2, 5, 8], [3, 6, 9]]),
+        ([[1, 2, 3], [4, 5, 6]], [[1, 4], [2, 5], [3, 6]]),
+        (((1, 2), (3, 4)), [[1, 3], [2, 4]]),
+        (iter([iter([1, 2]), iter([3, 4])]), [[1, 3], [2, 4]]),
+        ([[1, 2, 3], [4, 5]], [[1, 4], [2, 5], [3, None]]),
+        ([[1, 2], [3, 4, 5]], [[1, 3], [2, 4], [None, 5]]),
+        ([[], [1]], [[None, 1]]),
+        ([], []),
     ],
 )
 def test_transpose(case, expected):
     assert _.transpose(case) == expected
 
 
+@parametrize(
+    "case,kwargs,expected",
+    [
+        ([[1, 2, 3], [4, 5]], {"fill_value": 0}, [[1, 4], [2, 5], [3, 0]]),
+        ([[1, 2, 3], [4, 5]], {"truncate": True}, [[1, 4], [2, 5]]),
+        ([[1, 2], [3, 4, 5]], {"truncate": True}, [[1, 3], [2, 4]]),
+        ([[], [1]], {"truncate": True}, []),
+        ([[1, 2], [3, 4]], {"fill_value": 0, "truncate": True}, [[1, 3], [2, 4]]),
+    ],
+)
+def test_transpose_ragged(case, kwargs, expected):
+    assert _.transpose(case, **kwargs) == expected
+
+
+@parametrize(
+    "case,kwargs,expected",
+    [
+        ([[1, 2, 3], [4, 5, 6]], {}, [[1, 4], [2, 5], [3, 6]]),
+        ([[1, 2, 3], [4, 5]], {"fill_value": 0}, [[1, 4], [2, 5], [3, 0]]),
+        ([[1, 2, 3], [4, 5]], {"truncate": True}, [[1, 4], [2, 5]]),
+    ],
+)
+def test_transpose_lazy(case, kwargs, expected):
+    columns = _.transpose(case, lazy=True, **kwargs)
+    assert not isinstance(columns, list)
+    assert next(columns) == expected[0]
+    assert list(columns) == expected[1:]
+
+
 @parametrize(
     "case,expected",
     [
@@ -350,6 +832,33 @@ def test_variance(case, expected):
     assert _.variance(case) == expected
 
 
+@parametrize(
+    "case,ddof,expected",
+    [
+        ([1, 2, 3], 1, 1.0),
+        ((x for x in [1, 2, 3]), 0, 2.0 / 3.0),
+        ({"a": 1, "b": 3}, 0, 1.0),
+        ([Decimal("1.5"), Decimal("2.5")], 0, Decimal("0.25")),
+        ([5], 0, 0.0),
+    ],
+)
+def test_variance_ddof(case, ddof, expected):
+    assert _.variance(case, ddof=ddof) == expected
+
+
+@parametrize("case,ddof", [([], 0), ([1], 1)])
+def test_variance_too_few_values(case, ddof):
+    with pytest.raises(ZeroDivisionError):
+        _.variance(case, ddof=ddof)
+
+
+def test_variance_is_numerically_stable():
+    # A naive sum of squares loses all precision with a large offset.
+    values = [1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16]
+    assert _.variance(values) == pytest.approx(22.5)
+    assert _.variance(values, ddof=1) == pytest.approx(30.0)
+
+
 @parametrize(
     "case,expected",
     [
@@ -359,3 +868,229 @@ def test_variance(case, expected):
 )
 def test_zscore(case, expected):
     assert _.map_(_.zscore(*case), lambda v: round(v, 3)) == expected
+
+
+def test_zscore_ddof():
+    assert _.zscore(iter([1, 2, 3]), ddof=1) == [-1.0, 0.0, 1.0]
+
+
+def test_running_stats():
+    stats = _.RunningStats()
+    assert (stats.count, stats.mean, stats.sum_sq) == (0, 0, 0)
+    assert repr(stats) == "RunningStats(count=0, mean=0)"
+
+    assert stats.push(1) is stats
+    assert stats.update(iter([2, 3])) is stats
+    assert stats.count == 3
+    assert stats.mean == 2.0
+    assert stats.variance() == 2.0 / 3.0
+    assert stats.variance(ddof=1) == 1.0
+    assert stats.std_deviation(ddof=1) == 1.0
+    assert repr(stats) == "RunningStats(count=3, mean=2.0)"
+
+
+@parametrize(
+    "values,ddof",
+    [
+        ([], 0),
+        ([], 1),
+        ([5], 1),
+        ([5], 2),
+        ([1, 2], 3),
+    ],
+)
+def test_running_stats_variance_raises_without_enough_values(values, ddof):
+    stats = _.RunningStats(values)
+
+    with pytest.raises(ZeroDivisionError):
+        stats.variance(ddof)
+
+    with pytest.raises(ZeroDivisionError):
+        stats.std_deviation(ddof)
+
+
+@parametrize(
+    "parts",
+    [
+        [[1, 2, 3], [4, 5, 6, 7, 8]],
+        [[], [1.5, 2.5, 10.0]],
+        [[1.5, 2.5, 10.0], []],
+        [[], []],
+        [[4], [8], [15, 16], [23, 42]],
+    ],
+)
+def test_running_stats_merge(parts):
+    values = [value for part in parts for value in part]
+    merged = _.RunningStats()
+
+    for part in parts:
+        assert merged.merge(_.RunningStats(part)) is merged
+
+    expected = _.RunningStats(values)
+    assert merged.count == expected.count
+    assert merged.mean == pytest.approx(expected.mean)
+    assert merged.sum_sq == pytest.approx(expected.sum_sq)
+
+    if values:
+        assert merged.mean == pytest.approx(sum(values) / len(values))
+        assert merged.variance() == pytest.approx(_.variance(values))
+
+
+@parametrize(
+    "func,args,kwargs",
+    [
+        (_.sum_, ([1, 2, 3.5, -4],), {}),
+        (_.sum_, ({"a": 1, "b": 2},), {}),
+        (_.sum_, ([],), {}),
+        (_.mean, ([1, 2, 3.5, -4],), {}),
+        (_.mean, ({"a": 1, "b": 2},), {}),
+        (_.median, ([5, 1, 4, 2, 3],), {}),
+        (_.median, ([5, 1, 4, 2],), {}),
+        (_.median, ([{"a": 3}, {"a": 1}, {"a": 2}], "a"), {}),
+        (_.median, ([],), {}),
+        (_.variance, ([1, 2, 3, 10],), {}),
+        (_.variance, ([1, 2, 3, 10],), {"ddof": 1}),
+        (_.variance, ([5],), {}),
+        (_.std_deviation, ([1, 2, 3, 10], 1), {}),
+        (_.zscore, ([1, 2, 3, 10],), {}),
+        (_.zscore, ([{"a": 1}, {"a": 2}, {"a": 4}], "a"), {"ddof": 1}),
+        (_.scale, ([1, 2, 4, 8], 2), {}),
+        (_.scale, ((1, 2.5),), {}),
+        (_.clamp, (-10, -5, 5), {}),
+        (_.clamp, (3, 5), {}),
+        (_.clamp, (3, 2.5, 5), {}),
+        (_.clamp, (1, 2.5, 5), {}),
+        (_.round_, ([1.234, 5.678, -2.5],), {}),
+        (_.round_, ([1.234, 5.678, -2.5], 2), {}),
+        (_.round_, ([1, 2, 3],), {}),
+        (_.round_, ((1.25, 2),), {}),
+        (_.round_, (5.678, 1), {}),
+        (_.round_, (3,), {}),
+        (_.round_, ({1: "a"},), {}),
+        (_.round_, (["a"],), {}),
+        (_.round_, ([[1.5]],), {}),
+        (_.moving_mean, (list(range(10)), 3), {}),
+        (_.moving_mean, (random_values(1000, "random"), 50), {}),
+        (_.moving_mean, ([1, 2, 3], 0), {}),
+        (_.moving_mean, ([1, 2, 3], 4), {}),
+        (_.transpose, ([[1, 2, 3], [4, 5, 6]],), {}),
+        (_.transpose, ([[1, 2], [3, 4]],), {"lazy": True}),
+        (_.transpose, ([[1, 2, 3], [4, 5]],), {}),
+        (_.transpose, ([[1, 2, 3], [4, 5]], 0), {}),
+        (_.transpose, ([[1, 2, 3], [4, 5]],), {"truncate": True}),
+        (_.transpose, ([[1, 2.5], ["a", None]],), {}),
+        (_.transpose, (["ab", "cd"],), {}),
+    ],
+)
+def test_numpy_backend_parity(np, func, args, kwargs):
+    expected = func(*args, **kwargs)
+    result = func(*args, backend="numpy", **kwargs)
+
+    if kwargs.get("lazy"):
+        expected, result = list(expected), list(result)
+
+    assert_same_numbers(result, expected)
+
+    if isinstance(args[0], list) and all(_.is_number(item) for item in args[0]):
+        # NumPy arrays are calculated with NumPy by default.
+        assert_same_numbers(func(np.asarray(args[0]), *args[1:], **kwargs), expected)
+
+
+@parametrize(
+    "func,args",
+    [
+        (_.sum_, ([1, 2.5],)),
+        (_.mean, ([1, 2.5],)),
+        (_.median, ([3, 1, 2],)),
+        (_.moving_mean, ([1, 2, 3], 2)),
+        (_.variance, ([1, 2, 4],)),
+        (_.zscore, ([1, 2, 4],)),
+        (_.scale, ([1, 2, 4],)),
+        (_.round_, ([1.25, 2],)),
+        (_.transpose, ([[1, 2], [3]],)),
+    ],
+)
+def test_numpy_backend_parity_iterators(np, func, args):
+    expected = func(iter(args[0]), *args[1:])
+    assert_same_numbers(func(iter(args[0]), *args[1:], backend="numpy"), expected)
+
+
+@parametrize(
+    "func,args",
+    [
+        (_.mean, ([],)),
+        (_.mean, ({},)),
+        (_.variance, ([],)),
+        (_.variance, ([5], 1)),
+        (_.std_deviation, ([],)),
+        (_.zscore, ([],)),
+        (_.zscore, ([5],)),
+        (_.zscore, ([1, 1],)),
+        (_.zscore, ([1, 2], None, 2)),
+        (_.scale, ([],)),
+        (_.scale, ([0, 0],)),
+        (_.scale, ({"a": 1},)),
+        (_.clamp, ({"a": 1}, 0, 1)),
+        (_.clamp, (iter([1]), 0, 1)),
+    ],
+)
+def test_numpy_backend_parity_errors(np, func, args):
+    with pytest.raises(Exception) as expected:
+        func(*args)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+
+        with pytest.raises(expected.type):
+            func(*args, backend="numpy")
+
+        if isinstance(args[0], list):
+            with pytest.raises(expected.type):
+                func(np.asarray(args[0], dtype=float), *args[1:])
+
+
+def assert_same_numbers(result, expected):
+    assert type(result) is type(expected)
+
+    if isinstance(expected, list):
+        assert len(result) == len(expected)
+        for item, expected_item in zip(result, expected):
+            assert_same_numbers(item, expected_item)
+    elif isinstance(expected, float):
+        assert result == pytest.approx(expected)
+    else:
+        assert result == expected
+
+
+def test_numpy_backend_is_used_for_arrays(np, monkeypatch):
+    calls = []
+    monkeypatch.setattr(np, "mean", lambda values: calls.append(values) or np.float64(2.0))
+
+    assert _.mean(np.array([1, 2, 3])) == 2.0
+    assert len(calls) == 1
+    assert _.mean([1, 2, 3]) == 2.0
+    assert len(calls) == 1
+    assert _.mean(np.array([1, 2, 3]), backend="python") == 2.0
+    assert len(calls) == 1
+
+
+def test_numpy_backend_returns_python_types(np):
+    assert type(_.sum_(np.array([1, 2, 3]))) is int
+    assert type(_.mean(np.array([1, 2, 3]))) is float
+    assert _.zscore(np.array([1.0, 2.0, 3.0])) == pytest.approx([-1.2247449, 0.0, 1.2247449])
+    assert _.transpose(np.array([[1, 2], [3, 4]])) == [[1, 3], [2, 4]]
+    assert _.clamp(np.array([-10, 0, 10]), -5, 5) == [-5, 0, 5]
+
+
+def test_numpy_backend_invalid():
+    with pytest.raises(ValueError, match='backend must be "numpy" or "python"'):
+        _.sum_([1, 2], backend="fortran")
+
+
+def test_numpy_backend_without_numpy(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    assert _.sum_([1, 2]) == 3
+
+    with pytest.raises(ImportError, match="requires NumPy"):
+        _.sum_([1, 2], backend="numpy")
@@ -1,10 +1,13 @@
 from argparse import Namespace
-from collections import defaultdict, namedtuple
+from collections import OrderedDict, defaultdict, namedtuple
+import copy
 import datetime as dt
+from functools import partial
 
 import pytest
 
 import pydash as _
+from pydash.helpers import UNSET
 
 from . import helpers
 
@@ -101,6 +104,74 @@ def test_clone_deep(case):
         assert value is not case[key]
 
 
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    __hash__ = None  # type: ignore
+
+    def __eq__(self, other):
+        return isinstance(other, Point) and (self.x, self.y) == (other.x, other.y)
+
+
+@parametrize(
+    "case",
+    [
+        1,
+        "a",
+        None,
+        (1, 2),
+        {"a": [1, {"b": (2, [3])}], "c": {4, 5}, "d": 1.5, "e": None, "f": True},
+        [OrderedDict(a=[1]), Point([1], {"a": 2}), b"x", 1j],
+        {(1, 2): [3], frozenset([4]): {"a": []}},
+    ],
+)
+def test_clone_deep_matches_deepcopy(case):
+    result = _.clone_deep(case)
+    expected = copy.deepcopy(case)
+
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_clone_deep_copies_containers_and_shares_atomic_values():
+    text = "x" * 100
+    case = {"a": [text, {"b": text}], "c": (text, [text])}
+    result = _.clone_deep(case)
+
+    assert result == case
+    assert result["a"] is not case["a"]
+    assert result["a"][1] is not case["a"][1]
+    assert result["c"][1] is not case["c"][1]
+    assert result["a"][0] is text
+    assert result["a"][1]["b"] is text
+
+
+def test_clone_deep_preserves_shared_and_self_references():
+    shared = [1, {"a": 2}]
+    case = {"x": shared, "y": shared, "z": (shared,), "p": Point(shared, 1)}
+    case["self"] = case
+    result = _.clone_deep(case)
+
+    assert result["x"] is not shared
+    assert result["x"] is result["y"]
+    assert result["z"][0] is result["x"]
+    assert result["p"].x is result["x"]
+    assert result["self"] is result
+
+
+def test_clone_deep_deeply_nested():
+    case = value = []
+    for _i in range(10000):
+        value.append([])
+        value = value[0]
+
+    result = _.clone_deep(case)
+    assert result is not case
+    assert _.is_equal(result, case)
+
+
 @parametrize(
     "case,iteratee,expected",
     [
@@ -120,6 +191,34 @@ def test_clone_deep_with(case, iteratee, expected):
     assert result == expected
 
 
+def test_clone_deep_with_does_not_modify_obj():
+    obj = {"a": [1, {"b": 2}], "c": 3}
+    result = _.clone_deep_with(obj, lambda value: value * 10 if isinstance(value, int) else None)
+
+    assert result == {"a": [10, {"b": 20}], "c": 30}
+    assert obj == {"a": [1, {"b": 2}], "c": 3}
+    assert result["a"][1] is not obj["a"][1]
+
+
+def test_clone_deep_with_parents():
+    obj = {"a": [1, {"b": 2}]}
+    parents = []
+
+    def customizer(value, key, parent):
+        parents.append((key, parent))
+
+    result = _.clone_deep_with(obj, customizer)
+
+    assert result == obj
+    assert parents == [
+        (None, obj),
+        ("a", result),
+        (0, result["a"]),
+        (1, result["a"]),
+        ("b", result["a"][1]),
+    ]
+
+
 @parametrize(
     "case,expected",
     [
@@ -167,6 +266,106 @@ def test_defaults_deep(case, expected):
     assert _.defaults_deep(*case) == expected
 
 
+def test_defaults_deep_copy():
+    source = {"a": {"b": [1]}, "c": {"d": 1}}
+    result = _.defaults_deep({"c": {}}, source)
+
+    assert result == {"a": {"b": [1]}, "c": {"d": 1}}
+    assert result["a"] is not source["a"]
+    assert _.defaults_deep({}, source, copy_values=False)["a"] is source["a"]
+
+
+@parametrize(
+    "case,expected",
+    [
+        (({"a": 1}, {"a": 1}), []),
+        ((1, 2), [("set", [], 2)]),
+        (({"a": 1}, [1]), [("set", [], [1])]),
+        (({"a": 1, "b": 2}, {"a": 1, "c": 3}), [("unset", ["b"], None), ("set", ["c"], 3)]),
+        (({"a": {"b": 1, "c": 2}}, {"a": {"b": 1, "c": 3}}), [("set", ["a", "c"], 3)]),
+        (({"a": 1}, {"a": 1.0}), []),
+        (({"a": 1}, {"a": "1"}), [("set", ["a"], "1")]),
+        (({"a": {"b": 1}}, {"a": [1]}), [("set", ["a"], [1])]),
+        (({"a.b": {0: 1}}, {"a.b": {0: 2}}), [("set", ["a.b", 0], 2)]),
+        (([1, 2, 3], [1, 3]), [("set", [1], 3), ("unset", [2], None)]),
+        (([1, 2, 3], [1]), [("unset", [2], None), ("unset", [1], None)]),
+        (([1], [1, 2, 3]), [("set", [1], 2), ("set", [2], 3)]),
+        (([[1, 2]], [[1, 3]]), [("set", [0, 1], 3)]),
+        (
+            ([{"id": 1}, {"id": 2, "v": 1}, {"id": 3}], [{"id": 2, "v": 2}, {"id": 3}], "id"),
+            [("unset", [0], None), ("set", [0, "v"], 2)],
+        ),
+        (
+            ([{"id": 1}, {"id": 2}], [{"id": 2}, {"id": 1}, {"id": 3}], "id"),
+            [("set", [0], {"id": 2}), ("set", [1], {"id": 1}), ("set", [2], {"id": 3})],
+        ),
+        (
+            ([{"id": 1}, {"id": 1}], [{"id": 1, "v": 1}], lambda item: item["id"]),
+            [("set", [0, "v"], 1), ("unset", [1], None)],
+        ),
+    ],
+)
+def test_diff(case, expected):
+    assert _.diff(*case) == expected
+
+
+@parametrize(
+    "old,new,iteratee",
+    [
+        ({"a": [1, {"b": 2}], "c": 3}, {"a": [{"b": 3}], "d": {"e": [4]}}, None),
+        ([{"id": 1, "v": [1]}, {"id": 2}], [{"id": 3}, {"id": 1, "v": [1, 2]}], "id"),
+        ([{"id": 1}, {"id": 2}, {"id": 3}], [{"id": 3}, {"id": 2}], "id"),
+    ],
+)
+def test_diff_patch_round_trip(old, new, iteratee):
+    changes = _.diff(old, new, iteratee)
+    assert _.patch(_.clone_deep(old), changes) == new
+
+
+def test_diff_skips_identical_objects():
+    class Uncomparable:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __eq__(self, other):
+            raise AssertionError("compared identical object")
+
+    shared = {"b": [Uncomparable()]}
+
+    assert _.diff(shared, shared) == []
+    assert _.diff({"a": shared, "c": 1}, {"a": shared, "c": 2}) == [("set", ["c"], 2)]
+
+
+def test_diff_skips_equal_values_of_different_types():
+    assert _.diff({"a": 1, "b": 1}, {"a": 1.0, "b": 2}) == [("set", ["b"], 2)]
+
+
+def test_diff_shared_references():
+    shared = {"b": 1}
+    changed = {"b": 2}
+
+    assert _.diff({"a": shared, "c": shared}, {"a": changed, "c": changed}) == [
+        ("set", ["a", "b"], 2),
+        ("set", ["c", "b"], 2),
+    ]
+
+
+def test_diff_reference_cycles():
+    old = {"a": 1}
+    old["self"] = old
+    new = {"a": 2}
+    new["self"] = new
+
+    assert _.diff(old, new) == [("set", ["a"], 2)]
+
+
+def test_diff_deeply_nested():
+    old = new = 1
+    for _index in range(10000):
+        old, new = {"a": old}, {"a": new}
+
+    assert _.diff(old, _.set_(new, ["a"] * 10000, 2)) == [("set", ["a"] * 10000, 2)]
+
+
 @parametrize(
     "case,expected",
     [
@@ -236,6 +435,118 @@ def test_invoke__raises_for_objects_when_path_restricted(case):
         _.invoke(*case)
 
 
+def test_iterflatten_keys():
+    obj = {"a": [1, {"b": 2}], "c": 3}
+    pairs = _.iterflatten_keys(obj)
+
+    assert next(pairs) == ("a[0]", 1)
+    assert list(pairs) == [("a[1].b", 2), ("c", 3)]
+
+
+def test_iterflatten_keys_raises_for_invalid_list_style():
+    with pytest.raises(ValueError, match="list_style"):
+        _.iterflatten_keys({}, list_style="parens")
+
+
+@parametrize(
+    "case,expected",
+    [
+        (
+            ({"a": [1, {"b": 2}], "c": 3},),
+            [
+                ([], {"a": [1, {"b": 2}], "c": 3}, None),
+                (["a"], [1, {"b": 2}], {"a": [1, {"b": 2}], "c": 3}),
+                (["a", 0], 1, [1, {"b": 2}]),
+                (["a", 1], {"b": 2}, [1, {"b": 2}]),
+                (["a", 1, "b"], 2, {"b": 2}),
+                (["c"], 3, {"a": [1, {"b": 2}], "c": 3}),
+            ],
+        ),
+        (
+            ({"a": [1, {"b": 2}]}, "post"),
+            [
+                (["a", 0], 1, [1, {"b": 2}]),
+                (["a", 1, "b"], 2, {"b": 2}),
+                (["a", 1], {"b": 2}, [1, {"b": 2}]),
+                (["a"], [1, {"b": 2}], {"a": [1, {"b": 2}]}),
+                ([], {"a": [1, {"b": 2}]}, None),
+            ],
+        ),
+        (
+            ({"a": [1, {"b": 2}]}, "pre", lambda value, path: path == ["a", 1]),
+            [
+                ([], {"a": [1, {"b": 2}]}, None),
+                (["a"], [1, {"b": 2}], {"a": [1, {"b": 2}]}),
+                (["a", 0], 1, [1, {"b": 2}]),
+                (["a", 1], {"b": 2}, [1, {"b": 2}]),
+            ],
+        ),
+        (
+            ({"a": [1, {"b": 2}]}, "pre", lambda value: isinstance(value, list)),
+            [([], {"a": [1, {"b": 2}]}, None), (["a"], [1, {"b": 2}], {"a": [1, {"b": 2}]})],
+        ),
+        (
+            ([[1, [2]], 3], "pre", None, 2),
+            [
+                ([], [[1, [2]], 3], None),
+                ([0], [1, [2]], [[1, [2]], 3]),
+                ([0, 0], 1, [1, [2]]),
+                ([0, 1], [2], [1, [2]]),
+                ([1], 3, [[1, [2]], 3]),
+            ],
+        ),
+        (([1, [2]], "pre", None, 0), [([], [1, [2]], None)]),
+        (([1, [2]], "pre", lambda value: True), [([], [1, [2]], None)]),
+        (("abc",), [([], "abc", None)]),
+        (
+            ({"a": "bc", "d": (1, 2)},),
+            [
+                ([], {"a": "bc", "d": (1, 2)}, None),
+                (["a"], "bc", {"a": "bc", "d": (1, 2)}),
+                (["d"], (1, 2), {"a": "bc", "d": (1, 2)}),
+            ],
+        ),
+    ],
+)
+def test_iterwalk(case, expected):
+    assert list(_.iterwalk(*case)) == expected
+
+
+def test_iterwalk_paths_are_copies():
+    paths = [path for path, _value, _parent in _.iterwalk({"a": {"b": 1}})]
+    paths[1].append("x")
+
+    assert paths == [[], ["a", "x"], ["a", "b"]]
+
+
+def test_iterwalk_deeply_nested():
+    depth = 10000
+    obj: list = []
+    node = obj
+
+    for _i in range(depth):
+        node.append([])
+        node = node[0]
+
+    path, value, _parent = list(_.iterwalk(obj))[-1]
+
+    assert path == [0] * depth
+    assert value == []
+
+
+def test_iterwalk_raises_for_reference_cycle():
+    obj: dict = {"a": {}}
+    obj["a"]["b"] = obj
+
+    with pytest.raises(ValueError, match="references itself"):
+        list(_.iterwalk(obj))
+
+
+def test_iterwalk_raises_for_invalid_order():
+    with pytest.raises(ValueError, match="order"):
+        _.iterwalk({}, order="in")
+
+
 @parametrize(
     "case,expected",
     [
@@ -304,6 +615,76 @@ def test_find_last_key(case, expected):
     assert _.find_last_key(*case) in expected
 
 
+@parametrize(
+    "case,expected",
+    [
+        (({"a": 1, "b": {"c": 2}},), {"a": 1, "b.c": 2}),
+        (({"a": {"b": [1, {"c": 2}]}},), {"a.b[0]": 1, "a.b[1].c": 2}),
+        (([1, [2, [3]]],), {"[0]": 1, "[1][0]": 2, "[1][1][0]": 3}),
+        (({"a": {}, "b": [], "c": [{}]},), {"a": {}, "b": [], "c[0]": {}}),
+        (({"a.b": {"c\\d": 1}},), {"a\\.b.c\\\\d": 1}),
+        (({1: {None: 2}},), {"1.None": 2}),
+        (({"a": {"b": [1, 2]}}, "/"), {"a/b[0]": 1, "a/b[1]": 2}),
+        (({"a": {"b/c": [1, {"d": 2}]}}, "/", "dots"), {"a/b\\/c/0": 1, "a/b\\/c/1/d": 2}),
+        (([[1]], ".", "dots"), {"0.0": 1}),
+        (({},), {}),
+        (([],), {}),
+        ((1,), {}),
+        ((None,), {}),
+    ],
+)
+def test_flatten_keys(case, expected):
+    assert _.flatten_keys(*case) == expected
+
+
+@parametrize(
+    "obj",
+    [
+        {"a": {"b": [1, {"c": 2}, [], [3, [4]]], "d.e": {}, "f\\g": 5, "h\\.i": [6]}},
+        {"a": [[{"b": [[]]}]], "c": None},
+        {"back\\slash": 1},
+        {"trail\\": {"q": 2}},
+        {"a[0]": 1},
+        {"x": {"[1]": 2, "]": 3, "[y]": 4}},
+        {"a\\[0]": {"\\": [5]}},
+        {"a::b/c": {":": 1, "/": 2}},
+    ],
+)
+@parametrize("sep", [".", "/", "::"])
+def test_flatten_keys_roundtrip(obj, sep):
+    flat = _.flatten_keys(obj, sep=sep)
+
+    assert _.unflatten_keys(flat, sep=sep) == obj
+
+    if sep == ".":
+        assert all(_.get(obj, path) == value for path, value in flat.items())
+
+
+@parametrize("obj", [{"": 1}, {"a": {"": {"b": 1}}}, [{"": 1}]])
+def test_flatten_keys_raises_for_empty_key(obj):
+    with pytest.raises(ValueError, match="empty key"):
+        _.flatten_keys(obj)
+
+
+def test_flatten_keys_deeply_nested():
+    depth = 10000
+    obj: dict = {}
+    node = obj
+
+    for _i in range(depth):
+        node["a"] = {}
+        node = node["a"]
+
+    node["b"] = 1
+
+    assert _.flatten_keys(obj) == {".".join(["a"] * depth) + ".b": 1}
+
+
+def test_flatten_keys_raises_for_invalid_list_style():
+    with pytest.raises(ValueError, match="list_style"):
+        _.flatten_keys({"a": [1]}, list_style="parens")
+
+
 @parametrize(
     "case,expected",
     [
@@ -391,12 +772,18 @@ def test_for_in_right(case, expected):
         (({object: {object: 1}}, [object, object]), 1),
         (({1: {"name": "John Doe"}}, "1.name"), "John Doe"),
         ((helpers.Object(), "[0].field"), None),
+        ((type("Pair", (tuple,), {})((1, 2)), "1"), 2),
     ],
 )
 def test_get(case, expected):
     assert _.get(*case) == expected
 
 
+def test_get__raises_for_missing_path_when_default_unset():
+    with pytest.raises(KeyError, match="does not have key"):
+        _.get({"a": {}}, "a.b", default=UNSET)
+
+
 def test_get__should_not_populate_defaultdict():
     data = defaultdict(list)
     _.get(data, "a")
@@ -442,6 +829,49 @@ def test_get__does_not_raise_for_objects_when_path_is_unrestricted(obj, path):
     assert _.get(obj, path) is None
 
 
+@parametrize(
+    "obj,paths,default",
+    [
+        (
+            {"one": {"two": {"three": 4}}},
+            ["one.two", "one.two.three", ["one", "two"], "one.four", "one.four.three", "five"],
+            None,
+        ),
+        (
+            {"one": ["two", {"three": [4, 5]}]},
+            [["one", 1, "three", 1], "one.[1].three.[1]", "one.1.three.1", "one.bad.hello"],
+            [],
+        ),
+        (
+            ["one", {"two": {"three": [4, [{"four": [5]}], 6]}}],
+            ["[1].two.three[-2][0].four[0]", "[1].two.three[0]", "[2]", "[1].two"],
+            "default",
+        ),
+        ({"a": [{"b": range(50)}]}, ["a[0].b[42]", "a[0].b[-1]", "a[0].c"], 0),
+        ((SomeNamedTuple({"c": {"d": 1}}, 2)), ["a.c.d", "b", 0, "c"], None),
+        ({1: {"name": "John Doe"}}, ["1.name", "1", "2"], None),
+        (
+            {"lev.el1": {"lev\\el2": {"level3": ["value"]}}},
+            ["lev\\.el1.lev\\\\el2.level3.[0]"],
+            None,
+        ),
+        (helpers.Object(a=helpers.Object(b=1)), ["a.b", "a.c", "[0].field"], None),
+        ({"a": 1}, [], None),
+        ({"a": 1}, ["a", "a", "b"], None),
+    ],
+)
+def test_get_many(obj, paths, default):
+    expected = [_.get(obj, path, default) for path in paths]
+
+    assert _.get_many(obj, paths, default) == expected
+    assert _.get_many(obj, dict(enumerate(paths)), default) == dict(enumerate(expected))
+
+
+def test_get_many__raises_for_objects_when_path_restricted():
+    with pytest.raises(KeyError, match="access to restricted key"):
+        _.get_many(helpers.Object(), ["a", "__init__.__globals__"])
+
+
 @parametrize(
     "case,expected",
     [
@@ -466,6 +896,23 @@ def test_get__does_not_raise_for_objects_when_path_is_unrestricted(obj, path):
         (({"one": ["two", {"three": [4, 5]}]}, "one.1.three.1"), True),
         ((["one", {"two": {"three": [4, 5]}}], "[1].two.three.[0]"), True),
         (({"lev.el1": {r"lev\el2": {"level3": ["value"]}}}, r"lev\.el1.lev\\el2.level3.[0]"), True),
+        (([1, 2, 3], -3), True),
+        (([1, 2, 3], -4), False),
+        (([1, 2, 3], "a"), False),
+        (([1, 2, 3], 1.0), True),
+        (([1, 2, 3], 3.0), False),
+        (((1, 2, 3), "2"), True),
+        (({1: "a"}, " 1 "), True),
+        (({1: "a"}, ["1.0"]), False),
+        (({1: "a"}, 1.0), True),
+        (({1: "a"}, b"x"), False),
+        (("abc", "1"), True),
+        (("abc", "3"), False),
+        ((helpers.Object(a=1), "a"), True),
+        ((helpers.Object(a=1), "b"), False),
+        ((helpers.Object(a=1), 0), False),
+        ((helpers.Object(), "__init__.__globals__"), False),
+        ((None, "a"), False),
     ],
 )
 def test_has(case, expected):
@@ -536,6 +983,87 @@ def test_map_values_deep(case, expected):
     assert _.map_values_deep(*case) == expected
 
 
+@parametrize(
+    "case,expected",
+    [
+        (
+            ({"a": 1, (1, 2): {"b": 2}}, lambda value, path: path),
+            {"a": ["a"], (1, 2): {"b": [1, 2, "b"]}},
+        ),
+        (
+            ({"a": [1, {"b": 2}]}, lambda value, path: path, "x.y"),
+            {"a": [["x", "y", "a", 0], {"b": ["x", "y", "a", 1, "b"]}]},
+        ),
+        ((5, lambda value, path: (value, path)), (5, [])),
+        (({"a": {}, "b": [], "c": None},), {"a": {}, "b": [], "c": None}),
+        (({"a": 1}, lambda: 0), {"a": 0}),
+    ],
+)
+def test_map_values_deep_paths(case, expected):
+    assert _.map_values_deep(*case) == expected
+
+
+def test_map_values_deep_in_place():
+    obj = {"a": [1, {"b": 2}], "c": 3}
+    result = _.map_values_deep(obj, lambda value: value * 10)
+
+    assert result is obj
+    assert obj == {"a": [10, {"b": 20}], "c": 30}
+
+
+def test_map_values_deep_not_in_place():
+    obj = {"a": [1, {"b": 2}], "c": OrderedDict([("d", 3)])}
+    result = _.map_values_deep(obj, lambda value, path: (value, path), in_place=False)
+
+    assert result == {"a": [(1, ["a", 0]), {"b": (2, ["a", 1, "b"])}], "c": {"d": (3, ["c", "d"])}}
+    assert isinstance(result["c"], OrderedDict)
+    assert obj == {"a": [1, {"b": 2}], "c": OrderedDict([("d", 3)])}
+
+
+def test_map_values_deep_without_paths():
+    calls = []
+
+    def iteratee(*args):
+        calls.append(args)
+        return args[0] * 2
+
+    assert _.map_values_deep({"a": [1, {"b": 2}]}, iteratee, paths=False) == {"a": [2, {"b": 4}]}
+    assert calls == [(1,), (2,)]
+
+
+def test_map_values_deep_deeply_nested():
+    depth = 10000
+    obj: list = []
+    node = obj
+
+    for _i in range(depth):
+        node.append([])
+        node = node[0]
+
+    node.append(1)
+    result = _.map_values_deep(obj, lambda value, path: len(path))
+
+    for _i in range(depth):
+        result = result[0]
+
+    assert result == [depth + 1]
+
+
+def test_map_values_deep_raises_for_reference_cycle():
+    obj: dict = {"a": {}}
+    obj["a"]["b"] = obj
+
+    with pytest.raises(ValueError, match="references itself"):
+        _.map_values_deep(obj, lambda value: value)
+
+
+def test_map_values_deep_shared_references():
+    shared = {"b": 1}
+    result = _.map_values_deep({"a": shared, "c": shared}, lambda value, path: path, in_place=False)
+
+    assert result == {"a": {"b": ["a", "b"]}, "c": {"b": ["c", "b"]}}
+
+
 @parametrize(
     "case,expected",
     [
@@ -630,6 +1158,112 @@ def test_merge_no_link_list():
     assert case == {"foo": [{}]}
 
 
+def test_merge_does_not_modify_sources():
+    source1 = {"a": {"b": [1, {"c": 2}]}, "d": {"e": 3}}
+    source2 = {"a": {"b": [{"x": 1}, {"y": 2}]}, "d": [4]}
+    expected1 = _.clone_deep(source1)
+    expected2 = _.clone_deep(source2)
+    result = _.merge({}, source1, source2)
+
+    assert result == {"a": {"b": [{"x": 1}, {"c": 2, "y": 2}]}, "d": [4]}
+    assert source1 == expected1
+    assert source2 == expected2
+
+
+def test_merge_shared_references():
+    shared = {"a": 1}
+    result = _.merge({}, {"x": shared, "y": shared})
+
+    assert result["x"] is result["y"]
+    assert result["x"] is not shared
+
+
+def test_merge_copy_false():
+    nested = {"b": [1, 2]}
+    obj = {"c": {"d": 1}}
+    result = _.merge(obj, {"a": nested, "c": {"e": 2}}, copy_values=False)
+
+    assert result == {"a": {"b": [1, 2]}, "c": {"d": 1, "e": 2}}
+    assert result["a"] is nested
+
+
+@parametrize(
+    "func,sources,expected",
+    [
+        (_.merge, [{"x": {"y": 1}}, {"x": {"z": 2}}], {"x": {"y": 1, "z": 2}}),
+        (_.merge, [{"x": {"y": {"k": 1}}}, {"x": {"y": {"z": 2}}}], {"x": {"y": {"k": 1, "z": 2}}}),
+        (_.merge, [{"x": [{"y": 1}]}, {"x": [{"z": 2}]}], {"x": [{"y": 1, "z": 2}]}),
+        (_.merge, [{"x": {"y": 1}}, {"x": {"y": 2}}, {"x": {"z": 3}}], {"x": {"y": 2, "z": 3}}),
+        (_.defaults_deep, [{"x": {"y": 1}}, {"x": {"z": 2}}], {"x": {"y": 1, "z": 2}}),
+        (
+            partial(_.merge_with, iteratee=lambda obj_value, src_value: None),
+            [{"x": {"y": 1}}, {"x": {"z": 2}}],
+            {"x": {"y": 1, "z": 2}},
+        ),
+    ],
+)
+def test_merge_copy_values_false_does_not_modify_sources(func, sources, expected):
+    originals = copy.deepcopy(sources)
+    assert func({}, *sources, copy_values=False) == expected
+    assert sources == originals
+
+
+def test_merge_deeply_nested():
+    depth = 10000
+    obj: dict = {}
+    source: dict = {}
+    obj_node, source_node = obj, source
+
+    for _i in range(depth):
+        obj_node["a"] = {"obj": True}
+        source_node["a"] = {"src": True}
+        obj_node, source_node = obj_node["a"], source_node["a"]
+
+    result = _.merge(obj, source)
+    node = result
+
+    for _i in range(depth):
+        node = node["a"]
+        assert node["obj"] is True
+        assert node["src"] is True
+
+
+@parametrize(
+    "case",
+    [
+        ({"a": {"b": 1}, "c": {"d": 2}}, {"a": {"e": 3}}),
+        ({"a": [1, {"b": 2}], "c": [3]}, {"a": [4, {"e": 5}, 6]}),
+        ({"a": 1}, {"a": {"b": 2}}, {"a": {"c": 3}}),
+        ({"a": {"b": 1}}, {"a": {"c": 2}}, {"a": {"d": 3}}),
+        ([{"a": 1}, {"b": 2}], [{"c": 3}]),
+        ({},),
+        (None, {"a": 1}),
+    ],
+)
+def test_merge_in(case):
+    obj, *sources = case
+    original = _.clone_deep(obj)
+    original_sources = _.clone_deep(sources)
+    result = _.merge_in(obj, *sources)
+
+    assert result == _.merge(_.clone_deep(obj), *sources)
+    assert obj == original
+    assert sources == original_sources
+
+
+def test_merge_in_structural_sharing():
+    obj = {"a": {"b": {"c": 1}}, "d": {"e": 2}}
+    source = {"a": {"b": {"f": 3}}, "g": {"h": 4}}
+    result = _.merge_in(obj, source)
+
+    assert result == {"a": {"b": {"c": 1, "f": 3}}, "d": {"e": 2}, "g": {"h": 4}}
+    assert result is not obj
+    assert result["a"] is not obj["a"]
+    assert result["a"]["b"] is not obj["a"]["b"]
+    assert result["d"] is obj["d"]
+    assert result["g"] is source["g"]
+
+
 @parametrize(
     "case,expected",
     [
@@ -647,6 +1281,23 @@ def test_merge_with(case, expected):
     assert _.merge_with(*case) == expected
 
 
+def test_merge_with_copies_sources():
+    source = {"a": [{"b": 1}]}
+    result = _.merge_with({}, source, lambda obj_value, src_value: src_value)
+    result["a"][0]["b"] = 2
+
+    assert source == {"a": [{"b": 1}]}
+
+
+def test_merge_with_copy_false():
+    value = [{"b": 1}]
+    result = _.merge_with(
+        {}, {"a": value}, iteratee=lambda obj_value, src_value: src_value, copy_values=False
+    )
+
+    assert result["a"] is value
+
+
 @parametrize(
     "case,expected",
     [
@@ -697,6 +1348,26 @@ def test_parse_int(case, expected):
     assert _.parse_int(*case) == expected
 
 
+@parametrize(
+    "case,expected",
+    [
+        (({"a": 1}, []), {"a": 1}),
+        (({"a": 1}, [("set", [], 2)]), 2),
+        (({"a": 1}, [("set", "b.c", 2), ("unset", "a", None)]), {"b": {"c": 2}}),
+        (({"a": [1, 2, 3]}, [("unset", ["a", 0], None), ("set", ["a", 2], 4)]), {"a": [2, 3, 4]}),
+        (({"a": {0: 1}}, [("set", ["a", 0], 2)]), {"a": {0: 2}}),
+        (({"a": 1}, [("unset", "b", None)]), {"a": 1}),
+    ],
+)
+def test_patch(case, expected):
+    assert _.patch(*case) == expected
+
+
+def test_patch_raises_for_unknown_op():
+    with pytest.raises(ValueError, match="patch op"):
+        _.patch({}, [("insert", ["a"], 1)])
+
+
 @parametrize(
     "case,expected",
     [
@@ -714,6 +1385,11 @@ def test_parse_int(case, expected):
             ({"a": [{"b": 1}, {"c": 2}, {"d": 3}]}, "a[0]", "a[2]"),
             {"a": [{"b": 1}, None, {"d": 3}]},
         ),
+        (
+            ({"a": {"b": {"c": 1, "d": 2}, "e": [{"f": 3}]}}, "a.b.c", "a.b.x", "a.e[0].f", "x.y"),
+            {"a": {"b": {"c": 1}, "e": [{"f": 3}]}},
+        ),
+        ((helpers.Object(a=helpers.Object(b=1)), "a.b", "a.__globals__"), {"a": {"b": 1}}),
     ],
 )
 def test_pick(case, expected):
@@ -772,12 +1448,78 @@ def test_rename_keys(case, expected):
         (({}, "a.b[0][0].c", 1), {"a": {"b": [[{"c": 1}]]}}),
         (({}, "a", tuple), {"a": tuple}),
         (({}, r"a.b\.c.d", 1), {"a": {"b.c": {"d": 1}}}),
+        ((OrderedDict(), "a.b", 1), {"a": {"b": 1}}),
     ],
 )
 def test_set_(case, expected):
     assert _.set_(*case) == expected
 
 
+@parametrize(
+    "case",
+    [
+        ({}, "one.two.three.four", 1),
+        ({"one": {"two": {}, "three": {}}}, "one.two.three.four", 1),
+        ({"one": 1, "two": {"three": 3}}, "one", 2),
+        ([1, 2, [3, 4, [5, 6]]], [2, 2, 1], 7),
+        ([1, 2, [3, 4, [5, 6]]], "[2].[2].[2]", 7),
+        ({"a": {"b": []}}, "a.b[0].c", 1),
+        (Namespace(a=Namespace(b=5)), "a.c", 6),
+    ],
+)
+def test_set_in(case):
+    obj, path, value = case
+    original = _.clone_deep(obj)
+    result = _.set_in(obj, path, value)
+
+    assert result == _.set_(_.clone_deep(obj), path, value)
+    assert obj == original
+
+
+def test_set_in_structural_sharing():
+    obj = {"a": {"b": {"c": 1}, "d": [2]}, "e": {"f": 3}}
+    result = _.set_in(obj, "a.b.c", 4)
+
+    assert result == {"a": {"b": {"c": 4}, "d": [2]}, "e": {"f": 3}}
+    assert result["a"] is not obj["a"]
+    assert result["a"]["b"] is not obj["a"]["b"]
+    assert result["a"]["d"] is obj["a"]["d"]
+    assert result["e"] is obj["e"]
+
+
+@parametrize(
+    "obj,path_values",
+    [
+        ({}, {"a.b.c": 1, "a.b.d": 2, "a.e[0]": 3, "f": 4}),
+        ({"a": {"x": 0}}, {"a.b": 1, "a.c[2]": 2, "a.c[0]": 3}),
+        ([], [("[0].a", 1), ("[1]", 2), ("[0].b", 3)]),
+        ([1, 2, [3, 4, [5, 6]]], [([2, 2, 1], 7), ("[2].[2].[2]", 8), ("[2][0]", 9)]),
+        ({}, [(["a", "b"], 1), ("a.c", 2), (r"a.b\.c.d", 3)]),
+        ({}, [("a.b", 1), ("a.b", 2)]),
+        ({}, [("a", {"z": 0}), ("a.b", 1)]),
+        ({}, [("a.b", 1), ("a", 2)]),
+        ({}, [([], 1), ("a", 2)]),
+        ([1, None], [("[0]", 0), ("0", 1), ("[0]", 2)]),
+        ([[1]], [("[0][0]", 0), ("[0].0", 1)]),
+        ({}, [("a[0].1", 0), ("a.0.1", 1)]),
+        ([1, 2, 3], [("[-1]", 0), ("[2]", 1)]),
+        ([1, 2, 3], [("[2]", 0), ("[-1]", 1), ("[0]", 2)]),
+        ({}, [("[0]", 1), ("0", 2), ("1.5", 3), (1, 4)]),
+        ({}, [(["a", "1"], 1), (["a", 1.5], 2), (["a", float("inf")], 3)]),
+        (Namespace(a=Namespace(b=5)), {"a.c": 6, "d.e": 7}),
+        ({}, {}),
+    ],
+)
+def test_set_many(obj, path_values):
+    items = path_values.items() if isinstance(path_values, dict) else path_values
+    expected = _.clone_deep(obj)
+
+    for path, value in items:
+        _.set_(expected, path, value)
+
+    assert _.set_many(obj, path_values) == expected
+
+
 def test_set_on_class_works_the_same_with_string_and_list():
     class A:
         def __init__(self):
@@ -931,6 +1673,35 @@ def test_update(case, expected):
     assert _.update(*case) == expected
 
 
+@parametrize(
+    "case",
+    [
+        ({"rome": "Republic"}, ["rome"], lambda value: "Empire"),
+        ({}, ["rome"], lambda value: value),
+        ({"earth": {"rome": "Republic"}, "mars": {}}, "earth.rome", lambda value: value + "!"),
+        ([[1, 2], [3]], "[0][1]", lambda value: value * 10),
+    ],
+)
+def test_update_in(case):
+    obj, path, updater = case
+    original = _.clone_deep(obj)
+    result = _.update_in(obj, path, updater)
+
+    assert result == _.update(_.clone_deep(obj), path, updater)
+    assert obj == original
+
+
+def test_update_in_structural_sharing():
+    obj = {"a": [{"b": 1}, {"c": 2}], "d": {"e": 3}}
+    result = _.update_in(obj, "a[0].b", lambda value: value + 1)
+
+    assert result == {"a": [{"b": 2}, {"c": 2}], "d": {"e": 3}}
+    assert result["a"] is not obj["a"]
+    assert result["a"][0] is not obj["a"][0]
+    assert result["a"][1] is obj["a"][1]
+    assert result["d"] is obj["d"]
+
+
 @parametrize(
     "case,expected",
     [
@@ -943,6 +1714,24 @@ def test_update_with(case, expected):
     assert _.update_with(*case) == expected
 
 
+@parametrize(
+    "case,expected",
+    [
+        (({"a": 1, "b.c": 2},), {"a": 1, "b": {"c": 2}}),
+        (({"a.b[0]": 1, "a.b[1].c": 2},), {"a": {"b": [1, {"c": 2}]}}),
+        (({"a.b.0": 1, "a.b.1": 2},), {"a": {"b": {"0": 1, "1": 2}}}),
+        (({"[0]": 1, "[1].a": 2},), {0: 1, 1: {"a": 2}}),
+        (({"a\\.b": 1},), {"a.b": 1}),
+        (([("a/b", 1), ("a/c[0]", 2)], "/"), {"a": {"b": 1, "c": [2]}}),
+        (({"a\\/b/c.d": 1}, "/"), {"a/b": {"c.d": 1}}),
+        ((iter([("a.b", 1)]),), {"a": {"b": 1}}),
+        (({},), {}),
+    ],
+)
+def test_unflatten_keys(case, expected):
+    assert _.unflatten_keys(*case) == expected
+
+
 @parametrize(
     "obj,path,expected,new_obj",
     [
@@ -959,11 +1748,172 @@ def test_unset(obj, path, expected, new_obj):
     assert obj == new_obj
 
 
+@parametrize(
+    "obj,path,expected",
+    [
+        ({"a": [{"b": {"c": 7}}]}, "a.0.b.c", {"a": [{"b": {}}]}),
+        ({"a": [{"b": {"c": 7}}]}, "a[0].b", {"a": [{}]}),
+        ([1, 2, 3], "1", [1, 3]),
+        ([1, 2, 3], 1, [1, 3]),
+        ([1, [2, 3]], [1, 1], [1, [2]]),
+        ([1, 2, 3], "[0][0]", [1, 2, 3]),
+        ([1, 2, 3], "[0][0][0]", [1, 2, 3]),
+        ({"a": {"b": 1}}, "a.c", {"a": {"b": 1}}),
+        ({"a": {"b": 1}}, "x.y", {"a": {"b": 1}}),
+    ],
+)
+def test_unset_in(obj, path, expected):
+    original = _.clone_deep(obj)
+
+    assert _.unset_in(obj, path) == expected
+    assert obj == original
+
+
+def test_unset_in_structural_sharing():
+    obj = {"a": {"b": {"c": 1, "d": 2}, "e": [3]}, "f": {"g": 4}}
+    result = _.unset_in(obj, "a.b.c")
+
+    assert result == {"a": {"b": {"d": 2}, "e": [3]}, "f": {"g": 4}}
+    assert result["a"]["b"] is not obj["a"]["b"]
+    assert result["a"]["e"] is obj["a"]["e"]
+    assert result["f"] is obj["f"]
+    assert _.unset_in(obj, "a.b.x") is obj
+
+
 @parametrize("case,expected", [({"a": 1, "b": 2, "c": 3}, [1, 2, 3]), ([1, 2, 3], [1, 2, 3])])
 def test_values(case, expected):
     assert set(_.values(case)) == set(expected)
 
 
+@parametrize(
+    "case,expected",
+    [
+        (({"a": [1, 2], "b": {"c": 3}}, lambda value: value), {"a": [1, 2], "b": {"c": 3}}),
+        (
+            (
+                {"a": [1, 2], "b": {"c": 3}},
+                lambda value: value + 1 if isinstance(value, int) else value,
+            ),
+            {"a": [2, 3], "b": {"c": 4}},
+        ),
+        (
+            (
+                {"a": [1, 2], "b": {"c": 3}},
+                lambda value, path: "/".join(map(str, path)) if isinstance(value, int) else value,
+            ),
+            {"a": ["a/0", "a/1"], "b": {"c": "b/c"}},
+        ),
+        (
+            (
+                {"a": [1, 2], "b": {"c": 3}},
+                lambda value: len(value) if isinstance(value, list) else value,
+            ),
+            {"a": 2, "b": {"c": 3}},
+        ),
+        (([1, [2]], lambda value: "root" if value == [1, [2]] else value), "root"),
+        (
+            ([1, [2, [3]]], lambda value: sum(value) if isinstance(value, list) else value, "post"),
+            6,
+        ),
+        (
+            (
+                [1, [2, [3]]],
+                lambda value: value * 2 if isinstance(value, int) else value,
+                "pre",
+                lambda value, path: path == [1],
+            ),
+            [2, [2, [3]]],
+        ),
+        (
+            (
+                [1, [2, [3]]],
+                lambda value: value * 2 if isinstance(value, int) else value,
+                "post",
+                None,
+                1,
+            ),
+            [2, [2, [3]]],
+        ),
+        ((5, lambda value: value * 2), 10),
+        ((5, lambda value: value * 2, "post"), 10),
+        (({"a": [1, {"b": 2}]},), {"a": [1, {"b": 2}]}),
+    ],
+)
+def test_walk(case, expected):
+    assert _.walk(*case) == expected
+
+
+def test_walk_copies_walked_containers():
+    shared = {"c": 1}
+    obj = {"a": [shared, shared], "b": (1, 2)}
+    result = _.walk(obj)
+
+    assert result == obj
+    assert result is not obj
+    assert result["a"] is not obj["a"]
+    assert result["a"][0] is not shared
+    assert result["a"][0] is not result["a"][1]
+    assert result["b"] is obj["b"]
+
+
+def test_walk_shares_pruned_containers():
+    obj = {"a": {"b": [1]}, "c": [2]}
+    result = _.walk(obj, lambda value: value, prune=lambda value, path: path == ["a"])
+
+    assert result == obj
+    assert result["a"] is obj["a"]
+    assert result["c"] is not obj["c"]
+
+
+def test_walk_does_not_modify_obj():
+    obj = {"a": [1, {"b": 2}]}
+    _.walk(obj, lambda value: value * 2 if isinstance(value, int) else value, order="post")
+
+    assert obj == {"a": [1, {"b": 2}]}
+
+
+def test_walk_skips_replaced_containers():
+    visited = []
+
+    def visitor(value, path):
+        visited.append(path)
+        return [0] if path == ["a"] else value
+
+    assert _.walk({"a": [1, [2]], "b": [3]}, visitor) == {"a": [0], "b": [3]}
+    assert visited == [[], ["a"], ["b"], ["b", 0]]
+
+
+def test_walk_deeply_nested():
+    depth = 10000
+    obj: list = []
+    node = obj
+
+    for _i in range(depth):
+        node.append([])
+        node = node[0]
+
+    node.append(1)
+    result = _.walk(obj, lambda value: value + 1 if isinstance(value, int) else value)
+
+    for _i in range(depth):
+        result = result[0]
+
+    assert result == [2]
+
+
+def test_walk_raises_for_reference_cycle():
+    obj: list = [1]
+    obj.append(obj)
+
+    with pytest.raises(ValueError, match="references itself"):
+        _.walk(obj)
+
+
+def test_walk_raises_for_invalid_order():
+    with pytest.raises(ValueError, match="order"):
+        _.walk({}, order="in")
+
+
 @parametrize("case,expected", [((5, lambda x: x * 2), 10)])
 def test_apply(case, expected):
     assert _.apply(*case) == expected
@@ -265,6 +265,82 @@ def test_is_equal_with(case, expected):
     assert _.is_equal_with_cmp(*case[1:])(case[0]) == expected
 
 
+def nested(depth, leaf, container=list):
+    value = leaf
+    for _i in range(depth):
+        value = container([value]) if container is not dict else {"a": value}
+    return value
+
+
+def cyclic(value):
+    items = [value]
+    items.append(items)
+    return items
+
+
+def loose(a, b):
+    return a == b if isinstance(a, (int, float)) and isinstance(b, (int, float)) else None
+
+
+@parametrize(
+    "value,other,expected",
+    [
+        (nested(10000, 1), nested(10000, 1), True),
+        (nested(10000, 1), nested(10000, 2), False),
+        (nested(10000, 1, dict), nested(10000, 1, dict), True),
+        (nested(10000, 1, dict), nested(10000, 2, dict), False),
+        (cyclic(1), cyclic(1), True),
+        (cyclic(1), cyclic(2), False),
+        ({"a": cyclic(1), "b": 2}, {"a": cyclic(1), "b": 2}, True),
+        ({"a": cyclic(1), "b": 2}, {"a": cyclic(1), "c": 2}, False),
+    ],
+)
+def test_is_equal_deep_and_cyclic(value, other, expected):
+    assert _.is_equal(value, other) is expected
+    assert _.is_equal_with(value, other, loose) is expected
+
+
+@parametrize(
+    "value,other,expected",
+    [
+        (nested(10000, 1, tuple), nested(10000, 1, tuple), True),
+        (nested(10000, 1, tuple), nested(10000, 2, tuple), False),
+        (nested(10000, 1, tuple), nested(10000, 1, list), False),
+    ],
+)
+def test_is_equal_deep_tuples(value, other, expected):
+    assert _.is_equal(value, other) is expected
+
+
+@parametrize(
+    "case,expected",
+    [
+        (([], [], loose), True),
+        (({}, {}, loose), True),
+        (({"a.b": 1}, {"a.b": 1.0}, loose), True),
+        (({"a.b": 1}, {"a": {"b": 1}}, loose), False),
+        (({1: "a"}, {"1": "a"}, loose), False),
+        (([[1, 2], {"a": [3]}], [[1, 2.0], {"a": [3.0]}], loose), True),
+        (([[1, 2], {"a": [3]}], [[1, 2.0], {"a": [4]}], loose), False),
+        (([[1, 2], {"a": [3]}], [[1, 2.0], {"a": (3,)}], loose), False),
+    ],
+)
+def test_is_equal_with_nested(case, expected):
+    assert _.is_equal_with(*case) is expected
+
+
+def test_is_equal_with_skips_identical_sub_objects():
+    calls = []
+
+    def customizer(a, b):
+        calls.append((a, b))
+
+    shared = [float("nan")]
+    assert _.is_equal_with([shared, [2]], [shared, [2.0]], customizer) is True
+    assert len(calls) == 3
+    assert not [a for a, _b in calls if a is shared]
+
+
 @parametrize("case,expected", [(Exception(), True), ({}, False), ([], False)])
 def test_is_error(case, expected):
     assert _.is_error(case) == expected
@@ -440,6 +516,20 @@ def test_is_match_with(case, expected):
     assert _.is_match_with_cmp(*case[1:])(case[0]) == expected
 
 
+def test_is_match_deeply_nested():
+    def nested(leaf):
+        obj = value = {"b": 1}
+        for _i in range(10000):
+            value["a"] = {"b": 1}
+            value = value["a"]
+        value.update(leaf)
+        return obj
+
+    assert _.is_match(nested({"c": 2, "d": 3}), nested({"c": 2}))
+    assert not _.is_match(nested({"c": 2}), nested({"c": 3}))
+    assert not _.is_match(nested({}), nested({"c": 2}))
+
+
 @parametrize(
     "case,expected",
     [
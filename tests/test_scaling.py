@@ -0,0 +1,182 @@
+import pytest
+
+import pydash as _
+
+from .scaling import (
+    EXPONENT_LIMITS,
+    distinct_ints,
+    document,
+    fit_exponent,
+    floats,
+    int_pairs,
+    ints,
+    mapping,
+    measure_growth,
+    nested_lists,
+    record_pairs,
+    records,
+    square_matrix,
+    text,
+)
+
+
+parametrize = pytest.mark.parametrize
+pytestmark = pytest.mark.scaling
+
+LINEAR = "linear"
+NLOGN = "nlogn"
+
+
+def case(func, data, complexity=LINEAR, id=None, marks=()):
+    return pytest.param(func, data, complexity, id=id, marks=marks)
+
+
+@parametrize(
+    "func,data,complexity",
+    [
+        # Arrays
+        case(lambda data: _.chunk(data, 3), ints, id="chunk"),
+        case(_.compact, ints, id="compact"),
+        case(lambda data: _.concat(*data), int_pairs, id="concat"),
+        case(lambda data: _.difference(*data), int_pairs, id="difference"),
+        case(lambda data: _.difference(*data), record_pairs, id="difference-unhashable"),
+        case(_.duplicates, ints, id="duplicates"),
+        case(_.duplicates, records, id="duplicates-unhashable"),
+        case(_.flatten, nested_lists, id="flatten"),
+        case(_.flatten_deep, nested_lists, id="flatten_deep"),
+        case(lambda data: _.from_pairs(_.zip_(data, data)), ints, id="from_pairs"),
+        case(lambda data: _.index_of(data, -1), ints, id="index_of"),
+        case(lambda data: _.intersection(*data), int_pairs, id="intersection"),
+        case(lambda data: _.intersection(*data), record_pairs, id="intersection-unhashable"),
+        case(lambda data: _.intersperse(data, 0), ints, id="intersperse"),
+        case(lambda data: _.interleave(data, data), ints, id="interleave"),
+        case(_.sort, distinct_ints, NLOGN, id="sort"),
+        case(_.sorted_uniq, ints, NLOGN, id="sorted_uniq"),
+        case(lambda data: _.take_while(data, lambda x: x >= 0), ints, id="take_while"),
+        case(lambda data: _.union(*data), int_pairs, id="union"),
+        case(_.uniq, ints, id="uniq"),
+        case(_.uniq, records, id="uniq-unhashable"),
+        case(_.uniq_with, records, id="uniq_with"),
+        case(lambda data: _.unzip(_.zip_(data, data)), ints, id="unzip"),
+        case(lambda data: _.without(data, *data[::4]), ints, id="without"),
+        case(lambda data: _.xor(*data), int_pairs, id="xor"),
+        case(lambda data: _.xor(*data), record_pairs, id="xor-unhashable"),
+        case(lambda data: _.zip_(data, data), ints, id="zip_"),
+        case(lambda data: _.zip_object(data, data), ints, id="zip_object"),
+        case(
+            lambda data: _.zip_object_deep([f"a.b[{i}].c" for i in range(len(data))], data),
+            ints,
+            id="zip_object_deep",
+        ),
+        # Collections
+        case(lambda data: _.count_by(data, "group"), records, id="count_by"),  # type: ignore[call-overload]
+        case(lambda data: _.every(data, "id"), records, id="every"),
+        case(lambda data: _.filter_(data, {"group": 1}), records, id="filter_"),
+        case(
+            lambda data: _.filter_(data, {"group": 1, "tags": {"a": 1}}),
+            records,
+            id="filter_-nested",
+        ),
+        case(lambda data: _.find(data, {"id": -1}), records, id="find"),
+        case(lambda data: _.flat_map(data, lambda x: [x, x]), ints, id="flat_map"),
+        case(lambda data: _.group_by(data, "group"), records, id="group_by"),
+        case(lambda data: _.includes(data, -1), ints, id="includes"),
+        case(lambda data: _.key_by(data, "id"), records, id="key_by"),
+        case(lambda data: _.map_(data, "tags.a"), records, id="map_"),
+        case(lambda data: _.order_by(data, ["group", "-score"]), records, NLOGN, id="order_by"),
+        case(lambda data: _.partition(data, "group"), records, id="partition"),
+        case(lambda data: _.pluck(data, "score"), records, id="pluck"),
+        case(lambda data: _.reduce_(data, lambda a, b: a + b, 0), ints, id="reduce_"),
+        case(lambda data: _.reject(data, {"group": 1}), records, id="reject"),
+        case(lambda data: _.sort_by(data, "score"), records, NLOGN, id="sort_by"),
+        # Numerical
+        case(_.max_, ints, id="max_"),
+        case(lambda data: _.max_by(data, "score"), records, id="max_by"),
+        case(_.mean, floats, id="mean"),
+        case(lambda data: _.mean_by(data, "score"), records, id="mean_by"),  # type: ignore[call-overload]
+        case(_.median, floats, NLOGN, id="median"),
+        case(lambda data: _.min_max_by(data, "score"), records, id="min_max_by"),
+        case(lambda data: list(_.moving_max(data, len(data) // 4)), floats, id="moving_max"),
+        case(lambda data: _.moving_mean(data, len(data) // 4), floats, id="moving_mean"),
+        case(
+            lambda data: list(_.itermoving_mean(data, len(data) // 4)),
+            floats,
+            id="itermoving_mean",
+        ),
+        case(lambda data: list(_.moving_min(data, len(data) // 4)), floats, id="moving_min"),
+        case(lambda data: list(_.moving_std(data, len(data) // 4)), floats, id="moving_std"),
+        case(lambda data: list(_.moving_sum(data, len(data) // 4)), floats, id="moving_sum"),
+        case(lambda data: _.percentile(data, [50, 95, 99]), floats, NLOGN, id="percentile"),
+        case(lambda data: _.quantile(data, [0.5, 0.95, 0.99]), floats, NLOGN, id="quantile"),
+        case(lambda data: _.QuantileSketch([0.5, 0.95, 0.99], data), floats, id="QuantileSketch"),
+        case(_.scale, floats, id="scale"),
+        case(lambda data: _.stats_by(data, "score"), records, id="stats_by"),
+        case(_.std_deviation, floats, id="std_deviation"),
+        case(_.sum_, floats, id="sum_"),
+        case(lambda data: _.sum_by(data, "score"), records, id="sum_by"),  # type: ignore[call-overload]
+        case(_.transpose, square_matrix, id="transpose"),
+        case(lambda data: _.transpose([data, data]), ints, id="transpose-wide"),
+        case(_.variance, floats, id="variance"),
+        case(_.zscore, floats, id="zscore"),
+        # Objects
+        case(_.clone_deep, document, id="clone_deep"),
+        case(lambda data: _.diff(data, _.clone_deep(data)), document, id="diff"),
+        case(_.flatten_keys, document, id="flatten_keys"),
+        case(_.invert, mapping, id="invert"),
+        case(lambda data: _.map_values_deep(data, str), document, id="map_values_deep"),
+        case(lambda data: _.merge({}, data, data), document, id="merge"),
+        case(lambda data: _.pick(data, *list(data)[::2]), document, id="pick"),
+        case(_.to_pairs, mapping, id="to_pairs"),
+        case(lambda data: _.unflatten_keys(_.flatten_keys(data)), document, id="unflatten_keys"),
+        case(lambda data: list(_.iterwalk(data)), document, id="iterwalk"),
+        case(lambda data: _.walk(data, lambda value: value), document, id="walk"),
+        # Predicates
+        case(lambda data: _.is_equal(data, dict(data)), document, id="is_equal"),
+        case(
+            lambda data: _.is_equal_with(data, dict(data), lambda a, b: None),
+            document,
+            id="is_equal_with",
+        ),
+        case(lambda data: _.is_match(data, dict(data)), document, id="is_match"),
+        # Strings
+        case(_.camel_case, text, id="camel_case"),
+        case(_.snake_case, text, id="snake_case"),
+        case(_.words, text, id="words"),
+        # Utilities
+        case(_.deep_hash, records, id="deep_hash"),
+        # Chaining
+        case(lambda data: _.chain(data).map_("score").sum_().value(), records, id="chain"),
+    ],
+)
+def test_scaling(func, data, complexity):
+    growth = measure_growth(func, data)
+    limit = EXPONENT_LIMITS[complexity]
+    assert growth.exponent <= limit, f"expected {complexity} growth, got {growth}"
+
+
+@parametrize(
+    "func",
+    [
+        pytest.param(_.median, id="median"),
+        pytest.param(lambda data: _.percentile(data, [50, 95, 99]), id="percentile"),
+        pytest.param(lambda data: _.quantile(data, [0.5, 0.95, 0.99]), id="quantile"),
+    ],
+)
+def test_scaling_selection(monkeypatch, func):
+    # Inputs at the measured sizes are sorted unless the threshold for partitioning them instead is
+    # lowered below the sizes.
+    monkeypatch.setattr(_.numerical, "SELECT_SORT_SIZE", 32)
+    growth = measure_growth(func, floats)
+    assert growth.exponent <= EXPONENT_LIMITS[LINEAR], f"expected {LINEAR} growth, got {growth}"
+
+
+@parametrize(
+    "sizes,times,expected",
+    [
+        ([1, 2, 4, 8], [1, 2, 4, 8], 1.0),
+        ([1, 2, 4, 8], [1, 4, 16, 64], 2.0),
+        ([10, 100, 1000], [3, 3, 3], 0.0),
+    ],
+)
+def test_fit_exponent(sizes, times, expected):
+    assert fit_exponent(sizes, times) == pytest.approx(expected)
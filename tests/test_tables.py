@@ -0,0 +1,223 @@
+import pytest
+
+import pydash as _
+from pydash.tables import Table
+
+
+parametrize = pytest.mark.parametrize
+
+RECORDS = [
+    {"name": "ann", "group": "x", "score": 3},
+    {"name": "bob", "group": "y", "score": 1},
+    {"name": "cat", "group": "x", "score": 2},
+    {"name": "dan", "group": "y", "score": 3},
+]
+
+
+@pytest.fixture(params=["python", "numpy"])
+def table(request):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    return Table.from_records(RECORDS, backend=request.param)
+
+
+def test_table_from_records():
+    table = Table.from_records([{"a": 1}, {"b": 2, "a": 3}])
+    assert table.columns == ("a", "b")
+    assert len(table) == 2
+    assert table.column("a") == [1, 3]
+    assert table["b"] == [None, 2]
+    assert table.to_records() == [{"a": 1, "b": None}, {"a": 3, "b": 2}]
+
+
+def test_table_from_records_with_columns():
+    table = Table.from_records(RECORDS, ["score", "name"])
+    assert table.columns == ("score", "name")
+    assert table[0] == {"score": 3, "name": "ann"}
+
+
+def test_table_copies_list_columns():
+    values = [1, 2]
+    table = Table({"a": values})
+    values.append(3)
+    assert table["a"] == [1, 2]
+
+
+def test_table_empty():
+    table = Table()
+    assert table.columns == ()
+    assert len(table) == 0
+    assert list(table) == []
+    assert Table.from_records([]) == table
+
+
+def test_table_raises_for_ragged_columns():
+    with pytest.raises(ValueError, match="same length"):
+        Table({"a": [1, 2], "b": [1]})
+
+
+def test_table_raises_for_unknown_backend():
+    with pytest.raises(ValueError, match="backend"):
+        Table({"a": [1]}, backend="fortran")  # type: ignore[arg-type]
+
+
+def test_table_getitem(table):
+    assert table[1] == RECORDS[1]
+    assert table[-1] == RECORDS[-1]
+    assert table[1:3].to_records() == RECORDS[1:3]
+    assert table[::-2].to_records() == RECORDS[::-2]
+    assert list(table["score"]) == [3, 1, 2, 3]
+
+
+@parametrize("key,exception", [(4, IndexError), (-5, IndexError), ("missing", KeyError)])
+def test_table_getitem_raises(table, key, exception):
+    with pytest.raises(exception):
+        table[key]
+
+
+def test_table_getitem_prefers_column_names():
+    table = Table({0: ["a", "b"]})
+    assert table[0] == ["a", "b"]
+    assert table[1] == {0: "b"}
+
+
+def test_table_take(table):
+    assert table.take([3, 0, 0]).to_records() == [RECORDS[3], RECORDS[0], RECORDS[0]]
+    assert len(table.take([])) == 0
+
+
+def test_table_eq(table):
+    assert table == Table.from_records(RECORDS)
+    assert table != Table.from_records(RECORDS[:-1])
+    assert table != Table.from_records(RECORDS, ["score", "group", "name"])
+    assert table != RECORDS
+
+
+def test_table_is_unhashable():
+    with pytest.raises(TypeError):
+        hash(Table())
+
+
+def test_table_repr():
+    assert repr(Table.from_records(RECORDS)) == (
+        "Table(columns=('name', 'group', 'score'), rows=4)"
+    )
+
+
+def test_table_numpy_backend(np):
+    table = Table.from_records(RECORDS, backend="numpy")
+    assert isinstance(table["score"], np.ndarray)
+    assert type(table[0]["score"]) is int
+    assert all(type(row["name"]) is str for row in table)
+
+
+def test_table_keeps_numpy_arrays(np):
+    table = Table({"a": np.array([1, 2])})
+    assert isinstance(table["a"], np.ndarray)
+    assert isinstance(Table({"a": np.array([1, 2])}, backend="python")["a"], list)
+
+
+@parametrize(
+    "predicate",
+    [
+        {"group": "x"},
+        {"group": "y", "score": 3},
+        {"group": "z"},
+        {"score": 3.0},
+        {"score": "3"},
+        "score",
+        "name",
+        lambda row: row["score"] > 1,
+        ["group", "y"],
+        {"group": ["x"]},
+        {"missing": 1},
+        {},
+        None,
+    ],
+)
+def test_filter_table(table, predicate):
+    result = _.filter_(table, predicate)
+    assert isinstance(result, Table)
+    assert result.to_records() == _.filter_(RECORDS, predicate)
+
+
+def test_filter_table_numpy_with_unbroadcastable_value(np):
+    class One:
+        __array_ufunc__ = None
+        __hash__ = None  # type: ignore[assignment]
+
+        def __eq__(self, other):
+            return isinstance(other, int) and other == 1
+
+    table = Table({"a": np.array([1, 2]), "b": ["x", "y"]})
+    assert _.filter_(table, {"a": One()}).to_records() == [{"a": 1, "b": "x"}]
+    assert _.filter_(table, {"a": [1, 2], "b": "x"}).to_records() == []
+    assert _.filter_(table, {"a": None, "b": "x"}).to_records() == []
+
+
+@parametrize("iteratee", ["group", "score", lambda row: row["score"] % 2, {"group": "x"}])
+def test_group_by_table(table, iteratee):
+    result = _.group_by(table, iteratee)
+    assert {key: group.to_records() for key, group in result.items()} == _.group_by(
+        RECORDS, iteratee
+    )
+    assert all(isinstance(group, Table) for group in result.values())
+
+
+@parametrize("iteratee", ["name", "score", lambda row: row["name"].upper()])
+def test_key_by_table(table, iteratee):
+    assert _.key_by(table, iteratee) == _.key_by(RECORDS, iteratee)
+
+
+@parametrize(
+    "keys,orders,reverse",
+    [
+        (["score"], None, False),
+        (["-score", "name"], None, False),
+        (["group", "score"], [True, False], False),
+        (["group"], None, True),
+        (["score"], True, False),
+    ],
+)
+def test_order_by_table(table, keys, orders, reverse):
+    result = _.order_by(table, keys, orders, reverse)
+    assert isinstance(result, Table)
+    assert result.to_records() == _.order_by(RECORDS, keys, orders, reverse)
+
+
+@parametrize("path", ["name", "score", "missing"])
+def test_pluck_table(table, path):
+    assert _.pluck(table, path) == _.pluck(RECORDS, path)
+
+
+def test_pluck_table_copies_column():
+    table = Table.from_records(RECORDS)
+    result = _.pluck(table, "score")
+    result.append(4)
+    assert table["score"] == [3, 1, 2, 3]
+
+
+def test_table_deep_paths_are_not_column_names():
+    records = [{"a.b": 1, "a": {"b": 2}}]
+    table = Table.from_records(records)
+    assert _.pluck(table, "a.b") == _.pluck(records, "a.b") == [2]
+    assert _.filter_(table, {"a.b": 1}).to_records() == _.filter_(records, {"a.b": 1})
+
+
+@parametrize(
+    "func,iteratee",
+    [
+        (_.sum_by, "score"),
+        (_.mean_by, "score"),
+        (_.max_by, "score"),
+        (_.min_by, "score"),
+        (_.count_by, "group"),
+        (_.sum_by, lambda row: row["score"] * 2),
+    ],
+)
+def test_numerical_by_table(table, func, iteratee):
+    assert func(table, iteratee) == func(RECORDS, iteratee)
+
+
+def test_median_table_column(table):
+    assert _.median(table, "score") == _.median(RECORDS, "score")
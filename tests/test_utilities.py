@@ -1,3 +1,5 @@
+import abc
+from collections import OrderedDict
 import time
 from unittest import mock
 
@@ -5,6 +7,8 @@ import pytest
 
 import pydash as _
 
+from . import helpers
+
 
 parametrize = pytest.mark.parametrize
 
@@ -19,6 +23,70 @@ def test_attempt_exception(case, expected):
     assert isinstance(_.attempt(*case), expected)
 
 
+class Unequal:
+    def __eq__(self, other):
+        raise TypeError("cannot compare")
+
+    __hash__ = object.__hash__
+
+
+@parametrize(
+    "source,obj,expected",
+    [
+        ({"age": 36}, {"name": "barney", "age": 36}, True),
+        ({"age": 36}, {"name": "barney", "age": 40}, False),
+        ({"age": 36}, {"name": "barney"}, False),
+        ({"a": {"b": 2}}, {"a": {"b": 2, "c": 3}}, True),
+        ({"a": {"b": 2}}, {"a": {"c": 3}}, False),
+        ({"a": {"b": 2}}, {"a": 2}, False),
+        ({"a": [{"b": [{"d": 4}]}]}, {"a": [{"b": [{"c": 3, "d": 4}]}]}, True),
+        ({"a": [{"b": [{"d": 4}]}]}, {"a": [{"b": [{"c": 3, "d": 5}]}]}, False),
+        ({"a": {}}, {"a": 1}, True),
+        ({"a": {}}, {"b": 1}, False),
+        ({"a": []}, {"a": None}, True),
+        ({}, None, True),
+        ([], 1, True),
+        ([1, 2], [1, 2, 3], True),
+        ([1, 2], [1, 3], False),
+        ([1, 2], [1], False),
+        ({"1": "b"}, {1: "b"}, True),
+        ({0: "a"}, ["a"], True),
+        ({"a": "bc"}, {"a": "bc"}, True),
+        ({"a": "bc"}, {"a": ["b", "c"]}, False),
+        ({"a": 1}, helpers.Object(a=1), True),
+        ({"a": 1}, helpers.Object(a=2), False),
+        ({"a": {"b": 1}}, {"a": helpers.Object(b=1)}, True),
+        ({"a": 1}, 1, False),
+        ({"a": Unequal()}, {"a": 1}, False),
+        ({"a": 1}, {"a": Unequal()}, False),
+        ({"a": 1, "b": 2}, {"a": 1, "b": 2}, True),
+        ({"a": 1, "b": 2}, {"a": 2, "b": 2}, False),
+        ({"a": iter([])}, {"a": 1}, False),
+        (5, 5, True),
+        (5, 6, False),
+        ("abc", "abc", True),
+        (None, None, True),
+    ],
+)
+def test_compile_matcher(source, obj, expected):
+    assert _.compile_matcher(source)(obj) is expected
+    assert _.is_match(obj, source) is expected
+
+
+def test_compile_matcher_compiles_source_once():
+    matcher = _.compile_matcher({"a": (value for value in [1, 2])})
+    assert matcher({"a": [1, 2]}) is True
+    assert matcher({"a": [1, 2]}) is True
+    assert matcher({"a": [1, 3]}) is False
+
+
+def test_compile_matcher_shorthand():
+    records = [{"status": "active", "org": {"id": i % 3}} for i in range(9)]
+    assert _.filter_(records, {"status": "active", "org": {"id": 1}}) == records[1::3]
+    assert _.filter_(records, ["org", {"id": 2}]) == records[2::3]
+    assert _.filter_(records, ["org.id", 0]) == records[::3]
+
+
 @parametrize(
     "pairs,case,expected",
     [
@@ -105,6 +173,78 @@ def test_constant(case):
     assert _.constant(case)() == case
 
 
+def self_referencing(*values):
+    items = list(values)
+    items.append(items)
+    return items
+
+
+class Unhashable:
+    __hash__ = None  # type: ignore
+
+    def __eq__(self, other):
+        return isinstance(other, Unhashable)
+
+
+@parametrize(
+    "value,other",
+    [
+        (1, 1.0),
+        (1, True),
+        ("a", "a"),
+        ((1, 2), (1, 2)),
+        ([1, 2], [1, 2]),
+        ([1, 2], [1.0, 2]),
+        ({"a": 1, "b": [2]}, {"b": [2], "a": 1}),
+        ({1: "a"}, {1.0: "a"}),
+        ({1, 2}, {2, 1}),
+        ({1, 2}, frozenset([1, 2])),
+        ((1, [2]), (1, [2])),
+        ([{"a": [{"b": {1, 2}}]}], [{"a": [{"b": {2, 1}}]}]),
+        ([Unhashable()], [Unhashable()]),
+        (Unhashable(), Unhashable()),
+        ([(1, [2])], [(1, [2])]),
+        ([OrderedDict(a=[1], b=2)], [{"b": 2, "a": [1]}]),
+        (self_referencing(1), self_referencing(1)),
+        ({"a": self_referencing(1)}, {"a": self_referencing(1)}),
+    ],
+)
+def test_deep_hash_equal(value, other):
+    assert _.deep_hash(value) == _.deep_hash(other)
+
+
+@parametrize(
+    "value,other",
+    [
+        ([1, 2], [2, 1]),
+        ([1, 2], (1, 2)),
+        ([1, 2], [1, 2, 3]),
+        ({"a": 1}, {"a": 2}),
+        ({"a": 1}, {"b": 1}),
+        ({"a": [1]}, {"a": [[1]]}),
+        ([[1], [2]], [[1, 2]]),
+        (self_referencing(1), self_referencing(2)),
+    ],
+)
+def test_deep_hash_not_equal(value, other):
+    assert _.deep_hash(value) != _.deep_hash(other)
+
+
+def test_deep_hash_hashable():
+    assert _.deep_hash((1, "a")) == hash((1, "a"))
+
+
+def test_deep_hash_shared_and_deep_values():
+    shared = [1, {"a": 2}]
+    assert _.deep_hash([shared, shared]) == _.deep_hash([[1, {"a": 2}], [1, {"a": 2}]])
+
+    value = other = 1
+    for _i in range(10000):
+        value = [value]
+        other = [other]
+    assert _.deep_hash(value) == _.deep_hash(other)
+
+
 @parametrize(
     "case,expected",
     [
@@ -442,6 +582,98 @@ def test_range_right(case, expected):
     assert list(_.range_right(*case)) == expected
 
 
+def test_register_getter():
+    class Fields:
+        def __init__(self, **fields):
+            self.fields = fields
+
+    class SubFields(Fields):
+        pass
+
+    calls = []
+
+    @_.register_getter(Fields)
+    def get_field(obj, key, default):
+        calls.append(key)
+        return obj.fields.get(key, default)
+
+    obj = {"a": Fields(b=SubFields(c=1))}
+
+    assert _.get(obj, "a.b.c") == 1
+    assert _.get(obj, "a.x", "default") == "default"
+    assert _.has(obj, "a.b.c")
+    assert not _.has(obj, "a.fields")
+    assert calls == ["b", "c", "x", "b", "c", "fields"]
+
+
+def test_register_getter_for_abstract_base_class():
+    class Base(abc.ABC):
+        @abc.abstractmethod
+        def keys(self): ...
+
+    class Values:
+        def __init__(self, **values):
+            self.values = values
+
+    Base.register(Values)
+
+    assert _.register_getter(Base, lambda obj, key, default: obj.values.get(key, default))
+    assert _.get(Values(a=1), "a") == 1
+    assert _.get(Values(a=1), "values") is None
+
+
+def test_register_getter_keeps_builtin_lookups():
+    class Dict(dict):
+        pass
+
+    _.register_getter(Dict, lambda obj, key, default: "custom")
+
+    assert _.get({"a": 1}, "a") == 1
+    assert _.get([1], "0") == 1
+    assert _.get(Dict(a=1), "a") == "custom"
+
+
+def test_register_setter():
+    class Record:
+        def __init__(self, fields=None):
+            self.fields = fields or {}
+
+    @_.register_setter(Record)
+    def set_field(obj, key, value):
+        obj.fields[key] = value
+
+    _.register_getter(Record, lambda obj, key, default: obj.fields.get(key, default))
+    record = Record()
+
+    assert _.set_({"a": record}, "a.b", 1)["a"] is record
+    assert _.set_with(record, "c.d", 2, Record) is record
+    assert record.fields["b"] == 1
+    assert record.fields["c"].fields == {"d": 2}
+    assert _.get(record, "c.d") == 2
+
+    _.set_with(record, "b", 3, None)
+    assert record.fields["b"] == 3
+
+
+def test_register_setter_keeps_existing_path_objects():
+    class Record:
+        def __init__(self):
+            self.fields = {}
+
+    _.register_getter(Record, lambda obj, key, default: obj.fields.get(key, default))
+    _.register_setter(Record, lambda obj, key, value: obj.fields.__setitem__(key, value))
+    record = Record()
+
+    _.set_(record, "a.b", 2)
+    _.set_(record, "c.d", 3)
+    assert record.fields == {"a": {"b": 2}, "c": {"d": 3}}
+
+    inner = record.fields["a"]
+    _.set_(record, "a.e", 4)
+    assert record.fields["a"] is inner
+    assert inner == {"b": 2, "e": 4}
+
+
 @parametrize(
     "case,expected",
     [
@@ -623,6 +855,15 @@ def test_times(case, expected):
         ("a[0][1][2].b.c", ["a", 0, 1, 2, "b", "c"]),
         ("a[0][1][2].b.c", ["a", 0, 1, 2, "b", "c"]),
         ("a[0][-1][-2].b.c", ["a", 0, -1, -2, "b", "c"]),
+        ("one.[1].two", ["one", 1, "two"]),
+        ("a[b].c", ["a[b]", "c"]),
+        ("a\\.b.c", ["a.b", "c"]),
+        ("back\\\\slash", ["back\\slash"]),
+        ("trail\\\\.q", ["trail\\", "q"]),
+        ("a\\[0\\].b", ["a[0]", "b"]),
+        ("x.\\[1\\]", ["x", "[1]"]),
+        ("C:\\dir", ["C:\\dir"]),
+        (["a", "[0]", "b\\.c"], ["a", 0, "b.c"]),
     ],
 )
 def test_to_path(case, expected):